@@ -189,10 +189,10 @@ func _update_class_select() -> void:
 			last_type = cls.type
 		var label := Label.new()
 		if i == _selected_class_index:
-			label.text = "> %-12s %s %s" % [cls.name, cls.race, cls.gender]
+			label.text = "> %-12s %s %s" % [cls.get_display_name(), cls.race, cls.gender]
 			label.add_theme_color_override("font_color", ThemeColors.TEXT_HIGHLIGHT)
 		else:
-			label.text = "  %-12s %s %s" % [cls.name, cls.race, cls.gender]
+			label.text = "  %-12s %s %s" % [cls.get_display_name(), cls.race, cls.gender]
 		vbox.add_child(label)
 
 	scroll.add_child(vbox)
@@ -216,7 +216,7 @@ func _update_class_info() -> void:
 	vbox.add_theme_constant_override("separation", 4)
 
 	var name_label := Label.new()
-	name_label.text = cls.name
+	name_label.text = cls.get_display_name()
 	name_label.add_theme_color_override("font_color", ThemeColors.HEADER)
 	vbox.add_child(name_label)
 
@@ -326,7 +326,11 @@ func _update_preview_model() -> void:
 		_preview_model = null
 
 	var vi: int = int(_appearance["variation_index"])
-	var model_path: String = PlayerConfig.get_model_path(_selected_class_id, vi)
+	var hair: int = int(_appearance["hair_color_index"])
+	var skin: int = int(_appearance["skin_tone_index"])
+	var body: int = int(_appearance["body_color_index"])
+	var paths: Dictionary = PlayerConfig.get_appearance_paths(_selected_class_id, vi, hair, skin, body)
+	var model_path: String = paths["model_path"]
 
 	if not ResourceLoader.exists(model_path):
 		return
@@ -341,18 +345,15 @@ func _update_preview_model() -> void:
 	_preview_pivot.add_child(_preview_model)
 
 	# Apply texture
-	var hair: int = int(_appearance["hair_color_index"])
-	var skin: int = int(_appearance["skin_tone_index"])
-	var body: int = int(_appearance["body_color_index"])
-	var tex_path: String = PlayerConfig.get_texture_path(_selected_class_id, vi, hair, skin, body)
+	var tex_path: String = paths["texture_path"]
 
 	if ResourceLoader.exists(tex_path):
-		var texture := load(tex_path) as Texture2D
+		var texture := TextureTiers.load_texture(tex_path)
 		if texture:
-			_apply_texture_recursive(_preview_model, texture)
+			_apply_texture_recursive(_preview_model, texture, paths["uv_offset"])
 
 
-func _apply_texture_recursive(node: Node, texture: Texture2D) -> void:
+func _apply_texture_recursive(node: Node, texture: Texture2D, uv_offset := Vector3.ZERO) -> void:
 	if node is MeshInstance3D:
 		var mesh_instance := node as MeshInstance3D
 		var mesh := mesh_instance.mesh
@@ -363,14 +364,16 @@ func _apply_texture_recursive(node: Node, texture: Texture2D) -> void:
 					var new_mat := mat.duplicate() as StandardMaterial3D
 					new_mat.albedo_texture = texture
 					new_mat.texture_filter = BaseMaterial3D.TEXTURE_FILTER_NEAREST
+					new_mat.uv1_offset = uv_offset
 					mesh_instance.set_surface_override_material(surface_idx, new_mat)
 				elif mat == null:
 					var new_mat := StandardMaterial3D.new()
 					new_mat.albedo_texture = texture
 					new_mat.texture_filter = BaseMaterial3D.TEXTURE_FILTER_NEAREST
+					new_mat.uv1_offset = uv_offset
 					mesh_instance.set_surface_override_material(surface_idx, new_mat)
 	for child in node.get_children():
-		_apply_texture_recursive(child, texture)
+		_apply_texture_recursive(child, texture, uv_offset)
 
 
 func _teardown_preview() -> void:
@@ -545,7 +548,7 @@ func _show_confirm() -> void:
 	vbox.add_child(name_label)
 
 	var class_label := Label.new()
-	class_label.text = "  Class: %s" % cls.name
+	class_label.text = "  Class: %s" % cls.get_display_name()
 	vbox.add_child(class_label)
 
 	var type_label := Label.new()
@@ -97,7 +97,7 @@ func _refresh_slots() -> void:
 			var class_display := class_id
 			var class_data = ClassRegistry.get_class_data(class_id)
 			if class_data:
-				class_display = "%s  %s %s" % [class_data.name, class_data.race, class_data.gender]
+				class_display = "%s  %s %s" % [class_data.get_display_name(), class_data.race, class_data.gender]
 			var class_label := Label.new()
 			class_label.text = class_display
 			class_label.add_theme_color_override("font_color", ThemeColors.TEXT_SECONDARY)
@@ -174,14 +174,14 @@ func _build_slot_preview(character: Dictionary) -> SubViewportContainer:
 
 			# Apply texture
 			if ResourceLoader.exists(texture_path):
-				var texture := load(texture_path) as Texture2D
+				var texture := TextureTiers.load_texture(texture_path)
 				if texture:
-					_apply_texture_recursive(model_node, texture)
+					_apply_texture_recursive(model_node, texture, paths["uv_offset"])
 
 	return container
 
 
-func _apply_texture_recursive(node: Node, texture: Texture2D) -> void:
+func _apply_texture_recursive(node: Node, texture: Texture2D, uv_offset := Vector3.ZERO) -> void:
 	if node is MeshInstance3D:
 		var mesh_instance := node as MeshInstance3D
 		var mesh := mesh_instance.mesh
@@ -192,14 +192,16 @@ func _apply_texture_recursive(node: Node, texture: Texture2D) -> void:
 					var new_mat := mat.duplicate() as StandardMaterial3D
 					new_mat.albedo_texture = texture
 					new_mat.texture_filter = BaseMaterial3D.TEXTURE_FILTER_NEAREST
+					new_mat.uv1_offset = uv_offset
 					mesh_instance.set_surface_override_material(surface_idx, new_mat)
 				elif mat == null:
 					var new_mat := StandardMaterial3D.new()
 					new_mat.albedo_texture = texture
 					new_mat.texture_filter = BaseMaterial3D.TEXTURE_FILTER_NEAREST
+					new_mat.uv1_offset = uv_offset
 					mesh_instance.set_surface_override_material(surface_idx, new_mat)
 	for child in node.get_children():
-		_apply_texture_recursive(child, texture)
+		_apply_texture_recursive(child, texture, uv_offset)
 
 
 func _select_slot() -> void:
@@ -659,10 +659,10 @@ func _grant_mission_rewards(mission_id: String, difficulty: String) -> void:
 		_add_log("Meseta: +%d" % reward_meseta)
 
 	# Grant reward item
-	var item_name: String = str(reward.get("item", ""))
+	var item_id: String = str(reward.get("item", ""))
 	var quantity: int = int(reward.get("quantity", 1))
-	if not item_name.is_empty():
-		var item_id: String = item_name.to_lower().replace(" ", "_").replace("'", "").replace("-", "_").replace("/", "_")
+	if not item_id.is_empty():
+		var item_name: String = Inventory._lookup_item(item_id)["name"]
 		for _i in range(quantity):
 			if Inventory.can_add_item(item_id):
 				Inventory.add_item(item_id, 1)
@@ -894,7 +894,7 @@ func _refresh_actions() -> void:
 		for i in range(_available_pas.size()):
 			var art = _available_pas[i]
 			var label := Label.new()
-			var display: String = "%s (%d PP, %dx)" % [art.name, art.pp_cost, art.hits]
+			var display: String = "%s (%d PP, %dx)" % [art.get_display_name(), art.pp_cost, art.hits]
 			if i == _selected_pa:
 				label.text = "> " + display
 				label.modulate = Color(1, 0.8, 0) if current_pp >= art.pp_cost else Color(1, 0.267, 0.267)
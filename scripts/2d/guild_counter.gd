@@ -118,7 +118,7 @@ func _load_entries() -> void:
 		_entries.append({
 			"type": "mission",
 			"id": mission.id,
-			"name": mission.name,
+			"name": mission.get_display_name(),
 			"area": mission.area,
 			"is_main": mission.is_main,
 			"requires": mission.requires,
@@ -216,6 +216,7 @@ func _unhandled_input(event: InputEvent) -> void:
 
 
 func _update_availability() -> void:
+	var completed_mask := MissionRegistry.get_completed_mask(GameState.completed_missions)
 	for i in range(_entries.size()):
 		var entry: Dictionary = _entries[i]
 		if entry["type"] == "quest":
@@ -238,12 +239,7 @@ func _update_availability() -> void:
 						break
 				entry["available"] = prev_completed
 		else:
-			var all_met := true
-			for req in requires:
-				if not GameState.is_mission_completed(req):
-					all_met = false
-					break
-			entry["available"] = all_met
+			entry["available"] = MissionRegistry.is_mission_unlocked(entry["id"], completed_mask)
 
 
 func _accept_entry() -> void:
@@ -434,7 +430,7 @@ func _refresh_detail() -> void:
 			var req_names := PackedStringArray()
 			for req_id in requires:
 				var req_mission = MissionRegistry.get_mission(req_id)
-				req_names.append(req_mission.name if req_mission else req_id)
+				req_names.append(req_mission.get_display_name() if req_mission else req_id)
 			var req_label := Label.new()
 			req_label.text = "Requires: %s" % ", ".join(req_names)
 			req_label.add_theme_color_override("font_color", ThemeColors.DANGER)
@@ -452,10 +448,11 @@ func _refresh_detail() -> void:
 			vbox.add_child(rewards_header)
 			for diff_key in rewards:
 				var reward: Dictionary = rewards[diff_key]
+				var reward_item: String = str(reward.get("item", ""))
 				var r := Label.new()
 				r.text = "  %s: %s x%s, %s M" % [
 					str(diff_key).capitalize(),
-					str(reward.get("item", "???")),
+					Inventory._lookup_item(reward_item)["name"] if not reward_item.is_empty() else "???",
 					str(reward.get("quantity", 1)),
 					str(reward.get("meseta", 0)),
 				]
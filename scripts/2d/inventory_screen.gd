@@ -182,9 +182,9 @@ func _refresh_display() -> void:
 			# Use proper name from registry for unresolved items
 			if is_unresolved:
 				if weapon:
-					item_name = weapon.name
+					item_name = weapon.get_display_name()
 				elif armor_data:
-					item_name = armor_data.name
+					item_name = armor_data.get_display_name()
 			var qty: int = int(item.get("quantity", 1))
 			var equip_tag: String = " [E]" if item_id in equipped_ids else ""
 
@@ -301,7 +301,7 @@ func _refresh_detail() -> void:
 		consumable = ConsumableRegistry.get_consumable(norm_id)
 	if consumable:
 		var details := Label.new()
-		details.text = consumable.details
+		details.text = consumable.get_display_details()
 		details.autowrap_mode = TextServer.AUTOWRAP_WORD_SMART
 		vbox.add_child(details)
 
@@ -413,9 +413,9 @@ func _refresh_detail() -> void:
 		var mat = MaterialRegistry.get_material(item_id)
 		if mat:
 			_add_detail_line(vbox, "Type: Material")
-			if not mat.details.is_empty():
+			if not mat.get_display_details().is_empty():
 				var detail_label := Label.new()
-				detail_label.text = mat.details
+				detail_label.text = mat.get_display_details()
 				detail_label.autowrap_mode = TextServer.AUTOWRAP_WORD_SMART
 				vbox.add_child(detail_label)
 		var stat_name: String = CombatManager.MATERIAL_STAT_MAP[item_id]
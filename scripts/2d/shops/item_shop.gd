@@ -80,10 +80,10 @@ func _buy_item() -> void:
 		return
 
 	var item := _shop_items[_selected_index] as Dictionary
-	var item_name: String = str(item.get("item", ""))
+	var item_id: String = str(item.get("item", ""))
 	var cost: int = int(item.get("cost", 0))
-	if ShopManager.buy_item("item_shop", item_name):
-		hint_label.text = "Bought %s for %d meseta!" % [item_name, cost]
+	if ShopManager.buy_item("item_shop", item_id):
+		hint_label.text = "Bought %s for %d meseta!" % [Inventory._lookup_item(item_id)["name"], cost]
 	else:
 		hint_label.text = "Not enough meseta!"
 	_refresh_display()
@@ -148,11 +148,10 @@ func _refresh_display() -> void:
 		for i in range(list.size()):
 			var label := Label.new()
 			var item: Dictionary = list[i]
-			var shop_name: String = str(item.get("item", "???"))
-			var item_id: String = shop_name.to_lower().replace(" ", "_").replace("-", "_").replace("/", "_")
+			var item_id: String = str(item.get("item", ""))
 			var held: int = Inventory.get_item_count(item_id)
 			var held_str: String = " (%d)" % held if held > 0 else ""
-			label.text = "%-18s%s %5d M" % [shop_name, held_str, int(item.get("cost", 0))]
+			label.text = "%-18s%s %5d M" % [Inventory._lookup_item(item_id)["name"], held_str, int(item.get("cost", 0))]
 			if i == _selected_index:
 				label.text = "> " + label.text
 				label.add_theme_color_override("font_color", ThemeColors.TEXT_HIGHLIGHT)
@@ -242,7 +241,8 @@ func _refresh_item_detail(item: Dictionary) -> void:
 	vbox.add_theme_constant_override("separation", 4)
 
 	var name_label := Label.new()
-	name_label.text = "── %s ──" % str(item.get("item", "???"))
+	var item_id: String = str(item.get("item", ""))
+	name_label.text = "── %s ──" % Inventory._lookup_item(item_id)["name"]
 	name_label.add_theme_color_override("font_color", ThemeColors.HEADER)
 	vbox.add_child(name_label)
 
@@ -255,12 +255,10 @@ func _refresh_item_detail(item: Dictionary) -> void:
 	cost_label.add_theme_color_override("font_color", ThemeColors.TEXT_HIGHLIGHT)
 	vbox.add_child(cost_label)
 
-	var consumable = ConsumableRegistry.get_consumable(
-		str(item.get("item", "")).to_lower().replace(" ", "_").replace("-", "_").replace("/", "_")
-	)
+	var consumable = ConsumableRegistry.get_consumable(item_id)
 	if consumable:
 		var details_label := Label.new()
-		details_label.text = consumable.details
+		details_label.text = consumable.get_display_details()
 		details_label.autowrap_mode = TextServer.AUTOWRAP_WORD_SMART
 		vbox.add_child(details_label)
 
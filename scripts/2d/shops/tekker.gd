@@ -49,7 +49,7 @@ func _build_lists() -> void:
 			if current_grind < weapon.max_grind:
 				_grindable_weapons.append({
 					"id": weapon.id,
-					"name": weapon.name,
+					"name": weapon.get_display_name(),
 					"grind": current_grind,
 					"max_grind": weapon.max_grind,
 					"rarity": weapon.rarity,
@@ -61,7 +61,7 @@ func _build_lists() -> void:
 		if weapon:
 			_unidentified_weapons.append({
 				"id": weapon.id,
-				"name": weapon.name,
+				"name": weapon.get_display_name(),
 				"rarity": weapon.rarity,
 			})
 
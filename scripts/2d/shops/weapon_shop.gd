@@ -57,7 +57,7 @@ func _generate_inventory() -> void:
 			continue
 		var price: int = _weapon_price(w)
 		_weapons.append({
-			"id": w.id, "name": w.name, "category": "weapon",
+			"id": w.id, "name": w.get_display_name(), "category": "weapon",
 			"cost": price, "sell_price": int(price * 0.25),
 		})
 
@@ -67,7 +67,7 @@ func _generate_inventory() -> void:
 			continue
 		var price: int = _armor_price(a)
 		_armors.append({
-			"id": a.id, "name": a.name, "category": "armor",
+			"id": a.id, "name": a.get_display_name(), "category": "armor",
 			"cost": price, "sell_price": int(price * 0.25),
 		})
 
@@ -77,7 +77,7 @@ func _generate_inventory() -> void:
 			continue
 		var price: int = _unit_price(u)
 		_units.append({
-			"id": u.id, "name": u.name, "category": "unit",
+			"id": u.id, "name": u.get_display_name(), "category": "unit",
 			"cost": price, "sell_price": int(price * 0.25),
 		})
 
@@ -42,7 +42,7 @@ func _refresh_info() -> void:
 
 	var class_id: String = str(character.get("class_id", "???"))
 	var class_data = ClassRegistry.get_class_data(class_id)
-	var class_name_str: String = class_data.name if class_data else class_id
+	var class_name_str: String = class_data.get_display_name() if class_data else class_id
 
 	var class_label := Label.new()
 	class_label.text = "Class: %s" % class_name_str
@@ -233,17 +233,17 @@ func _calculate_equipment_bonuses(character: Dictionary) -> Dictionary:
 func _get_item_name(slot_type: String, item_id: String) -> String:
 	if slot_type == "weapon":
 		var weapon = WeaponRegistry.get_weapon(item_id)
-		return weapon.name if weapon else item_id
+		return weapon.get_display_name() if weapon else item_id
 	elif slot_type == "frame":
 		var armor = ArmorRegistry.get_armor(item_id)
-		return armor.name if armor else item_id
+		return armor.get_display_name() if armor else item_id
 	elif slot_type == "mag":
 		var mag_path := "res://data/mags/%s.tres" % item_id
 		if ResourceLoader.exists(mag_path):
 			var mag = load(mag_path)
 			if mag:
-				return mag.name
+				return mag.get_display_name()
 		return item_id
 	else:
 		var unit = UnitRegistry.get_unit(item_id)
-		return unit.name if unit else item_id
+		return unit.get_display_name() if unit else item_id
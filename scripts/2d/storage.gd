@@ -277,9 +277,9 @@ func _refresh_items_panel(panel: PanelContainer, items: Array, header_text: Stri
 			var item_name: String = str(item.get("name", item_id))
 			if is_unresolved:
 				if weapon:
-					item_name = weapon.name
+					item_name = weapon.get_display_name()
 				elif armor_data:
-					item_name = armor_data.name
+					item_name = armor_data.get_display_name()
 			var qty: int = int(item.get("quantity", 1))
 			var equip_tag: String = " [E]" if item_id in equipped_ids else ""
 
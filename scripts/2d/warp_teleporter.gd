@@ -82,7 +82,7 @@ func _unhandled_input(event: InputEvent) -> void:
 			if not _is_area_unlocked(str(area["id"])):
 				var mission_id: String = AREA_UNLOCK_MISSIONS.get(str(area["id"]), "")
 				var mission = MissionRegistry.get_mission(mission_id)
-				var mission_name: String = mission.name if mission else mission_id
+				var mission_name: String = mission.get_display_name() if mission else mission_id
 				hint_label.text = "Area locked! Complete \"%s\" to unlock." % mission_name
 				get_viewport().set_input_as_handled()
 				return
@@ -207,7 +207,7 @@ func _refresh_info() -> void:
 		var lock_label := Label.new()
 		var mission_id: String = AREA_UNLOCK_MISSIONS.get(str(area["id"]), "")
 		var mission = MissionRegistry.get_mission(mission_id)
-		var mission_name: String = mission.name if mission else mission_id
+		var mission_name: String = mission.get_display_name() if mission else mission_id
 		lock_label.text = "Complete \"%s\" to unlock" % mission_name
 		lock_label.add_theme_color_override("font_color", ThemeColors.DANGER)
 		vbox.add_child(lock_label)
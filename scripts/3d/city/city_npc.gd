@@ -32,7 +32,7 @@ func _load_model() -> void:
 
 	# Apply texture if PNG exists alongside GLB
 	var tex_path := npc_model_path.replace(".glb", ".png")
-	var texture := load(tex_path) as Texture2D
+	var texture := TextureTiers.load_texture(tex_path)
 	if texture:
 		_apply_npc_texture(model, texture)
 
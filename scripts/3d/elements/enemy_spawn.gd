@@ -131,7 +131,7 @@ func _apply_enemy_texture() -> void:
 			var fname := dir.get_next()
 			while not fname.is_empty():
 				if fname.ends_with(".png") and not fname.ends_with(".import"):
-					var tex := load(tex_dir + fname) as Texture2D
+					var tex := TextureTiers.load_texture(tex_dir + fname)
 					if tex:
 						_apply_texture(tex)
 						break
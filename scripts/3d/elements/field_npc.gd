@@ -54,7 +54,7 @@ func _load_npc_model() -> void:
 	# Apply separate texture if specified
 	var tex_path: String = entry.get("texture", "")
 	if not tex_path.is_empty():
-		var tex := load(tex_path) as Texture2D
+		var tex := TextureTiers.load_texture(tex_path)
 		if tex:
 			_apply_texture(model, tex)
 
@@ -0,0 +1,106 @@
+extends RefCounted
+class_name SpatialGrid
+## SpatialGrid — uniform XZ hash grid for proximity queries in one room.
+## Starts from a map's offline index (StageSpatialIndex) and takes runtime
+## inserts for quest objects. Items are { kind, id, min: Vector2, max: Vector2, data }
+## in stage-local space; queries only look at the cells around the point.
+
+var cell_size: float
+var _items: Array[Dictionary] = []
+var _cells: Dictionary = {}  # Vector2i → Array[int] item indices
+
+
+func _init(size: float = 8.0) -> void:
+	cell_size = maxf(size, 0.01)
+
+
+## Add every item of one StageSpatialIndex map entry
+func load_map(map: Dictionary) -> void:
+	var kinds: PackedStringArray = map.get("kinds", PackedStringArray())
+	var ids: PackedStringArray = map.get("ids", PackedStringArray())
+	var bounds: PackedFloat32Array = map.get("bounds", PackedFloat32Array())
+	var base := _items.size()
+	for i in range(kinds.size()):
+		_items.append({
+			"kind": kinds[i], "id": ids[i],
+			"min": Vector2(bounds[i * 4], bounds[i * 4 + 1]),
+			"max": Vector2(bounds[i * 4 + 2], bounds[i * 4 + 3]),
+			"data": null,
+		})
+	var cells: Dictionary = map.get("cells", {})
+	for cell in cells:
+		var bucket: Array = _cells.get(cell, [])
+		for index in cells[cell]:
+			bucket.append(base + int(index))
+		_cells[cell] = bucket
+
+
+## Index a footprint; returns the item index
+func insert(kind: String, id: String, min_xz: Vector2, max_xz: Vector2, data: Variant = null) -> int:
+	var index := _items.size()
+	_items.append({"kind": kind, "id": id, "min": min_xz, "max": max_xz, "data": data})
+	var lo := _cell_of(min_xz)
+	var hi := _cell_of(max_xz)
+	for cx in range(lo.x, hi.x + 1):
+		for cz in range(lo.y, hi.y + 1):
+			var cell := Vector2i(cx, cz)
+			if not _cells.has(cell):
+				_cells[cell] = []
+			_cells[cell].append(index)
+	return index
+
+
+## Index a point (a placed object) by its XZ position
+func insert_point(kind: String, id: String, pos: Vector3, data: Variant = null) -> int:
+	var xz := Vector2(pos.x, pos.z)
+	return insert(kind, id, xz, xz, data)
+
+
+## Items of `kind` ("" = any) whose footprint comes within `radius` of pos (XZ)
+func query(pos: Vector3, radius: float, kind: String = "") -> Array[Dictionary]:
+	var result: Array[Dictionary] = []
+	var center := Vector2(pos.x, pos.z)
+	var lo := _cell_of(center - Vector2(radius, radius))
+	var hi := _cell_of(center + Vector2(radius, radius))
+	var seen: Dictionary = {}
+	for cx in range(lo.x, hi.x + 1):
+		for cz in range(lo.y, hi.y + 1):
+			for index in _cells.get(Vector2i(cx, cz), []):
+				if seen.has(index):
+					continue
+				seen[index] = true
+				var item: Dictionary = _items[index]
+				if not kind.is_empty() and item["kind"] != kind:
+					continue
+				var nearest: Vector2 = center.clamp(item["min"], item["max"])
+				if nearest.distance_to(center) <= radius:
+					result.append(item)
+	return result
+
+
+## Closest item of `kind` within `radius` of pos, or {} if there is none
+func nearest(pos: Vector3, radius: float, kind: String = "") -> Dictionary:
+	var best: Dictionary = {}
+	var best_dist := INF
+	var center := Vector2(pos.x, pos.z)
+	for item in query(pos, radius, kind):
+		var dist: float = center.clamp(item["min"], item["max"]).distance_to(center)
+		if dist < best_dist:
+			best_dist = dist
+			best = item
+	return best
+
+
+func has_kind(kind: String) -> bool:
+	for item in _items:
+		if item["kind"] == kind:
+			return true
+	return false
+
+
+func size() -> int:
+	return _items.size()
+
+
+func _cell_of(xz: Vector2) -> Vector2i:
+	return Vector2i(floori(xz.x / cell_size), floori(xz.y / cell_size))
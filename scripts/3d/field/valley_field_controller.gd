@@ -8,6 +8,8 @@ const GridGenerator := preload("res://scripts/3d/field/grid_generator.gd")
 const MapOverlayScript := preload("res://scripts/3d/field/map_overlay.gd")
 const TEXTURE_FIX_SHADER := preload("res://scripts/3d/field/texture_fix_shader.gdshader")
 const WATERFALL_SHADER := preload("res://scripts/3d/field/waterfall_shader.gdshader")
+const STAGE_INDEX_PATH := "res://data/stage_spatial_index.tres"
+const LOD_MANIFEST_PATH := "res://assets/environments/lod_manifest.json"
 const StartWarpScript := preload("res://scripts/3d/elements/start_warp.gd")
 const AreaWarpScript := preload("res://scripts/3d/elements/area_warp.gd")
 const GateScript := preload("res://scripts/3d/elements/gate.gd")
@@ -62,6 +64,8 @@ var _room_minimap: Control
 var _field_hud: CanvasLayer
 var _blob_shadow: MeshInstance3D
 var _stage_config: Dictionary = {}
+var _spatial_grid: SpatialGrid  # Portals/spawns/obstacles + this room's placed objects, stage-local
+var _lod_files: Dictionary = {}  # "<folder>/<stage>.glb" → LOD copy (relative to environments/)
 var _texture_fixes: Array = []
 var _spawn_edge: String = ""
 var _rotation_deg: int = 0
@@ -147,7 +151,7 @@ func _ready() -> void:
 	TimeManager.stage_label = stage_id
 	var area_id: String = str(SessionManager.get_session().get("area_id", "gurhacia"))
 	var area_cfg: Dictionary = GridGenerator.AREA_CONFIG.get(area_id, GridGenerator.AREA_CONFIG["gurhacia"])
-	var map_path := "res://assets/environments/%s/%s.glb" % [area_cfg["folder"], stage_id]
+	var map_path := _map_glb_path(area_cfg["folder"], stage_id)
 	var packed_scene := load(map_path) as PackedScene
 	if not packed_scene:
 		push_error("[ValleyField] Failed to load map: %s" % map_path)
@@ -165,12 +169,15 @@ func _ready() -> void:
 	# Load stage config JSON (texture fixes + portal data)
 	_stage_config = _load_stage_config(area_cfg["folder"], stage_id)
 	_texture_fixes = _stage_config.get("textureFixes", []) as Array
+	_spatial_grid = _load_spatial_grid(stage_id)
 	if _texture_fixes.size() > 0:
 		print("[ValleyField] Loaded %d texture fixes from config" % _texture_fixes.size())
 
 	add_child(_map_root)
+	_apply_lod_ranges(_map_root)
 	_strip_embedded_lights(_map_root)
 	_fix_materials(_map_root)
+	TextureTiers.apply_to_node(_map_root)
 	await get_tree().process_frame
 
 	# Setup collision from GLB -colonly meshes
@@ -637,6 +644,36 @@ func _collect_embedded_lights(node: Node, out: Array[Node]) -> void:
 		_collect_embedded_lights(child, out)
 
 
+## The map's LOD copy when build_environment_lods.py made one, else the source GLB.
+func _map_glb_path(folder: String, stage_id: String) -> String:
+	var rel := "%s/%s.glb" % [folder, stage_id]
+	if _lod_files.is_empty() and FileAccess.file_exists(LOD_MANIFEST_PATH):
+		var json := JSON.new()
+		if json.parse(FileAccess.get_file_as_string(LOD_MANIFEST_PATH)) == OK and json.data is Dictionary:
+			var maps: Dictionary = json.data.get("maps", {})
+			for key in maps:
+				var file := str(maps[key].get("file", ""))
+				if not file.is_empty():
+					_lod_files[key] = file
+	var lod_path := "res://assets/environments/" + str(_lod_files.get(rel, ""))
+	if _lod_files.has(rel) and ResourceLoader.exists(lod_path):
+		return lod_path
+	return "res://assets/environments/" + rel
+
+
+## Turn the LOD copy's node extras ({"lod": {begin, end}}) into visibility ranges.
+func _apply_lod_ranges(node: Node) -> void:
+	if node is GeometryInstance3D and node.has_meta("extras"):
+		var extras = node.get_meta("extras")
+		if extras is Dictionary and extras.has("lod"):
+			var lod: Dictionary = extras["lod"]
+			var geometry := node as GeometryInstance3D
+			geometry.visibility_range_begin = float(lod.get("begin", 0.0))
+			geometry.visibility_range_end = float(lod.get("end", 0.0))
+	for child in node.get_children():
+		_apply_lod_ranges(child)
+
+
 func _load_stage_config(folder: String, stage_id: String) -> Dictionary:
 	var config_path := "res://assets/environments/%s/%s_config.json" % [folder, stage_id]
 	if not FileAccess.file_exists(config_path):
@@ -650,6 +687,31 @@ func _load_stage_config(folder: String, stage_id: String) -> Dictionary:
 	return json.data as Dictionary
 
 
+## Spatial grid for a map from the offline index (empty if the index or map is missing).
+func _load_spatial_grid(stage_id: String) -> SpatialGrid:
+	var index := load(STAGE_INDEX_PATH) as StageSpatialIndex if ResourceLoader.exists(STAGE_INDEX_PATH) else null
+	if index == null:
+		return SpatialGrid.new()
+	return index.create_grid(stage_id)
+
+
+## Track a placed room object in the spatial grid (by its stage-local position).
+func _index_room_object(kind: String, node: Node3D) -> void:
+	if _spatial_grid:
+		_spatial_grid.insert_point(kind, "", node.position, node)
+
+
+## Placed room object of `kind` within `tolerance` of a stage-local position, or null.
+func _room_object_at(kind: String, pos: Vector3, tolerance: float) -> Node3D:
+	if _spatial_grid == null:
+		return null
+	for item in _spatial_grid.query(pos, tolerance, kind):
+		var node = item["data"]
+		if is_instance_valid(node) and (node as Node3D).position.distance_to(pos) < tolerance:
+			return node as Node3D
+	return null
+
+
 ## Direction base rotations for portal position math (matches ExportTab.tsx DIRECTION_ROTATIONS).
 ## north=0, south=PI, east=PI/2, west=-PI/2.
 const DIRECTION_ROTATIONS := {
@@ -740,7 +802,7 @@ func _load_fix_texture(tex_file: String) -> Texture2D:
 	var area_cfg_local: Dictionary = GridGenerator.AREA_CONFIG.get(area_id_local, GridGenerator.AREA_CONFIG["gurhacia"])
 	var tex_path := "res://assets/environments/%s/%s" % [area_cfg_local["folder"], tex_file]
 	if ResourceLoader.exists(tex_path):
-		return load(tex_path) as Texture2D
+		return TextureTiers.load_texture(tex_path)
 	return null
 
 
@@ -1410,20 +1472,18 @@ func _restore_cell_objects(saved: Dictionary) -> void:
 				var link_id: String = str(obj.get("link_id", ""))
 				_spawn_fence(pos, obj_rot, link_id)
 				# Restore fence state if disabled
-				if state == "disabled" and not _fence_links.is_empty():
-					for lid in _fence_links:
-						for f in _fence_links[lid]["fences"]:
-							if (f as Fence).position.distance_to(pos) < 0.1:
-								(f as Fence).disable()
+				if state == "disabled":
+					var fence := _room_object_at("fence", pos, 0.1) as Fence
+					if fence:
+						fence.disable()
 			"step_switch":
 				var link_id: String = str(obj.get("link_id", ""))
 				_spawn_switch(pos, link_id)
 				# Restore switch state
 				if state == "on":
-					for lid in _fence_links:
-						for s in _fence_links[lid]["switches"]:
-							if (s as StepSwitch).position.distance_to(pos) < 0.1:
-								(s as StepSwitch).set_state("on")
+					var sw := _room_object_at("step_switch", pos, 0.1) as StepSwitch
+					if sw:
+						sw.set_state("on")
 			"message":
 				var text: String = str(obj.get("text", ""))
 				var msg_state: String = state if not state.is_empty() else "available"
@@ -1507,21 +1567,12 @@ func _save_cell_state() -> void:
 		})
 	# Also record destroyed boxes from the original quest data
 	var objects: Array = _current_cell.get("objects", [])
-	var intact_box_positions: Array = []
-	for box in _room_boxes:
-		if is_instance_valid(box):
-			intact_box_positions.append(box.position)
 	for obj in objects:
 		var obj_type: String = str(obj.get("type", ""))
 		if obj_type in ["box", "rare_box"]:
 			var pos_arr: Array = obj.get("position", [0, 0, 0])
 			var pos := Vector3(float(pos_arr[0]), float(pos_arr[1]), float(pos_arr[2]))
-			var found := false
-			for intact_pos in intact_box_positions:
-				if intact_pos.distance_to(pos) < 0.1:
-					found = true
-					break
-			if not found:
+			if _room_object_at("box", pos, 0.1) == null:
 				obj_states.append({
 					"type": obj_type,
 					"px": pos.x, "py": pos.y, "pz": pos.z,
@@ -1575,16 +1626,9 @@ func _save_cell_state() -> void:
 			var pos_arr: Array = obj.get("position", [0, 0, 0])
 			var pos := Vector3(float(pos_arr[0]), float(pos_arr[1]), float(pos_arr[2]))
 			var state: String = ""
-			if obj_type == "fence":
-				for lid in _fence_links:
-					for f in _fence_links[lid]["fences"]:
-						if is_instance_valid(f) and (f as Node3D).position.distance_to(pos) < 0.5:
-							state = (f as Fence).element_state
-			elif obj_type == "step_switch":
-				for lid in _fence_links:
-					for s in _fence_links[lid]["switches"]:
-						if is_instance_valid(s) and (s as Node3D).position.distance_to(pos) < 0.5:
-							state = (s as StepSwitch).element_state
+			var element := _room_object_at(obj_type, pos, 0.5) as GameElement
+			if element:
+				state = element.element_state
 			obj_states.append({
 				"type": obj_type,
 				"px": pos.x, "py": pos.y, "pz": pos.z,
@@ -1698,6 +1742,7 @@ func _spawn_box(pos: Vector3, is_rare: bool, state: String = "intact", drop_type
 	box.position = pos
 	_fixup_element_materials(box)
 	_room_boxes.append(box)
+	_index_room_object("box", box)
 	# Track drops spawned from this box
 	box.destroyed_box.connect(func() -> void:
 		# Find new drop children added after destruction
@@ -1734,6 +1779,7 @@ func _spawn_fence(pos: Vector3, rotation_deg: float, link_id: String) -> void:
 	_fixup_element_materials(fence)
 	# Re-run laser material setup after fixup replaced materials (storybook pattern)
 	fence._setup_laser_materials()
+	_index_room_object("fence", fence)
 	if not link_id.is_empty():
 		if not _fence_links.has(link_id):
 			_fence_links[link_id] = {"fences": [], "switches": []}
@@ -1746,6 +1792,7 @@ func _spawn_switch(pos: Vector3, link_id: String) -> void:
 	_map_root.add_child(sw)
 	sw.position = pos
 	_fixup_element_materials(sw)
+	_index_room_object("step_switch", sw)
 	if not link_id.is_empty():
 		if not _fence_links.has(link_id):
 			_fence_links[link_id] = {"fences": [], "switches": []}
@@ -1758,11 +1805,11 @@ func _spawn_enemy_drops(pos: Vector3, enemy_id: String) -> void:
 	var enemy_data = EnemyRegistry.get_enemy(enemy_id)
 	var meseta_min: int = 5
 	var meseta_max: int = 20
-	var enemy_name: String = enemy_id.capitalize()
+	var drop_key: String = enemy_id
 	if enemy_data:
 		meseta_min = int(enemy_data.meseta_min) if int(enemy_data.meseta_min) > 0 else 5
 		meseta_max = int(enemy_data.meseta_max) if int(enemy_data.meseta_max) > 0 else 20
-		enemy_name = str(enemy_data.name)
+		drop_key = enemy_data.id
 
 	# Always drop meseta
 	var dm := DropMesetaScript.new()
@@ -1778,10 +1825,9 @@ func _spawn_enemy_drops(pos: Vector3, enemy_id: String) -> void:
 		var area_id: String = str(SessionManager.get_session().get("area_id", "gurhacia"))
 		var difficulty: String = str(SessionManager.get_session().get("difficulty", "normal"))
 		var drop_area: String = AREA_DROP_KEYS.get(area_id, "gurhacia-valley")
-		var drop_list: Array = DropRegistry.get_enemy_drops(difficulty, drop_area, enemy_name)
+		var drop_list: PackedStringArray = DropRegistry.get_enemy_drops(difficulty, drop_area, drop_key)
 		if drop_list.size() > 0:
-			var item_name: String = str(drop_list[randi() % drop_list.size()])
-			var item_id: String = item_name.to_lower().replace(" ", "_").replace("/", "_")
+			var item_id: String = drop_list[randi() % drop_list.size()]
 			var di := DropItemScript.new()
 			di.item_id = item_id
 			di.amount = 1
@@ -1789,7 +1835,7 @@ func _spawn_enemy_drops(pos: Vector3, enemy_id: String) -> void:
 			_map_root.add_child(di)
 			di.position = pos + item_offset
 			_room_drops.append(di)
-			print("[EnemyDrop] Item '%s' (id=%s) at %s" % [item_name, item_id, di.position])
+			print("[EnemyDrop] Item %s at %s" % [item_id, di.position])
 
 
 ## Spawn a message pack element.
@@ -1970,6 +2016,13 @@ func _spawn_wave(wave_num: int) -> void:
 
 ## Guess gate direction from position (for gate unlock)
 func _gate_direction(gate: Node3D) -> String:
+	# Indexed portals carry their config direction; _portal_data is keyed by grid direction
+	if _spatial_grid and _map_root:
+		var portal := _spatial_grid.nearest(_map_root.to_local(gate.global_position), 2.0, "portal")
+		if not portal.is_empty():
+			var dir := _rotate_dir(str(portal["id"]), _rotation_deg)
+			if _portal_data.has(dir):
+				return dir
 	for dir in _portal_data:
 		if dir == "default":
 			continue
@@ -39,6 +39,9 @@ const ANIMATION_MAP: Dictionary = {
 
 # Default asset paths (fallback when no character data)
 const DEFAULT_TEXTURE_PATH := "res://assets/player/pc_000/textures/pc_000_000.png"
+const ANIMATIONS_PATH := "res://assets/player/animations/saber_m.glb"
+# Key-reduced copies of animation GLBs (scripts/tools/compress_animations.py)
+const COMPRESSED_ANIMATIONS_DIR := "compressed"
 
 # Node references
 @onready var model: Node3D = $PlayerModel
@@ -122,14 +125,16 @@ func _setup_animations() -> void:
 	var model_node := $PlayerModel/Model
 	skeleton = _find_node_of_type(model_node, "Skeleton3D") as Skeleton3D
 
-	# Find the AnimationPlayer in the Animations node
-	var anims_node := $PlayerModel/Animations
+	# Find the AnimationPlayer in the animation set (compressed copy when built)
+	var anims_node := _instantiate_animations()
 	var source_anim_player: AnimationPlayer
 	if anims_node:
 		source_anim_player = _find_node_of_type(anims_node, "AnimationPlayer") as AnimationPlayer
 
 	if not source_anim_player or not skeleton:
 		push_warning("Could not set up animations - skeleton: %s, anim_player: %s" % [skeleton != null, source_anim_player != null])
+		if anims_node:
+			anims_node.free()
 		return
 
 	# Add AnimationPlayer as sibling to skeleton (under skeleton's parent)
@@ -154,6 +159,17 @@ func _setup_animations() -> void:
 		lib.add_animation(anim_name, new_anim)
 
 	animation_player.add_animation_library("", lib)
+	# The remapped copies don't reference the source scene
+	anims_node.free()
+
+
+## Instance of the animation set: the compressed copy when it has been built, else the source GLB
+func _instantiate_animations() -> Node:
+	var path := ANIMATIONS_PATH.get_base_dir().path_join(COMPRESSED_ANIMATIONS_DIR).path_join(ANIMATIONS_PATH.get_file())
+	if not ResourceLoader.exists(path):
+		path = ANIMATIONS_PATH
+	var packed := load(path) as PackedScene
+	return packed.instantiate() if packed else null
 
 
 func _setup_weapon() -> void:
@@ -255,7 +271,7 @@ func _load_character_model() -> void:
 
 	# Apply texture
 	if ResourceLoader.exists(texture_path):
-		_apply_player_texture_from_path(texture_path)
+		_apply_player_texture_from_path(texture_path, paths["uv_offset"])
 	else:
 		# Fallback: try default texture for this variation
 		var variation: String = PlayerConfig.get_variation(
@@ -282,20 +298,21 @@ func _swap_model(model_path: String) -> void:
 	var new_model := packed.instantiate() as Node3D
 	new_model.name = "Model"
 	$PlayerModel.add_child(new_model)
-	# Move Model before Animations to maintain child order
+	# Keep Model as the first child of PlayerModel
 	$PlayerModel.move_child(new_model, 0)
 	print("[Player] Loaded model: %s" % model_path)
 
 
-func _apply_player_texture_from_path(texture_path: String) -> void:
-	var texture := load(texture_path) as Texture2D
+func _apply_player_texture_from_path(texture_path: String, uv_offset := Vector3.ZERO) -> void:
+	var texture := TextureTiers.load_texture(texture_path)
 	if not texture:
 		push_warning("[Player] Failed to load texture: " + texture_path)
 		return
-	_apply_texture_to_materials(model, texture)
+	_apply_texture_to_materials(model, texture, uv_offset)
 
 
-func _apply_texture_to_materials(node: Node, texture: Texture2D) -> void:
+## uv_offset selects the skin's cell when texture is a variation atlas
+func _apply_texture_to_materials(node: Node, texture: Texture2D, uv_offset := Vector3.ZERO) -> void:
 	if node is MeshInstance3D:
 		var mesh_instance := node as MeshInstance3D
 		var mesh := mesh_instance.mesh
@@ -307,16 +324,18 @@ func _apply_texture_to_materials(node: Node, texture: Texture2D) -> void:
 					var new_mat := mat.duplicate() as StandardMaterial3D
 					new_mat.albedo_texture = texture
 					new_mat.texture_filter = BaseMaterial3D.TEXTURE_FILTER_NEAREST
+					new_mat.uv1_offset = uv_offset
 					mesh_instance.set_surface_override_material(surface_idx, new_mat)
 				elif mat == null:
 					# No material, create one
 					var new_mat := StandardMaterial3D.new()
 					new_mat.albedo_texture = texture
 					new_mat.texture_filter = BaseMaterial3D.TEXTURE_FILTER_NEAREST
+					new_mat.uv1_offset = uv_offset
 					mesh_instance.set_surface_override_material(surface_idx, new_mat)
 
 	for child in node.get_children():
-		_apply_texture_to_materials(child, texture)
+		_apply_texture_to_materials(child, texture, uv_offset)
 
 
 func _physics_process(delta: float) -> void:
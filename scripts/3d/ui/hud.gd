@@ -100,5 +100,5 @@ func _update_char_info() -> void:
 	var class_display := class_id
 	var class_data = ClassRegistry.get_class_data(class_id)
 	if class_data:
-		class_display = class_data.name
+		class_display = class_data.get_display_name()
 	char_info_label.text = "%s  Lv.%d  %s" % [char_name, level, class_display]
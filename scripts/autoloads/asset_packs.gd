@@ -0,0 +1,110 @@
+extends Node
+## AssetPacks — loads per-area resource packs on demand.
+## The manifest is written by scripts/tools/build_asset_packs.py. Without it
+## (editor, or an export that ships everything in one pack) nothing is loaded
+## and every call succeeds immediately.
+
+signal pack_loaded(pack_name: String)
+
+const MANIFEST_PATH := "res://data/asset_packs.json"
+const PACK_DIR := "packs"
+const DOWNLOAD_DIR := "user://packs"
+
+var _manifest: Dictionary = {}
+var _loaded: Dictionary = {}  # pack name → true
+
+
+func _ready() -> void:
+	load_manifest(MANIFEST_PATH)
+
+
+## Load a pack manifest; returns false if it's missing or invalid
+func load_manifest(path: String) -> bool:
+	_manifest = {}
+	if not FileAccess.file_exists(path):
+		return false
+	var json := JSON.new()
+	if json.parse(FileAccess.get_file_as_string(path)) != OK or not json.data is Dictionary:
+		push_warning("[AssetPacks] Invalid manifest: " + path)
+		return false
+	_manifest = json.data
+	return true
+
+
+## True when resources come from split packs (exported build with a manifest)
+func is_enabled() -> bool:
+	return not _manifest.is_empty() and not OS.has_feature("editor")
+
+
+## Pack names a scene needs; field scenes depend on the session's area
+func packs_for_scene(scene_path: String, area_id: String = "") -> Array:
+	var scenes: Dictionary = _manifest.get("scenes", {})
+	if scenes.has(scene_path):
+		return scenes[scene_path]
+	if scene_path in _manifest.get("field_scenes", []):
+		return packs_for_area(area_id)
+	return []
+
+
+func packs_for_area(area_id: String) -> Array:
+	return _manifest.get("areas", {}).get(area_id, [])
+
+
+func is_loaded(pack_name: String) -> bool:
+	return _loaded.has(pack_name)
+
+
+## Load every pack a scene needs (downloading first on web). Awaitable.
+func ensure_for_scene(scene_path: String) -> bool:
+	if not is_enabled():
+		return true
+	var area_id := str(SessionManager.get_session().get("area_id", ""))
+	var ok := true
+	for pack_name in packs_for_scene(scene_path, area_id):
+		var loaded: bool = await ensure_pack(str(pack_name))
+		if not loaded:
+			ok = false
+	return ok
+
+
+## Load one pack by name. Awaitable.
+func ensure_pack(pack_name: String) -> bool:
+	if _loaded.has(pack_name):
+		return true
+	var info: Dictionary = _manifest.get("packs", {}).get(pack_name, {})
+	if info.is_empty():
+		push_warning("[AssetPacks] Unknown pack: " + pack_name)
+		return false
+	var file_name := str(info.get("file", pack_name + ".pck"))
+	var local := OS.get_executable_path().get_base_dir().path_join(PACK_DIR).path_join(file_name)
+	if OS.has_feature("web"):
+		local = DOWNLOAD_DIR.path_join(file_name)
+		if not FileAccess.file_exists(local):
+			var downloaded: bool = await _download(file_name, local)
+			if not downloaded:
+				return false
+	if not ProjectSettings.load_resource_pack(local):
+		push_error("[AssetPacks] Failed to load pack: " + local)
+		return false
+	_loaded[pack_name] = true
+	print("[AssetPacks] Loaded %s (%d files)" % [pack_name, int(info.get("files", 0))])
+	pack_loaded.emit(pack_name)
+	return true
+
+
+func _download(file_name: String, local: String) -> bool:
+	DirAccess.make_dir_recursive_absolute(DOWNLOAD_DIR)
+	var base_url := str(JavaScriptBridge.eval("new URL('%s/', document.baseURI).href" % PACK_DIR))
+	var request := HTTPRequest.new()
+	request.download_file = local
+	add_child(request)
+	var err := request.request(base_url + file_name)
+	var ok := err == OK
+	if ok:
+		var result: Array = await request.request_completed
+		ok = int(result[0]) == HTTPRequest.RESULT_SUCCESS and int(result[1]) == 200
+	request.queue_free()
+	if not ok:
+		push_error("[AssetPacks] Download failed: " + base_url + file_name)
+		DirAccess.remove_absolute(local)
+	return ok
@@ -156,7 +156,7 @@ func _get_player_stats(character: Dictionary) -> Dictionary:
 	# Set bonuses
 	var set_bonus: Dictionary = {}
 	if not armor_name.is_empty() and not weapon_name.is_empty():
-		set_bonus = SetBonusRegistry.get_set_bonus_for_equipment(armor_name, weapon_name)
+		set_bonus = SetBonusRegistry.get_set_bonus_for_ids(frame_id, weapon_id)
 	player_attack += int(set_bonus.get("attack", 0))
 	player_defense += int(set_bonus.get("defense", 0))
 	player_accuracy += int(set_bonus.get("accuracy", 0))
@@ -504,12 +504,12 @@ func use_photon_art(art_id: String, target_index: int) -> Dictionary:
 	if weapon == null:
 		return {"hit": false, "message": "Unknown weapon"}
 	if weapon.get_weapon_type_name() != art.weapon_type:
-		return {"hit": false, "message": "%s requires a %s" % [art.name, art.weapon_type]}
+		return {"hit": false, "message": "%s requires a %s" % [art.get_display_name(), art.weapon_type]}
 
 	# Check class type match
 	var class_data = ClassRegistry.get_class_data(str(character.get("class_id", "")))
 	if class_data and art.class_type != "" and class_data.type != art.class_type:
-		return {"hit": false, "message": "%s cannot use %s" % [class_data.name, art.name]}
+		return {"hit": false, "message": "%s cannot use %s" % [class_data.get_display_name(), art.get_display_name()]}
 
 	# PP cost
 	var pp_cost: int = art.pp_cost
@@ -573,9 +573,9 @@ func use_photon_art(art_id: String, target_index: int) -> Dictionary:
 		result["meseta"] = int(enemy.get("meseta_reward", 0))
 		enemy_defeated.emit(target_index, enemy)
 		_check_wave_cleared()
-		result["message"] = "%s! %d/%d hits, %d total damage — %s defeated! (-%d PP)" % [art.name, hits_landed, hits, total_damage, str(enemy.get("name", "Enemy")), pp_cost]
+		result["message"] = "%s! %d/%d hits, %d total damage — %s defeated! (-%d PP)" % [art.get_display_name(), hits_landed, hits, total_damage, str(enemy.get("name", "Enemy")), pp_cost]
 	else:
-		result["message"] = "%s! %d/%d hits, %d total damage to %s. (-%d PP)" % [art.name, hits_landed, hits, total_damage, str(enemy.get("name", "Enemy")), pp_cost]
+		result["message"] = "%s! %d/%d hits, %d total damage to %s. (-%d PP)" % [art.get_display_name(), hits_landed, hits, total_damage, str(enemy.get("name", "Enemy")), pp_cost]
 
 	return result
 
@@ -776,7 +776,8 @@ func is_enemy_aggroed(index: int) -> bool:
 ## Generate drops when an enemy is defeated
 func generate_drops(enemy: Dictionary) -> Array:
 	var drops: Array = []
-	var enemy_name: String = str(enemy.get("name", ""))
+	# Spawn ids are source stems ("finjer-r"); drop tables key on EnemyData ids
+	var enemy_id: String = str(enemy.get("id", "")).replace("-", "_")
 	var is_boss: bool = enemy.get("is_boss", false)
 	var is_rare: bool = enemy.get("is_rare", false)
 
@@ -792,7 +793,7 @@ func generate_drops(enemy: Dictionary) -> Array:
 
 	# 2. Weapon drops from drop table
 	var drop_area: String = AREA_DROP_NAMES.get(_area_id, _area_id)
-	var weapon_drops: Array = DropRegistry.get_enemy_drops(_difficulty, drop_area, enemy_name)
+	var weapon_drops: PackedStringArray = DropRegistry.get_enemy_drops(_difficulty, drop_area, enemy_id)
 	if not weapon_drops.is_empty():
 		var weapon_chance := 0.03  # 3% for normal enemies
 		if is_rare:
@@ -800,8 +801,7 @@ func generate_drops(enemy: Dictionary) -> Array:
 		if is_boss:
 			weapon_chance = 0.25
 		if randf() < weapon_chance:
-			var drop_name: String = weapon_drops[randi() % weapon_drops.size()]
-			var weapon_id: String = drop_name.to_lower().replace(" ", "_").replace("'", "").replace("-", "_").replace("/", "_")
+			var weapon_id: String = weapon_drops[randi() % weapon_drops.size()]
 			# Check if high-rarity weapon should be unidentified
 			var weapon = WeaponRegistry.get_weapon(weapon_id)
 			if weapon and weapon.rarity >= 5:
@@ -21,9 +21,10 @@ func _load_all() -> void:
 func get_drop_table(difficulty: String):
 	return _drops.get(difficulty, null)
 
-func get_enemy_drops(difficulty: String, area: String, enemy_name: String) -> Array:
+## Item ids an enemy (EnemyData id) drops in an area
+func get_enemy_drops(difficulty: String, area: String, enemy_id: String) -> PackedStringArray:
 	var table = get_drop_table(difficulty)
 	if table == null:
-		return []
+		return PackedStringArray()
 	var area_data: Dictionary = table.area_drops.get(area, {})
-	return area_data.get(enemy_name, [])
+	return area_data.get(enemy_id, PackedStringArray())
@@ -2,8 +2,14 @@ extends Node
 ## EnemySpawner — generates enemy waves based on area, difficulty, and stage.
 ## Ported from psz-sketch/src/systems/stage/enemy-pools.ts
 
+const SPAWN_POOLS_PATH := "res://data/spawn_pools.tres"
+
 ## Enemy pools by area: { area_id: { common: [], uncommon: [], rare: [], bosses: [], elites: [] } }
 var _enemy_pools: Dictionary = {}
+## Cumulative spawn weights parallel to _enemy_pools: { area_id: { tier: PackedInt32Array } }
+var _pool_weights: Dictionary = {}
+## Name string ids from the spawn pool table: { enemy_id: StringTable id }
+var _enemy_names: Dictionary = {}
 
 ## Difficulty settings
 const ENEMY_COUNTS := {
@@ -37,62 +43,44 @@ func _ready() -> void:
 
 
 func _init_enemy_pools() -> void:
-	_enemy_pools = {
-		"gurhacia": {
-			"common": ["ghowl", "vulkure", "garapython"],
-			"uncommon": ["garahadan", "grimble", "tormatible"],
-			"rare": ["rappy", "booma-origin", "blaze-helion"],
-			"bosses": ["reyburn"],
-			"elites": ["helion"],
-		},
-		"rioh": {
-			"common": ["usanny", "usanimere", "reyhound"],
-			"uncommon": ["stagg", "hildeghana"],
-			"rare": ["rappy", "booma-origin", "hildegigas"],
-			"bosses": ["hildegao"],
-			"elites": ["hildegigas"],
-		},
-		"ozette": {
-			"common": ["porel", "pomarr", "hypao"],
-			"uncommon": ["vespao", "pelcatraz"],
-			"rare": ["rappy", "booma-origin", "pelcatobur"],
-			"bosses": ["octo-diablo"],
-			"elites": ["pelcatobur"],
-		},
-		"paru": {
-			"common": ["pobomma", "bolix", "izhirak-s6"],
-			"uncommon": ["goldix", "azherowa-b2", "froutang"],
-			"rare": ["ar-rappy", "booma-origin", "frunaked"],
-			"bosses": ["frunaked"],
-			"elites": ["froutang"],
-		},
-		"makara": {
-			"common": ["batt", "bullbatt", "rumole"],
-			"uncommon": ["kapantha", "rohjade"],
-			"rare": ["ar-rappy", "booma-origin", "rohcrysta"],
-			"bosses": ["rohcrysta"],
-			"elites": ["rohjade"],
-		},
-		"arca": {
-			"common": ["korse", "akorse", "finjer-r"],
-			"uncommon": ["finjer-g", "finjer-b"],
-			"rare": ["rab-rappy", "booma-origin"],
-			"bosses": ["blade-mother"],
-			"elites": ["akorse"],
-		},
-		"dark": {
-			"common": ["eulid", "eulidveil", "eulada"],
-			"uncommon": ["euladaveil", "arkzein", "arkzein-r"],
-			"rare": ["rab-rappy", "booma-origin", "derreo"],
-			"bosses": ["dark-falz", "chaos-mobius"],
-			"elites": ["derreo", "arkzein-r"],
-		},
-	}
+	_enemy_pools.clear()
+	_pool_weights.clear()
+	_enemy_names.clear()
+	if not ResourceLoader.exists(SPAWN_POOLS_PATH):
+		push_warning("[EnemySpawner] Spawn pool table not found: " + SPAWN_POOLS_PATH)
+		return
+	var table = load(SPAWN_POOLS_PATH)
+	if table == null:
+		return
+	for area_id in table.pools:
+		var area_pool: Dictionary = {}
+		var area_weights: Dictionary = {}
+		for tier in table.pools[area_id]:
+			area_pool[tier] = Array(table.get_tier_ids(area_id, tier))
+			area_weights[tier] = table.get_tier_weights(area_id, tier)
+		_enemy_pools[area_id] = area_pool
+		_pool_weights[area_id] = area_weights
+	_enemy_names = table.names
+	print("[EnemySpawner] Loaded spawn pools for ", _enemy_pools.size(), " areas")
+
+
+## Pick a weighted enemy id from an area tier (binary search over cumulative weights)
+func _pick_enemy(area_id: String, tier: String) -> String:
+	var ids: Array = _enemy_pools.get(area_id, {}).get(tier, [])
+	if ids.is_empty():
+		return ""
+	var cumulative: PackedInt32Array = _pool_weights.get(area_id, {}).get(tier, PackedInt32Array())
+	if cumulative.size() != ids.size():
+		return ids[randi() % ids.size()]
+	var roll := randi_range(0, cumulative[cumulative.size() - 1] - 1)
+	return ids[cumulative.bsearch(roll, false)]
 
 
 ## Generate a wave of enemies for the given area/difficulty/stage
 func generate_wave(area_id: String, difficulty: String, stage: int, wave: int) -> Array:
-	var pool: Dictionary = _enemy_pools.get(area_id, _enemy_pools.get("gurhacia", {}))
+	if not _enemy_pools.has(area_id):
+		area_id = "gurhacia"
+	var pool: Dictionary = _enemy_pools.get(area_id, {})
 	var counts: Dictionary = ENEMY_COUNTS.get(difficulty, ENEMY_COUNTS["normal"])
 	var weights: Dictionary = SPAWN_WEIGHTS.get(difficulty, SPAWN_WEIGHTS["normal"])
 	var diff_mult: float = DIFFICULTY_MULTIPLIERS.get(difficulty, 1.0)
@@ -101,16 +89,14 @@ func generate_wave(area_id: String, difficulty: String, stage: int, wave: int) -
 
 	# Last stage, last wave = boss
 	if stage >= 3 and wave >= 3:
-		var boss_list: Array = pool.get("bosses", [])
-		if not boss_list.is_empty():
+		var boss_id := _pick_enemy(area_id, "bosses")
+		if not boss_id.is_empty():
 			var boss_wave: Array = []
-			var boss_id: String = boss_list[randi() % boss_list.size()]
 			boss_wave.append(_create_enemy_instance(boss_id, "boss", diff_mult, stage))
 			# Add some regular enemies alongside boss
 			for i in range(randi_range(2, 4)):
-				var common_list: Array = pool.get("common", [])
-				if not common_list.is_empty():
-					var enemy_id: String = common_list[randi() % common_list.size()]
+				var enemy_id := _pick_enemy(area_id, "common")
+				if not enemy_id.is_empty():
 					boss_wave.append(_create_enemy_instance(enemy_id, "normal", diff_mult, stage))
 			return boss_wave
 
@@ -123,11 +109,11 @@ func generate_wave(area_id: String, difficulty: String, stage: int, wave: int) -
 		elif roll < int(weights.get("rare", 5)) + int(weights.get("uncommon", 25)):
 			tier = "uncommon"
 
-		var tier_list: Array = pool.get(tier, pool.get("common", []))
-		if tier_list.is_empty():
-			tier_list = pool.get("common", ["ghowl"])
-
-		var enemy_id: String = tier_list[randi() % tier_list.size()]
+		if not pool.has(tier):
+			tier = "common"
+		var enemy_id := _pick_enemy(area_id, tier)
+		if enemy_id.is_empty():
+			enemy_id = "ghowl"
 		var stat_tier := "normal"
 		if tier == "rare":
 			stat_tier = "elite"
@@ -190,6 +176,9 @@ const ENEMY_NAME_OVERRIDES := {
 }
 
 func _format_enemy_name(enemy_id: String) -> String:
+	var table_name: String = StringTable.get_text(int(_enemy_names.get(enemy_id, 0)))
+	if not table_name.is_empty():
+		return table_name
 	if ENEMY_NAME_OVERRIDES.has(enemy_id):
 		return ENEMY_NAME_OVERRIDES[enemy_id]
 	return enemy_id.replace("-", " ").capitalize()
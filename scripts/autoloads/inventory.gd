@@ -190,32 +190,32 @@ func _lookup_item(item_id: String) -> Dictionary:
 	var consumable = ConsumableRegistry.get_consumable(item_id)
 	if consumable:
 		var ms = int(consumable.max_stack) if int(consumable.max_stack) > 0 else 10
-		return {"name": consumable.name, "max_stack": ms}
+		return {"name": consumable.get_display_name(), "max_stack": ms}
 
 	# WeaponRegistry (non-stackable)
 	var weapon = WeaponRegistry.get_weapon(item_id)
 	if weapon:
-		return {"name": weapon.name, "max_stack": 1}
+		return {"name": weapon.get_display_name(), "max_stack": 1}
 
 	# ArmorRegistry (non-stackable)
 	var armor = ArmorRegistry.get_armor(item_id)
 	if armor:
-		return {"name": armor.name, "max_stack": 1}
+		return {"name": armor.get_display_name(), "max_stack": 1}
 
 	# UnitRegistry (non-stackable)
 	var unit = UnitRegistry.get_unit(item_id)
 	if unit:
-		return {"name": unit.name, "max_stack": 1}
+		return {"name": unit.get_display_name(), "max_stack": 1}
 
 	# MaterialRegistry (stackable materials)
 	var material = MaterialRegistry.get_material(item_id)
 	if material:
-		return {"name": material.name, "max_stack": 99}
+		return {"name": material.get_display_name(), "max_stack": 99}
 
 	# ModifierRegistry (grinders, elements)
 	var modifier = ModifierRegistry.get_modifier(item_id)
 	if modifier:
-		return {"name": modifier.name, "max_stack": 99}
+		return {"name": modifier.get_display_name(), "max_stack": 99}
 
 	# Technique disks (per-slot, format: disk_<tech_id>_<level>)
 	if item_id.begins_with("disk_"):
@@ -233,7 +233,7 @@ func _lookup_item(item_id: String) -> Dictionary:
 	if ResourceLoader.exists(mag_path):
 		var mag = load(mag_path)
 		if mag:
-			return {"name": mag.name, "max_stack": 1}
+			return {"name": mag.get_display_name(), "max_stack": 1}
 
 	# Unknown item — allow with default stack
 	return {"name": item_id, "max_stack": 10}
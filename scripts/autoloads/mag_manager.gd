@@ -3,6 +3,7 @@ extends Node
 ## Ported from psz-sketch/src/systems/mag-feeder + mag-evolutions
 
 const _RU = preload("res://scripts/utils/resource_utils.gd")
+const TABLES_PATH = "res://data/mag_tables.tres"
 
 signal mag_fed(item_id: String, stat_changes: Dictionary)
 signal mag_leveled_up(new_level: int)
@@ -29,6 +30,8 @@ const FEED_EFFECTS := {
 
 ## All mag form data keyed by id, loaded from .tres files
 var _mag_forms: Dictionary = {}
+## Precomputed evolution lookups (null → scan _mag_forms)
+var _tables: MagTables = null
 
 
 func _ready() -> void:
@@ -40,6 +43,7 @@ func _load_mag_forms() -> void:
 		var mag_data = load(path)
 		if mag_data:
 			_mag_forms[mag_data.id] = mag_data
+	_tables = load(TABLES_PATH) as MagTables if ResourceLoader.exists(TABLES_PATH) else null
 	print("[MagManager] Loaded %d mag forms" % _mag_forms.size())
 
 
@@ -133,16 +137,17 @@ func feed_mag(mag_state: Dictionary, item_id: String) -> Dictionary:
 func determine_form(mag_state: Dictionary) -> String:
 	var stats: Dictionary = mag_state.get("stats", {})
 	var level: int = get_level(mag_state)
+	var primary: String = _get_highest_stat(stats)
+	var secondary: String = _get_second_highest_stat(stats, primary)
+	var sec_val: int = int(stats.get(secondary, 0))
+	if _tables:
+		return _tables.get_form(level, primary, secondary, sec_val)
 
 	if level < 10:
 		return "mag"
 
-	var primary: String = _get_highest_stat(stats)
-	var secondary: String = _get_second_highest_stat(stats, primary)
-
 	# Stage 4: Level 60+, requires dual stats (secondary > 0)
 	if level >= 60:
-		var sec_val: int = int(stats.get(secondary, 0))
 		if sec_val > 0:
 			for form_id in _mag_forms:
 				var form = _mag_forms[form_id]
@@ -5,10 +5,12 @@ const _RU = preload("res://scripts/utils/resource_utils.gd")
 const MISSIONS_PATH = "res://data/missions/"
 const QUEST_AREAS_PATH = "res://data/quest_areas/"
 const QUEST_DEFS_PATH = "res://data/quest_definitions/"
+const UNLOCK_GRAPH_PATH = "res://data/unlock_graph.tres"
 
 var _missions: Dictionary = {}
 var _quest_areas: Dictionary = {}
 var _quest_defs: Dictionary = {}
+var _unlock_graph: UnlockGraph = null
 
 signal data_loaded()
 
@@ -16,6 +18,8 @@ func _ready() -> void:
 	_load_dir(MISSIONS_PATH, _missions, "MissionRegistry:missions")
 	_load_dir(QUEST_AREAS_PATH, _quest_areas, "MissionRegistry:quest_areas")
 	_load_dir(QUEST_DEFS_PATH, _quest_defs, "MissionRegistry:quest_defs")
+	if ResourceLoader.exists(UNLOCK_GRAPH_PATH):
+		_unlock_graph = load(UNLOCK_GRAPH_PATH) as UnlockGraph
 	data_loaded.emit()
 
 func _load_dir(path: String, dict: Dictionary, label: String) -> void:
@@ -49,3 +53,24 @@ func get_main_missions() -> Array:
 		if mission.is_main:
 			result.append(mission)
 	return result
+
+## Completed missions as an unlock mask; compute once per refresh and pass to is_mission_unlocked
+func get_completed_mask(completed: Array) -> PackedInt64Array:
+	if _unlock_graph == null:
+		return PackedInt64Array()
+	return _unlock_graph.completed_mask("missions", completed)
+
+## True when every mission `mission_id` requires is completed
+func is_mission_unlocked(mission_id: String, completed_mask: PackedInt64Array) -> bool:
+	if _unlock_graph and _unlock_graph.has_kind("missions"):
+		return _unlock_graph.is_unlocked("missions", mission_id, completed_mask)
+	var mission = get_mission(mission_id)
+	if mission == null:
+		return false
+	for req in mission.requires:
+		if not GameState.is_mission_completed(req):
+			return false
+	return true
+
+func get_unlock_graph() -> UnlockGraph:
+	return _unlock_graph
@@ -24,6 +24,10 @@ const BODY_COLORS: Array[String] = ["Red", "Blue", "Green", "Blue & Red", "Black
 const HAIR_COLORS: Array[String] = ["Blonde", "Brown", "Black"]
 const SKIN_TONES: Array[String] = ["Light", "Medium", "Dark"]
 const HEAD_VARIATIONS := 4  # 0-3
+const ATLAS_MANIFEST_PATH := "res://assets/player/%s/%s_atlas.json"
+
+# Variation → parsed atlas manifest ({} when the variation isn't atlased)
+var _atlas_cache: Dictionary = {}
 
 
 ## Get the variation directory name for a class + variation index (e.g. "pc_032")
@@ -49,7 +53,27 @@ func get_texture_path(class_id: String, variation_index: int, hair_color: int, s
 	return "res://assets/player/%s/textures/%s.png" % [variation, texture_name]
 
 
-## Get both model and texture paths from a character dictionary
+## Get model path, texture path and UV offset for an appearance combo.
+## Uses the variation's texture atlas when build_player_atlases.py made one:
+## the atlas model's UVs cover one cell and uv_offset selects the skin.
+func get_appearance_paths(class_id: String, variation_index: int, hair_color: int, skin_tone: int, body_color: int) -> Dictionary:
+	var variation := get_variation(class_id, variation_index)
+	var texture_path := get_texture_path(class_id, variation_index, hair_color, skin_tone, body_color)
+	var paths := {
+		"model_path": get_model_path(class_id, variation_index),
+		"texture_path": texture_path,
+		"uv_offset": Vector3.ZERO,
+	}
+	var cell := resolve_atlas_cell(get_atlas(variation), texture_path.get_file().get_basename())
+	if not cell.is_empty():
+		var base := "res://assets/player/%s/" % variation
+		paths["model_path"] = base + str(cell["model"])
+		paths["texture_path"] = base + str(cell["atlas"])
+		paths["uv_offset"] = cell["uv_offset"]
+	return paths
+
+
+## Get both model and texture paths (plus atlas uv_offset) from a character dictionary
 func get_paths_for_character(character: Dictionary) -> Dictionary:
 	var class_id: String = character.get("class_id", "humar")
 	var appearance: Dictionary = character.get("appearance", {})
@@ -57,7 +81,35 @@ func get_paths_for_character(character: Dictionary) -> Dictionary:
 	var hair: int = int(appearance.get("hair_color_index", 0))
 	var skin: int = int(appearance.get("skin_tone_index", 0))
 	var body: int = int(appearance.get("body_color_index", 0))
+	return get_appearance_paths(class_id, vi, hair, skin, body)
+
+
+## Atlas manifest for a variation (pc_XXX_atlas.json), or {} if it has none
+func get_atlas(variation: String) -> Dictionary:
+	if not _atlas_cache.has(variation):
+		var manifest := {}
+		var path := ATLAS_MANIFEST_PATH % [variation, variation]
+		if FileAccess.file_exists(path):
+			var json := JSON.new()
+			if json.parse(FileAccess.get_file_as_string(path)) == OK and json.data is Dictionary:
+				manifest = json.data
+		_atlas_cache[variation] = manifest
+	return _atlas_cache[variation]
+
+
+## Look up a texture in an atlas manifest: {model, atlas, uv_offset} or {} if not atlased
+func resolve_atlas_cell(manifest: Dictionary, texture_name: String) -> Dictionary:
+	var cells: Dictionary = manifest.get("cells", {})
+	if not cells.has(texture_name):
+		return {}
+	var cell: Array = cells[texture_name]
+	var atlases: Array = manifest.get("atlases", [])
+	var scale: Array = manifest.get("uv_scale", [1.0, 1.0])
+	var atlas_index := int(cell[0])
+	if atlas_index < 0 or atlas_index >= atlases.size():
+		return {}
 	return {
-		"model_path": get_model_path(class_id, vi),
-		"texture_path": get_texture_path(class_id, vi, hair, skin, body),
+		"model": manifest.get("model", ""),
+		"atlas": atlases[atlas_index],
+		"uv_offset": Vector3(float(cell[1]) * float(scale[0]), float(cell[2]) * float(scale[1]), 0.0),
 	}
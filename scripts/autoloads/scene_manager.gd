@@ -150,6 +150,9 @@ func _fade_to_scene(scene_path: String) -> void:
 	tween.tween_property(_fade_rect, "color:a", 1.0, 0.15)
 	await tween.finished
 
+	# Load the area's resource packs (no-op unless the export is split)
+	await AssetPacks.ensure_for_scene(scene_path)
+
 	# Change scene
 	get_tree().change_scene_to_file(scene_path)
 	scene_changed.emit(scene_path)
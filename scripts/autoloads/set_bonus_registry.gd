@@ -3,8 +3,10 @@ extends Node
 
 const _RU = preload("res://scripts/utils/resource_utils.gd")
 const SET_BONUSES_PATH = "res://data/set_bonuses/"
+const TABLE_PATH = "res://data/set_bonus_table.tres"
 
 var _set_bonuses: Dictionary = {}
+var _table: SetBonusTable = null
 
 signal set_bonuses_loaded()
 
@@ -19,6 +21,7 @@ func _load_all() -> void:
 		var res = load(path)
 		if res and not res.id.is_empty():
 			_set_bonuses[res.id] = res
+	_table = load(TABLE_PATH) as SetBonusTable if ResourceLoader.exists(TABLE_PATH) else null
 	print("[SetBonusRegistry] Loaded ", _set_bonuses.size(), " set bonuses")
 	set_bonuses_loaded.emit()
 
@@ -31,9 +34,18 @@ func get_all_set_bonuses() -> Array:
 	return _set_bonuses.values()
 
 
-## Check if equipped armor+weapon have a set bonus. Returns bonus dict or empty.
-func get_set_bonus_for_equipment(armor_name: String, weapon_name: String) -> Dictionary:
+## Check if equipped armor+weapon (content ids) have a set bonus. Returns bonus dict or empty.
+func get_set_bonus_for_equipment(armor_id: String, weapon_id: String) -> Dictionary:
 	for bonus in _set_bonuses.values():
-		if bonus.armor == armor_name and weapon_name in bonus.weapons:
+		if bonus.armor == armor_id and weapon_id in bonus.weapons:
 			return bonus.bonuses.duplicate()
 	return {}
+
+
+## Set bonus for an equipped armor and weapon by id (one lookup in the
+## precomputed table). Returns the shared bonus dict — don't modify it.
+func get_set_bonus_for_ids(armor_id: String, weapon_id: String) -> Dictionary:
+	if _table == null:
+		return get_set_bonus_for_equipment(armor_id, weapon_id)
+	var bonus = _set_bonuses.get(_table.get_set_bonus_id(armor_id, weapon_id), null)
+	return bonus.bonuses if bonus else {}
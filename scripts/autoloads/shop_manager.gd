@@ -2,7 +2,7 @@ extends Node
 ## ShopManager — handles buy/sell transactions.
 ## Ported from psz-sketch/src/api/shop.ts
 
-signal item_bought(item_name: String, cost: int)
+signal item_bought(item_id: String, cost: int)
 signal item_sold(item_name: String, meseta_gained: int)
 
 var _last_refresh_count: int = -1
@@ -16,8 +16,8 @@ func get_shop_inventory(shop_id: String) -> Array:
 	return shop.items.duplicate()
 
 
-## Buy an item from a shop
-func buy_item(shop_id: String, item_name: String, quantity: int = 1) -> bool:
+## Buy an item (content id) from a shop
+func buy_item(shop_id: String, item_id: String, quantity: int = 1) -> bool:
 	var shop = ShopRegistry.get_shop(shop_id)
 	if shop == null:
 		return false
@@ -25,7 +25,7 @@ func buy_item(shop_id: String, item_name: String, quantity: int = 1) -> bool:
 	# Find item in shop
 	var shop_item: Dictionary = {}
 	for item in shop.items:
-		if item.get("item", "") == item_name:
+		if item.get("item", "") == item_id:
 			shop_item = item
 			break
 
@@ -46,9 +46,6 @@ func buy_item(shop_id: String, item_name: String, quantity: int = 1) -> bool:
 	if int(character.get("meseta", 0)) < cost:
 		return false
 
-	# Convert shop item name to registry ID (e.g. "Monomate" → "monomate")
-	var item_id: String = item_name.to_lower().replace(" ", "_").replace("-", "_").replace("/", "_")
-
 	# Check if inventory can hold the item
 	if not Inventory.can_add_item(item_id):
 		return false
@@ -57,11 +54,11 @@ func buy_item(shop_id: String, item_name: String, quantity: int = 1) -> bool:
 	character["meseta"] = int(character["meseta"]) - cost
 	GameState.meseta = int(character["meseta"])
 
-	# Add item to inventory
-	Inventory.add_item(item_id, quantity)
+	# Add item to inventory (entries like "Lassi Soul x 5" sell a bundle)
+	Inventory.add_item(item_id, quantity * int(shop_item.get("quantity", 1)))
 
-	item_bought.emit(item_name, cost)
-	print("[ShopManager] Bought %dx %s for %d meseta" % [quantity, item_name, cost])
+	item_bought.emit(item_id, cost)
+	print("[ShopManager] Bought %dx %s for %d meseta" % [quantity, item_id, cost])
 	return true
 
 
@@ -0,0 +1,56 @@
+extends Node
+## StringTable — names and descriptions for all generated content.
+## Content resources store string ids (name_id, details_id, ...) and drop
+## tables store item name ids; the text lives once in data/string_table.tres,
+## written by scripts/tools/string_table.py. UI code resolves ids with
+## get_text, so swapping that one file (or its ja column) localizes every
+## registry without a re-import. Listed first in the autoloads so registries
+## can read names from their _ready.
+
+const TABLE_PATH := "res://data/string_table.tres"
+const LANGUAGES: Array[String] = ["en", "ja"]
+
+## Display language ("en" or "ja")
+var language: String = "en"
+
+var _table: StringTableData = null
+
+
+func _ready() -> void:
+	load_table(TABLE_PATH)
+	if TranslationServer.get_locale().begins_with("ja"):
+		language = "ja"
+
+
+## Load a string table; returns false (and clears it) if it's missing or invalid
+func load_table(path: String) -> bool:
+	_table = null
+	if not ResourceLoader.exists(path):
+		return false
+	_table = load(path) as StringTableData
+	if not _table:
+		push_warning("[StringTable] Invalid string table: " + path)
+		return false
+	print("[StringTable] Loaded %d strings" % _table.size())
+	return true
+
+
+func is_loaded() -> bool:
+	return _table != null
+
+
+func set_language(value: String) -> void:
+	if value not in LANGUAGES:
+		push_warning("[StringTable] Unknown language: " + value)
+		return
+	language = value
+
+
+## Text for a string id in the current language (for UI)
+func get_text(string_id: int) -> String:
+	return _table.get_text(string_id, language) if _table else ""
+
+
+## English text for a string id (what registries and references key on)
+func get_english(string_id: int) -> String:
+	return _table.get_text(string_id) if _table else ""
@@ -136,18 +136,18 @@ func can_learn(character: Dictionary, technique_id: String, level: int) -> Dicti
 
 	# Empty technique_limits means no technique access (CASTs)
 	if technique_limits.is_empty():
-		return {"allowed": false, "reason": "%s cannot use techniques" % class_data.name}
+		return {"allowed": false, "reason": "%s cannot use techniques" % class_data.get_display_name()}
 
 	# Check if the class has access to this technique group
 	if not technique_limits.has(group):
-		return {"allowed": false, "reason": "%s cannot learn %s techniques" % [class_data.name, tech["name"]]}
+		return {"allowed": false, "reason": "%s cannot learn %s techniques" % [class_data.get_display_name(), tech["name"]]}
 
 	var max_level: int = int(technique_limits.get(group, 0))
 	if max_level <= 0:
-		return {"allowed": false, "reason": "%s cannot learn %s" % [class_data.name, tech["name"]]}
+		return {"allowed": false, "reason": "%s cannot learn %s" % [class_data.get_display_name(), tech["name"]]}
 
 	if level > max_level:
-		return {"allowed": false, "reason": "%s can only learn %s up to Lv.%d" % [class_data.name, tech["name"], max_level]}
+		return {"allowed": false, "reason": "%s can only learn %s up to Lv.%d" % [class_data.get_display_name(), tech["name"], max_level]}
 
 	# Check player level requirement
 	var required_level: int = get_disk_required_level(level)
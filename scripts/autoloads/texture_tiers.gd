@@ -0,0 +1,130 @@
+extends Node
+## TextureTiers — picks downscaled texture variants from the quality setting.
+## Tiers are generated by scripts/tools/build_texture_tiers.py; without its
+## manifest every path resolves to the full-resolution source.
+
+const MANIFEST_PATH := "res://assets/tiers/manifest.json"
+const QUALITY_LEVELS: Array[String] = ["full", "half", "quarter"]
+const ASSETS_PREFIX := "res://assets/"
+
+## Current texture quality ("full", "half" or "quarter")
+var quality: String = "full"
+
+# Tier name → {scale, root}; source path (relative to assets/) → {sha256, tiers}
+var _tiers: Dictionary = {}
+var _textures: Dictionary = {}
+
+
+func _ready() -> void:
+	load_manifest(MANIFEST_PATH)
+	quality = load_quality()
+	if quality != "full":
+		print("[TextureTiers] Texture quality: %s (%d textures have tiers)" % [quality, _textures.size()])
+
+
+## Load a tier manifest; returns false (and clears tiers) if it's missing or invalid
+func load_manifest(path: String) -> bool:
+	_tiers = {}
+	_textures = {}
+	if not FileAccess.file_exists(path):
+		return false
+	var json := JSON.new()
+	if json.parse(FileAccess.get_file_as_string(path)) != OK or not json.data is Dictionary:
+		push_warning("[TextureTiers] Invalid manifest: " + path)
+		return false
+	var data: Dictionary = json.data
+	_tiers = data.get("tiers", {})
+	_textures = data.get("textures", {})
+	return true
+
+
+## Quality from user://graphics.cfg > res://data/graphics.cfg > "half" on web, "full" elsewhere
+static func load_quality() -> String:
+	var fallback := "half" if OS.has_feature("web") else "full"
+	var cfg := ConfigFile.new()
+	if cfg.load("user://graphics.cfg") != OK:
+		if cfg.load("res://data/graphics.cfg") != OK:
+			return fallback
+	var value := str(cfg.get_value("graphics", "texture_quality", fallback))
+	return value if value in QUALITY_LEVELS else fallback
+
+
+## Change the quality (affects textures loaded from now on) and optionally persist it
+func set_quality(value: String, save := true) -> void:
+	if value not in QUALITY_LEVELS:
+		push_warning("[TextureTiers] Unknown texture quality: " + value)
+		return
+	quality = value
+	if save:
+		var cfg := ConfigFile.new()
+		cfg.load("user://graphics.cfg")
+		cfg.set_value("graphics", "texture_quality", value)
+		cfg.save("user://graphics.cfg")
+
+
+## Path of the texture to load for `path` at the current quality
+func resolve(path: String) -> String:
+	if quality == "full" or not path.begins_with(ASSETS_PREFIX):
+		return path
+	var entry: Dictionary = _textures.get(path.substr(ASSETS_PREFIX.length()), {})
+	var available: Array = entry.get("tiers", [])
+	# Fall back to the next larger tier when this one wasn't built (too small / odd size)
+	var index := QUALITY_LEVELS.find(quality)
+	while index > 0:
+		var tier := QUALITY_LEVELS[index]
+		if tier in available and _tiers.has(tier):
+			return str(_tiers[tier].get("root", "")) + path.substr(ASSETS_PREFIX.length())
+		index -= 1
+	return path
+
+
+## load() a texture at the current quality, falling back to the source on failure
+func load_texture(path: String) -> Texture2D:
+	var tiered := resolve(path)
+	if tiered != path and ResourceLoader.exists(tiered):
+		var texture := load(tiered) as Texture2D
+		if texture:
+			return texture
+	return load(path) as Texture2D
+
+
+## Swap tiered textures into every mesh material under `node` (for GLB-embedded textures)
+func apply_to_node(node: Node) -> void:
+	if quality == "full" or _textures.is_empty():
+		return
+	if node is MeshInstance3D:
+		var mesh_inst := node as MeshInstance3D
+		for i in range(mesh_inst.get_surface_override_material_count()):
+			var mat := mesh_inst.get_active_material(i)
+			var replaced := _tiered_material(mat)
+			if replaced:
+				mesh_inst.set_surface_override_material(i, replaced)
+	for child in node.get_children():
+		apply_to_node(child)
+
+
+func _tiered_material(mat: Material) -> Material:
+	if mat is StandardMaterial3D:
+		var tex: Texture2D = (mat as StandardMaterial3D).albedo_texture
+		var tiered := _tiered_texture(tex)
+		if tiered:
+			var new_mat := mat.duplicate() as StandardMaterial3D
+			new_mat.albedo_texture = tiered
+			return new_mat
+	elif mat is ShaderMaterial:
+		var tex = (mat as ShaderMaterial).get_shader_parameter("albedo_texture")
+		var tiered := _tiered_texture(tex as Texture2D)
+		if tiered:
+			var new_mat := mat.duplicate() as ShaderMaterial
+			new_mat.set_shader_parameter("albedo_texture", tiered)
+			return new_mat
+	return null
+
+
+func _tiered_texture(tex: Texture2D) -> Texture2D:
+	if not tex or tex.resource_path.is_empty():
+		return null
+	var tiered := resolve(tex.resource_path)
+	if tiered == tex.resource_path or not ResourceLoader.exists(tiered):
+		return null
+	return load(tiered) as Texture2D
@@ -11,11 +11,8 @@ enum ArmorType {
 ## Unique identifier (derived from filename)
 @export var id: String = ""
 
-## Display name
-@export var name: String = ""
-
-## Japanese name
-@export var japanese_name: String = ""
+## StringTable id of the display name (its "ja" entry is the Japanese name)
+@export var name_id: int = 0
 
 ## Armor category
 @export var type: ArmorType = ArmorType.ARMOR
@@ -66,6 +63,16 @@ enum ArmorType {
 ## Icon texture
 @export var icon: Texture2D
 
+## English name (registries and references match on it)
+var name: String:
+	get:
+		return StringTable.get_english(name_id)
+
+
+## Name in the StringTable language, for UI text
+func get_display_name() -> String:
+	return StringTable.get_text(name_id)
+
 
 ## Get armor type as string
 func get_type_name() -> String:
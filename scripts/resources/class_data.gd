@@ -2,7 +2,7 @@ class_name ClassData extends Resource
 ## Resource definition for character classes, matching psz-sketch class schema.
 
 @export var id: String = ""
-@export var name: String = ""
+@export var name_id: int = 0  # StringTable id
 @export var race: String = ""   # Human, Newman, Cast
 @export var gender: String = "" # Male, Female
 @export var type: String = ""   # Hunter, Ranger, Force
@@ -12,15 +12,31 @@ class_name ClassData extends Resource
 ## Stats dict: { "hp": { "1": 82, "20": 258, ... }, "attack": {...}, ... }
 @export var stats: Dictionary = {}
 
+## Per-level stats precomputed at import: { "hp": PackedInt32Array, ... } indexed by level - 1
+@export var level_stats: Dictionary = {}
+
 ## Technique limits: { "foieBartaZonde": 15, "grants": 0, ... } (0 = can't use)
 @export var technique_limits: Dictionary = {}
 
 ## Trap limits: { "fire": [5,6,7,8,9,10], ... } or empty if no traps
 @export var trap_limits: Dictionary = {}
 
+## English name (registries and references match on it)
+var name: String:
+	get:
+		return StringTable.get_english(name_id)
+
+
+## Name in the StringTable language, for UI text
+func get_display_name() -> String:
+	return StringTable.get_text(name_id)
+
 
 ## Get stat value at a specific level (interpolates between defined breakpoints)
 func get_stat_at_level(stat_name: String, level: int) -> int:
+	var table: PackedInt32Array = level_stats.get(stat_name, PackedInt32Array())
+	if level >= 1 and level <= table.size():
+		return table[level - 1]
 	if not stats.has(stat_name):
 		return 0
 	var stat_table: Dictionary = stats[stat_name]
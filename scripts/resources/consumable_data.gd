@@ -2,9 +2,8 @@ class_name ConsumableData extends Resource
 ## Resource definition for consumable items.
 
 @export var id: String = ""
-@export var name: String = ""
-@export var japanese_name: String = ""
-@export var details: String = ""
+@export var name_id: int = 0  # StringTable id; "ja" entry is the Japanese name
+@export var details_id: int = 0  # StringTable id
 @export_range(1, 7) var rarity: int = 1
 @export var max_stack: int = 10
 @export var pso_world_id: int = 0
@@ -12,3 +11,23 @@ class_name ConsumableData extends Resource
 ## Buy/sell price
 @export var buy_price: int = 0
 @export var sell_price: int = 0
+
+## English name (registries and references match on it)
+var name: String:
+	get:
+		return StringTable.get_english(name_id)
+
+## English details text
+var details: String:
+	get:
+		return StringTable.get_english(details_id)
+
+
+## Name in the StringTable language, for UI text
+func get_display_name() -> String:
+	return StringTable.get_text(name_id)
+
+
+## Details text in the StringTable language, for UI text
+func get_display_details() -> String:
+	return StringTable.get_text(details_id)
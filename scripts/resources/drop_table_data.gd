@@ -3,5 +3,5 @@ class_name DropTableData extends Resource
 
 @export var id: String = ""
 @export var difficulty: String = ""  # "normal", "hard", "super-hard"
-## Area drops: { "areaName": { "enemyName": ["item1", "item2"] } }
+## Area drops: { "areaName": { enemy_id: PackedStringArray(item ids) } }
 @export var area_drops: Dictionary = {}
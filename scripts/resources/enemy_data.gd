@@ -21,11 +21,8 @@ enum BehaviorType {
 ## Unique identifier (derived from filename)
 @export var id: String = ""
 
-## Display name
-@export var name: String = ""
-
-## Japanese name
-@export var japanese_name: String = ""
+## StringTable id of the display name (its "ja" entry is the Japanese name)
+@export var name_id: int = 0
 
 ## Element type (affects damage weaknesses)
 @export var element: Element = Element.NATIVE
@@ -83,6 +80,16 @@ enum BehaviorType {
 ## Collision height
 @export var collision_height: float = 1.5
 
+## English name (registries and references match on it)
+var name: String:
+	get:
+		return StringTable.get_english(name_id)
+
+
+## Name in the StringTable language, for UI text
+func get_display_name() -> String:
+	return StringTable.get_text(name_id)
+
 
 ## Get element as string
 func get_element_name() -> String:
@@ -1,10 +1,16 @@
 class_name ExperienceTable extends Resource
 ## Experience table for leveling. Array of { "level": int, "totalExp": int, "expToNext": int }
+## total_exp / exp_to_next are the same values precomputed at import as arrays
+## indexed by level - 1; lookups fall back to scanning `levels` without them.
 
 @export var levels: Array[Dictionary] = []
+@export var total_exp: PackedInt64Array = PackedInt64Array()
+@export var exp_to_next: PackedInt64Array = PackedInt64Array()
 
 
 func get_exp_for_level(level: int) -> int:
+	if level >= 1 and level <= total_exp.size():
+		return total_exp[level - 1]
 	for entry in levels:
 		if int(entry.get("level", 0)) == level:
 			return int(entry.get("totalExp", 0))
@@ -12,16 +18,21 @@ func get_exp_for_level(level: int) -> int:
 
 
 func get_exp_to_next(level: int) -> int:
+	if level >= 1 and level <= exp_to_next.size():
+		return exp_to_next[level - 1]
 	for entry in levels:
 		if int(entry.get("level", 0)) == level:
 			return int(entry.get("expToNext", 0))
 	return 0
 
 
-func get_level_for_exp(total_exp: int) -> int:
+func get_level_for_exp(total: int) -> int:
+	if not total_exp.is_empty():
+		# Index of the first threshold above `total` is the level reached
+		return maxi(total_exp.bsearch(total, false), 1)
 	var result_level := 1
 	for entry in levels:
-		if total_exp >= int(entry.get("totalExp", 0)):
+		if total >= int(entry.get("totalExp", 0)):
 			result_level = int(entry.get("level", 1))
 		else:
 			break
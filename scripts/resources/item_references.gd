@@ -0,0 +1,7 @@
+class_name ItemReferences extends Resource
+## Item name index written by scripts/tools/item_references.py, which the
+## importer resolves shop, drop, set bonus and reward names through.
+## ids: { display name: content id }, kinds: { content id: data/ category }
+
+@export var ids: Dictionary = {}
+@export var kinds: Dictionary = {}
@@ -2,10 +2,19 @@ class_name MagData extends Resource
 ## Resource definition for mags (companion creatures).
 
 @export var id: String = ""
-@export var name: String = ""
-@export var japanese_name: String = ""
+@export var name_id: int = 0  # StringTable id; "ja" entry is the Japanese name
 @export var stage: String = ""  # "2", "3", "4", "rare"
 @export var evolution_level: int = 0
 @export var evolution_requirement: Dictionary = {}
 @export var photon_blast: String = ""
 @export var pso_world_id: int = 0
+
+## English name (registries and references match on it)
+var name: String:
+	get:
+		return StringTable.get_english(name_id)
+
+
+## Name in the StringTable language, for UI text
+func get_display_name() -> String:
+	return StringTable.get_text(name_id)
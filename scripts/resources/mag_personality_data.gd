@@ -2,11 +2,20 @@ class_name MagPersonalityData extends Resource
 ## Resource definition for mag personalities.
 
 @export var id: String = ""
-@export var name: String = ""
-@export var japanese_name: String = ""
+@export var name_id: int = 0  # StringTable id; "ja" entry is the Japanese name
 @export var category: String = ""  # offensive, defensive, recovery, special
 @export var tier: String = ""      # basic, advanced
 @export var unlock_level: int = 0
 @export var favorite_food: String = ""
 @export var switch_from: String = ""
 @export var triggers: Dictionary = {}
+
+## English name (registries and references match on it)
+var name: String:
+	get:
+		return StringTable.get_english(name_id)
+
+
+## Name in the StringTable language, for UI text
+func get_display_name() -> String:
+	return StringTable.get_text(name_id)
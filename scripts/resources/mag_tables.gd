@@ -0,0 +1,33 @@
+class_name MagTables extends Resource
+## Mag evolution and personality lookups, built by scripts/tools/mag_tables.py.
+## evolution_levels: stage thresholds, highest first; evolution_forms[i] is that
+##   stage's { "primary" | "primary/secondary": form_id } (lower-case stat names)
+## personality_switches: { "kind" | "kind_a/kind_b" (sorted): [{id, feeds, level}] }
+
+@export var base_form: String = "mag"
+@export var evolution_levels: PackedInt32Array = PackedInt32Array()
+@export var evolution_forms: Array = []
+@export var personality_switches: Dictionary = {}
+
+
+## Form for a mag level and its top two stats; a pair key needs secondary_value > 0
+func get_form(level: int, primary: String, secondary: String, secondary_value: int) -> String:
+	for i in range(evolution_levels.size()):
+		if level < evolution_levels[i]:
+			continue
+		var forms: Dictionary = evolution_forms[i]
+		if secondary_value > 0 and forms.has(primary + "/" + secondary):
+			return str(forms[primary + "/" + secondary])
+		if forms.has(primary):
+			return str(forms[primary])
+	return base_form
+
+
+## Switch candidates ({id, feeds, level}) for a run of feeds of one or two kinds
+func get_personality_switches(feed_kinds: Array) -> Array:
+	var kinds: Array = []
+	for kind in feed_kinds:
+		if not kinds.has(str(kind)):
+			kinds.append(str(kind))
+	kinds.sort()
+	return personality_switches.get("/".join(PackedStringArray(kinds)), [])
@@ -2,8 +2,27 @@ class_name MaterialData extends Resource
 ## Resource definition for materials (stat enhancement items).
 
 @export var id: String = ""
-@export var name: String = ""
-@export var japanese_name: String = ""
-@export var details: String = ""
+@export var name_id: int = 0  # StringTable id; "ja" entry is the Japanese name
+@export var details_id: int = 0  # StringTable id
 @export_range(1, 7) var rarity: int = 6
 @export var pso_world_id: int = 0
+
+## English name (registries and references match on it)
+var name: String:
+	get:
+		return StringTable.get_english(name_id)
+
+## English details text
+var details: String:
+	get:
+		return StringTable.get_english(details_id)
+
+
+## Name in the StringTable language, for UI text
+func get_display_name() -> String:
+	return StringTable.get_text(name_id)
+
+
+## Details text in the StringTable language, for UI text
+func get_display_details() -> String:
+	return StringTable.get_text(details_id)
@@ -2,10 +2,21 @@ class_name MissionData extends Resource
 ## Resource definition for missions.
 
 @export var id: String = ""
-@export var name: String = ""
+@export var name_id: int = 0  # StringTable id
 @export var area: String = ""
 @export var is_main: bool = false
 @export var is_secret: bool = false
 @export var requires: PackedStringArray = []
 ## Rewards per difficulty: { "normal": {item, quantity, meseta}, "hard": {...}, "superHard": {...} }
+## where item is a content id
 @export var rewards: Dictionary = {}
+
+## English name (registries and references match on it)
+var name: String:
+	get:
+		return StringTable.get_english(name_id)
+
+
+## Name in the StringTable language, for UI text
+func get_display_name() -> String:
+	return StringTable.get_text(name_id)
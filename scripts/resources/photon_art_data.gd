@@ -2,7 +2,7 @@ class_name PhotonArtData extends Resource
 ## Resource definition for photon arts (special attacks/techniques).
 
 @export var id: String = ""
-@export var name: String = ""
+@export var name_id: int = 0  # StringTable id
 @export var weapon_type: String = ""
 @export var class_type: String = ""  # Hunter, Ranger, Force
 @export var attack_mod: float = 0.0
@@ -13,3 +13,13 @@ class_name PhotonArtData extends Resource
 @export var area: float = 0.0
 @export var hits: int = 1
 @export var notes: String = ""
+
+## English name (registries and references match on it)
+var name: String:
+	get:
+		return StringTable.get_english(name_id)
+
+
+## Name in the StringTable language, for UI text
+func get_display_name() -> String:
+	return StringTable.get_text(name_id)
@@ -4,8 +4,18 @@ class_name QuestAreaData extends Resource
 @export var id: String = ""
 @export var area_id: String = ""
 @export var area_name: String = ""
-@export var description: String = ""
+@export var description_id: int = 0  # StringTable id
 @export var unlock_condition: String = ""
 @export var recommended_level: int = 1
 @export var environment: String = ""
 @export var quest_count: int = 0
+
+## English description
+var description: String:
+	get:
+		return StringTable.get_english(description_id)
+
+
+## Description in the StringTable language, for UI text
+func get_display_description() -> String:
+	return StringTable.get_text(description_id)
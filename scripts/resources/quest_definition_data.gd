@@ -6,9 +6,19 @@ class_name QuestDefinitionData extends Resource
 @export var quest_name: String = ""
 @export var quest_type: String = ""  # "story", "side"
 @export var area: String = ""
-@export var description: String = ""
+@export var description_id: int = 0  # StringTable id
 @export var difficulties: Array[Dictionary] = []
 @export var requirements: Dictionary = {}
 @export var objectives: Array[Dictionary] = []
 @export var is_repeatable: bool = false
 @export var is_secret: bool = false
+
+## English description
+var description: String:
+	get:
+		return StringTable.get_english(description_id)
+
+
+## Description in the StringTable language, for UI text
+func get_display_description() -> String:
+	return StringTable.get_text(description_id)
@@ -2,6 +2,6 @@ class_name SetBonusData extends Resource
 ## Resource definition for armor set bonuses.
 
 @export var id: String = ""
-@export var armor: String = ""
-@export var weapons: PackedStringArray = []
+@export var armor: String = ""  # Armor id
+@export var weapons: PackedStringArray = []  # Weapon ids
 @export var bonuses: Dictionary = {}  # { "attack": 10, "defense": 5, ... }
@@ -0,0 +1,9 @@
+class_name SetBonusTable extends Resource
+## Set bonus matches by content id, built by scripts/tools/set_bonus_table.py.
+## Pairs: { "armor_id/weapon_id": set_bonus_id }
+
+@export var pairs: Dictionary = {}
+
+
+func get_set_bonus_id(armor_id: String, weapon_id: String) -> String:
+	return str(pairs.get(armor_id + "/" + weapon_id, ""))
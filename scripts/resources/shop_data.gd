@@ -2,7 +2,28 @@ class_name ShopData extends Resource
 ## Resource definition for shop inventories.
 
 @export var id: String = ""
-@export var name: String = ""
-@export var description: String = ""
-## Items: [ { "item": "Monomate", "category": "consumable", "cost": 50, "currency": "Meseta" } ]
+@export var name_id: int = 0  # StringTable id
+@export var description_id: int = 0  # StringTable id
+## Items: [ { "item": "monomate", "category": "consumable", "cost": 50, "currency": "Meseta" } ]
+## "item" and "tradeIn" are content ids; "quantity" / "tradeInQuantity" are set for bundles
 @export var items: Array[Dictionary] = []
+
+## English name (registries and references match on it)
+var name: String:
+	get:
+		return StringTable.get_english(name_id)
+
+## English description
+var description: String:
+	get:
+		return StringTable.get_english(description_id)
+
+
+## Name in the StringTable language, for UI text
+func get_display_name() -> String:
+	return StringTable.get_text(name_id)
+
+
+## Description in the StringTable language, for UI text
+func get_display_description() -> String:
+	return StringTable.get_text(description_id)
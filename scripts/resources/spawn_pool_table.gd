@@ -0,0 +1,25 @@
+class_name SpawnPoolTable extends Resource
+## Spawn pools derived from enemy locations by tools/convert_psz_data.py.
+## Pools: { area_id: { tier: { "ids": PackedStringArray, "cumulative": PackedInt32Array } } }
+## "cumulative" holds running weight totals parallel to "ids".
+
+@export var pools: Dictionary = {}
+@export var names: Dictionary = {}  # { enemy_id: name StringTable id }
+
+
+func get_area_ids() -> Array:
+	return pools.keys()
+
+
+func get_tier_ids(area_id: String, tier: String) -> PackedStringArray:
+	var entry: Dictionary = pools.get(area_id, {}).get(tier, {})
+	return entry.get("ids", PackedStringArray())
+
+
+func get_tier_weights(area_id: String, tier: String) -> PackedInt32Array:
+	var entry: Dictionary = pools.get(area_id, {}).get(tier, {})
+	return entry.get("cumulative", PackedInt32Array())
+
+
+func get_enemy_name(enemy_id: String) -> String:
+	return StringTable.get_text(int(names.get(enemy_id, 0)))
@@ -0,0 +1,21 @@
+class_name StageSpatialIndex extends Resource
+## Per-map grid of portals, spawns and obstacles, built by scripts/tools/stage_spatial_index.py.
+## maps: { map_id: { "kinds": PackedStringArray, "ids": PackedStringArray,
+##   "bounds": PackedFloat32Array (min_x, min_z, max_x, max_z per item),
+##   "cells": { Vector2i: PackedInt32Array(item indices) } } }
+## Positions are stage-local (the map config's space), cells are cell_size metres square.
+
+@export var cell_size: float = 8.0
+@export var maps: Dictionary = {}
+
+
+func has_map(map_id: String) -> bool:
+	return maps.has(map_id)
+
+
+## A SpatialGrid holding the map's indexed items (empty for unknown maps)
+func create_grid(map_id: String) -> SpatialGrid:
+	var grid := SpatialGrid.new(cell_size)
+	if maps.has(map_id):
+		grid.load_map(maps[map_id])
+	return grid
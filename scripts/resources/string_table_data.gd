@@ -0,0 +1,19 @@
+class_name StringTableData extends Resource
+## Interned content strings written by scripts/tools/string_table.py.
+## en/ja are parallel columns indexed by string id; id 0 is "".
+
+@export var en: PackedStringArray = PackedStringArray()
+@export var ja: PackedStringArray = PackedStringArray()
+
+
+func size() -> int:
+	return en.size()
+
+
+## Text for a string id in "en" or "ja"; Japanese falls back to English when untranslated
+func get_text(string_id: int, language: String = "en") -> String:
+	if string_id <= 0 or string_id >= en.size():
+		return ""
+	if language == "ja" and string_id < ja.size() and not ja[string_id].is_empty():
+		return ja[string_id]
+	return en[string_id]
@@ -2,10 +2,19 @@ class_name UnitData extends Resource
 ## Resource definition for unit (equipment slot) items.
 
 @export var id: String = ""
-@export var name: String = ""
-@export var japanese_name: String = ""
+@export var name_id: int = 0  # StringTable id; "ja" entry is the Japanese name
 @export_range(1, 7) var rarity: int = 1
 @export var category: String = ""  # Power, Guard, HP, Hit, Mind, Swift
 @export var effect: String = ""
 @export var effect_value: int = 0
 @export var pso_world_id: int = 0
+
+## English name (registries and references match on it)
+var name: String:
+	get:
+		return StringTable.get_english(name_id)
+
+
+## Name in the StringTable language, for UI text
+func get_display_name() -> String:
+	return StringTable.get_text(name_id)
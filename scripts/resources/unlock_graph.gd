@@ -0,0 +1,69 @@
+class_name UnlockGraph extends Resource
+## Mission / quest prerequisites as bitsets, built by scripts/tools/unlock_graph.py.
+## graphs: { "missions" | "quests": { "order": PackedStringArray, "words": int,
+##   "direct": PackedInt64Array, "transitive": PackedInt64Array } }
+## Bit i of a mask is order[i]; each id has `words` 64-bit words in direct/transitive.
+
+@export var graphs: Dictionary = {}
+
+var _index: Dictionary = {}  # kind → { id: bit index }, built on first use
+
+
+func has_kind(kind: String) -> bool:
+	return graphs.has(kind)
+
+
+## Bit index of an id, -1 if it isn't in the graph
+func index_of(kind: String, id: String) -> int:
+	if not _index.has(kind):
+		var ids: Dictionary = {}
+		var order: PackedStringArray = graphs.get(kind, {}).get("order", PackedStringArray())
+		for i in range(order.size()):
+			ids[order[i]] = i
+		_index[kind] = ids
+	return int(_index[kind].get(id, -1))
+
+
+## Mask of completed ids (unknown ids are ignored)
+func completed_mask(kind: String, completed: Array) -> PackedInt64Array:
+	var words: int = int(graphs.get(kind, {}).get("words", 1))
+	var mask := PackedInt64Array()
+	mask.resize(words)
+	for id in completed:
+		var index := index_of(kind, str(id))
+		if index >= 0:
+			mask[index / 64] |= 1 << (index % 64)
+	return mask
+
+
+## True when every prerequisite of `id` is in `completed`; `transitive` also
+## requires everything further upstream
+func is_unlocked(kind: String, id: String, completed: PackedInt64Array, transitive := false) -> bool:
+	var graph: Dictionary = graphs.get(kind, {})
+	var index := index_of(kind, id)
+	if index < 0:
+		return false
+	var words: int = int(graph.get("words", 1))
+	var masks: PackedInt64Array = graph.get("transitive" if transitive else "direct", PackedInt64Array())
+	for w in range(words):
+		var need: int = masks[index * words + w]
+		var have: int = completed[w] if w < completed.size() else 0
+		if (have & need) != need:
+			return false
+	return true
+
+
+## Every prerequisite upstream of `id`, in unlock order
+func get_prerequisites(kind: String, id: String) -> PackedStringArray:
+	var result := PackedStringArray()
+	var graph: Dictionary = graphs.get(kind, {})
+	var index := index_of(kind, id)
+	if index < 0:
+		return result
+	var words: int = int(graph.get("words", 1))
+	var masks: PackedInt64Array = graph.get("transitive", PackedInt64Array())
+	var order: PackedStringArray = graph.get("order", PackedStringArray())
+	for i in range(order.size()):
+		if (masks[index * words + i / 64] & (1 << (i % 64))) != 0:
+			result.append(order[i])
+	return result
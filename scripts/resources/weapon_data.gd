@@ -23,11 +23,8 @@ enum WeaponType {
 ## Unique identifier (derived from filename)
 @export var id: String = ""
 
-## Display name
-@export var name: String = ""
-
-## Japanese name
-@export var japanese_name: String = ""
+## StringTable id of the display name (its "ja" entry is the Japanese name)
+@export var name_id: int = 0
 
 ## Rarity (1-7 stars)
 @export_range(1, 7) var rarity: int = 1
@@ -62,7 +59,14 @@ enum WeaponType {
 ## Element level
 @export var element_level: int = 0
 
-## Photon Arts available on this weapon
+## Photon Arts available on this weapon, as PhotonArtRegistry ids
+@export var photon_art_ids: PackedStringArray = []
+
+## Per-weapon values that differ from the catalog art: { art_id: { field: value } }
+@export var photon_art_overrides: Dictionary = {}
+
+## Inline Photon Arts missing from the catalog (name, attack_mod, accuracy_mod, pp_used, element,
+## slot: position among all of the weapon's arts)
 @export var photon_arts: Array[Dictionary] = []
 
 ## Classes that can use this weapon
@@ -80,6 +84,16 @@ enum WeaponType {
 ## Icon texture
 @export var icon: Texture2D
 
+## English name (registries and references match on it)
+var name: String:
+	get:
+		return StringTable.get_english(name_id)
+
+
+## Name in the StringTable language, for UI text
+func get_display_name() -> String:
+	return StringTable.get_text(name_id)
+
 
 ## Get weapon type as string
 func get_weapon_type_name() -> String:
@@ -103,6 +117,31 @@ func get_weapon_type_name() -> String:
 	return "Unknown"
 
 
+## All Photon Arts on this weapon as dictionaries (id, name, attack_mod,
+## accuracy_mod, pp_used, element) in slot order
+func get_photon_arts() -> Array[Dictionary]:
+	var result: Array[Dictionary] = []
+	for art_id in photon_art_ids:
+		var art = PhotonArtRegistry.get_art(art_id)
+		if art == null:
+			continue
+		var overrides: Dictionary = photon_art_overrides.get(art_id, {})
+		result.append({
+			"id": art_id,
+			"name": art.name,
+			"attack_mod": overrides.get("attack_mod", art.attack_mod),
+			"accuracy_mod": overrides.get("accuracy_mod", art.accuracy_mod),
+			"pp_used": overrides.get("pp_cost", art.pp_cost),
+			"element": overrides.get("element", "-"),
+		})
+	for pa in photon_arts:
+		var entry: Dictionary = pa.duplicate()
+		var slot: int = int(entry.get("slot", result.size()))
+		entry.erase("slot")
+		result.insert(mini(slot, result.size()), entry)
+	return result
+
+
 ## Get attack at specific grind level
 func get_attack_at_grind(grind: int) -> int:
 	if max_grind <= 0:
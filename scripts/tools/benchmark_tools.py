@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""Benchmark the content importers and exporters on synthetic content.
+
+Generates psz-sketch trees at several scales (generate_sketch_content.py),
+runs each tool on them as a subprocess into a scratch directory, and
+records wall time, CPU time, throughput (files/s, MB/s of input) and peak
+RSS per tool and scale. Results are written as JSON, tagged with the git
+commit, so two runs can be compared with --compare.
+
+Tools:
+  import_content      scripts/tools/import_content.py (cold: fresh data dir + DB)
+  convert_psz_data    tools/convert_psz_data.py (cold)
+  content_pipeline    scripts/tools/content_pipeline.py, all categories (cold)
+  content_pipeline_warm  same again on the populated output (unchanged content)
+  export_enemy_list   scripts/tools/export_enemy_list.py on convert_psz_data's enemies
+
+Usage:
+    python3 scripts/tools/benchmark_tools.py
+    python3 scripts/tools/benchmark_tools.py --scales 1,10 --repeat 3
+    python3 scripts/tools/benchmark_tools.py --compare build/benchmarks/<earlier>.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+GODOT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, '..', '..'))
+BENCH_DIR = os.path.join(GODOT_ROOT, 'build', 'benchmarks')
+WORK_DIR = os.path.join(GODOT_ROOT, 'build', 'bench-work')
+
+DEFAULT_SCALES = [1, 10, 100]
+DEFAULT_THRESHOLD = 0.15
+
+IMPORT_CONTENT_SOURCES = [
+    'classes', 'consumables', 'units', 'photon-arts', 'mags', 'missions',
+    'quest-areas', 'quest-definitions', 'materials', 'set-bonuses', 'drops',
+    'shops', 'mag-personalities', 'modifiers', 'experience',
+]
+CONVERT_PSZ_SOURCES = ['weapons', 'armors', 'enemies']
+
+
+def tree_size(directory: str, suffix: str) -> tuple[int, int]:
+    """(files, bytes) of the files ending in `suffix` directly under `directory`."""
+    files = total = 0
+    if os.path.isdir(directory):
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(suffix) and entry.is_file():
+                    files += 1
+                    total += entry.stat().st_size
+    return files, total
+
+
+def content_size(content_dir: str, sources) -> tuple[int, int]:
+    files = total = 0
+    for source in sources:
+        f, b = tree_size(os.path.join(content_dir, source), '.json')
+        files += f
+        total += b
+    return files, total
+
+
+def run_measured(cmd: list[str]) -> dict:
+    """Run `cmd`, returning wall/CPU time, peak RSS and exit status of that child."""
+    start = time.perf_counter()
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    stderr = proc.stderr.read()
+    _, status, usage = os.wait4(proc.pid, 0)
+    wall = time.perf_counter() - start
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    proc.stderr.close()
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    rss = usage.ru_maxrss if sys.platform == 'darwin' else usage.ru_maxrss * 1024
+    return {
+        'wall_s': wall,
+        'cpu_s': usage.ru_utime + usage.ru_stime,
+        'peak_rss_mb': rss / (1024 * 1024),
+        'returncode': proc.returncode,
+        'stderr': stderr.decode('utf-8', 'replace')[-2000:],
+    }
+
+
+def tool_runs(sketch: str, work: str) -> list[tuple]:
+    """(name, command, setup, size) for every tool; size() returns input (files, bytes)."""
+    py = sys.executable
+    content = os.path.join(sketch, 'src', 'content')
+    out = {name: os.path.join(work, name) for name in
+           ('import_content', 'convert_psz_data', 'content_pipeline')}
+
+    def fresh(path):
+        def setup():
+            shutil.rmtree(path, ignore_errors=True)
+            os.makedirs(path)
+        return setup
+
+    def keep():
+        pass
+
+    def db(name):
+        return os.path.join(out[name], 'content.db')
+
+    pipeline_cmd = [py, os.path.join(SCRIPT_DIR, 'content_pipeline.py'), sketch,
+                    '--output', os.path.join(out['content_pipeline'], 'data'),
+                    '--db', db('content_pipeline')]
+    return [
+        ('import_content',
+         [py, os.path.join(SCRIPT_DIR, 'import_content.py'), sketch,
+          '--output', os.path.join(out['import_content'], 'data'), '--db', db('import_content')],
+         fresh(out['import_content']),
+         lambda: content_size(content, IMPORT_CONTENT_SOURCES)),
+        ('convert_psz_data',
+         [py, os.path.join(GODOT_ROOT, 'tools', 'convert_psz_data.py'), '--source', content,
+          '--output', os.path.join(out['convert_psz_data'], 'data'), '--db', db('convert_psz_data')],
+         fresh(out['convert_psz_data']),
+         lambda: content_size(content, CONVERT_PSZ_SOURCES)),
+        ('content_pipeline', pipeline_cmd, fresh(out['content_pipeline']),
+         lambda: content_size(content, IMPORT_CONTENT_SOURCES + CONVERT_PSZ_SOURCES)),
+        ('content_pipeline_warm', pipeline_cmd, keep,
+         lambda: content_size(content, IMPORT_CONTENT_SOURCES + CONVERT_PSZ_SOURCES)),
+        ('export_enemy_list',
+         [py, os.path.join(SCRIPT_DIR, 'export_enemy_list.py'),
+          '--enemies', os.path.join(out['convert_psz_data'], 'data', 'enemies'),
+          '--output', os.path.join(work, 'enemies.json')],
+         keep,
+         lambda: tree_size(os.path.join(out['convert_psz_data'], 'data', 'enemies'), '.tres')),
+    ]
+
+
+def median(values: list[float]) -> float:
+    values = sorted(values)
+    mid = len(values) // 2
+    return values[mid] if len(values) % 2 else (values[mid - 1] + values[mid]) / 2
+
+
+def bench_scale(scale: int, seed: int, repeat: int, tools, template, work_root: str) -> list[dict]:
+    work = os.path.join(work_root, f'{scale}x')
+    sketch = os.path.join(work, 'psz-sketch')
+    manifest_path = os.path.join(sketch, 'generator.json')
+    manifest = None
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        template_path = os.path.abspath(template) if template else None
+        if (manifest.get('scale'), manifest.get('seed'), manifest.get('template')) != (scale, seed, template_path):
+            manifest = None
+    if manifest is None:
+        # Generated in a child process: ru_maxrss carries over across exec,
+        # so this process must stay small for the RSS numbers to be the tools' own
+        print(f"Generating {scale}x content...")
+        cmd = [sys.executable, os.path.join(SCRIPT_DIR, 'generate_sketch_content.py'), sketch,
+               '--scale', str(scale), '--seed', str(seed)]
+        if template:
+            cmd += ['--template', template]
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL)
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    print(f"{scale}x: {manifest['files']} files, {manifest['bytes'] / 1e6:.1f} MB")
+
+    results = []
+    for name, cmd, setup, size in tool_runs(sketch, work):
+        if tools and name not in tools:
+            continue
+        runs = []
+        for _ in range(repeat):
+            setup()
+            runs.append(run_measured(cmd))
+            if runs[-1]['returncode'] != 0:
+                break
+        files, total = size()
+        wall = median([r['wall_s'] for r in runs])
+        result = {
+            'tool': name,
+            'scale': scale,
+            'files': files,
+            'bytes': total,
+            'runs': len(runs),
+            'wall_s': round(wall, 4),
+            'cpu_s': round(median([r['cpu_s'] for r in runs]), 4),
+            'files_per_s': round(files / wall, 1) if wall > 0 else None,
+            'mb_per_s': round(total / 1e6 / wall, 3) if wall > 0 else None,
+            'peak_rss_mb': round(max(r['peak_rss_mb'] for r in runs), 1),
+            'returncode': runs[-1]['returncode'],
+        }
+        if result['returncode'] != 0:
+            result['stderr'] = runs[-1]['stderr']
+        results.append(result)
+        status = '' if result['returncode'] == 0 else f"  FAILED (exit {result['returncode']})"
+        print(f"  {name:<22} {result['wall_s']:8.2f}s  {result['files_per_s'] or 0:9.0f} files/s  "
+              f"{result['mb_per_s'] or 0:7.2f} MB/s  {result['peak_rss_mb']:7.1f} MB RSS{status}")
+    return results
+
+
+def git_commit() -> str | None:
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=GODOT_ROOT,
+                             capture_output=True, text=True, check=True)
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'],
+                               cwd=GODOT_ROOT, capture_output=True, text=True).stdout.strip()
+        return out.stdout.strip() + ('-dirty' if dirty else '')
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(previous: dict, current: dict, threshold: float) -> list[str]:
+    """Print per tool/scale deltas; return the regressions beyond `threshold`."""
+    before = {(r['tool'], r['scale']): r for r in previous.get('results', [])}
+    regressions = []
+    print(f"\nCompared with {previous.get('commit')} ({previous.get('timestamp')}):")
+    for r in current['results']:
+        old = before.get((r['tool'], r['scale']))
+        if not old or not old.get('wall_s') or not old.get('peak_rss_mb'):
+            continue
+        wall = r['wall_s'] / old['wall_s'] - 1.0
+        rss = r['peak_rss_mb'] / old['peak_rss_mb'] - 1.0
+        flags = []
+        if wall > threshold:
+            flags.append('time')
+        if rss > threshold:
+            flags.append('memory')
+        label = f"{r['tool']} @ {r['scale']}x"
+        print(f"  {label:<32} time {wall:+7.1%}  rss {rss:+7.1%}"
+              + (f"  REGRESSION ({', '.join(flags)})" if flags else ''))
+        if flags:
+            regressions.append(label)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark content importers/exporters on synthetic content")
+    parser.add_argument('--scales', default=','.join(str(s) for s in DEFAULT_SCALES),
+                        help="Comma-separated content scales (default: 1,10,100)")
+    parser.add_argument('--tools', help="Comma-separated subset of tools to run")
+    parser.add_argument('--repeat', type=int, default=1, help="Runs per tool; the median is reported")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--template', help="Real psz-sketch checkout to scale instead of data/")
+    parser.add_argument('--work', default=WORK_DIR, help="Scratch directory for content and outputs")
+    parser.add_argument('--output', help="Results JSON (default: build/benchmarks/<time>-<commit>.json)")
+    parser.add_argument('--compare', help="Earlier results JSON to diff against")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="Relative slowdown/growth counted as a regression (default 0.15)")
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help="Exit 1 when --compare finds a regression")
+    args = parser.parse_args()
+
+    scales = [int(s) for s in args.scales.split(',') if s.strip()]
+    tools = {t.strip() for t in args.tools.split(',')} if args.tools else None
+
+    commit = git_commit()
+    results = []
+    for scale in scales:
+        results.extend(bench_scale(scale, args.seed, args.repeat, tools, args.template, args.work))
+
+    report = {
+        'commit': commit,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'seed': args.seed,
+        'repeat': args.repeat,
+        'results': results,
+    }
+    output = args.output
+    if not output:
+        stamp = time.strftime('%Y%m%d-%H%M%S')
+        output = os.path.join(BENCH_DIR, f"{stamp}-{commit or 'nogit'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults → {output}")
+
+    failed = [r for r in results if r['returncode'] != 0]
+    regressions = []
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), report, args.threshold)
+    if failed:
+        print(f"{len(failed)} tool runs failed")
+        sys.exit(1)
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""Split the exported assets into a base pack, a shared pack and one pack per area.
+
+Uses the resource graph (resource_graph.py) to compute load closures:
+
+  base      static closure of project.godot (autoloads + main scene); ships
+            in the main export and is all startup needs
+  area_*    per field area (GridGenerator.AREA_CONFIG): everything under
+            assets/environments/<folder>/ plus the models of the enemies in
+            the area's spawn pool (data/spawn_pools.tres), with their static
+            closures
+  city      the city hub environments (city, counter, warp)
+  shared    files two or more of the above packs need, minus base
+
+Texture tier copies (assets/tiers/, see resource_graph.py) follow their
+source texture into its pack, so whichever quality TextureTiers picks is
+loaded with the area.
+
+Writes build/packs/<pack>.files (one res:// path per line) and the runtime
+manifest data/asset_packs.json, which the AssetPacks autoload reads to load
+an area's packs before SceneManager changes to its scenes. Dynamically
+reachable files that belong to no area stay in base; orphans are left out
+of every pack and listed.
+
+--write-presets adds/updates a "Pack: <name>" export preset per pack (export
+filter "resources") plus a "<preset> (base)" variant of the main preset, and
+--godot BIN then runs `BIN --headless --export-pack` for each pack.
+
+Usage:
+    python3 scripts/tools/build_asset_packs.py
+    python3 scripts/tools/build_asset_packs.py --write-presets --godot godot
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+
+from resource_graph import ResourceGraph
+from tool_metrics import add_metrics_arguments, metrics_from_args
+from tres_reader import read_tres
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+GODOT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, '..', '..'))
+PACKS_DIR = os.path.join(GODOT_ROOT, 'build', 'packs')
+MANIFEST_PATH = os.path.join(GODOT_ROOT, 'data', 'asset_packs.json')
+GRID_GENERATOR = os.path.join(GODOT_ROOT, 'scripts', '3d', 'field', 'grid_generator.gd')
+
+AREA_CONFIG_RE = re.compile(r'"(\w+)":\s*\{"prefix":\s*"(\w+)",\s*"folder":\s*"(\w+)"')
+CITY_FOLDERS = ('city', 'counter', 'warp')
+CITY_SCENES = ('res://scenes/3d/city/city_counter.tscn', 'res://scenes/3d/city/city_market.tscn',
+               'res://scenes/3d/city/city_warp.tscn')
+# Scenes whose content depends on the session's area_id
+FIELD_SCENES = ('res://scenes/3d/field/valley_field.tscn', 'res://scenes/2d/valley_field.tscn')
+PRESET_PREFIX = 'Pack: '
+MANIFEST_VERSION = 1
+
+
+def read_area_config(path: str = GRID_GENERATOR) -> dict[str, dict]:
+    """area_id → {prefix, folder} parsed from GridGenerator.AREA_CONFIG."""
+    with open(path) as f:
+        text = f.read()
+    start = text.index('const AREA_CONFIG')
+    block = text[start:text.index('\n}', start)]
+    return {area: {'prefix': prefix, 'folder': folder}
+            for area, prefix, folder in AREA_CONFIG_RE.findall(block)}
+
+
+def enemy_models(root: str) -> dict[str, str]:
+    """Enemy id → assets/enemies/<model> directory name."""
+    models = {}
+    enemies_dir = os.path.join(root, 'data', 'enemies')
+    if os.path.isdir(enemies_dir):
+        for name in sorted(os.listdir(enemies_dir)):
+            if name.endswith('.tres'):
+                props = read_tres(os.path.join(enemies_dir, name))
+                enemy_id = str(props.get('id', name[:-5]))
+                models[enemy_id] = str(props.get('model_id') or enemy_id)
+    return models
+
+
+def area_enemies(root: str) -> dict[str, set[str]]:
+    path = os.path.join(root, 'data', 'spawn_pools.tres')
+    if not os.path.exists(path):
+        return {}
+    pools = read_tres(path).get('pools', {})
+    return {area: {i for tier in tiers.values() for i in tier.get('ids', [])}
+            for area, tiers in pools.items()}
+
+
+def under(files, prefix: str) -> set[str]:
+    return {f for f in files if f.startswith(prefix)}
+
+
+def plan_packs(graph: ResourceGraph, root: str) -> tuple[dict[str, set[str]], dict, list[str]]:
+    """(pack → files, area_id → pack names, orphans)."""
+    areas = read_area_config(os.path.join(root, 'scripts', '3d', 'field', 'grid_generator.gd'))
+    models = enemy_models(root)
+    enemies = area_enemies(root)
+
+    base = graph.closure(graph.roots, dynamic=False, variants=True)
+    closures: dict[str, set[str]] = {}
+    for area_id, cfg in areas.items():
+        seeds = under(graph.files, f"res://assets/environments/{cfg['folder']}/")
+        for enemy_id in sorted(enemies.get(area_id, ())):
+            model = models.get(enemy_id, enemy_id)
+            seeds |= under(graph.files, f'res://assets/enemies/{model}/')
+        closures[f"area_{cfg['folder']}"] = graph.closure(seeds, dynamic=False, variants=True)
+    city_seeds = set(CITY_SCENES) & set(graph.files)
+    for folder in CITY_FOLDERS:
+        city_seeds |= under(graph.files, f'res://assets/environments/{folder}/')
+    closures['city'] = graph.closure(city_seeds, dynamic=False, variants=True)
+
+    owners: dict[str, list[str]] = {}
+    for pack, files in closures.items():
+        for f in files - base:
+            owners.setdefault(f, []).append(pack)
+    packs = {'base': set(base), 'shared': set()}
+    packs.update({pack: set() for pack in closures})
+    for f, owned in owners.items():
+        packs[owned[0] if len(owned) == 1 else 'shared'].add(f)
+
+    reachable = graph.closure(graph.roots, dynamic=True, variants=True)
+    assigned = set().union(*packs.values())
+    packs['base'] |= reachable - assigned
+    orphans = sorted(set(graph.files) - reachable - assigned)
+
+    area_packs = {area_id: ['shared', f"area_{cfg['folder']}"] for area_id, cfg in areas.items()}
+    return packs, area_packs, orphans
+
+
+def pack_bytes(graph: ResourceGraph, files: set[str]) -> int:
+    return sum(graph.files[f] for f in files)
+
+
+def write_manifest(path: str, packs: dict[str, set[str]], area_packs: dict, graph: ResourceGraph):
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'packs': {name: {'file': f'{name}.pck', 'files': len(files), 'bytes': pack_bytes(graph, files)}
+                  for name, files in sorted(packs.items()) if name != 'base' and files},
+        'areas': {area: [p for p in names if packs.get(p)] for area, names in sorted(area_packs.items())},
+        'scenes': {scene: [p for p in ('shared', 'city') if packs.get(p)] for scene in CITY_SCENES},
+        'field_scenes': list(FIELD_SCENES),
+    }
+    with open(path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+        f.write('\n')
+
+
+def _sections(text: str) -> list[tuple[str, str]]:
+    """Split export_presets.cfg into (header, body) pairs."""
+    parts = re.split(r'^(\[[^\]]+\])\s*$', text, flags=re.M)
+    return [(parts[i], parts[i + 1]) for i in range(1, len(parts) - 1, 2)]
+
+
+def write_presets(path: str, packs: dict[str, set[str]], base_preset: str):
+    """Add/replace one resources-filter preset per pack (and a base variant of `base_preset`)."""
+    with open(path) as f:
+        sections = _sections(f.read())
+    presets: list[tuple[str, str, str]] = []  # (name, preset body, options body)
+    by_index: dict[str, dict] = {}
+    for header, body in sections:
+        match = re.match(r'\[preset\.(\d+)(\.options)?\]', header)
+        if match:
+            by_index.setdefault(match.group(1), {})['options' if match.group(2) else 'preset'] = body
+    for index in sorted(by_index, key=int):
+        entry = by_index[index]
+        name = re.search(r'^name="([^"]*)"', entry.get('preset', ''), re.M).group(1)
+        presets.append((name, entry.get('preset', ''), entry.get('options', '\n')))
+
+    base_name = f'{base_preset} (base)'
+    keep = [p for p in presets if not p[0].startswith(PRESET_PREFIX) and p[0] != base_name]
+    template = next((p for p in keep if p[0] == base_preset), None)
+    if template is None:
+        raise SystemExit(f"ERROR: export preset not found: {base_preset}")
+
+    def variant(name: str, files: set[str], export_path: str) -> tuple[str, str, str]:
+        body = template[1]
+        body = re.sub(r'^name=".*"$', f'name="{name}"', body, flags=re.M)
+        body = re.sub(r'^export_filter=".*"$', 'export_filter="resources"', body, flags=re.M)
+        body = re.sub(r'^export_path=".*"$', f'export_path="{export_path}"', body, flags=re.M)
+        listing = ', '.join(f'"{f}"' for f in sorted(files))
+        body = re.sub(r'^(export_filter=.*)$', rf'\1\nexport_files=PackedStringArray({listing})',
+                      body, count=1, flags=re.M)
+        return name, body, template[2]
+
+    export_dir = os.path.dirname(re.search(r'^export_path="([^"]*)"', template[1], re.M).group(1))
+    out = keep + [variant(base_name, packs['base'], re.search(r'^export_path="([^"]*)"',
+                                                             template[1], re.M).group(1))]
+    for pack, files in sorted(packs.items()):
+        if pack != 'base' and files:
+            out.append(variant(PRESET_PREFIX + pack, files, f'{export_dir}/packs/{pack}.pck'))
+
+    lines = []
+    for i, (_, body, options) in enumerate(out):
+        lines.append(f'[preset.{i}]\n{body.rstrip()}\n\n[preset.{i}.options]\n{options.rstrip()}\n')
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines))
+
+
+def export_packs(godot: str, packs: dict[str, set[str]], out_dir: str, root: str) -> bool:
+    ok = True
+    for pack, files in sorted(packs.items()):
+        if pack == 'base' or not files:
+            continue
+        target = os.path.join(out_dir, f'{pack}.pck')
+        cmd = [godot, '--headless', '--path', root, '--export-pack', PRESET_PREFIX + pack, target]
+        print(f"  {' '.join(cmd)}")
+        if subprocess.run(cmd).returncode != 0:
+            print(f"  FAILED {pack}")
+            ok = False
+    return ok
+
+
+def _mb(size: int) -> str:
+    return f"{size / (1024 * 1024):.2f} MB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Split assets into base, shared and per-area packs")
+    parser.add_argument('--root', default=GODOT_ROOT, help="Godot project root")
+    parser.add_argument('--out', default=PACKS_DIR, help="Pack file lists / .pck output (default: build/packs)")
+    parser.add_argument('--manifest', default=MANIFEST_PATH, help="Runtime manifest (default: data/asset_packs.json)")
+    parser.add_argument('--write-presets', action='store_true', help="Update export_presets.cfg with pack presets")
+    parser.add_argument('--base-preset', default='Web', help="Main export preset the packs are split from")
+    parser.add_argument('--godot', metavar='BIN', help="Godot binary; export every pack with --export-pack")
+    parser.add_argument('--jobs', '-j', type=int, default=None, help="Worker processes for the graph")
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+
+    if not os.path.exists(os.path.join(args.root, 'project.godot')):
+        print(f"ERROR: no project.godot in {args.root}")
+        sys.exit(1)
+
+    metrics = metrics_from_args('build_asset_packs', args)
+    with metrics.stage('graph'):
+        graph = ResourceGraph.build(args.root, args.jobs, metrics)
+    with metrics.stage('plan'):
+        packs, area_packs, orphans = plan_packs(graph, args.root)
+
+    with metrics.stage('write'):
+        os.makedirs(args.out, exist_ok=True)
+        for pack, files in packs.items():
+            with open(os.path.join(args.out, f'{pack}.files'), 'w') as f:
+                f.writelines(p + '\n' for p in sorted(files))
+        write_manifest(args.manifest, packs, area_packs, graph)
+        if args.write_presets:
+            write_presets(os.path.join(args.root, 'export_presets.cfg'), packs, args.base_preset)
+
+    total = sum(graph.files.values())
+    print(f"{'pack':<18} {'files':>6} {'size':>10}")
+    for pack, files in sorted(packs.items(), key=lambda kv: (kv[0] != 'base', kv[0] != 'shared', kv[0])):
+        print(f"{pack:<18} {len(files):>6} {_mb(pack_bytes(graph, files)):>10}")
+    print(f"{'(orphans)':<18} {len(orphans):>6} {_mb(sum(graph.files[o] for o in orphans)):>10}")
+    print(f"\nStartup (base) {_mb(pack_bytes(graph, packs['base']))} of {_mb(total)}; "
+          f"manifest → {os.path.relpath(args.manifest, args.root)}, lists → {args.out}")
+
+    if args.godot:
+        if not args.write_presets:
+            print("NOTE: --godot exports from the existing 'Pack: *' presets (add --write-presets to refresh)")
+        with metrics.stage('export'):
+            ok = export_packs(args.godot, packs, args.out, args.root)
+        if not ok:
+            metrics.finish()
+            sys.exit(1)
+    metrics.finish()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,591 @@
+#!/usr/bin/env python3
+"""Build distance LOD chains for the environment GLBs.
+
+For every assets/environments/<area>/<map>.glb this simplifies each visual
+mesh to a ½ and a ¼ triangle budget with a NumPy edge collapse (shortest
+edges first, independent batches, collapses that would flip a face are
+undone) and writes a copy of the map with the simplified meshes added as
+children of the nodes they replace:
+
+  assets/environments/<area>/lod/<map>.glb
+    node "<name>"       extras {"lod": {"level": 0, "begin": 0, "end": 30}}
+    node "<name>_lod1"  extras {"lod": {"level": 1, "begin": 30, "end": 60}}
+    node "<name>_lod2"  extras {"lod": {"level": 2, "begin": 60, "end": 0}}
+
+Godot imports node extras as metadata; the field controller loads the LOD
+copy when the manifest lists one and turns the ranges into visibility
+ranges. The copies live in the area folder so they go into that area's
+asset pack.
+
+Never simplified: collision meshes (-colonly, collision_*), the portal,
+gate, spawn and trigger markers, skinned or morphing primitives, and the
+meshes a stage config names in textureFixes. Boundary and UV-seam
+vertices stay put, as do the vertices of floor triangles (every corner
+within the config's floorCollision.yTolerance of y=0, the same test the
+stage editor uses to build collision_floor), so the visible floor keeps
+matching its collision at every level.
+
+assets/environments/lod_manifest.json records each source's SHA-256 (with
+its config), the LOD file and the triangle count per level; unchanged maps
+are not rebuilt. A map gets a LOD file only when it has simplifiable
+triangles and its first level saves at least 10% of them. --report prints
+the per-map triangle counts.
+
+Usage:
+    python3 scripts/tools/build_environment_lods.py
+    python3 scripts/tools/build_environment_lods.py --jobs 4 --force --report
+    python3 scripts/tools/build_environment_lods.py --prune   # drop LOD files the manifest no longer lists
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from glb_io import ARRAY_BUFFER, ELEMENT_ARRAY_BUFFER, FLOAT, UNSIGNED_INT, UNSIGNED_SHORT, Glb, GlbError
+from tool_metrics import add_metrics_arguments, metrics_from_args
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+GODOT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, '..', '..'))
+ENVIRONMENTS_DIR = os.path.join(GODOT_ROOT, 'assets', 'environments')
+MANIFEST_NAME = 'lod_manifest.json'
+LOD_DIR = 'lod'
+MANIFEST_VERSION = 2
+
+# (triangle ratio of the source, camera distance in metres where the level
+#  takes over, largest vertex move in metres)
+LOD_LEVELS = ((0.5, 30.0, 0.15), (0.25, 60.0, 0.4))
+# A level (and a map's LOD file) is kept only if it has at most this
+# fraction of the previous level's triangles
+MIN_GAIN = 0.9
+# Primitives smaller than this are not worth simplifying
+MIN_TRIANGLES = 32
+DEFAULT_Y_TOLERANCE = 0.25
+PROTECTED_PREFIXES = ('collision_', 'gate_', 'spawn_', 'trigger_', 'portals')
+PROTECTED_SUFFIXES = ('-colonly', '-convcolonly', '-col', '-convcol', '-navmesh')
+TRIANGLES = 4
+
+
+def is_protected_name(name: str) -> bool:
+    return name.startswith(PROTECTED_PREFIXES) or name.endswith(PROTECTED_SUFFIXES)
+
+
+def node_matrix(node: dict) -> np.ndarray:
+    if 'matrix' in node:
+        return np.array(node['matrix'], dtype=np.float64).reshape(4, 4).T
+    m = np.eye(4)
+    x, y, z, w = node.get('rotation', [0, 0, 0, 1])
+    m[:3, :3] = np.array([
+        [1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+        [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+        [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)],
+    ]) * np.array(node.get('scale', [1, 1, 1]))
+    m[:3, 3] = node.get('translation', [0, 0, 0])
+    return m
+
+
+def mesh_instances(doc: dict, fixed_names: set[str]) -> tuple[dict[int, list[tuple[int, np.ndarray]]], set[int]]:
+    """({mesh: [(node, world matrix)]} of simplifiable nodes, meshes a protected node uses)."""
+    nodes = doc.get('nodes', [])
+    children = {c for node in nodes for c in node.get('children', [])}
+    instances: dict[int, list] = {}
+    protected: set[int] = set()
+    stack = [(i, np.eye(4), False) for i in range(len(nodes)) if i not in children]
+    while stack:
+        index, parent, inherited = stack.pop()
+        node = nodes[index]
+        name = node.get('name', '')
+        world = parent @ node_matrix(node)
+        guarded = inherited or is_protected_name(name) or name in fixed_names or 'skin' in node
+        if 'mesh' in node:
+            if guarded:
+                protected.add(node['mesh'])
+            else:
+                instances.setdefault(node['mesh'], []).append((index, world))
+        stack.extend((c, world, inherited or is_protected_name(name)) for c in node.get('children', []))
+    return {m: inst for m, inst in instances.items() if m not in protected}, protected
+
+
+def _unique_rows(columns: list[np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+    """(index of each distinct row's first occurrence, row → distinct id) over byte columns."""
+    rows = np.ascontiguousarray(np.hstack([np.ascontiguousarray(c).view(np.uint8).reshape(len(c), -1)
+                                           for c in columns]))
+    keys = rows.view(np.dtype((np.void, rows.shape[1]))).ravel()
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    return first, inverse.ravel()
+
+
+class LodMesh:
+    """One primitive being simplified.
+
+    Faces index wedges (vertices with all their attributes); wedges that
+    share a position share a `wedge_pos` entry, and edges are collapsed on
+    positions so UV and colour splits don't read as open borders. Positions
+    with several wedges sit on a seam and are never moved or removed.
+    """
+
+    def __init__(self, positions, wedge_pos, attributes, faces, locked):
+        self.positions = positions    # (p, 3) float64
+        self.wedge_pos = wedge_pos    # (w,) position of each wedge
+        self.attributes = attributes  # {name: (w, k) float64}, POSITION excluded
+        self.faces = faces            # (t, 3) wedge indices
+        self.locked = locked          # (p,) bool, never moved
+
+    @classmethod
+    def from_accessors(cls, values: dict[str, np.ndarray], faces: np.ndarray) -> 'LodMesh':
+        used = np.unique(faces)
+        first, inverse = _unique_rows([values[k][used] for k in sorted(values)])
+        remap = np.zeros(int(used.max()) + 1, dtype=np.int64)
+        remap[used] = inverse
+        wedges = used[first]
+        pos_first, wedge_pos = _unique_rows([values['POSITION'][wedges]])
+        return cls(values['POSITION'][wedges][pos_first].astype(np.float64), wedge_pos,
+                   {k: v[wedges].astype(np.float64) for k, v in values.items() if k != 'POSITION'},
+                   remap[faces], np.zeros(len(pos_first), dtype=bool))
+
+    def corners(self, faces=None) -> np.ndarray:
+        return self.wedge_pos[self.faces if faces is None else faces]
+
+    def lock_floor(self, worlds: list[np.ndarray], tolerance: float):
+        """Lock triangles on the floor (every corner |y| < tolerance) in any instance."""
+        corners = self.corners()
+        for world in worlds:
+            y = self.positions @ world[1, :3] + world[1, 3]
+            on_floor = (np.abs(y[corners]) < tolerance).all(axis=1)
+            self.locked[corners[on_floor].ravel()] = True
+
+    def simplified(self, target: int, max_error: float) -> 'LodMesh':
+        """Copy collapsed down to at most `target` triangles, moving no vertex
+        further than about `max_error` metres (or as far as it can go)."""
+        mesh = LodMesh(self.positions, self.wedge_pos, self.attributes, self.faces,
+                       self.locked | (np.bincount(self.wedge_pos, minlength=len(self.positions)) > 1))
+        while len(mesh.faces) > target and mesh._collapse_batch(target, max_error):
+            pass
+        return mesh._compacted()
+
+    def _candidates(self, corners: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(pairs (keep, drop), cost in metres, midpoint flag) of every allowed collapse.
+
+        Interior edges: a free end merges into a fixed one (cost: edge length)
+        or two free ends meet at the midpoint (cost: half the length).
+        Border edges: a free vertex with exactly two border edges slides onto
+        a border neighbour (cost: its distance from the line between them),
+        so open strips lose their near-straight border vertices.
+        """
+        count = len(self.positions)
+        edges = np.sort(np.concatenate([corners[:, [0, 1]], corners[:, [1, 2]], corners[:, [2, 0]]]), axis=1)
+        edges, uses = np.unique(edges, axis=0, return_counts=True)
+        border_edges = edges[uses == 1]
+        on_border = np.zeros(count, dtype=bool)
+        on_border[border_edges.ravel()] = True
+        fixed = self.locked | on_border
+        lengths = np.linalg.norm(self.positions[edges[:, 0]] - self.positions[edges[:, 1]], axis=1)
+
+        inner = (uses > 1) & ~(fixed[edges[:, 0]] & fixed[edges[:, 1]])
+        pairs = edges[inner].copy()
+        swap = fixed[pairs[:, 1]]
+        pairs[swap] = pairs[swap][:, ::-1]  # drop the free end
+        midpoint = ~fixed[pairs[:, 0]]
+        cost = np.where(midpoint, lengths[inner] / 2, lengths[inner])
+
+        ends = np.concatenate([border_edges[:, 0], border_edges[:, 1]])
+        others = np.concatenate([border_edges[:, 1], border_edges[:, 0]])
+        order = np.argsort(ends, kind='stable')
+        ends, others = ends[order], others[order]
+        degree = np.bincount(ends, minlength=count)
+        slides = (degree == 2) & ~self.locked
+        deviation = np.full(count, np.inf)
+        v = np.nonzero(slides)[0]
+        first = np.searchsorted(ends, v)
+        a, b = self.positions[others[first]], self.positions[others[first + 1]]
+        ab = b - a
+        t = np.clip(np.einsum('ij,ij->i', self.positions[v] - a, ab)
+                    / np.maximum(np.einsum('ij,ij->i', ab, ab), 1e-12), 0, 1)
+        deviation[v] = np.linalg.norm(a + ab * t[:, None] - self.positions[v], axis=1)
+        slide_pairs = np.concatenate([border_edges, border_edges[:, ::-1]])
+        slide_pairs = slide_pairs[slides[slide_pairs[:, 1]]]
+        return (np.concatenate([pairs, slide_pairs]),
+                np.concatenate([cost, deviation[slide_pairs[:, 1]]]),
+                np.concatenate([midpoint, np.zeros(len(slide_pairs), dtype=bool)]))
+
+    def _collapse_batch(self, target: int, max_error: float) -> bool:
+        """One batch of cheapest collapses; False when nothing can move."""
+        corners = self.corners()
+        pairs, cost, midpoint = self._candidates(corners)
+        allowed = cost <= max_error
+        pairs, cost, midpoint = pairs[allowed], cost[allowed], midpoint[allowed]
+        if not len(pairs):
+            return False
+        order = np.argsort(cost, kind='stable')
+        chosen = _independent_edges(pairs[order], len(self.positions), max(1, (len(self.faces) - target) // 2))
+        pairs, midpoint = pairs[order][chosen], midpoint[order][chosen]
+
+        before = _face_normals(self.positions[corners])
+        area = np.einsum('ij,ij->i', before, before)
+        while len(pairs):
+            result, undo = self._try_collapse(pairs, midpoint)
+            if result is not None:
+                positions, attributes, faces, alive = result
+                dots = np.einsum('ij,ij->i', before, _face_normals(positions[self.wedge_pos[faces]]))
+                flipped = alive & (dots <= 0) & (area > 1e-12)
+                if not flipped.any():
+                    self.positions, self.attributes, self.faces = positions, attributes, faces[alive]
+                    return True
+                # Undo every collapse that touches a flipped face
+                bad = np.zeros(len(self.positions), dtype=bool)
+                bad[self.wedge_pos[faces[flipped]].ravel()] = True
+                undo = bad[pairs[:, 0]] | bad[pairs[:, 1]]
+            self.locked[pairs[undo, 1]] = True
+            pairs, midpoint = pairs[~undo], midpoint[~undo]
+        return True  # nothing collapsed, but more positions are locked
+
+    def _try_collapse(self, pairs: np.ndarray, midpoint: np.ndarray):
+        """Merge position pairs[:, 1] into pairs[:, 0] (at their midpoint where flagged).
+
+        Returns ((positions, attributes, faces, alive), None), or (None, undo
+        mask) when a dropped wedge meets more than one wedge of the kept
+        position (the edge runs along a seam there).
+        """
+        keep, drop = pairs[:, 0], pairs[:, 1]
+        into = np.full(len(self.positions), -1, dtype=np.int64)
+        into[drop] = keep
+        corners = self.corners()
+        # For every face corner on a dropped position, the kept position's wedge in that face
+        wedge_into = np.full(len(self.wedge_pos), -1, dtype=np.int64)
+        conflict = np.zeros(len(self.positions), dtype=bool)
+        for i in range(3):
+            target = into[corners[:, i]]
+            for j in range(3):
+                hit = (target >= 0) & (corners[:, j] == target)
+                dropped, kept = self.faces[hit, i], self.faces[hit, j]
+                seen = wedge_into[dropped]
+                conflict[self.wedge_pos[dropped[(seen >= 0) & (seen != kept)]]] = True
+                wedge_into[dropped] = kept
+        if conflict.any():
+            return None, conflict[drop]
+        positions = self.positions.copy()
+        positions[keep[midpoint]] = (positions[keep[midpoint]] + positions[drop[midpoint]]) / 2
+        dropped_w = np.nonzero(wedge_into >= 0)[0]
+        kept_w = wedge_into[dropped_w]
+        moved = np.zeros(len(self.positions), dtype=bool)
+        moved[keep[midpoint]] = True
+        blend = moved[self.wedge_pos[kept_w]]  # the kept wedge moved to the midpoint
+        attributes = {}
+        for name, values in self.attributes.items():
+            values = values.copy()
+            values[kept_w[blend]] = (values[kept_w[blend]] + values[dropped_w[blend]]) / 2
+            attributes[name] = values
+        remap = np.arange(len(self.wedge_pos))
+        remap[dropped_w] = kept_w
+        faces = remap[self.faces]
+        c = self.wedge_pos[faces]
+        alive = (c[:, 0] != c[:, 1]) & (c[:, 1] != c[:, 2]) & (c[:, 2] != c[:, 0])
+        return (positions, attributes, faces, alive), None
+
+    def _compacted(self) -> 'LodMesh':
+        used, faces = np.unique(self.faces, return_inverse=True)
+        pos_used, wedge_pos = np.unique(self.wedge_pos[used], return_inverse=True)
+        return LodMesh(self.positions[pos_used], wedge_pos.ravel(),
+                       {k: v[used] for k, v in self.attributes.items()},
+                       faces.reshape(-1, 3), self.locked[pos_used])
+
+
+def _independent_edges(edges: np.ndarray, count: int, budget: int) -> np.ndarray:
+    """Indices of a greedy prefix of `edges` (already ordered) that shares no vertex."""
+    taken = np.zeros(count, dtype=bool)
+    chosen = []
+    for i, (a, b) in enumerate(edges.tolist()):
+        if taken[a] or taken[b]:
+            continue
+        taken[a] = taken[b] = True
+        chosen.append(i)
+        if len(chosen) >= budget:
+            break
+    return np.array(chosen, dtype=np.int64)
+
+
+def _face_normals(triangles: np.ndarray) -> np.ndarray:
+    return np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+
+
+def _read_primitive(glb: Glb, primitive: dict) -> LodMesh | None:
+    """The primitive as a LodMesh, or None if it is left as is."""
+    attrs = primitive.get('attributes', {})
+    if (primitive.get('mode', TRIANGLES) != TRIANGLES or 'POSITION' not in attrs
+            or 'targets' in primitive or 'JOINTS_0' in attrs):
+        return None
+    values = {name: glb.read_accessor(index) for name, index in attrs.items()}
+    if 'indices' in primitive:
+        faces = glb.read_accessor(primitive['indices']).astype(np.int64)
+    else:
+        faces = np.arange(len(values['POSITION']), dtype=np.int64)
+    faces = faces[:len(faces) - len(faces) % 3].reshape(-1, 3)
+    if len(faces) < MIN_TRIANGLES:
+        return None
+    return LodMesh.from_accessors(values, faces)
+
+
+def _write_primitive(glb: Glb, source: dict, mesh: LodMesh) -> dict:
+    accessors = glb.json['accessors']
+    out = {k: v for k, v in source.items() if k not in ('attributes', 'indices')}
+    out['attributes'] = {}
+    for name, index in source['attributes'].items():
+        accessor = accessors[index]
+        values = mesh.positions[mesh.wedge_pos] if name == 'POSITION' else mesh.attributes[name]
+        if name == 'NORMAL':
+            values = values / np.maximum(np.linalg.norm(values, axis=1, keepdims=True), 1e-12)
+        if accessor['componentType'] != FLOAT:
+            values = np.rint(values)
+        out['attributes'][name] = glb.append_accessor(
+            values, accessor['componentType'], accessor['type'],
+            accessor.get('normalized', False), ARRAY_BUFFER)
+    index_type = UNSIGNED_SHORT if len(mesh.wedge_pos) < 65536 else UNSIGNED_INT
+    out['indices'] = glb.append_accessor(mesh.faces.ravel(), index_type, 'SCALAR', target=ELEMENT_ARRAY_BUFFER)
+    return out
+
+
+def build_lod_glb(glb: Glb, config: dict) -> tuple[list[int], int]:
+    """Add LOD meshes and nodes to `glb`; returns (triangles per level, protected triangles).
+
+    Triangle counts are per node instance, so shared meshes count once per use.
+    """
+    doc = glb.json
+    fixed_names = {name for fix in config.get('textureFixes', []) for name in fix.get('meshNames', [])}
+    tolerance = float(config.get('floorCollision', {}).get('yTolerance', DEFAULT_Y_TOLERANCE))
+    instances, protected = mesh_instances(doc, fixed_names)
+    totals = [0] * (len(LOD_LEVELS) + 1)
+    protected_triangles = 0
+    node_levels: dict[int, list[tuple[int, int]]] = {}  # node → [(level, mesh)]
+
+    for mesh_index in protected:
+        for primitive in doc['meshes'][mesh_index]['primitives']:
+            protected_triangles += _triangle_count(doc, primitive)
+
+    for mesh_index, nodes in sorted(instances.items()):
+        mesh = doc['meshes'][mesh_index]
+        sources = [_read_primitive(glb, primitive) for primitive in mesh['primitives']]
+        for source in sources:
+            if source is not None:
+                source.lock_floor([world for _, world in nodes], tolerance)
+        original = [_triangle_count(doc, primitive) for primitive in mesh['primitives']]
+        counts = [sum(original)]
+        levels = []
+        current = sources
+        for level, (ratio, _, max_error) in enumerate(LOD_LEVELS, start=1):
+            simplified = [state.simplified(int(n * ratio), max_error) if state is not None else None
+                          for state, n in zip(current, original)]
+            count = sum(len(s.faces) if s is not None else n for s, n in zip(simplified, original))
+            if count > counts[-1] * MIN_GAIN:
+                break
+            primitives = [_write_primitive(glb, p, s) if s is not None else dict(p)
+                          for s, p in zip(simplified, mesh['primitives'])]
+            doc['meshes'].append({'name': f"{mesh.get('name', f'mesh_{mesh_index}')}_lod{level}",
+                                  'primitives': primitives})
+            levels.append((level, len(doc['meshes']) - 1))
+            counts.append(count)
+            current = simplified
+        for node_index, _ in nodes:
+            node_levels[node_index] = levels
+            for level in range(len(totals)):
+                totals[level] += counts[min(level, len(counts) - 1)]
+
+    for node_index, levels in node_levels.items():
+        if not levels:
+            continue
+        node = doc['nodes'][node_index]
+        starts = [0.0] + [LOD_LEVELS[level - 1][1] for level, _ in levels]
+        _set_lod(node, 0, starts[0], starts[1])
+        for i, (level, mesh_index) in enumerate(levels, start=1):
+            child = {'name': f"{node.get('name', f'node_{node_index}')}_lod{level}", 'mesh': mesh_index}
+            _set_lod(child, level, starts[i], starts[i + 1] if i + 1 < len(starts) else 0.0)
+            doc['nodes'].append(child)
+            node.setdefault('children', []).append(len(doc['nodes']) - 1)
+    return totals, protected_triangles
+
+
+def _set_lod(node: dict, level: int, begin: float, end: float):
+    node.setdefault('extras', {})['lod'] = {'level': level, 'begin': begin, 'end': end}
+
+
+def _triangle_count(doc: dict, primitive: dict) -> int:
+    if primitive.get('mode', TRIANGLES) != TRIANGLES:
+        return 0
+    index = primitive.get('indices', primitive.get('attributes', {}).get('POSITION'))
+    return doc['accessors'][index]['count'] // 3 if index is not None else 0
+
+
+def _relink_images(doc: dict, depth: int):
+    """Point relative image URIs back at the source folder from `depth` levels down."""
+    for image in doc.get('images', []):
+        uri = image.get('uri', '')
+        if uri and ':' not in uri and not uri.startswith('/'):
+            image['uri'] = '../' * depth + uri
+
+
+def source_digest(glb_path: str, config_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(glb_path, 'rb') as f:
+        digest.update(f.read())
+    if os.path.exists(config_path):
+        with open(config_path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def lod_path(environments_dir: str, rel: str) -> str:
+    area, name = rel.split('/', 1)
+    return os.path.join(environments_dir, area, LOD_DIR, name)
+
+
+def config_path(environments_dir: str, rel: str) -> str:
+    return os.path.join(environments_dir, rel[:-len('.glb')] + '_config.json')
+
+
+def _build_one(job: tuple[str, str]) -> tuple[str, dict | None, int, float, str]:
+    """Worker: (rel, manifest entry, bytes written, seconds, error)."""
+    environments_dir, rel = job
+    start = time.perf_counter()
+    cfg_path = config_path(environments_dir, rel)
+    try:
+        glb = Glb.load(os.path.join(environments_dir, rel))
+        config = {}
+        if os.path.exists(cfg_path):
+            with open(cfg_path, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+        triangles, protected = build_lod_glb(glb, config)
+    except (OSError, ValueError, GlbError, KeyError) as e:
+        return rel, None, 0, time.perf_counter() - start, str(e)
+    entry = {'sha256': source_digest(os.path.join(environments_dir, rel), cfg_path),
+             'file': '', 'triangles': triangles, 'protected': protected}
+    written = 0
+    # Swapping meshes by distance costs extra nodes; only worth it when the map gets lighter.
+    # A map with nothing to simplify would otherwise get a plain copy of its source.
+    if triangles[0] > 0 and triangles[1] <= triangles[0] * MIN_GAIN:
+        _relink_images(glb.json, 1)
+        path = lod_path(environments_dir, rel)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        written = glb.save(path)
+        entry['file'] = f"{rel.split('/', 1)[0]}/{LOD_DIR}/{rel.split('/', 1)[1]}"
+    return rel, entry, written, time.perf_counter() - start, ''
+
+
+def find_sources(environments_dir: str) -> list[str]:
+    rels = []
+    for area in sorted(os.listdir(environments_dir)):
+        area_dir = os.path.join(environments_dir, area)
+        if os.path.isdir(area_dir):
+            rels.extend(f'{area}/{name}' for name in sorted(os.listdir(area_dir))
+                        if name.endswith('.glb'))
+    return rels
+
+
+def load_manifest(path: str) -> dict:
+    if os.path.exists(path):
+        with open(path) as f:
+            manifest = json.load(f)
+        if manifest.get('version') == MANIFEST_VERSION and manifest.get('levels') == _levels():
+            return manifest
+    return {'version': MANIFEST_VERSION, 'levels': _levels(), 'maps': {}}
+
+
+def _levels() -> list[dict]:
+    return [{'ratio': ratio, 'distance': distance, 'max_error': error} for ratio, distance, error in LOD_LEVELS]
+
+
+def build_lods(environments_dir: str = ENVIRONMENTS_DIR, jobs: int | None = None, force: bool = False,
+               prune: bool = False, report: bool = False, metrics=None) -> dict:
+    """Build every missing or stale LOD file and rewrite the manifest."""
+    manifest_path = os.path.join(environments_dir, MANIFEST_NAME)
+    old = load_manifest(manifest_path)['maps']
+    maps, pending = {}, []
+    skipped = 0
+    for rel in find_sources(environments_dir):
+        entry = old.get(rel)
+        if (not force and entry
+                and entry['sha256'] == source_digest(os.path.join(environments_dir, rel),
+                                                     config_path(environments_dir, rel))
+                and (not entry['file'] or os.path.exists(os.path.join(environments_dir, entry['file'])))):
+            maps[rel] = entry
+            skipped += 1
+            if metrics:
+                metrics.file('lods', rel, 0.0, status='cached')
+        else:
+            pending.append((environments_dir, rel))
+
+    written_total, failed = 0, 0
+    if pending:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for rel, entry, written, seconds, error in pool.map(_build_one, pending, chunksize=4):
+                if error:
+                    failed += 1
+                    print(f"  FAILED {rel}: {error}")
+                else:
+                    maps[rel] = entry
+                    written_total += written
+                if metrics:
+                    metrics.file('lods', rel, seconds, written=written,
+                                 status='failed' if error else 'built')
+
+    removed = 0
+    if prune:
+        # Scan the lod/ folders rather than the old manifest, which a version bump discards
+        keep = {entry['file'] for entry in maps.values() if entry['file']}
+        for area in sorted(os.listdir(environments_dir)):
+            lod_dir = os.path.join(environments_dir, area, LOD_DIR)
+            if not os.path.isdir(lod_dir):
+                continue
+            for name in sorted(os.listdir(lod_dir)):
+                if name.endswith('.glb') and f'{area}/{LOD_DIR}/{name}' not in keep:
+                    os.remove(os.path.join(lod_dir, name))
+                    removed += 1
+            if not os.listdir(lod_dir):
+                os.rmdir(lod_dir)
+
+    manifest = {'version': MANIFEST_VERSION, 'levels': _levels(), 'maps': dict(sorted(maps.items()))}
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f, separators=(',', ':'))
+        f.write('\n')
+
+    if report:
+        print(f"  {'map':<28} " + ' '.join(f'{f"LOD{i}":>8}' for i in range(len(LOD_LEVELS) + 1))
+              + f" {'kept':>8}")
+        for rel, entry in manifest['maps'].items():
+            print(f"  {rel:<28} " + ' '.join(f'{n:>8}' for n in entry['triangles'])
+                  + f" {entry['protected']:>8}")
+    totals = [sum(entry['triangles'][i] for entry in maps.values()) for i in range(len(LOD_LEVELS) + 1)]
+    with_lods = sum(1 for entry in maps.values() if entry['file'])
+    print(f"LODs: {with_lods}/{len(maps)} maps; triangles "
+          + ' -> '.join(f"LOD{i} {n}" for i, n in enumerate(totals))
+          + f", {sum(e['protected'] for e in maps.values())} protected; built {len(pending) - failed}, "
+          f"cached {skipped}, failed {failed}, {written_total / (1024 * 1024):.2f} MB written"
+          + (f", {removed} stale files removed" if prune else ""))
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build distance LOD chains for the environment GLBs")
+    parser.add_argument('--environments', default=ENVIRONMENTS_DIR, help="assets/environments directory")
+    parser.add_argument('--jobs', '-j', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--force', action='store_true', help="Rebuild every map, ignoring the manifest hashes")
+    parser.add_argument('--prune', action='store_true', help="Delete LOD files the new manifest no longer lists")
+    parser.add_argument('--report', action='store_true', help="Print triangle counts per map and level")
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.environments):
+        print(f"ERROR: environments directory not found: {args.environments}")
+        sys.exit(1)
+
+    metrics = metrics_from_args('build_environment_lods', args)
+    with metrics.stage('lods'):
+        build_lods(args.environments, args.jobs, args.force, args.prune, args.report, metrics)
+    metrics.finish()
+
+
+if __name__ == '__main__':
+    main()
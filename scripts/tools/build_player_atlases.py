@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""Pack each player variation's appearance textures into a texture atlas.
+
+Every assets/player/pc_XXX/textures/ directory holds ~45 full-body skins
+(one per hair/skin/body colour combination) for the same GLB. This stage
+packs them into one (or a few, past --max-size) grid atlases and writes:
+
+  pc_XXX_atlas_N.png      the atlas image(s), cells in sorted texture order
+  pc_XXX_000_atlas.glb    the model with TEXCOORD_0 scaled into one cell and
+                          its materials pointing at atlas 0 (nearest, clamp)
+  pc_XXX_atlas.json       manifest: grid, uv scale and {texture: [atlas, col, row]}
+
+At runtime PlayerConfig picks the atlas model and selects a skin with the
+material's uv1_offset, so every character of a variation shares one texture
+and one .import instead of one per appearance.
+
+Variations whose UVs leave 0..1 (wrap-mode sampling), whose UVs aren't
+floats, or whose textures differ in size are left as they are and reported.
+
+Usage:
+    python3 scripts/tools/build_player_atlases.py
+    python3 scripts/tools/build_player_atlases.py --only pc_000,pc_001 --dry-run
+    python3 scripts/tools/build_player_atlases.py --prune   # delete atlased source PNGs
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sys
+import time
+
+import numpy as np
+
+from glb_io import FLOAT, Glb, GlbError
+from png_io import PngError, read_png, read_png_header, write_png
+from tool_metrics import add_metrics_arguments, metrics_from_args
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+GODOT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, '..', '..'))
+PLAYER_DIR = os.path.join(GODOT_ROOT, 'assets', 'player')
+
+VARIATION_RE = re.compile(r'^pc_\d{3}$')
+DEFAULT_MAX_SIZE = 2048
+UV_EPSILON = 1e-4
+
+# glTF sampler enums
+NEAREST = 9728
+CLAMP_TO_EDGE = 33071
+
+
+def atlas_grid(count: int, max_cells_x: int, max_cells_y: int) -> tuple[int, int]:
+    """Smallest cols x rows grid (fewest empty cells, then squarest) for one atlas."""
+    per_atlas = max_cells_x * max_cells_y
+    cells = min(count, per_atlas)
+    best = None
+    for cols in range(1, max_cells_x + 1):
+        rows = math.ceil(cells / cols)
+        if rows > max_cells_y:
+            continue
+        key = (cols * rows, abs(cols - rows), -cols)
+        if best is None or key < best[0]:
+            best = (key, cols, rows)
+    return best[1], best[2]
+
+
+def uv_accessors(glb: Glb) -> set[int]:
+    return {prim['attributes']['TEXCOORD_0']
+            for mesh in glb.json.get('meshes', [])
+            for prim in mesh.get('primitives', [])
+            if 'TEXCOORD_0' in prim.get('attributes', {})}
+
+
+def unatlasable_reason(glb: Glb, accessors: set[int]) -> str | None:
+    """Why this model's UVs can't be squeezed into one cell, or None."""
+    if not accessors:
+        return "no TEXCOORD_0"
+    for index in accessors:
+        if glb.json['accessors'][index]['componentType'] != FLOAT:
+            return "non-float UVs"
+        uv = glb.read_accessor(index)
+        if uv.size and (uv.min() < -UV_EPSILON or uv.max() > 1.0 + UV_EPSILON):
+            return f"UVs outside 0..1 (wrap mode, range {uv.min():.3f}..{uv.max():.3f})"
+    return None
+
+
+def rewrite_glb(glb: Glb, accessors: set[int], scale: tuple[float, float], atlas_uri: str):
+    """Scale UVs into cell (0, 0) and point every material at the atlas."""
+    for index in accessors:
+        glb.write_accessor(index, glb.read_accessor(index) * np.array(scale, dtype=np.float32))
+
+    doc = glb.json
+    doc['images'] = [{'uri': atlas_uri}]
+    doc['samplers'] = [{'magFilter': NEAREST, 'minFilter': NEAREST,
+                        'wrapS': CLAMP_TO_EDGE, 'wrapT': CLAMP_TO_EDGE}]
+    doc['textures'] = [{'sampler': 0, 'source': 0}]
+    for material in doc.get('materials', []):
+        pbr = material.setdefault('pbrMetallicRoughness', {})
+        pbr['baseColorTexture'] = {'index': 0}
+
+
+def source_textures(tex_dir: str, name: str) -> list[str]:
+    if not os.path.isdir(tex_dir):
+        return []
+    prefix = name + '_'
+    return sorted(f for f in os.listdir(tex_dir)
+                  if f.endswith('.png') and f.startswith(prefix) and '_atlas' not in f)
+
+
+def build_variation(var_dir: str, max_size: int = DEFAULT_MAX_SIZE, prune: bool = False,
+                    dry_run: bool = False) -> dict:
+    """Atlas one variation directory; returns a report row."""
+    name = os.path.basename(os.path.normpath(var_dir))
+    tex_dir = os.path.join(var_dir, 'textures')
+    textures = source_textures(tex_dir, name)
+    report = {'variation': name, 'textures_before': len(textures), 'textures_after': len(textures),
+              'atlases': 0, 'status': 'skipped', 'reason': '', 'bytes_written': 0}
+
+    glb_path = os.path.join(var_dir, f'{name}_000.glb')
+    if not os.path.exists(glb_path):
+        report['reason'] = 'no GLB'
+        return report
+    if len(textures) < 2:
+        report['reason'] = 'fewer than 2 textures'
+        return report
+
+    try:
+        glb = Glb.load(glb_path)
+        accessors = uv_accessors(glb)
+        reason = unatlasable_reason(glb, accessors)
+        sizes = {(h['width'], h['height'])
+                 for h in (read_png_header(os.path.join(tex_dir, t)) for t in textures)}
+    except (GlbError, PngError, OSError) as e:
+        report['status'] = 'failed'
+        report['reason'] = str(e)
+        return report
+    if reason:
+        report['reason'] = reason
+        return report
+    if len(sizes) != 1:
+        report['reason'] = f"mixed texture sizes {sorted(sizes)}"
+        return report
+
+    cell_w, cell_h = sizes.pop()
+    max_x, max_y = max(1, max_size // cell_w), max(1, max_size // cell_h)
+    cols, rows = atlas_grid(len(textures), max_x, max_y)
+    per_atlas = cols * rows
+    atlas_count = math.ceil(len(textures) / per_atlas)
+    scale = (1.0 / cols, 1.0 / rows)
+    report.update(status='atlased', reason='', atlases=atlas_count, textures_after=atlas_count,
+                  grid=[cols, rows], atlas_size=[cols * cell_w, rows * cell_h])
+    if dry_run:
+        return report
+
+    try:
+        atlas_names = [f'{name}_atlas_{i}.png' for i in range(atlas_count)]
+        cells = {}
+        atlases = [None] * atlas_count
+        for i, tex in enumerate(textures):
+            atlas, cell = divmod(i, per_atlas)
+            row, col = divmod(cell, cols)
+            pixels = read_png(os.path.join(tex_dir, tex))
+            if atlases[atlas] is None:
+                atlases[atlas] = np.zeros((rows * cell_h, cols * cell_w, pixels.shape[2]), dtype=np.uint8)
+            if pixels.shape[2] != atlases[atlas].shape[2]:
+                raise PngError(f"{tex}: {pixels.shape[2]} channels, atlas has {atlases[atlas].shape[2]}")
+            atlases[atlas][row * cell_h:(row + 1) * cell_h, col * cell_w:(col + 1) * cell_w] = pixels
+            cells[tex[:-len('.png')]] = [atlas, col, row]
+
+        written = 0
+        for atlas_name, pixels in zip(atlas_names, atlases):
+            written += write_png(os.path.join(var_dir, atlas_name), pixels)
+
+        model_name = f'{name}_000_atlas.glb'
+        rewrite_glb(glb, accessors, scale, atlas_names[0])
+        written += glb.save(os.path.join(var_dir, model_name))
+
+        manifest = {
+            'model': model_name,
+            'atlases': atlas_names,
+            'grid': [cols, rows],
+            'cell_size': [cell_w, cell_h],
+            'uv_scale': list(scale),
+            'cells': cells,
+        }
+        text = json.dumps(manifest, indent=2) + '\n'
+        with open(os.path.join(var_dir, f'{name}_atlas.json'), 'w') as f:
+            f.write(text)
+        written += len(text)
+    except (GlbError, PngError, OSError) as e:
+        report['status'] = 'failed'
+        report['reason'] = str(e)
+        return report
+    report['bytes_written'] = written
+
+    if prune:
+        for tex in textures:
+            for path in (os.path.join(tex_dir, tex), os.path.join(tex_dir, tex + '.import')):
+                if os.path.exists(path):
+                    os.remove(path)
+    return report
+
+
+def build_atlases(player_dir: str = PLAYER_DIR, only=None, max_size: int = DEFAULT_MAX_SIZE,
+                  prune: bool = False, dry_run: bool = False, metrics=None) -> list[dict]:
+    """Atlas every pc_XXX variation under `player_dir`; prints one line each."""
+    variations = sorted(d for d in os.listdir(player_dir)
+                        if VARIATION_RE.match(d) and os.path.isdir(os.path.join(player_dir, d)))
+    if only:
+        variations = [v for v in variations if v in only]
+
+    reports = []
+    for name in variations:
+        start = time.perf_counter()
+        report = build_variation(os.path.join(player_dir, name), max_size, prune, dry_run)
+        elapsed = time.perf_counter() - start
+        reports.append(report)
+        if metrics:
+            metrics.file('atlas', name, elapsed, written=report['bytes_written'], status=report['status'])
+        if report['status'] == 'atlased':
+            cols, rows = report['grid']
+            print(f"  {name}: {report['textures_before']} textures → {report['atlases']} atlas "
+                  f"({cols}x{rows} cells, {report['atlas_size'][0]}x{report['atlas_size'][1]})")
+        else:
+            print(f"  {name}: {report['status'].upper()} ({report['reason']}), "
+                  f"{report['textures_before']} textures kept")
+
+    before = sum(r['textures_before'] for r in reports)
+    after = sum(r['textures_after'] for r in reports)
+    atlased = sum(1 for r in reports if r['status'] == 'atlased')
+    kept = sum(r['textures_before'] for r in reports if r['status'] != 'atlased')
+    print(f"\nAtlas: {atlased}/{len(reports)} variations, textures {before} → {after} "
+          f"({kept} kept unatlased)")
+    return reports
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack player variation textures into atlases")
+    parser.add_argument('--player-dir', default=PLAYER_DIR, help="assets/player directory")
+    parser.add_argument('--only', help="Comma-separated variations (e.g. pc_000,pc_001)")
+    parser.add_argument('--max-size', type=int, default=DEFAULT_MAX_SIZE, help="Max atlas width/height")
+    parser.add_argument('--prune', action='store_true', help="Delete source PNGs of atlased variations")
+    parser.add_argument('--dry-run', action='store_true', help="Report the packing without writing")
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.player_dir):
+        print(f"ERROR: player directory not found: {args.player_dir}")
+        sys.exit(1)
+
+    metrics = metrics_from_args('build_player_atlases', args)
+    only = {v.strip() for v in args.only.split(',')} if args.only else None
+    with metrics.stage('atlas'):
+        reports = build_atlases(args.player_dir, only, args.max_size, args.prune, args.dry_run, metrics)
+    metrics.finish()
+    if any(r['status'] == 'failed' for r in reports):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
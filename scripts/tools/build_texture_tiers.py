@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Build downscaled texture tiers for low-memory devices and the web build.
+
+For every PNG under assets/environments, assets/player and assets/enemies
+this writes a ½ and a ¼ copy (alpha-premultiplied box filter) to
+
+  assets/tiers/half/<path relative to assets/>
+  assets/tiers/quarter/<path relative to assets/>
+
+and a manifest, assets/tiers/manifest.json, that the TextureTiers autoload
+reads at startup to map a source path to the tier picked by the texture
+quality setting. Textures whose size doesn't divide evenly, or that would
+drop below MIN_SIZE pixels, keep the source resolution for that tier.
+
+Work runs on a process pool. The manifest records each source's SHA-256,
+so unchanged textures whose tier files exist are not rebuilt.
+
+Usage:
+    python3 scripts/tools/build_texture_tiers.py
+    python3 scripts/tools/build_texture_tiers.py --jobs 4 --force
+    python3 scripts/tools/build_texture_tiers.py --prune   # drop tier files whose source is gone
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from png_io import PngError, encode_png, read_png
+from tool_metrics import add_metrics_arguments, metrics_from_args
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+GODOT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, '..', '..'))
+ASSETS_DIR = os.path.join(GODOT_ROOT, 'assets')
+TIERS_DIR = os.path.join(ASSETS_DIR, 'tiers')
+
+SOURCE_DIRS = ('environments', 'player', 'enemies')
+# tier name → downscale factor
+TIERS = {'half': 2, 'quarter': 4}
+MIN_SIZE = 8
+MANIFEST_VERSION = 1
+
+
+def downscale(pixels: np.ndarray, factor: int) -> np.ndarray:
+    """Box-filter an (h, w, c) uint8 image by an integer factor.
+
+    RGBA is averaged premultiplied so transparent texels don't bleed their
+    (often black) colour into the edges of opaque ones.
+    """
+    h, w, c = pixels.shape
+    blocks = pixels.reshape(h // factor, factor, w // factor, factor, c).astype(np.float32)
+    if c in (2, 4):
+        alpha = blocks[..., -1:] / 255.0
+        colour = (blocks[..., :-1] * alpha).mean(axis=(1, 3))
+        mean_alpha = alpha.mean(axis=(1, 3))
+        colour = np.where(mean_alpha > 0, colour / np.maximum(mean_alpha, 1e-6), 0.0)
+        out = np.concatenate([colour, mean_alpha * 255.0], axis=-1)
+    else:
+        out = blocks.mean(axis=(1, 3))
+    return np.clip(np.rint(out), 0, 255).astype(np.uint8)
+
+
+def tier_path(tiers_dir: str, tier: str, rel: str) -> str:
+    return os.path.join(tiers_dir, tier, rel)
+
+
+def _build_one(job: tuple[str, str, str]) -> tuple[str, list[str], int, float, str]:
+    """Worker: (rel, built tiers, bytes written, seconds, error)."""
+    assets_dir, tiers_dir, rel = job
+    start = time.perf_counter()
+    try:
+        pixels = read_png(os.path.join(assets_dir, rel))
+    except (OSError, PngError) as e:
+        return rel, [], 0, time.perf_counter() - start, str(e)
+    h, w = pixels.shape[:2]
+    built, written = [], 0
+    for tier, factor in TIERS.items():
+        if h % factor or w % factor or min(h, w) // factor < MIN_SIZE:
+            continue
+        data = encode_png(downscale(pixels, factor))
+        path = tier_path(tiers_dir, tier, rel)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+        built.append(tier)
+        written += len(data)
+    return rel, built, written, time.perf_counter() - start, ''
+
+
+def load_manifest(path: str) -> dict:
+    if os.path.exists(path):
+        with open(path) as f:
+            manifest = json.load(f)
+        if manifest.get('version') == MANIFEST_VERSION:
+            return manifest
+    return {'version': MANIFEST_VERSION, 'tiers': {}, 'textures': {}}
+
+
+def find_sources(assets_dir: str) -> list[str]:
+    rels = []
+    for top in SOURCE_DIRS:
+        root = os.path.join(assets_dir, top)
+        for dirpath, _, files in os.walk(root):
+            rels.extend(os.path.relpath(os.path.join(dirpath, f), assets_dir)
+                        for f in files if f.lower().endswith('.png'))
+    return sorted(rel.replace(os.sep, '/') for rel in rels)
+
+
+def build_tiers(assets_dir: str = ASSETS_DIR, tiers_dir: str = TIERS_DIR, jobs: int | None = None,
+                force: bool = False, prune: bool = False, metrics=None) -> dict:
+    """Build every missing or stale tier file and rewrite the manifest."""
+    manifest_path = os.path.join(tiers_dir, 'manifest.json')
+    manifest = load_manifest(manifest_path)
+    old = manifest['textures']
+    textures, pending, hashes = {}, [], {}
+    skipped = 0
+
+    for rel in find_sources(assets_dir):
+        with open(os.path.join(assets_dir, rel), 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        entry = old.get(rel)
+        if (not force and entry and entry['sha256'] == digest
+                and all(os.path.exists(tier_path(tiers_dir, t, rel)) for t in entry['tiers'])):
+            textures[rel] = entry
+            skipped += 1
+            if metrics:
+                metrics.file('tiers', rel, 0.0, status='cached')
+        else:
+            hashes[rel] = digest
+            pending.append((assets_dir, tiers_dir, rel))
+
+    written_total, failed = 0, 0
+    if pending:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for rel, built, written, seconds, error in pool.map(_build_one, pending, chunksize=16):
+                if error:
+                    failed += 1
+                    print(f"  FAILED {rel}: {error}")
+                else:
+                    textures[rel] = {'sha256': hashes[rel], 'tiers': built}
+                    written_total += written
+                if metrics:
+                    metrics.file('tiers', rel, seconds, written=written,
+                                 status='failed' if error else 'built')
+
+    removed = 0
+    if prune:
+        for rel, entry in old.items():
+            for tier in entry['tiers']:
+                if rel not in textures or tier not in textures[rel]['tiers']:
+                    path = tier_path(tiers_dir, tier, rel)
+                    if os.path.exists(path):
+                        os.remove(path)
+                        removed += 1
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'tiers': {tier: {'scale': factor, 'root': f'res://assets/tiers/{tier}/'}
+                  for tier, factor in TIERS.items()},
+        'textures': dict(sorted(textures.items())),
+    }
+    os.makedirs(tiers_dir, exist_ok=True)
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f, separators=(',', ':'))
+        f.write('\n')
+
+    per_tier = {tier: sum(1 for e in textures.values() if tier in e['tiers']) for tier in TIERS}
+    counts = ', '.join(f"{tier} {n}" for tier, n in per_tier.items())
+    print(f"Tiers: {len(textures)} textures ({counts}); built {len(pending) - failed}, "
+          f"cached {skipped}, failed {failed}, {written_total / (1024 * 1024):.2f} MB written"
+          + (f", {removed} stale files removed" if prune else ""))
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build downscaled texture tiers and their manifest")
+    parser.add_argument('--assets', default=ASSETS_DIR, help="assets/ directory")
+    parser.add_argument('--jobs', '-j', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--force', action='store_true', help="Rebuild every tier, ignoring the manifest hashes")
+    parser.add_argument('--prune', action='store_true', help="Delete tier files whose source is gone")
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.assets):
+        print(f"ERROR: assets directory not found: {args.assets}")
+        sys.exit(1)
+
+    metrics = metrics_from_args('build_texture_tiers', args)
+    with metrics.stage('tiers'):
+        build_tiers(args.assets, os.path.join(args.assets, 'tiers'), args.jobs, args.force, args.prune, metrics)
+    metrics.finish()
+
+
+if __name__ == '__main__':
+    main()
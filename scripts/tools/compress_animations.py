@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""Compress the keyframe tracks of the player animation GLBs.
+
+The player animation set (assets/player/animations/saber_m.glb) stores every
+bone track at 60 keys per second as float32, and each spawned player
+duplicates every clip when it remaps the tracks onto its skeleton. For
+every GLB with animations under the given roots this
+
+  - drops keys that interpolation from their kept neighbours reproduces
+    within a tolerance (slerp for rotations, lerp for translation and
+    scale; STEP tracks only lose repeated values, CUBICSPLINE is kept),
+  - optionally resamples tracks onto a fixed frame rate first (--fps),
+  - stores rotations as normalized int16 quaternions (glTF allows
+    normalized SHORT for rotation outputs; translation and scale outputs
+    must stay float, so those are only reduced); rotation keys are
+    reduced so the tolerance still holds after that rounding,
+
+and writes the result beside the source as <dir>/compressed/<name>.glb with
+unused accessors dropped. The player loads the compressed copy when it
+exists. GLBs without animations (the per-variation player models) are
+skipped.
+
+<root>/animation_compression.json records each source's SHA-256, the output
+file and per clip: keys before and after, and the largest rotation (degrees)
+and translation (metres) error measured at the source key times after
+quantization. Unchanged sources are not rebuilt. --report prints the
+per-clip table.
+
+Usage:
+    python3 scripts/tools/compress_animations.py
+    python3 scripts/tools/compress_animations.py --report
+    python3 scripts/tools/compress_animations.py --rotation-tolerance 0.25 --fps 30 --force
+    python3 scripts/tools/compress_animations.py assets/enemies --report
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from glb_io import COMPONENT_DTYPES, FLOAT, Glb, GlbError
+from tool_metrics import add_metrics_arguments, metrics_from_args
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+GODOT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, '..', '..'))
+PLAYER_DIR = os.path.join(GODOT_ROOT, 'assets', 'player')
+OUTPUT_DIR = 'compressed'
+MANIFEST_NAME = 'animation_compression.json'
+MANIFEST_VERSION = 2
+
+ROTATION_TOLERANCE = 0.5      # degrees
+TRANSLATION_TOLERANCE = 0.002  # metres (also used for scale, unitless)
+SHORT = 5122
+SHORT_MAX = 32767
+NORMALIZED_MAX = {5120: 127, 5121: 255, 5122: 32767, 5123: 65535}
+# Worst-case rotation change from rounding a unit quaternion to int16, degrees
+QUANTIZATION_ERROR = float(np.degrees(2 * np.arcsin(1.0 / SHORT_MAX)))
+
+
+def _normalize(q: np.ndarray) -> np.ndarray:
+    return q / np.maximum(np.linalg.norm(q, axis=-1, keepdims=True), 1e-12)
+
+
+def _continuous(q: np.ndarray) -> np.ndarray:
+    """Flip quaternions onto one hemisphere so neighbours interpolate the short way."""
+    q = _normalize(q.astype(np.float64))
+    signs = np.ones(len(q))
+    if len(q) > 1:
+        flips = np.einsum('ij,ij->i', q[1:], q[:-1]) < 0
+        signs[1:] = np.where(np.cumsum(flips) % 2, -1.0, 1.0)
+    return q * signs[:, None]
+
+
+def slerp(q0: np.ndarray, q1: np.ndarray, u: np.ndarray) -> np.ndarray:
+    """Row-wise slerp between (n, 4) quaternion arrays at fractions u (n,)."""
+    dot = np.einsum('ij,ij->i', q0, q1)
+    q1 = np.where(dot[:, None] < 0, -q1, q1)
+    dot = np.clip(np.abs(dot), -1.0, 1.0)
+    theta = np.arccos(dot)
+    sin = np.sin(theta)
+    near = sin < 1e-6
+    safe = np.where(near, 1.0, sin)
+    w0 = np.where(near, 1 - u, np.sin((1 - u) * theta) / safe)
+    w1 = np.where(near, u, np.sin(u * theta) / safe)
+    return _normalize(q0 * w0[:, None] + q1 * w1[:, None])
+
+
+def angle_error(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Rotation angle in degrees between rows of two quaternion arrays."""
+    dot = np.clip(np.abs(np.einsum('ij,ij->i', _normalize(a), _normalize(b))), 0.0, 1.0)
+    return np.degrees(2 * np.arccos(dot))
+
+
+def sample(times: np.ndarray, values: np.ndarray, at: np.ndarray, rotation: bool) -> np.ndarray:
+    """Evaluate a LINEAR track at times `at` (clamped at the ends)."""
+    if len(times) == 1:
+        return np.repeat(values[:1], len(at), axis=0)
+    i = np.clip(np.searchsorted(times, at, side='right') - 1, 0, len(times) - 2)
+    span = np.maximum(times[i + 1] - times[i], 1e-12)
+    u = np.clip((at - times[i]) / span, 0.0, 1.0)
+    if rotation:
+        return slerp(values[i], values[i + 1], u)
+    return values[i] + (values[i + 1] - values[i]) * u[:, None]
+
+
+def reduce_keys(times: np.ndarray, values: np.ndarray, tolerance: float, rotation: bool) -> np.ndarray:
+    """Indices of the keys to keep so every dropped key is reproduced within tolerance.
+
+    Greedy: from each kept key, extend the segment as far as interpolation
+    between its ends still matches every key inside it.
+    """
+    n = len(times)
+    if n <= 2:
+        keep = np.arange(n)
+    else:
+        keep = [0]
+        anchor = 0
+        end = 2
+        while end < n:
+            inside = np.arange(anchor + 1, end)
+            approx = sample(times[[anchor, end]], values[[anchor, end]], times[inside], rotation)
+            error = angle_error(approx, values[inside]) if rotation \
+                else np.abs(approx - values[inside]).max(axis=1)
+            if error.max() > tolerance:
+                anchor = end - 1
+                keep.append(anchor)
+            end += 1
+        keep.append(n - 1)
+        keep = np.array(keep)
+    if len(keep) == 2:
+        ends = values[keep]
+        same = angle_error(ends[:1], ends[1:])[0] if rotation else np.abs(ends[0] - ends[1]).max()
+        if same <= tolerance and _track_error(times, values, keep[:1], rotation) <= tolerance:
+            keep = keep[:1]
+    return keep
+
+
+def _track_error(times, values, keep, rotation) -> float:
+    approx = sample(times[keep], values[keep], times, rotation)
+    error = angle_error(approx, values) if rotation else np.abs(approx - values).max(axis=1)
+    return float(error.max()) if len(error) else 0.0
+
+
+def quantize_rotations(q: np.ndarray) -> np.ndarray:
+    return np.rint(np.clip(q, -1.0, 1.0) * SHORT_MAX).astype(np.int16)
+
+
+def reduce_rotation_keys(times: np.ndarray, values: np.ndarray, tolerance: float) -> np.ndarray:
+    """reduce_keys for a rotation track, with the tolerance holding after quantization.
+
+    Keys are reduced against the tolerance less QUANTIZATION_ERROR, then the
+    int16 track is measured; if rounding still pushes a key past the
+    tolerance, the reduction budget is halved until it doesn't (keeping every
+    key as the last resort).
+    """
+    budget = max(tolerance - QUANTIZATION_ERROR, 0.0)
+    while True:
+        keep = reduce_keys(times, values, budget, True)
+        if len(keep) == len(times):
+            return keep
+        decoded = quantize_rotations(values[keep]).astype(np.float64) / SHORT_MAX
+        approx = sample(times[keep], decoded, times, True)
+        if angle_error(approx, values).max() <= tolerance:
+            return keep
+        if budget < 1e-6:
+            return np.arange(len(times))
+        budget /= 2
+
+
+def resample(times: np.ndarray, values: np.ndarray, fps: float, rotation: bool):
+    """(times, values) on a fixed frame grid covering the source span."""
+    start, end = times[0], times[-1]
+    frames = np.arange(round(start * fps), round(end * fps) + 1) / fps
+    frames = np.clip(frames, start, end)
+    return frames, sample(times, values, frames, rotation)
+
+
+class _Packer:
+    """Appends accessors that share one bufferView.
+
+    Glb.append_accessor gives every accessor its own view; a few hundred
+    short tracks would cost more JSON than their keys save.
+    """
+
+    def __init__(self, glb: Glb):
+        self.glb = glb
+        self.data = bytearray()
+        self.accessors: list[dict] = []
+
+    def add(self, values: np.ndarray, component_type: int, accessor_type: str,
+            normalized: bool = False, bounds: bool = False) -> int:
+        dtype = np.dtype(COMPONENT_DTYPES[component_type]).newbyteorder('<')
+        values = np.ascontiguousarray(values, dtype=dtype).reshape(len(values), -1)
+        self.data.extend(b'\0' * (-len(self.data) % 4))
+        accessor = {'byteOffset': len(self.data), 'componentType': component_type,
+                    'count': len(values), 'type': accessor_type}
+        if normalized:
+            accessor['normalized'] = True
+        if bounds:
+            accessor['min'] = values.min(axis=0).tolist()
+            accessor['max'] = values.max(axis=0).tolist()
+        self.data.extend(values.tobytes())
+        self.accessors.append(accessor)
+        self.glb.json.setdefault('accessors', []).append(accessor)
+        return len(self.glb.json['accessors']) - 1
+
+    def finish(self):
+        """Write the shared view at the end of BIN and point the accessors at it."""
+        if not self.accessors:
+            return
+        glb = self.glb
+        glb.bin.extend(b'\0' * (-len(glb.bin) % 4))
+        glb.json.setdefault('bufferViews', []).append(
+            {'buffer': 0, 'byteOffset': len(glb.bin), 'byteLength': len(self.data)})
+        glb.bin.extend(self.data)
+        for accessor in self.accessors:
+            accessor['bufferView'] = len(glb.json['bufferViews']) - 1
+
+
+def compress_glb(glb: Glb, rotation_tolerance: float = ROTATION_TOLERANCE,
+                 translation_tolerance: float = TRANSLATION_TOLERANCE, fps: float = 0.0) -> dict:
+    """Rewrite every animation sampler of `glb`; returns {clip: stats}."""
+    doc = glb.json
+    inputs: dict[bytes, int] = {}  # shared time accessors by content
+    packer = _Packer(glb)
+    clips = {}
+    for animation_index, animation in enumerate(doc.get('animations', [])):
+        name = animation.get('name') or f'animation_{animation_index}'
+        stats = {'keys': 0, 'kept': 0, 'rotation_error': 0.0, 'translation_error': 0.0}
+        paths = {channel['sampler']: channel['target'].get('path', '') for channel in animation['channels']}
+        for sampler_index, sampler in enumerate(animation['samplers']):
+            path = paths.get(sampler_index, '')
+            interpolation = sampler.get('interpolation', 'LINEAR')
+            times = glb.read_accessor(sampler['input']).astype(np.float64)
+            output = glb.json['accessors'][sampler['output']]
+            values = glb.read_accessor(sampler['output']).astype(np.float64)
+            if output.get('normalized'):
+                values = np.maximum(values / NORMALIZED_MAX[output['componentType']], -1.0)
+            stats['keys'] += len(times)
+            if interpolation == 'CUBICSPLINE' or path == 'weights' or not len(times):
+                stats['kept'] += len(times)
+                continue
+            rotation = path == 'rotation'
+            if rotation:
+                values = _continuous(values)
+            source_times, source_values = times, values
+            if fps and interpolation == 'LINEAR':
+                times, values = resample(times, values, fps, rotation)
+            if interpolation == 'STEP':
+                changed = np.any(np.diff(values, axis=0) != 0, axis=1)
+                keep = np.concatenate([[0], np.nonzero(changed)[0] + 1])
+            elif rotation:
+                keep = reduce_rotation_keys(times, values, rotation_tolerance)
+            else:
+                keep = reduce_keys(times, values, translation_tolerance, rotation)
+            times, values = times[keep], values[keep]
+
+            if rotation:
+                stored = quantize_rotations(values)
+                decoded = stored.astype(np.float64) / SHORT_MAX
+                sampler['output'] = packer.add(stored, SHORT, 'VEC4', normalized=True)
+            else:
+                decoded = values.astype(np.float32).astype(np.float64)
+                sampler['output'] = packer.add(values, FLOAT, output['type'])
+            key = times.astype(np.float32).tobytes()
+            if key not in inputs:
+                inputs[key] = packer.add(times, FLOAT, 'SCALAR', bounds=True)
+            sampler['input'] = inputs[key]
+            stats['kept'] += len(times)
+
+            if interpolation == 'LINEAR':
+                approx = sample(times, decoded, source_times, rotation)
+                if rotation:
+                    stats['rotation_error'] = max(stats['rotation_error'],
+                                                  float(angle_error(approx, source_values).max()))
+                elif path == 'translation':
+                    stats['translation_error'] = max(stats['translation_error'],
+                                                     float(np.abs(approx - source_values).max()))
+        clips[name] = stats
+    packer.finish()
+    glb.compact()
+    return clips
+
+
+def source_digest(path: str) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def output_path(path: str) -> str:
+    return os.path.join(os.path.dirname(path), OUTPUT_DIR, os.path.basename(path))
+
+
+def find_sources(root: str) -> list[str]:
+    """GLBs under root (not in compressed/ folders), relative with /."""
+    rels = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d != OUTPUT_DIR)
+        for fname in sorted(filenames):
+            if fname.endswith('.glb'):
+                rels.append(os.path.relpath(os.path.join(dirpath, fname), root).replace(os.sep, '/'))
+    return rels
+
+
+def _settings(rotation_tolerance: float, translation_tolerance: float, fps: float) -> dict:
+    return {'rotation_tolerance': rotation_tolerance, 'translation_tolerance': translation_tolerance,
+            'fps': fps}
+
+
+def load_manifest(path: str, settings: dict) -> dict:
+    if os.path.exists(path):
+        with open(path) as f:
+            manifest = json.load(f)
+        if manifest.get('version') == MANIFEST_VERSION and manifest.get('settings') == settings:
+            return manifest
+    return {'version': MANIFEST_VERSION, 'settings': settings, 'files': {}}
+
+
+def compress_animations(root: str = PLAYER_DIR, rotation_tolerance: float = ROTATION_TOLERANCE,
+                        translation_tolerance: float = TRANSLATION_TOLERANCE, fps: float = 0.0,
+                        force: bool = False, report: bool = False, metrics=None) -> dict:
+    """Compress every animated GLB under root and rewrite its manifest."""
+    settings = _settings(rotation_tolerance, translation_tolerance, fps)
+    manifest_path = os.path.join(root, MANIFEST_NAME)
+    old = load_manifest(manifest_path, settings)['files']
+    files = {}
+    built = cached = skipped = failed = 0
+    for rel in find_sources(root):
+        path = os.path.join(root, rel)
+        start = time.perf_counter()
+        digest = source_digest(path)
+        entry = old.get(rel)
+        if not force and entry and entry['sha256'] == digest \
+                and os.path.exists(os.path.join(root, entry['file'])):
+            files[rel] = entry
+            cached += 1
+            if metrics:
+                metrics.file('compress', rel, time.perf_counter() - start, status='cached')
+            continue
+        try:
+            glb = Glb.load(path)
+            if not glb.json.get('animations'):
+                skipped += 1
+                continue
+            source_bytes = os.path.getsize(path)
+            clips = compress_glb(glb, rotation_tolerance, translation_tolerance, fps)
+            target = output_path(path)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            written = glb.save(target)
+        except (OSError, ValueError, GlbError, KeyError) as e:
+            failed += 1
+            print(f"  FAILED {rel}: {e}")
+            if metrics:
+                metrics.file('compress', rel, time.perf_counter() - start, status='failed')
+            continue
+        files[rel] = {'sha256': digest, 'file': os.path.relpath(target, root).replace(os.sep, '/'),
+                      'bytes': [source_bytes, written], 'clips': clips}
+        built += 1
+        if metrics:
+            metrics.file('compress', rel, time.perf_counter() - start, source_bytes, written, 'built')
+
+    manifest = {'version': MANIFEST_VERSION, 'settings': settings, 'files': dict(sorted(files.items()))}
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f, indent=1)
+        f.write('\n')
+
+    if report:
+        for rel, entry in manifest['files'].items():
+            print(f"  {rel}: {entry['bytes'][0] / 1024:.1f} KB -> {entry['bytes'][1] / 1024:.1f} KB")
+            print(f"    {'clip':<18} {'keys':>6} {'kept':>6} {'rot °':>7} {'trans m':>8}")
+            for clip, stats in entry['clips'].items():
+                print(f"    {clip:<18} {stats['keys']:>6} {stats['kept']:>6} "
+                      f"{stats['rotation_error']:>7.3f} {stats['translation_error']:>8.4f}")
+    keys = sum(s['keys'] for e in files.values() for s in e['clips'].values())
+    kept = sum(s['kept'] for e in files.values() for s in e['clips'].values())
+    before = sum(e['bytes'][0] for e in files.values())
+    after = sum(e['bytes'][1] for e in files.values())
+    print(f"Animations: {len(files)} files, keys {keys} -> {kept}, "
+          f"{before / 1024:.1f} KB -> {after / 1024:.1f} KB; built {built}, cached {cached}, "
+          f"{skipped} without animations, failed {failed}")
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compress keyframe tracks of animated GLBs")
+    parser.add_argument('root', nargs='?', default=PLAYER_DIR, help="Directory to scan (default: assets/player)")
+    parser.add_argument('--rotation-tolerance', type=float, default=ROTATION_TOLERANCE,
+                        help="Largest rotation error of a dropped key, degrees")
+    parser.add_argument('--translation-tolerance', type=float, default=TRANSLATION_TOLERANCE,
+                        help="Largest translation/scale error of a dropped key, metres")
+    parser.add_argument('--fps', type=float, default=0.0, help="Resample LINEAR tracks to this rate first (0 = keep)")
+    parser.add_argument('--force', action='store_true', help="Rebuild every file, ignoring the manifest hashes")
+    parser.add_argument('--report', action='store_true', help="Print keys and errors per clip")
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.root):
+        print(f"ERROR: directory not found: {args.root}")
+        sys.exit(1)
+    if args.rotation_tolerance < 0 or args.translation_tolerance < 0 or args.fps < 0:
+        print("ERROR: tolerances and --fps must not be negative")
+        sys.exit(1)
+
+    metrics = metrics_from_args('compress_animations', args)
+    with metrics.stage('compress'):
+        compress_animations(args.root, args.rotation_tolerance, args.translation_tolerance, args.fps,
+                            args.force, args.report, metrics)
+    metrics.finish()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+"""SQLite content store written alongside the generated .tres files.
+
+Both importers (scripts/tools/import_content.py and tools/convert_psz_data.py)
+push every source record through ContentDB.put(), so tools that need game
+data can run indexed queries instead of re-parsing JSON or scraping .tres.
+
+Updates are incremental: each row remembers the hash of the record it came
+from, unchanged records are skipped, and records that disappear from a
+category are pruned at the end of that category's import. Name references
+(drop table enemies/items, armor set bonuses) are resolved to foreign keys
+in a final link() pass, so the two importers can run in any order.
+
+Usage (as a module):
+    db = ContentDB(DEFAULT_DB_PATH)
+    db.put('weapons', 'gun_diva', data, source=path)
+    db.prune('weapons')
+    db.close()
+
+Usage (inspect):
+    python3 scripts/tools/content_db.py [path/to/content.db]
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+
+GODOT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+DEFAULT_DB_PATH = os.path.join(GODOT_ROOT, 'build', 'content.db')
+ENVIRONMENTS_DIR = os.path.join(GODOT_ROOT, 'assets', 'environments')
+
+SCHEMA_VERSION = 1
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS sources (
+    category TEXT NOT NULL,
+    content_id TEXT NOT NULL,
+    path TEXT,
+    sha1 TEXT NOT NULL,
+    PRIMARY KEY (category, content_id)
+);
+
+CREATE TABLE IF NOT EXISTS weapons (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    japanese_name TEXT,
+    weapon_type TEXT,
+    rarity INTEGER,
+    level INTEGER,
+    attack_base INTEGER,
+    attack_max INTEGER,
+    accuracy_base INTEGER,
+    accuracy_max INTEGER,
+    element TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS weapons_name ON weapons(name);
+CREATE INDEX IF NOT EXISTS weapons_type ON weapons(weapon_type, rarity);
+
+CREATE TABLE IF NOT EXISTS weapon_photon_arts (
+    weapon_id TEXT NOT NULL REFERENCES weapons(id) ON DELETE CASCADE,
+    slot INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    attack_mod REAL,
+    accuracy_mod REAL,
+    pp_used INTEGER,
+    element TEXT,
+    PRIMARY KEY (weapon_id, slot)
+);
+CREATE INDEX IF NOT EXISTS weapon_photon_arts_name ON weapon_photon_arts(name);
+
+CREATE TABLE IF NOT EXISTS armors (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    japanese_name TEXT,
+    type TEXT,
+    rarity INTEGER,
+    level INTEGER,
+    defense_base INTEGER,
+    defense_max INTEGER,
+    evasion_base INTEGER,
+    evasion_max INTEGER,
+    max_slots INTEGER,
+    set_bonus TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS armors_name ON armors(name);
+
+CREATE TABLE IF NOT EXISTS enemies (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    japanese_name TEXT,
+    element TEXT,
+    is_rare INTEGER,
+    is_boss INTEGER,
+    model_id TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS enemies_name ON enemies(name);
+
+CREATE TABLE IF NOT EXISTS enemy_locations (
+    enemy_id TEXT NOT NULL REFERENCES enemies(id) ON DELETE CASCADE,
+    location TEXT NOT NULL,
+    PRIMARY KEY (enemy_id, location)
+);
+CREATE INDEX IF NOT EXISTS enemy_locations_location ON enemy_locations(location);
+
+CREATE TABLE IF NOT EXISTS content (
+    category TEXT NOT NULL,
+    id TEXT NOT NULL,
+    name TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (category, id)
+);
+CREATE INDEX IF NOT EXISTS content_name ON content(name);
+
+CREATE TABLE IF NOT EXISTS set_bonus_weapons (
+    set_bonus_id TEXT NOT NULL,
+    weapon_name TEXT NOT NULL,
+    armor_id TEXT REFERENCES armors(id) ON DELETE SET NULL,
+    weapon_id TEXT REFERENCES weapons(id) ON DELETE SET NULL,
+    PRIMARY KEY (set_bonus_id, weapon_name)
+);
+
+CREATE TABLE IF NOT EXISTS missions (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    area TEXT,
+    is_main INTEGER,
+    is_secret INTEGER,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS mission_requires (
+    mission_id TEXT NOT NULL REFERENCES missions(id) ON DELETE CASCADE,
+    required_id TEXT NOT NULL,
+    PRIMARY KEY (mission_id, required_id)
+);
+CREATE INDEX IF NOT EXISTS mission_requires_required ON mission_requires(required_id);
+
+CREATE TABLE IF NOT EXISTS quests (
+    id TEXT PRIMARY KEY,
+    quest_name TEXT NOT NULL,
+    quest_type TEXT,
+    area TEXT,
+    is_repeatable INTEGER,
+    is_secret INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS quests_area ON quests(area);
+
+CREATE TABLE IF NOT EXISTS drops (
+    difficulty TEXT NOT NULL,
+    area TEXT NOT NULL,
+    enemy_name TEXT NOT NULL,
+    slot INTEGER NOT NULL,
+    item_name TEXT NOT NULL,
+    enemy_id TEXT REFERENCES enemies(id) ON DELETE SET NULL,
+    weapon_id TEXT REFERENCES weapons(id) ON DELETE SET NULL,
+    armor_id TEXT REFERENCES armors(id) ON DELETE SET NULL,
+    PRIMARY KEY (difficulty, area, enemy_name, slot)
+);
+CREATE INDEX IF NOT EXISTS drops_item ON drops(item_name);
+CREATE INDEX IF NOT EXISTS drops_weapon ON drops(weapon_id);
+CREATE INDEX IF NOT EXISTS drops_enemy ON drops(enemy_id);
+
+CREATE TABLE IF NOT EXISTS stage_configs (
+    map_id TEXT PRIMARY KEY,
+    area TEXT NOT NULL,
+    path TEXT NOT NULL,
+    portal_count INTEGER,
+    obstacle_count INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS stage_configs_area ON stage_configs(area);
+'''
+
+
+def _record_hash(data) -> str:
+    raw = json.dumps(data, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return hashlib.sha1(raw).hexdigest()
+
+
+def _json(data) -> str:
+    return json.dumps(data, ensure_ascii=False)
+
+
+def _write_weapon(cur, content_id, data):
+    cur.execute(
+        'INSERT OR REPLACE INTO weapons VALUES (?,?,?,?,?,?,?,?,?,?,?,?)',
+        (content_id, data.get('name', ''), data.get('japaneseName', ''),
+         data.get('weaponType', ''), data.get('rarity', 1), data.get('level', 1),
+         data.get('attackBase', 0) or 0, data.get('attackMax', 0) or 0,
+         data.get('accuracyBase', 0), data.get('accuracyMax', 0),
+         data.get('element', '') or '', _json(data)))
+    cur.execute('DELETE FROM weapon_photon_arts WHERE weapon_id = ?', (content_id,))
+    cur.executemany(
+        'INSERT INTO weapon_photon_arts VALUES (?,?,?,?,?,?,?)',
+        [(content_id, slot, pa.get('name', ''), pa.get('attackMod', 0),
+          pa.get('accuracyMod', 0), pa.get('ppUsed', 0), pa.get('element', '-'))
+         for slot, pa in enumerate(data.get('photonArts', []) or [])])
+
+
+def _write_armor(cur, content_id, data):
+    cur.execute(
+        'INSERT OR REPLACE INTO armors VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)',
+        (content_id, data.get('name', ''), data.get('japaneseName', ''),
+         data.get('type', 'Armor'), data.get('rarity', 1), data.get('level', 1) or 1,
+         data.get('defenseBase', 0), data.get('defenseMax', 0),
+         data.get('evasionBase', 0), data.get('evasionMax', 0),
+         data.get('maxSlots', 0), data.get('setBonus', '') or '', _json(data)))
+
+
+def _write_enemy(cur, content_id, data):
+    cur.execute(
+        'INSERT OR REPLACE INTO enemies VALUES (?,?,?,?,?,?,?,?)',
+        (content_id, data.get('name', ''), data.get('japaneseName', ''),
+         data.get('element', 'Native'), int(bool(data.get('isRare', False))),
+         int(bool(data.get('isBoss', False))), data.get('modelId', ''), _json(data)))
+    cur.execute('DELETE FROM enemy_locations WHERE enemy_id = ?', (content_id,))
+    cur.executemany(
+        'INSERT OR IGNORE INTO enemy_locations VALUES (?,?)',
+        [(content_id, loc) for loc in data.get('locations', [])])
+
+
+def _write_mission(cur, content_id, data):
+    cur.execute(
+        'INSERT OR REPLACE INTO missions VALUES (?,?,?,?,?,?)',
+        (content_id, data.get('name', ''), data.get('area', ''),
+         int(bool(data.get('main', False))), int(bool(data.get('isSecret', False))),
+         _json(data)))
+    cur.execute('DELETE FROM mission_requires WHERE mission_id = ?', (content_id,))
+    cur.executemany(
+        'INSERT OR IGNORE INTO mission_requires VALUES (?,?)',
+        [(content_id, req) for req in data.get('requires', [])])
+
+
+def _write_quest(cur, content_id, data):
+    cur.execute(
+        'INSERT OR REPLACE INTO quests VALUES (?,?,?,?,?,?,?)',
+        (content_id, data.get('questName', ''), data.get('questType', ''),
+         data.get('area', ''), int(bool(data.get('isRepeatable', False))),
+         int(bool(data.get('isSecret', False))), _json(data)))
+
+
+def _write_drop_table(cur, content_id, data):
+    cur.execute('DELETE FROM drops WHERE difficulty = ?', (content_id,))
+    rows = []
+    for area, enemies in data.items():
+        for enemy_name, items in enemies.items():
+            for slot, item_name in enumerate(items):
+                rows.append((content_id, area, enemy_name, slot, item_name))
+    cur.executemany(
+        'INSERT INTO drops (difficulty, area, enemy_name, slot, item_name) VALUES (?,?,?,?,?)',
+        rows)
+
+
+def _write_set_bonus(cur, content_id, data):
+    _write_content(cur, 'set_bonuses', content_id, data, data.get('armor', ''))
+    cur.execute('DELETE FROM set_bonus_weapons WHERE set_bonus_id = ?', (content_id,))
+    cur.executemany(
+        'INSERT OR IGNORE INTO set_bonus_weapons (set_bonus_id, weapon_name) VALUES (?,?)',
+        [(content_id, name) for name in data.get('weapons', [])])
+
+
+def _write_stage_config(cur, content_id, data):
+    cur.execute(
+        'INSERT OR REPLACE INTO stage_configs VALUES (?,?,?,?,?,?)',
+        (content_id, data.get('_area', ''), data.get('_path', ''),
+         len(data.get('portals', []) or []), len(data.get('obstacles', []) or []),
+         _json({k: v for k, v in data.items() if not k.startswith('_')})))
+
+
+def _write_content(cur, category, content_id, data, name=None):
+    if name is None:
+        name = data.get('name', data.get('areaName', ''))
+    cur.execute('INSERT OR REPLACE INTO content VALUES (?,?,?,?)',
+                (category, content_id, name, _json(data)))
+
+
+_WRITERS = {
+    'weapons': _write_weapon,
+    'armors': _write_armor,
+    'enemies': _write_enemy,
+    'missions': _write_mission,
+    'quest_definitions': _write_quest,
+    'drop_tables': _write_drop_table,
+    'set_bonuses': _write_set_bonus,
+    'stage_configs': _write_stage_config,
+}
+
+# Rows to remove when a record disappears: (table, key column)
+_DELETE = {
+    'weapons': [('weapons', 'id')],
+    'armors': [('armors', 'id')],
+    'enemies': [('enemies', 'id')],
+    'missions': [('missions', 'id')],
+    'quest_definitions': [('quests', 'id')],
+    'drop_tables': [('drops', 'difficulty')],
+    'set_bonuses': [('set_bonus_weapons', 'set_bonus_id')],
+    'stage_configs': [('stage_configs', 'map_id')],
+}
+
+
+class ContentDB:
+    """Incrementally maintained SQLite mirror of the imported content."""
+
+    def __init__(self, path: str = DEFAULT_DB_PATH):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA foreign_keys = ON')
+        self.conn.execute('PRAGMA journal_mode = WAL')
+        version = self.conn.execute('PRAGMA user_version').fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            raise RuntimeError(f"{path}: schema v{version}, expected v{SCHEMA_VERSION}; delete it to rebuild")
+        self.conn.executescript(SCHEMA)
+        self.conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        self._seen: dict[str, set] = {}
+        self.changed = 0
+        self.unchanged = 0
+
+    def put(self, category: str, content_id: str, data, source: str | None = None) -> bool:
+        """Insert or update one record. Returns False if it was already current."""
+        self._seen.setdefault(category, set()).add(content_id)
+        digest = _record_hash(data)
+        row = self.conn.execute(
+            'SELECT sha1 FROM sources WHERE category = ? AND content_id = ?',
+            (category, content_id)).fetchone()
+        if row and row[0] == digest:
+            self.unchanged += 1
+            return False
+
+        cur = self.conn.cursor()
+        writer = _WRITERS.get(category)
+        if writer:
+            writer(cur, content_id, data)
+        else:
+            _write_content(cur, category, content_id, data)
+        cur.execute('INSERT OR REPLACE INTO sources VALUES (?,?,?,?)',
+                    (category, content_id, source, digest))
+        self.changed += 1
+        return True
+
+    def delete(self, category: str, content_id: str):
+        cur = self.conn.cursor()
+        for table, column in _DELETE.get(category, []):
+            cur.execute(f'DELETE FROM {table} WHERE {column} = ?', (content_id,))
+        cur.execute('DELETE FROM content WHERE category = ? AND id = ?', (category, content_id))
+        cur.execute('DELETE FROM sources WHERE category = ? AND content_id = ?', (category, content_id))
+
+    def prune(self, category: str) -> int:
+        """Drop records of `category` that weren't put() during this import."""
+        seen = self._seen.get(category, set())
+        stale = [row[0] for row in self.conn.execute(
+            'SELECT content_id FROM sources WHERE category = ?', (category,))
+            if row[0] not in seen]
+        for content_id in stale:
+            self.delete(category, content_id)
+        return len(stale)
+
+    def link(self):
+        """Resolve display-name references into foreign key columns."""
+        cur = self.conn.cursor()
+        cur.execute('''UPDATE drops SET
+            enemy_id = (SELECT id FROM enemies WHERE enemies.name = drops.enemy_name),
+            weapon_id = (SELECT id FROM weapons WHERE weapons.name = drops.item_name),
+            armor_id = (SELECT id FROM armors WHERE armors.name = drops.item_name)''')
+        cur.execute('''UPDATE set_bonus_weapons SET
+            weapon_id = (SELECT id FROM weapons WHERE weapons.name = set_bonus_weapons.weapon_name),
+            armor_id = (SELECT armors.id FROM armors JOIN content
+                ON content.category = 'set_bonuses' AND content.id = set_bonus_weapons.set_bonus_id
+                WHERE armors.name = content.name)''')
+
+    def commit(self):
+        self.link()
+        self.conn.commit()
+
+    def close(self):
+        self.commit()
+        self.conn.close()
+
+
+def index_stage_configs(db: ContentDB, environments_dir: str = ENVIRONMENTS_DIR) -> int:
+    """Mirror assets/environments/<area>/<map>_config.json into stage_configs."""
+    if not os.path.isdir(environments_dir):
+        return 0
+    count = 0
+    for area in sorted(os.listdir(environments_dir)):
+        area_dir = os.path.join(environments_dir, area)
+        if not os.path.isdir(area_dir):
+            continue
+        for fname in sorted(os.listdir(area_dir)):
+            if not fname.endswith('_config.json'):
+                continue
+            path = os.path.join(area_dir, fname)
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            map_id = data.get('mapId') or fname[:-len('_config.json')]
+            data['_area'] = area
+            data['_path'] = os.path.relpath(path, GODOT_ROOT)
+            db.put('stage_configs', map_id, data, source=path)
+            count += 1
+    db.prune('stage_configs')
+    return count
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_DB_PATH
+    if not os.path.exists(path):
+        print(f"Error: database not found: {path}")
+        sys.exit(1)
+    conn = sqlite3.connect(path)
+    tables = [row[0] for row in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name")]
+    print(f"{path} (schema v{conn.execute('PRAGMA user_version').fetchone()[0]})")
+    for table in tables:
+        count = conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+        print(f"  {table}: {count} rows")
+    unresolved = conn.execute(
+        'SELECT COUNT(*) FROM drops WHERE weapon_id IS NULL AND armor_id IS NULL').fetchone()[0]
+    print(f"  drops without a weapon/armor match: {unresolved}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,573 @@
+#!/usr/bin/env python3
+"""Unified psz-sketch content import pipeline.
+
+Scans src/content once with os.scandir, dispatches every JSON file to the
+converter registered for its directory, and then runs derived stages (spawn
+pools, indexes, ...) once everything they depend on has been converted.
+Each file is read and parsed exactly once; derived stages work from the
+parsed records kept in memory.
+
+Converters live in import_content.py and tools/convert_psz_data.py; both of
+those CLIs now run this pipeline restricted to their own categories.
+
+Usage:
+    python3 scripts/tools/content_pipeline.py /path/to/psz-sketch
+    python3 scripts/tools/content_pipeline.py /path/to/psz-sketch --only weapons,enemies
+    python3 scripts/tools/content_pipeline.py /path/to/psz-sketch --no-db
+    python3 scripts/tools/content_pipeline.py /path/to/psz-sketch --watch [--poll]
+    python3 scripts/tools/content_pipeline.py /path/to/psz-sketch --output /tmp/data --db /tmp/content.db
+    python3 scripts/tools/content_pipeline.py /path/to/psz-sketch --profile --metrics-json metrics.json
+    python3 scripts/tools/content_pipeline.py --list
+
+--watch keeps the pipeline resident after the initial import and re-imports
+only changed, added or deleted files (see content_watch.py).
+
+--profile prints per-category wall/CPU time split into parse, convert and DB
+phases with the slowest files; --metrics-json writes the same as JSON and
+--cprofile DIR dumps a .prof per category (see tool_metrics.py).
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+GODOT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, '..', '..'))
+DATA_DIR = os.path.join(GODOT_ROOT, 'data')
+
+sys.path.insert(0, os.path.join(GODOT_ROOT, 'tools'))
+
+import convert_psz_data  # noqa: E402
+import import_content  # noqa: E402
+from content_db import ContentDB, DEFAULT_DB_PATH, index_stage_configs  # noqa: E402
+from item_references import (ITEM_CATEGORIES, OUTPUT_NAME as OUTPUT_ITEM_REFERENCES,  # noqa: E402
+                             index_for, save_item_references)
+from mag_tables import OUTPUT_NAME as OUTPUT_MAG_TABLES, MagTablesBuilder  # noqa: E402
+from set_bonus_table import SetBonusTableBuilder  # noqa: E402
+from stage_spatial_index import build_stage_spatial_index  # noqa: E402
+from string_table import save_string_table  # noqa: E402
+from tres_reader import TresParseError, read_tres  # noqa: E402
+from unlock_graph import OUTPUT_NAME as OUTPUT_UNLOCK_GRAPH, UnlockGraphBuilder  # noqa: E402
+from tool_metrics import VALUE_FLAGS, Metrics, metrics_from_options  # noqa: E402
+
+
+class Category:
+    """A psz-sketch content directory and its per-file converter.
+
+    convert(path, data, data_dir) writes the .tres and returns the content id;
+    `output` is that file's path under data/, with {id} for the content id.
+    """
+
+    def __init__(self, name, source, label, convert, output=None, depends=()):
+        self.name = name
+        self.source = source
+        self.label = label
+        self.convert = convert
+        self.output = output or name + '/{id}.tres'
+        self.depends = tuple(depends)
+
+    def output_path(self, data_dir: str, content_id: str) -> str:
+        return os.path.join(data_dir, self.output.format(id=content_id))
+
+
+class Stage:
+    """A derived output built from already-converted categories.
+
+    run(pipeline) returns a count for the summary line. `triggers` are
+    categories whose changes make the stage stale in watch mode without being
+    required in the plan (for stages that read data/ rather than records, or
+    keep a builder that _update_builder seeds from data/).
+    """
+
+    def __init__(self, name, label, run, depends=(), needs_db=False, triggers=()):
+        self.name = name
+        self.label = label
+        self.run = run
+        self.depends = tuple(depends)
+        self.needs_db = needs_db
+        self.triggers = tuple(triggers)
+
+
+class Record:
+    __slots__ = ('path', 'stem', 'content_id', 'data')
+
+    def __init__(self, path, stem, content_id, data):
+        self.path = path
+        self.stem = stem
+        self.content_id = content_id
+        self.data = data
+
+
+CATEGORIES: dict[str, Category] = {}
+STAGES: dict[str, Stage] = {}
+
+
+def register_category(name, source, label, convert, output=None, depends=()):
+    CATEGORIES[name] = Category(name, source, label, convert, output, depends)
+
+
+def register_stage(name, label, run, depends=(), needs_db=False, triggers=()):
+    STAGES[name] = Stage(name, label, run, depends, needs_db, triggers)
+
+
+def _path_converter(func):
+    """Adapt a convert_psz_data converter (Path arguments) to the pipeline."""
+    def convert(path, data, data_dir):
+        return func(Path(path), Path(data_dir), data)
+    return convert
+
+
+# ---- Registered categories (order is the report order) ----
+register_category('classes', 'classes', 'Classes', import_content.convert_class)
+register_category('consumables', 'consumables', 'Consumables', import_content.convert_consumable)
+register_category('units', 'units', 'Units', import_content.convert_unit)
+register_category('photon_arts', 'photon-arts', 'Photon Arts', import_content.convert_photon_art)
+register_category('mags', 'mags', 'Mags', import_content.convert_mag)
+register_category('missions', 'missions', 'Missions', import_content.convert_mission,
+                  depends=ITEM_CATEGORIES)
+register_category('quest_areas', 'quest-areas', 'Quest Areas', import_content.convert_quest_area)
+register_category('quest_definitions', 'quest-definitions', 'Quest Definitions',
+                  import_content.convert_quest_definition)
+register_category('materials', 'materials', 'Materials', import_content.convert_material)
+register_category('set_bonuses', 'set-bonuses', 'Set Bonuses', import_content.convert_set_bonus,
+                  depends=ITEM_CATEGORIES)
+register_category('drop_tables', 'drops', 'Drop Tables', import_content.convert_drop_table,
+                  depends=ITEM_CATEGORIES)
+register_category('shops', 'shops', 'Shops', import_content.convert_shop, depends=ITEM_CATEGORIES)
+register_category('mag_personalities', 'mag-personalities', 'Mag Personalities',
+                  import_content.convert_mag_personality)
+register_category('modifiers', 'modifiers', 'Modifiers', import_content.convert_modifier)
+register_category('experience', 'experience', 'Experience Table', import_content.convert_experience,
+                  output='experience_table.tres')
+register_category('weapons', 'weapons', 'Weapons', _path_converter(convert_psz_data.convert_weapon),
+                  depends=['photon_arts'])
+register_category('armors', 'armors', 'Armors', _path_converter(convert_psz_data.convert_armor))
+register_category('enemies', 'enemies', 'Enemies', _path_converter(convert_psz_data.convert_enemy))
+
+
+# ---- Registered derived stages ----
+def _build_spawn_pools(pipeline) -> int:
+    enemies = {r.stem: r.data for r in pipeline.records['enemies'].values()}
+    return convert_psz_data.build_spawn_pools(enemies, Path(pipeline.data_dir))
+
+
+def _index_stage_configs(pipeline) -> int:
+    return index_stage_configs(pipeline.db)
+
+
+def _build_stage_spatial_index(pipeline) -> int:
+    return len(build_stage_spatial_index(pipeline.data_dir))
+
+
+def _update_builder(pipeline, name: str, new, updates: dict):
+    """The stage's builder, brought up to date with the outputs converted since
+    its last run.
+
+    `updates` maps a category to the builder method taking (content id,
+    converted .tres or None for removed). A new builder is seeded from every
+    .tres under the category's data/ directory once; after that only the
+    records converted or removed since are read again.
+    """
+    builder = pipeline.builders.get(name)
+    if builder is None:
+        builder = pipeline.builders[name] = new()
+        pipeline.pending[name] = {category: {} for category in updates}
+        for category, update in updates.items():
+            out_dir = os.path.dirname(CATEGORIES[category].output_path(pipeline.data_dir, ''))
+            if not os.path.isdir(out_dir):
+                continue
+            for fname in sorted(os.listdir(out_dir)):
+                if fname.endswith('.tres'):
+                    update(builder, fname[:-len('.tres')], _read_output(os.path.join(out_dir, fname)))
+        return builder
+    for category, changed in pipeline.pending[name].items():
+        for content_id, out in sorted(changed.items()):
+            updates[category](builder, content_id, out and _read_output(out))
+        changed.clear()
+    return builder
+
+
+def _read_output(path: str) -> dict | None:
+    try:
+        return read_tres(path)
+    except (OSError, TresParseError) as e:
+        print(f"  Skipping {path}: {e}")
+        return None
+
+
+def _build_set_bonus_table(pipeline) -> int:
+    builder = _update_builder(pipeline, 'set_bonus_table', SetBonusTableBuilder,
+                              {'set_bonuses': SetBonusTableBuilder.update})
+    return len(builder.write(pipeline.data_dir))
+
+
+def _save_item_references(pipeline) -> int:
+    index = save_item_references(pipeline.data_dir)
+    for problem in index.all_problems():
+        print(f"  Item references: {problem}")
+        pipeline.errors.append((OUTPUT_ITEM_REFERENCES, problem))
+    return len(index.ids)
+
+
+def _build_mag_tables(pipeline) -> int:
+    builder = _update_builder(pipeline, 'mag_tables', MagTablesBuilder,
+                              {'mags': MagTablesBuilder.update_mag,
+                               'mag_personalities': MagTablesBuilder.update_personality})
+    forms, switches, unparsed = builder.write(pipeline.data_dir)
+    pipeline.errors.extend((OUTPUT_MAG_TABLES, f"{personality_id}: can't parse switch_from '{text}'")
+                           for personality_id, text in unparsed)
+    return forms + switches
+
+
+def _build_unlock_graph(pipeline) -> int:
+    builder = _update_builder(pipeline, 'unlock_graph', UnlockGraphBuilder,
+                              {'missions': UnlockGraphBuilder.update_mission,
+                               'quest_definitions': UnlockGraphBuilder.update_quest})
+    graphs = builder.write(pipeline.data_dir)
+    for graph in graphs:
+        pipeline.errors.extend((OUTPUT_UNLOCK_GRAPH, problem) for problem in graph.problems)
+    return sum(len(graph.order) for graph in graphs)
+
+
+def _save_string_table(pipeline) -> int:
+    return save_string_table(pipeline.data_dir)
+
+
+register_stage('spawn_pools', 'Spawn Pools (areas)', _build_spawn_pools, depends=['enemies'])
+register_stage('stage_configs', 'Stage Configs (DB)', _index_stage_configs, needs_db=True)
+register_stage('stage_spatial_index', 'Stage Spatial Index (maps)', _build_stage_spatial_index)
+register_stage('set_bonus_table', 'Set Bonus Table (pairs)', _build_set_bonus_table,
+               depends=['set_bonuses'])
+# Item converters index names and the referencing converters resolve through
+# the index as they write, so this saves it and reports what didn't resolve
+register_stage('item_references', 'Item References (names)', _save_item_references,
+               triggers=list(ITEM_CATEGORIES) + ['shops', 'drop_tables', 'set_bonuses', 'missions'])
+register_stage('mag_tables', 'Mag Tables (entries)', _build_mag_tables,
+               depends=['mags'], triggers=['mag_personalities'])
+register_stage('unlock_graph', 'Unlock Graph (ids)', _build_unlock_graph,
+               triggers=['missions', 'quest_definitions'])
+# Converters intern into the shared table as they write, so this only saves it
+# (when something was added); it runs last and after partial imports too
+register_stage('string_table', 'String Table (strings)', _save_string_table,
+               triggers=list(CATEGORIES))
+
+IMPORT_CONTENT_CATEGORIES = [
+    'classes', 'consumables', 'units', 'photon_arts', 'mags', 'missions',
+    'quest_areas', 'quest_definitions', 'materials', 'set_bonuses',
+    'drop_tables', 'shops', 'mag_personalities', 'modifiers', 'experience',
+]
+CONVERT_PSZ_CATEGORIES = ['weapons', 'armors', 'enemies']
+
+
+class ContentPipeline:
+    """Holds the parsed records of one import so derived stages can reuse them."""
+
+    def __init__(self, content_dir: str, data_dir: str = DATA_DIR, db: ContentDB | None = None,
+                 metrics: Metrics | None = None):
+        self.content_dir = content_dir
+        self.data_dir = data_dir
+        self.db = db
+        self.metrics = metrics or Metrics('content_pipeline')
+        self.records: dict[str, dict[str, Record]] = {name: {} for name in CATEGORIES}
+        self.errors: list[tuple[str, str]] = []
+        # Stage builders kept across watch-mode updates, and per stage the
+        # {category: {content id: output path or None if removed}} they haven't seen
+        self.builders: dict[str, object] = {}
+        self.pending: dict[str, dict[str, dict[str, str | None]]] = {}
+
+    def scan(self, categories) -> dict[str, list[str]]:
+        """One pass over the content tree: {category: sorted JSON paths}.
+
+        Categories whose directory is missing are left out of the result.
+        """
+        by_source = {CATEGORIES[name].source: name for name in categories}
+        found: dict[str, list[str]] = {}
+        with os.scandir(self.content_dir) as top:
+            for entry in top:
+                name = by_source.get(entry.name)
+                if name is None or not entry.is_dir():
+                    continue
+                with os.scandir(entry.path) as files:
+                    found[name] = sorted(
+                        f.path for f in files
+                        if f.name.endswith('.json') and f.is_file())
+        return found
+
+    def plan(self, categories) -> list[str]:
+        """Order categories and stages so every node runs after its dependencies.
+
+        A stage is scheduled only if all of its dependencies are; ties keep
+        registration order so reports stay stable.
+        """
+        pending = [name for name in CATEGORIES if name in categories]
+        for stage in STAGES.values():
+            if stage.needs_db and self.db is None:
+                continue
+            pending.append(stage.name)
+
+        nodes = {**CATEGORIES, **STAGES}
+        scheduled = set(pending)
+        changed = True
+        while changed:
+            changed = False
+            for name in list(pending):
+                if name in STAGES and not all(dep in scheduled for dep in nodes[name].depends):
+                    pending.remove(name)
+                    scheduled.discard(name)
+                    changed = True
+
+        order = []
+        done = set()
+        while pending:
+            for name in pending:
+                if all(dep in done or dep not in scheduled for dep in nodes[name].depends):
+                    break
+            else:
+                raise RuntimeError(f"dependency cycle among: {', '.join(pending)}")
+            pending.remove(name)
+            order.append(name)
+            done.add(name)
+        return order
+
+    def convert_file(self, category: str, path: str) -> Record | None:
+        """Parse and convert one source file; keeps its record in memory."""
+        cat = CATEGORIES[category]
+        previous = self.records[category].get(path)
+        start = time.perf_counter()
+        raw = b''
+        try:
+            with open(path, 'rb') as f:
+                raw = f.read()
+            data = json.loads(raw)
+            parsed = time.perf_counter()
+            content_id = cat.convert(path, data, self.data_dir)
+        except Exception as e:
+            self.errors.append((path, str(e)))
+            print(f"  Error converting {path}: {e}")
+            self.metrics.file(category, path, time.perf_counter() - start, len(raw), status='failed')
+            return None
+        converted = time.perf_counter()
+        if previous and previous.content_id != content_id:
+            # Renamed record (ids come from names): drop the stale output
+            self._remove_output(category, previous.content_id)
+        record = Record(path, os.path.splitext(os.path.basename(path))[0], content_id, data)
+        self.records[category][path] = record
+        if category in ITEM_CATEGORIES:
+            index_for(self.data_dir).add(category, content_id, data.get('name', ''))
+        self._output_changed(category, content_id, cat.output_path(self.data_dir, content_id))
+        status = 'written'
+        if self.db:
+            changed = self.db.put(category, content_id, data if isinstance(data, dict) else {'items': data},
+                                  source=path)
+            status = 'changed' if changed else 'unchanged'
+        done = time.perf_counter()
+        if self.metrics.enabled:
+            out = cat.output_path(self.data_dir, content_id)
+            written = os.path.getsize(out) if os.path.exists(out) else 0
+            self.metrics.file(category, path, done - start, len(raw), written, status,
+                              {'parse_s': parsed - start, 'convert_s': converted - parsed,
+                               'db_s': done - converted})
+        return record
+
+    def remove_file(self, category: str, path: str) -> bool:
+        """Forget a deleted source file and remove what it generated."""
+        record = self.records[category].pop(path, None)
+        if record is None:
+            return False
+        self._remove_output(category, record.content_id)
+        return True
+
+    def _remove_output(self, category: str, content_id: str):
+        # Another source file may still produce the same id
+        if any(r.content_id == content_id for r in self.records[category].values()):
+            return
+        out = CATEGORIES[category].output_path(self.data_dir, content_id)
+        if os.path.exists(out):
+            os.remove(out)
+        if category in ITEM_CATEGORIES:
+            index_for(self.data_dir).remove(content_id)
+        self._output_changed(category, content_id, None)
+        if self.db:
+            self.db.delete(category, content_id)
+
+    def _output_changed(self, category: str, content_id: str, out: str | None):
+        for changed in self.pending.values():
+            if category in changed:
+                changed[category][content_id] = out
+
+    def category_for(self, path: str) -> str | None:
+        """Map a source path back to its registered category."""
+        parent = os.path.dirname(os.path.normpath(path))
+        if os.path.dirname(parent) != os.path.normpath(self.content_dir):
+            return None
+        source = os.path.basename(parent)
+        for cat in CATEGORIES.values():
+            if cat.source == source:
+                return cat.name
+        return None
+
+    def dependent_stages(self, categories) -> list[str]:
+        """Stages (in plan order) that transitively depend on `categories`."""
+        dirty = set(categories)
+        stages = []
+        for name in self.plan(list(CATEGORIES)):
+            if name in STAGES and dirty.intersection(STAGES[name].depends + STAGES[name].triggers):
+                stages.append(name)
+                dirty.add(name)
+        return stages
+
+    def apply_changes(self, changes: dict[str, bool]) -> list[tuple[str, int]]:
+        """Incremental update. `changes` maps source paths to True (written) or
+        False (deleted); only those files and their dependent stages are rebuilt.
+        """
+        touched = {}
+        for path, exists in sorted(changes.items()):
+            category = self.category_for(path)
+            if category is None or not path.endswith('.json'):
+                continue
+            if exists:
+                ok = self.convert_file(category, path) is not None
+            else:
+                ok = self.remove_file(category, path)
+            if ok:
+                touched[category] = touched.get(category, 0) + 1
+
+        report = [(CATEGORIES[name].label, count) for name, count in touched.items()]
+        for name in self.dependent_stages(touched):
+            report.append((STAGES[name].label, self.run_stage(name)))
+        if self.db and touched:
+            self.db.commit()
+        return report
+
+    def run_category(self, category: str, paths: list[str]) -> int:
+        count = 0
+        with self.metrics.stage(category):
+            for path in paths:
+                if self.convert_file(category, path):
+                    count += 1
+            if self.db and count:
+                self.db.prune(category)
+        return count
+
+    def run_stage(self, name: str) -> int:
+        with self.metrics.stage(name):
+            return STAGES[name].run(self)
+
+    def run(self, categories=None) -> list[tuple[str, int]]:
+        """Full import of the given categories (default: all). Returns report rows."""
+        categories = list(CATEGORIES) if categories is None else list(categories)
+        found = self.scan(categories)
+        if all(name in found for name in ITEM_CATEGORIES):
+            # Every item is converted again, so names of removed items go too
+            index_for(self.data_dir, fresh=True)
+        report = []
+        for name in self.plan(categories):
+            if name in CATEGORIES:
+                if name not in found:
+                    print(f"  Skipping {name}: {CATEGORIES[name].source}/ not found")
+                    continue
+                report.append((CATEGORIES[name].label, self.run_category(name, found[name])))
+            else:
+                report.append((STAGES[name].label, self.run_stage(name)))
+        return report
+
+
+def run_pipeline(content_dir: str, data_dir: str = DATA_DIR, categories=None,
+                 db_path: str | None = DEFAULT_DB_PATH, keep_open: bool = False,
+                 metrics: Metrics | None = None) -> ContentPipeline:
+    """CLI driver shared by this tool, import_content.py and convert_psz_data.py.
+
+    With keep_open the DB stays open (committed) for a following watch loop.
+    metrics (tool_metrics.Metrics) gets per-category timings and is finished here.
+    """
+    if not os.path.isdir(content_dir):
+        print(f"Error: content directory not found: {content_dir}")
+        sys.exit(1)
+
+    print(f"Importing from: {content_dir}")
+    print(f"Outputting to:  {data_dir}")
+    print()
+
+    db = ContentDB(db_path) if db_path else None
+    pipeline = ContentPipeline(content_dir, data_dir, db, metrics)
+    total = 0
+    derived = []
+    stage_labels = {stage.label for stage in STAGES.values()}
+    for label, count in pipeline.run(categories):
+        if label in stage_labels:
+            # Derived stages count pairs, names, strings, ... rather than files
+            derived.append(f"{label}: {count}")
+            continue
+        print(f"  {label}: {count} files")
+        total += count
+
+    print(f"\nTotal: {total} files generated")
+    if derived:
+        print(f"Derived: {', '.join(derived)}")
+    if db:
+        with pipeline.metrics.stage('db_commit'):
+            if keep_open:
+                db.commit()
+            else:
+                db.close()
+        print(f"Content DB: {db.changed} updated, {db.unchanged} unchanged → {db.path}")
+    pipeline.metrics.finish()
+    if pipeline.errors and not keep_open:
+        print(f"{len(pipeline.errors)} files failed to convert")
+        sys.exit(1)
+    return pipeline
+
+
+def main():
+    argv = sys.argv[1:]
+    if '--list' in argv:
+        for cat in CATEGORIES.values():
+            print(f"  {cat.name:<20} src/content/{cat.source}/")
+        for stage in STAGES.values():
+            print(f"  {stage.name:<20} derived from: {', '.join(stage.depends) or ('data/' if stage.triggers else '-')}")
+        return
+
+    only = None
+    options = {}
+    args = []
+    i = 0
+    while i < len(argv):
+        if argv[i] == '--only' and i + 1 < len(argv):
+            only = [c.strip() for c in argv[i + 1].split(',') if c.strip()]
+            i += 2
+            continue
+        if argv[i] in ('--output', '--db') + VALUE_FLAGS and i + 1 < len(argv):
+            options[argv[i]] = argv[i + 1]
+            i += 2
+            continue
+        if not argv[i].startswith('--'):
+            args.append(argv[i])
+        i += 1
+
+    if not args:
+        print("Usage: python3 scripts/tools/content_pipeline.py /path/to/psz-sketch "
+              "[--only cat1,cat2] [--no-db] [--output DATA_DIR] [--db DB_PATH] "
+              "[--list] [--watch [--poll]] [--profile] [--metrics-json PATH] [--cprofile DIR]")
+        sys.exit(1)
+
+    if only:
+        unknown = [c for c in only if c not in CATEGORIES]
+        if unknown:
+            print(f"Error: unknown categories: {', '.join(unknown)} (see --list)")
+            sys.exit(1)
+
+    content_dir = os.path.join(args[0], 'src', 'content')
+    db_path = None if '--no-db' in argv else options.get('--db', DEFAULT_DB_PATH)
+    watch = '--watch' in argv
+    metrics = metrics_from_options('content_pipeline', argv, options)
+    pipeline = run_pipeline(content_dir, options.get('--output', DATA_DIR), categories=only,
+                            db_path=db_path, keep_open=watch, metrics=metrics)
+    if watch:
+        from content_watch import watch_pipeline
+        watch_pipeline(pipeline, categories=only, force_poll='--poll' in argv)
+
+
+if __name__ == '__main__':
+    main()
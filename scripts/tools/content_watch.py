@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""Watch mode for the content pipeline.
+
+Keeps a ContentPipeline resident after the initial import and feeds it
+batches of changed, added and deleted psz-sketch JSON files, so each edit
+costs one file's conversion plus the derived stages that depend on it.
+
+Uses Linux inotify (through ctypes, no extra packages) and falls back to
+polling mtimes with os.scandir elsewhere. Events are debounced: a batch is
+processed once the tree has been quiet for DEBOUNCE_SECONDS.
+
+Usage:
+    python3 scripts/tools/content_pipeline.py /path/to/psz-sketch --watch [--poll]
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+
+DEBOUNCE_SECONDS = 0.05
+POLL_INTERVAL = 0.25
+
+# <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_EVENT_HEADER = struct.Struct('iIII')
+_FILE_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_MOVED_FROM | IN_DELETE | IN_CREATE
+_DIR_MASK = IN_CREATE | IN_MOVED_TO | IN_DELETE_SELF
+
+
+class InotifyWatcher:
+    """Minimal inotify wrapper: watches the content dir and its category dirs."""
+
+    def __init__(self, content_dir: str, sources):
+        libc_name = ctypes.util.find_library('c') or 'libc.so.6'
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.content_dir = content_dir
+        self.sources = set(sources)
+        self._dirs: dict[int, str] = {}
+        self._add(content_dir, _DIR_MASK)
+        for name in sorted(self.sources):
+            path = os.path.join(content_dir, name)
+            if os.path.isdir(path):
+                self._add(path, _FILE_MASK)
+
+    def _add(self, path: str, mask: int):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), mask)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f'inotify_add_watch failed: {path}')
+        self._dirs[wd] = path
+
+    def poll(self, timeout: float) -> dict[str, bool]:
+        """Wait up to `timeout` seconds; returns {path: exists} for touched files."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return {}
+        try:
+            buf = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return {}
+        changes = {}
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(buf):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+            offset += _EVENT_HEADER.size
+            name = buf[offset:offset + length].rstrip(b'\0').decode('utf-8', 'replace')
+            offset += length
+            parent = self._dirs.get(wd)
+            if parent is None or not name:
+                continue
+            path = os.path.join(parent, name)
+            if mask & IN_ISDIR:
+                # A category directory (re)appeared: watch it and import its files
+                if parent == self.content_dir and name in self.sources and os.path.isdir(path):
+                    self._add(path, _FILE_MASK)
+                    with os.scandir(path) as files:
+                        for f in files:
+                            changes[f.path] = True
+                continue
+            if name.endswith('.json'):
+                changes[path] = os.path.exists(path)
+        return changes
+
+    def close(self):
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """Fallback: diff (mtime, size) snapshots of the category directories."""
+
+    def __init__(self, content_dir: str, sources):
+        self.content_dir = content_dir
+        self.sources = set(sources)
+        self._snapshot = self._scan()
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        snapshot = {}
+        for name in self.sources:
+            path = os.path.join(self.content_dir, name)
+            if not os.path.isdir(path):
+                continue
+            with os.scandir(path) as files:
+                for f in files:
+                    if f.name.endswith('.json'):
+                        st = f.stat()
+                        snapshot[f.path] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def poll(self, timeout: float) -> dict[str, bool]:
+        time.sleep(timeout)
+        current = self._scan()
+        changes = {path: True for path, sig in current.items() if self._snapshot.get(path) != sig}
+        changes.update({path: False for path in self._snapshot if path not in current})
+        self._snapshot = current
+        return changes
+
+    def close(self):
+        pass
+
+
+def make_watcher(content_dir: str, sources, force_poll: bool = False):
+    if not force_poll and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(content_dir, sources)
+        except (OSError, AttributeError) as e:
+            print(f"  inotify unavailable ({e}), falling back to polling")
+    return PollingWatcher(content_dir, sources)
+
+
+def watch_pipeline(pipeline, categories=None, force_poll: bool = False):
+    """Block forever, applying debounced change batches to `pipeline`."""
+    from content_pipeline import CATEGORIES
+
+    names = list(CATEGORIES) if categories is None else list(categories)
+    sources = [CATEGORIES[name].source for name in names]
+    watcher = make_watcher(pipeline.content_dir, sources, force_poll)
+    idle_timeout = POLL_INTERVAL if isinstance(watcher, PollingWatcher) else 1.0
+    kind = 'polling' if isinstance(watcher, PollingWatcher) else 'inotify'
+    print(f"\nWatching {pipeline.content_dir} ({kind}); Ctrl+C to stop")
+
+    try:
+        while True:
+            batch = watcher.poll(idle_timeout)
+            if not batch:
+                continue
+            # Debounce: keep collecting until the tree goes quiet
+            while True:
+                more = watcher.poll(DEBOUNCE_SECONDS)
+                if not more:
+                    break
+                batch.update(more)
+
+            start = time.perf_counter()
+            report = pipeline.apply_changes(batch)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if not report:
+                continue
+            summary = ', '.join(f"{label}: {count}" for label, count in report)
+            stamp = time.strftime('%H:%M:%S')
+            print(f"[{stamp}] {len(batch)} changed → {summary} ({elapsed_ms:.1f} ms)")
+            for path, exists in sorted(batch.items()):
+                rel = os.path.relpath(path, pipeline.content_dir)
+                print(f"    {'updated' if exists else 'deleted'} {rel}")
+    except KeyboardInterrupt:
+        print("\nStopping watch")
+    finally:
+        watcher.close()
+        if pipeline.db:
+            pipeline.db.close()
@@ -2,14 +2,23 @@
 """Export enemy data from .tres files to a JSON list for the quest editor.
 
 Usage:
-    python3 scripts/tools/export_enemy_list.py
+    python3 scripts/tools/export_enemy_list.py [--enemies DIR] [--output PATH]
+        [--profile] [--metrics-json PATH] [--cprofile DIR]
 
 Writes to: ../psz-sketch/public/data/enemies.json
+
+The deployed web editors get a minified, content-hashed copy from
+export_web_data.py.
 """
 
+import argparse
 import os
 import re
 import json
+import time
+
+from string_table import StringTable, table_for
+from tool_metrics import add_metrics_arguments, metrics_from_args
 
 ENEMIES_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'enemies')
 OUTPUT_PATH = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'psz-sketch', 'public', 'data', 'enemies.json')
@@ -35,8 +44,8 @@ ELEMENT_MAP = {
 }
 
 
-def parse_tres(path: str) -> dict | None:
-    """Parse a .tres file and extract enemy data fields."""
+def parse_tres(path: str, strings: StringTable) -> dict | None:
+    """Parse a .tres file and extract enemy data fields; names come from `strings`."""
     with open(path, 'r') as f:
         text = f.read()
 
@@ -54,7 +63,7 @@ def parse_tres(path: str) -> dict | None:
     if not enemy_id:
         return None
 
-    name = get_field('name')
+    name = strings.text(get_field('name_id', '0'))
     model_id = get_field('model_id')
     element = ELEMENT_MAP.get(get_field('element', '0'), 'Native')
     is_rare = get_field('is_rare', 'false') == 'true'
@@ -84,23 +93,41 @@ def parse_tres(path: str) -> dict | None:
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Export enemy .tres files to the quest editor's JSON list")
+    parser.add_argument('--enemies', default=ENEMIES_DIR, help="Directory of enemy .tres files")
+    parser.add_argument('--output', default=OUTPUT_PATH, help="JSON file to write")
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+    metrics = metrics_from_args('export_enemy_list', args)
+
     enemies = []
-    for fname in sorted(os.listdir(ENEMIES_DIR)):
-        if not fname.endswith('.tres'):
-            continue
-        path = os.path.join(ENEMIES_DIR, fname)
-        data = parse_tres(path)
-        if data:
-            enemies.append(data)
+    # The string table sits in the data/ directory above the enemies
+    strings = table_for(os.path.dirname(os.path.abspath(args.enemies)))
+    with metrics.stage('parse'):
+        for fname in sorted(os.listdir(args.enemies)):
+            if not fname.endswith('.tres'):
+                continue
+            path = os.path.join(args.enemies, fname)
+            start = time.perf_counter()
+            data = parse_tres(path, strings)
+            if data:
+                enemies.append(data)
+            if metrics.enabled:
+                metrics.file('parse', path, time.perf_counter() - start, os.path.getsize(path),
+                             status='parsed' if data else 'skipped')
 
     # Sort by name
     enemies.sort(key=lambda e: e['name'])
 
-    os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
-    with open(OUTPUT_PATH, 'w') as f:
-        json.dump(enemies, f, indent=2)
+    with metrics.stage('write'):
+        start = time.perf_counter()
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        text = json.dumps(enemies, indent=2)
+        with open(args.output, 'w') as f:
+            f.write(text)
+        metrics.file('write', args.output, time.perf_counter() - start, written=len(text.encode('utf-8')))
 
-    print(f'Exported {len(enemies)} enemies to {OUTPUT_PATH}')
+    print(f'Exported {len(enemies)} enemies to {args.output}')
 
     # Print summary by area
     area_counts: dict[str, int] = {}
@@ -109,6 +136,7 @@ def main():
             area_counts[loc] = area_counts.get(loc, 0) + 1
     for area, count in sorted(area_counts.items()):
         print(f'  {area}: {count} enemies')
+    metrics.finish()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Export the JSON the web editors read as fingerprinted, precompressed files.
+
+The quest and stage editors under web/ fetch data/enemies.json,
+data/stage_configs/*.json and data/quests/*.json. For the deployed site this
+writes each of them minified under a content-hash name,
+
+  <output>/enemies.3f9c2a1b.json        (+ .json.gz, .json.br)
+  <output>/stage_configs/valley_configs.8e01d44c.json
+  ...
+  <output>/data-manifest.json           { "files": { "enemies.json": "enemies.3f9c2a1b.json", ... } }
+
+The editors load data-manifest.json first (web/src/utils/assets.ts,
+fetchData) and request the hashed names, which can be cached forever; an
+export only changes the names of files whose content changed. Without a
+manifest (vite dev server) they fall back to the plain paths.
+
+Gzip siblings are always written; brotli ones need the `brotli` module
+and are skipped with a note when it isn't installed. Files already present
+under their hash are not rewritten. --prune removes hashed files that the
+new manifest no longer lists (other files in --output are left alone).
+
+Usage:
+    python3 scripts/tools/export_web_data.py --output web/dist/data
+    python3 scripts/tools/export_web_data.py --output build/web-data --prune --profile
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+
+from tool_metrics import add_metrics_arguments, metrics_from_args
+
+try:
+    import brotli
+except ImportError:  # optional: only the .br siblings need it
+    brotli = None
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+GODOT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, '..', '..'))
+DATA_DIR = os.path.join(GODOT_ROOT, 'data')
+OUTPUT_DIR = os.path.join(GODOT_ROOT, 'build', 'web-data')
+
+# Paths under data/ the editors fetch (files, or directories of *.json)
+SOURCES = ('enemies.json', 'stage_configs', 'quests')
+MANIFEST_NAME = 'data-manifest.json'
+MANIFEST_VERSION = 1
+HASH_LENGTH = 8
+# Only files named like our output are pruned; the directory may hold others
+HASHED_RE = re.compile(r'\.[0-9a-f]{%d}\.json(\.gz|\.br)?$' % HASH_LENGTH)
+
+
+def find_sources(data_dir: str) -> list[str]:
+    """Relative paths (with /) of every exported JSON file."""
+    rels = []
+    for source in SOURCES:
+        path = os.path.join(data_dir, source)
+        if os.path.isfile(path):
+            rels.append(source)
+        elif os.path.isdir(path):
+            rels.extend(f'{source}/{name}' for name in sorted(os.listdir(path))
+                        if name.endswith('.json'))
+    return rels
+
+
+def minify(raw: bytes) -> bytes:
+    return json.dumps(json.loads(raw), separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def hashed_name(rel: str, data: bytes) -> str:
+    stem, ext = os.path.splitext(rel)
+    return f'{stem}.{hashlib.sha256(data).hexdigest()[:HASH_LENGTH]}{ext}'
+
+
+def compressed_siblings(data: bytes) -> dict[str, bytes]:
+    """{suffix: bytes} of the precompressed variants."""
+    out = {'.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        out['.br'] = brotli.compress(data, quality=11)
+    return out
+
+
+def export_web_data(data_dir: str = DATA_DIR, output_dir: str = OUTPUT_DIR, prune: bool = False,
+                    metrics=None) -> dict:
+    """Write hashed + precompressed copies and the manifest; returns the manifest."""
+    files, sizes = {}, {}
+    written = cached = 0
+    totals = {'json': 0, 'min': 0, '.gz': 0, '.br': 0}
+    for rel in find_sources(data_dir):
+        start = time.perf_counter()
+        with open(os.path.join(data_dir, rel), 'rb') as f:
+            raw = f.read()
+        try:
+            data = minify(raw)
+        except ValueError as e:
+            print(f"  Skipping {rel}: {e}")
+            continue
+        name = hashed_name(rel, data)
+        files[rel] = name
+        variants = compressed_siblings(data)
+        sizes[name] = {'bytes': len(data), **{s.lstrip('.'): len(v) for s, v in variants.items()}}
+        totals['json'] += len(raw)
+        totals['min'] += len(data)
+        for suffix, blob in variants.items():
+            totals[suffix] += len(blob)
+
+        target = os.path.join(output_dir, name)
+        status = 'cached'
+        if not os.path.exists(target):
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            for path, blob in [(target, data)] + [(target + s, v) for s, v in variants.items()]:
+                with open(path, 'wb') as f:
+                    f.write(blob)
+            status = 'written'
+            written += 1
+        else:
+            cached += 1
+        if metrics:
+            metrics.file('export', rel, time.perf_counter() - start, len(raw), len(data), status)
+
+    removed = 0
+    if prune:
+        keep = set()
+        for name in files.values():
+            keep.update({name, name + '.gz', name + '.br'})
+        for dirpath, _, names in os.walk(output_dir):
+            for fname in names:
+                rel = os.path.relpath(os.path.join(dirpath, fname), output_dir).replace(os.sep, '/')
+                if HASHED_RE.search(fname) and rel not in keep:
+                    os.remove(os.path.join(dirpath, fname))
+                    removed += 1
+
+    manifest = {'version': MANIFEST_VERSION, 'files': files, 'sizes': sizes}
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, separators=(',', ':'))
+
+    def kb(n):
+        return f"{n / 1024:.1f} KB"
+
+    print(f"Web data: {len(files)} files ({written} written, {cached} unchanged"
+          + (f", {removed} stale removed" if prune else "") + ")")
+    print(f"  JSON {kb(totals['json'])} -> minified {kb(totals['min'])}, gzip {kb(totals['.gz'])}"
+          + (f", brotli {kb(totals['.br'])}" if brotli is not None else
+             " (brotli module not installed: no .br files)"))
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export fingerprinted, precompressed JSON for the web editors")
+    parser.add_argument('--data', default=DATA_DIR, help="data/ directory to read")
+    parser.add_argument('--output', default=OUTPUT_DIR, help="Directory to write (e.g. web/dist/data)")
+    parser.add_argument('--prune', action='store_true', help="Delete hashed files not in the new manifest")
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.data):
+        print(f"ERROR: data directory not found: {args.data}")
+        sys.exit(1)
+
+    metrics = metrics_from_args('export_web_data', args)
+    with metrics.stage('export'):
+        export_web_data(args.data, args.output, args.prune, metrics)
+    metrics.finish()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""Generate synthetic psz-sketch content trees for benchmarking the importers.
+
+The 1x tree mirrors today's content. By default it is rebuilt from the
+committed data/*.tres, or it is copied from a real checkout with --template.
+Larger scales add renamed copies of every record and grow the shapes that
+stress the converters:
+  - drop tables list every enemy (copies included) with longer item lists
+  - quest definitions get more objectives and reward items
+  - every weapon carries photon arts
+
+Output is deterministic for a given --scale/--seed.
+
+Usage:
+    python3 scripts/tools/generate_sketch_content.py /tmp/sketch-10x --scale 10
+    python3 scripts/tools/generate_sketch_content.py /tmp/sketch-1x --template ../psz-sketch
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+from pathlib import Path
+
+from item_references import ItemIndex, index_for
+from string_table import TEXT_FIELDS, StringTable, table_for
+from tres_reader import read_tres
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+GODOT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, '..', '..'))
+DATA_DIR = os.path.join(GODOT_ROOT, 'data')
+
+sys.path.insert(0, os.path.join(GODOT_ROOT, 'tools'))
+
+from convert_psz_data import (ARMOR_TYPE_MAP, ELEMENT_MAP, WEAPON_TYPE_MAP,  # noqa: E402
+                              inline_photon_arts, load_art_catalog)
+
+WEAPON_TYPES = {v: k for k, v in WEAPON_TYPE_MAP.items()}
+ARMOR_TYPES = {v: k for k, v in ARMOR_TYPE_MAP.items()}
+ELEMENTS = {v: k for k, v in ELEMENT_MAP.items()}
+
+# data/ directory → psz-sketch src/content directory
+SOURCE_DIRS = {
+    'classes': 'classes',
+    'consumables': 'consumables',
+    'units': 'units',
+    'photon_arts': 'photon-arts',
+    'mags': 'mags',
+    'missions': 'missions',
+    'quest_areas': 'quest-areas',
+    'quest_definitions': 'quest-definitions',
+    'materials': 'materials',
+    'set_bonuses': 'set-bonuses',
+    'shops': 'shops',
+    'mag_personalities': 'mag-personalities',
+    'modifiers': 'modifiers',
+    'weapons': 'weapons',
+    'armors': 'armors',
+    'enemies': 'enemies',
+}
+
+# .tres property → JSON key where the importer doesn't just camelCase it
+RENAMED_KEYS = {'is_main': 'main', 'hit_range': 'range'}
+
+# Fields that carry a record's identity (ids are slugged from these)
+IDENTITY_KEYS = ('name', 'questName', 'areaName')
+ID_KEYS = ('questId', 'areaId')
+
+DEFAULT_DROP_DEPTH = 6
+DEFAULT_QUEST_LENGTH = 4
+MAX_PHOTON_ARTS = 3
+
+
+def camel(key: str) -> str:
+    head, *rest = key.split('_')
+    return head + ''.join(part.title() for part in rest)
+
+
+def _stem(content_id: str) -> str:
+    return content_id.replace('_', '-')
+
+
+def _tres_files(directory: str):
+    if not os.path.isdir(directory):
+        return []
+    return sorted(os.path.join(directory, f) for f in os.listdir(directory) if f.endswith('.tres'))
+
+
+def _resolve_text(props: dict, strings: StringTable) -> dict:
+    """props with each <field>_id string id replaced by its text; a Japanese
+    name comes back as japanese_name."""
+    out = {}
+    for key, value in props.items():
+        field = key[:-len('_id')]
+        if key.endswith('_id') and field in TEXT_FIELDS:
+            out[field] = strings.text(value)
+            if field == 'name' and strings.japanese(value):
+                out['japanese_name'] = strings.japanese(value)
+        else:
+            out[key] = value
+    return out
+
+
+def _item_name(index: ItemIndex, item_id: str) -> str:
+    """Source name for an item id; disk ids become "Disk: Foie Lv.1" again."""
+    if item_id.startswith('disk_'):
+        technique, _, level = item_id[len('disk_'):].rpartition('_')
+        return f"Disk: {technique.title()} Lv.{level}"
+    return index.name(item_id) or item_id
+
+
+def _name_items(category: str, data: dict, index: ItemIndex) -> dict:
+    """Undo the importer's name → id rewrite of item references."""
+    if category == 'shops':
+        for entry in data.get('items') or []:
+            for field, count in (('item', 'quantity'), ('tradeIn', 'tradeInQuantity')):
+                if entry.get(field):
+                    entry[field] = _item_name(index, entry[field])
+                    if count in entry:
+                        entry[field] += f" x {entry.pop(count)}"
+    elif category == 'missions':
+        for reward in (data.get('rewards') or {}).values():
+            if isinstance(reward, dict) and reward.get('item'):
+                reward['item'] = _item_name(index, reward['item'])
+    elif category == 'set_bonuses':
+        data['armor'] = _item_name(index, data.get('armor', ''))
+        data['weapons'] = [_item_name(index, item_id) for item_id in data.get('weapons', [])]
+    return data
+
+
+def _from_tres(category: str, props: dict, art_catalog: dict | None = None) -> dict:
+    """Undo the importer's field mapping for one record.
+
+    Weapons reference photon arts by id; art_catalog (data/photon_arts by id)
+    turns those back into inline photonArts.
+    """
+    if category == 'weapons':
+        data = {camel(k): v for k, v in props.items()
+                if k not in ('script', 'id', 'photon_art_ids', 'photon_art_overrides', 'photon_arts',
+                             'weapon_type')}
+        data['weaponType'] = WEAPON_TYPES.get(props.get('weapon_type', 0), 'Saber')
+        data['photonArts'] = inline_photon_arts(props.get('photon_art_ids', []),
+                                                props.get('photon_art_overrides', {}), art_catalog or {},
+                                                props.get('photon_arts', []))
+        return data
+    if category == 'armors':
+        data = {camel(k): v for k, v in props.items()
+                if k not in ('script', 'id', 'type') and not k.startswith('resist_')}
+        data['type'] = ARMOR_TYPES.get(props.get('type', 0), 'Armor')
+        data['resistances'] = {k[len('resist_'):]: v for k, v in props.items() if k.startswith('resist_')}
+        return data
+    if category == 'enemies':
+        return {
+            'name': props.get('name', ''),
+            'japaneseName': props.get('japanese_name', ''),
+            'element': ELEMENTS.get(props.get('element', 0), 'Native'),
+            'locations': props.get('locations', []),
+            'isRare': props.get('is_rare', False),
+            'isBoss': props.get('is_boss', False),
+            'modelId': props.get('model_id', ''),
+        }
+    return {RENAMED_KEYS.get(k, camel(k)): v for k, v in props.items() if k not in ('script', 'id')}
+
+
+def load_from_data(data_dir: str) -> dict:
+    """Rebuild a 1x content set {source_dir: {stem: json}} from data/*.tres."""
+    content = {}
+    strings = table_for(data_dir)
+    index = index_for(data_dir)
+    art_catalog = load_art_catalog(Path(data_dir))
+    for category, source in SOURCE_DIRS.items():
+        records = {}
+        for path in _tres_files(os.path.join(data_dir, category)):
+            props = _resolve_text(read_tres(path), strings)
+            stem = _stem(props.get('id') or os.path.splitext(os.path.basename(path))[0])
+            records[stem] = _name_items(category, _from_tres(category, props, art_catalog), index)
+        content[source] = records
+
+    # Drop tables key on enemy ids and list item ids; the source uses names
+    enemy_names = {stem.replace('-', '_'): data.get('name', '') for stem, data in content['enemies'].items()}
+    content['drops'] = {}
+    for path in _tres_files(os.path.join(data_dir, 'drop_tables')):
+        props = read_tres(path)
+        content['drops'][props.get('id', '')] = {
+            area: {enemy_names.get(enemy) or enemy: [_item_name(index, i) for i in item_ids]
+                   for enemy, item_ids in enemies.items()}
+            for area, enemies in props.get('area_drops', {}).items()
+        }
+
+    exp_path = os.path.join(data_dir, 'experience_table.tres')
+    if os.path.exists(exp_path):
+        content['experience'] = {'experience': {'levels': read_tres(exp_path).get('levels', [])}}
+    return content
+
+
+def load_from_template(sketch_dir: str) -> dict:
+    """Read a real psz-sketch checkout as the 1x content set."""
+    content_dir = os.path.join(sketch_dir, 'src', 'content')
+    content = {}
+    with os.scandir(content_dir) as top:
+        for entry in top:
+            if not entry.is_dir():
+                continue
+            records = {}
+            with os.scandir(entry.path) as files:
+                for f in files:
+                    if f.name.endswith('.json'):
+                        with open(f.path, 'r', encoding='utf-8') as fh:
+                            records[f.name[:-len('.json')]] = json.load(fh)
+            content[entry.name] = records
+    return content
+
+
+def _copy_record(data, copy: int):
+    """Renamed copy `copy` (2, 3, ...) of a record, so every id stays unique."""
+    if not isinstance(data, dict):
+        return data
+    data = json.loads(json.dumps(data))
+    for key in IDENTITY_KEYS:
+        if isinstance(data.get(key), str):
+            data[key] = f"{data[key]} {copy}"
+    for key in ID_KEYS:
+        if isinstance(data.get(key), str):
+            data[key] = f"{data[key]}_{copy}"
+    return data
+
+
+def _lengthen_quest(rng: random.Random, quest: dict, length: int, reward_pool: list):
+    objectives = quest.get('objectives') or []
+    if objectives and length > 1:
+        extra = []
+        for i in range(1, length):
+            for obj in objectives:
+                obj = dict(obj)
+                obj['description'] = f"{obj.get('description', '')} ({i + 1})"
+                if isinstance(obj.get('required'), int):
+                    obj['required'] = obj['required'] + rng.randint(0, 10)
+                extra.append(obj)
+        quest['objectives'] = objectives + extra
+    for difficulty in quest.get('difficulties') or []:
+        items = (difficulty.get('rewards') or {}).get('items')
+        if isinstance(items, list) and reward_pool:
+            for name in rng.sample(reward_pool, min(length, len(reward_pool))):
+                items.append({'itemId': name.lower().replace(' ', '_'), 'itemName': name,
+                              'quantity': rng.randint(1, 5)})
+
+
+def _ensure_photon_arts(rng: random.Random, weapon: dict, arts: list):
+    if not weapon.get('photonArts') and arts:
+        count = min(len(arts), rng.randint(1, MAX_PHOTON_ARTS))
+        weapon['photonArts'] = [dict(a) for a in rng.sample(arts, count)]
+
+
+def _deepen_drops(rng: random.Random, table: dict, enemy_names: list, item_names: list, depth: int):
+    """Every area lists every enemy, each with at least `depth` items."""
+    for area, drops in table.items():
+        for enemy in enemy_names:
+            items = list(drops.get(enemy, []))
+            missing = depth - len(items)
+            if missing > 0:
+                items.extend(rng.sample(item_names, min(missing, len(item_names))))
+            drops[enemy] = sorted(set(items))
+
+
+def scale_content(base: dict, scale: int, seed: int = 0,
+                  drop_depth: int = DEFAULT_DROP_DEPTH,
+                  quest_length: int = DEFAULT_QUEST_LENGTH) -> dict:
+    """Return {source_dir: {stem: json}} with `scale` copies of every record."""
+    rng = random.Random(seed)
+    out = {}
+    for source, records in base.items():
+        if source in ('drops', 'experience'):
+            continue
+        scaled = {}
+        for stem, data in sorted(records.items()):
+            scaled[stem] = json.loads(json.dumps(data))
+            for copy in range(2, scale + 1):
+                scaled[f"{stem}-{copy}"] = _copy_record(data, copy)
+        out[source] = scaled
+
+    weapons = out.get('weapons', {})
+    item_names = sorted({w['name'] for w in weapons.values() if w.get('name')})
+    if scale > 1:
+        arts = [pa for w in weapons.values() for pa in (w.get('photonArts') or [])]
+        for weapon in weapons.values():
+            _ensure_photon_arts(rng, weapon, arts)
+        for quest in out.get('quest-definitions', {}).values():
+            _lengthen_quest(rng, quest, quest_length, item_names)
+
+    out['drops'] = {}
+    enemy_names = sorted({e['name'] for e in out.get('enemies', {}).values() if e.get('name')})
+    for difficulty, table in sorted(base.get('drops', {}).items()):
+        table = json.loads(json.dumps(table))
+        if scale > 1:
+            _deepen_drops(rng, table, enemy_names, item_names, drop_depth)
+        out['drops'][difficulty] = table
+
+    if 'experience' in base:
+        out['experience'] = json.loads(json.dumps(base['experience']))
+    return out
+
+
+def write_tree(content: dict, out_dir: str) -> tuple[int, int]:
+    """Write <out_dir>/src/content/<source>/<stem>.json; returns (files, bytes)."""
+    content_dir = os.path.join(out_dir, 'src', 'content')
+    if os.path.isdir(content_dir):
+        shutil.rmtree(content_dir)
+    files = total = 0
+    for source, records in sorted(content.items()):
+        directory = os.path.join(content_dir, source)
+        os.makedirs(directory, exist_ok=True)
+        for stem, data in records.items():
+            text = json.dumps(data, ensure_ascii=False, indent=2)
+            with open(os.path.join(directory, f'{stem}.json'), 'w', encoding='utf-8') as f:
+                f.write(text)
+            files += 1
+            total += len(text.encode('utf-8'))
+    return files, total
+
+
+def generate(out_dir: str, scale: int = 1, seed: int = 0, template: str | None = None,
+             data_dir: str = DATA_DIR, drop_depth: int = DEFAULT_DROP_DEPTH,
+             quest_length: int = DEFAULT_QUEST_LENGTH) -> dict:
+    """Generate a tree and return its manifest (also written as generator.json)."""
+    base = load_from_template(template) if template else load_from_data(data_dir)
+    content = scale_content(base, scale, seed, drop_depth, quest_length)
+    files, total = write_tree(content, out_dir)
+    manifest = {
+        'scale': scale,
+        'seed': seed,
+        'template': os.path.abspath(template) if template else None,
+        'drop_depth': drop_depth,
+        'quest_length': quest_length,
+        'files': files,
+        'bytes': total,
+        'per_category': {source: len(records) for source, records in sorted(content.items())},
+    }
+    with open(os.path.join(out_dir, 'generator.json'), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic psz-sketch content tree")
+    parser.add_argument('output', help="Directory to create (gets src/content/...)")
+    parser.add_argument('--scale', type=int, default=1, help="Copies of every record (1 = today's size)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--template', help="Real psz-sketch checkout to scale instead of data/")
+    parser.add_argument('--data', default=DATA_DIR, help="Path to psz-godot/data (default template)")
+    parser.add_argument('--drop-depth', type=int, default=DEFAULT_DROP_DEPTH,
+                        help="Minimum items per enemy in scaled drop tables")
+    parser.add_argument('--quest-length', type=int, default=DEFAULT_QUEST_LENGTH,
+                        help="Objective multiplier for scaled quest definitions")
+    args = parser.parse_args()
+
+    if args.scale < 1:
+        print("Error: --scale must be >= 1")
+        sys.exit(1)
+
+    manifest = generate(args.output, args.scale, args.seed, args.template, args.data,
+                        args.drop_depth, args.quest_length)
+    print(f"Generated {manifest['files']} files ({manifest['bytes'] / 1e6:.1f} MB) "
+          f"at {args.scale}x → {os.path.join(args.output, 'src', 'content')}")
+    for source, count in manifest['per_category'].items():
+        print(f"  {source}: {count}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""Read, edit and write binary glTF (.glb) files with NumPy.
+
+Only what the asset tools need: the JSON document, the single BIN chunk,
+and accessors exposed as NumPy arrays (strided views are handled).
+
+Usage (as a module):
+    from glb_io import Glb
+    glb = Glb.load('assets/player/pc_000/pc_000_000.glb')
+    uv = glb.read_accessor(glb.json['meshes'][0]['primitives'][0]['attributes']['TEXCOORD_0'])
+    glb.write_accessor(index, uv * 0.5)
+    new_index = glb.append_accessor(positions, FLOAT, 'VEC3', target=ARRAY_BUFFER)
+    glb.compact()  # drop accessors nothing references any more
+    glb.save('out.glb')
+    doc, bin_offset = read_glb_json(path)  # JSON only, for scanning many files
+"""
+
+import json
+import struct
+
+import numpy as np
+
+GLB_MAGIC = 0x46546C67  # 'glTF'
+CHUNK_JSON = 0x4E4F534A
+CHUNK_BIN = 0x004E4942
+
+COMPONENT_DTYPES = {
+    5120: np.int8,
+    5121: np.uint8,
+    5122: np.int16,
+    5123: np.uint16,
+    5125: np.uint32,
+    5126: np.float32,
+}
+TYPE_SIZES = {'SCALAR': 1, 'VEC2': 2, 'VEC3': 3, 'VEC4': 4, 'MAT2': 4, 'MAT3': 9, 'MAT4': 16}
+
+FLOAT = 5126
+UNSIGNED_SHORT = 5123
+UNSIGNED_INT = 5125
+ARRAY_BUFFER = 34962
+ELEMENT_ARRAY_BUFFER = 34963
+
+
+class GlbError(ValueError):
+    pass
+
+
+def read_glb_json(path: str) -> tuple[dict, int | None]:
+    """(JSON document, file offset of the BIN payload or None) without reading BIN."""
+    with open(path, 'rb') as f:
+        header = f.read(20)
+        if len(header) < 20:
+            raise GlbError(f"file too short for a GLB header: {path}")
+        magic, version, _, json_len, json_type = struct.unpack('<IIIII', header)
+        if magic != GLB_MAGIC or version != 2 or json_type != CHUNK_JSON:
+            raise GlbError(f"not a glTF 2.0 binary: {path}")
+        document = json.loads(f.read(json_len))
+        bin_header = f.read(8)
+        if len(bin_header) == 8 and struct.unpack('<II', bin_header)[1] == CHUNK_BIN:
+            return document, 20 + json_len + 8
+        return document, None
+
+
+class Glb:
+    def __init__(self, document: dict, binary: bytes = b''):
+        self.json = document
+        self.bin = bytearray(binary)
+
+    @classmethod
+    def load(cls, path: str) -> 'Glb':
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Glb':
+        if len(data) < 20:
+            raise GlbError("file too short for a GLB header")
+        magic, version, length = struct.unpack_from('<III', data, 0)
+        if magic != GLB_MAGIC or version != 2:
+            raise GlbError("not a glTF 2.0 binary")
+        document = None
+        binary = b''
+        pos = 12
+        while pos + 8 <= min(length, len(data)):
+            chunk_len, chunk_type = struct.unpack_from('<II', data, pos)
+            payload = data[pos + 8:pos + 8 + chunk_len]
+            if chunk_type == CHUNK_JSON:
+                document = json.loads(payload)
+            elif chunk_type == CHUNK_BIN and not binary:
+                binary = payload
+            pos += 8 + chunk_len
+        if document is None:
+            raise GlbError("missing JSON chunk")
+        return cls(document, binary)
+
+    def to_bytes(self) -> bytes:
+        if self.bin and self.json.get('buffers'):
+            self.json['buffers'][0]['byteLength'] = len(self.bin)
+        text = json.dumps(self.json, separators=(',', ':')).encode('utf-8')
+        text += b' ' * (-len(text) % 4)
+        chunks = struct.pack('<II', len(text), CHUNK_JSON) + text
+        if self.bin:
+            binary = bytes(self.bin) + b'\0' * (-len(self.bin) % 4)
+            chunks += struct.pack('<II', len(binary), CHUNK_BIN) + binary
+        return struct.pack('<III', GLB_MAGIC, 2, 12 + len(chunks)) + chunks
+
+    def save(self, path: str) -> int:
+        data = self.to_bytes()
+        with open(path, 'wb') as f:
+            f.write(data)
+        return len(data)
+
+    def _accessor_layout(self, index: int):
+        accessor = self.json['accessors'][index]
+        if 'bufferView' not in accessor:
+            raise GlbError(f"accessor {index} has no bufferView (sparse/empty)")
+        view = self.json['bufferViews'][accessor['bufferView']]
+        if view.get('buffer', 0) != 0:
+            raise GlbError(f"accessor {index} uses an external buffer")
+        dtype = np.dtype(COMPONENT_DTYPES[accessor['componentType']]).newbyteorder('<')
+        width = TYPE_SIZES[accessor['type']]
+        element = dtype.itemsize * width
+        stride = view.get('byteStride') or element
+        offset = view.get('byteOffset', 0) + accessor.get('byteOffset', 0)
+        return accessor, dtype, width, stride, offset
+
+    def _rows(self, index: int):
+        """Writable (count, element bytes) view of accessor `index` in the BIN chunk."""
+        accessor, dtype, width, stride, offset = self._accessor_layout(index)
+        count = accessor['count']
+        element = dtype.itemsize * width
+        if count and offset + stride * (count - 1) + element > len(self.bin):
+            raise GlbError(f"accessor {index} runs past the end of the buffer")
+        buf = np.frombuffer(self.bin, dtype=np.uint8)
+        rows = np.lib.stride_tricks.as_strided(buf[offset:], shape=(count, element), strides=(stride, 1))
+        return accessor, dtype, width, rows
+
+    def read_accessor(self, index: int) -> np.ndarray:
+        """Copy of accessor `index` as a (count, components) array ((count,) for SCALAR)."""
+        accessor, dtype, width, rows = self._rows(index)
+        values = rows.copy().view(dtype).reshape(accessor['count'], width)
+        return values[:, 0].copy() if accessor['type'] == 'SCALAR' else values
+
+    def write_accessor(self, index: int, values: np.ndarray):
+        """Overwrite accessor `index` in place (same count and component type)."""
+        accessor, dtype, width, rows = self._rows(index)
+        values = np.asarray(values, dtype=dtype).reshape(accessor['count'], width)
+        rows[:] = values.view(np.uint8).reshape(rows.shape)
+        if 'min' in accessor or 'max' in accessor:
+            accessor['min'] = values.min(axis=0).tolist()
+            accessor['max'] = values.max(axis=0).tolist()
+
+    def append_accessor(self, values: np.ndarray, component_type: int, accessor_type: str,
+                        normalized: bool = False, target: int | None = None) -> int:
+        """Add `values` as a new tightly packed accessor at the end of BIN; returns its index.
+
+        Float VEC3 data gets min/max (required for POSITION). `target` is the
+        bufferView target (ARRAY_BUFFER or ELEMENT_ARRAY_BUFFER).
+        """
+        dtype = np.dtype(COMPONENT_DTYPES[component_type]).newbyteorder('<')
+        width = TYPE_SIZES[accessor_type]
+        values = np.ascontiguousarray(np.asarray(values).reshape(-1, width), dtype=dtype)
+        self.bin.extend(b'\0' * (-len(self.bin) % 4))
+        view = {'buffer': 0, 'byteOffset': len(self.bin), 'byteLength': values.nbytes}
+        if target is not None:
+            view['target'] = target
+        self.bin.extend(values.tobytes())
+        if not self.json.get('buffers'):
+            self.json['buffers'] = [{'byteLength': 0}]
+        self.json.setdefault('bufferViews', []).append(view)
+        accessor = {'bufferView': len(self.json['bufferViews']) - 1, 'componentType': component_type,
+                    'count': len(values), 'type': accessor_type}
+        if normalized:
+            accessor['normalized'] = True
+        if component_type == FLOAT and accessor_type == 'VEC3' and len(values):
+            accessor['min'] = values.min(axis=0).tolist()
+            accessor['max'] = values.max(axis=0).tolist()
+        self.json.setdefault('accessors', []).append(accessor)
+        return len(self.json['accessors']) - 1
+
+    def compact(self) -> int:
+        """Drop accessors and bufferViews nothing references and repack BIN; returns bytes saved.
+
+        Accessors are referenced from mesh attributes/indices/morph targets,
+        skins and animation samplers; bufferViews from accessors (and sparse
+        storage) and images.
+        """
+        doc = self.json
+        accessor_refs = []  # (dict, key) holding an accessor index
+        for mesh in doc.get('meshes', []):
+            for primitive in mesh.get('primitives', []):
+                attrs = primitive.get('attributes', {})
+                accessor_refs.extend((attrs, name) for name in attrs)
+                if 'indices' in primitive:
+                    accessor_refs.append((primitive, 'indices'))
+                for target in primitive.get('targets', []):
+                    accessor_refs.extend((target, name) for name in target)
+        for skin in doc.get('skins', []):
+            if 'inverseBindMatrices' in skin:
+                accessor_refs.append((skin, 'inverseBindMatrices'))
+        for animation in doc.get('animations', []):
+            for sampler in animation.get('samplers', []):
+                accessor_refs.extend((sampler, key) for key in ('input', 'output'))
+
+        accessors = doc.get('accessors', [])
+        used = sorted({holder[key] for holder, key in accessor_refs})
+        remap = {old: new for new, old in enumerate(used)}
+        for holder, key in accessor_refs:
+            holder[key] = remap[holder[key]]
+        accessors = [accessors[i] for i in used]
+        doc['accessors'] = accessors
+
+        view_refs = [(a, 'bufferView') for a in accessors if 'bufferView' in a]
+        for accessor in accessors:
+            sparse = accessor.get('sparse')
+            if sparse:
+                view_refs.extend((sparse[part], 'bufferView') for part in ('indices', 'values'))
+        view_refs.extend((image, 'bufferView') for image in doc.get('images', []) if 'bufferView' in image)
+        views = doc.get('bufferViews', [])
+        used_views = sorted({holder[key] for holder, key in view_refs})
+        view_remap = {old: new for new, old in enumerate(used_views)}
+        for holder, key in view_refs:
+            holder[key] = view_remap[holder[key]]
+
+        before = len(self.bin)
+        packed = bytearray()
+        kept = []
+        for index in used_views:
+            view = views[index]
+            if view.get('buffer', 0) == 0:
+                start = view.get('byteOffset', 0)
+                packed.extend(b'\0' * (-len(packed) % 4))
+                chunk = self.bin[start:start + view['byteLength']]
+                view['byteOffset'] = len(packed)
+                packed.extend(chunk)
+            kept.append(view)
+        doc['bufferViews'] = kept
+        self.bin = packed
+        return before - len(self.bin)
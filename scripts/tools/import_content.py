@@ -1,7 +1,16 @@
 #!/usr/bin/env python3
 """Import all JSON content from psz-sketch into Godot .tres resource files.
 
-Usage: python3 scripts/tools/import_content.py /path/to/psz-sketch
+Holds the per-file converters for every category except weapons, armors and
+enemies (tools/convert_psz_data.py). Scanning and dispatch live in
+content_pipeline.py; this CLI runs the pipeline for these categories only.
+
+Also mirrors every record into the SQLite content store (build/content.db,
+see content_db.py) unless --no-db is given.
+
+Usage: python3 scripts/tools/import_content.py /path/to/psz-sketch [--no-db]
+       [--output /path/to/data] [--db /path/to/content.db]
+       [--profile] [--metrics-json PATH] [--cprofile DIR]   (see tool_metrics.py)
 """
 
 import json
@@ -9,6 +18,15 @@ import os
 import sys
 import re
 
+import numpy as np
+
+from item_references import index_for
+from string_table import table_for
+
+# Class stats are given at these levels and interpolated linearly between them
+STAT_BREAKPOINTS = [1, 20, 40, 60, 80, 100]
+MAX_LEVEL = 100
+
 
 def slugify(name: str) -> str:
     """Convert a name to a filesystem-safe slug."""
@@ -80,105 +98,109 @@ def packed_string_array(arr: list) -> str:
     return 'PackedStringArray(%s)' % items
 
 
+def packed_int_array(values, kind: str = 'PackedInt32Array') -> str:
+    return '%s(%s)' % (kind, ', '.join(str(int(v)) for v in values))
+
+
+def level_stat_table(stat: dict) -> np.ndarray:
+    """Value of one class stat at every level 1..MAX_LEVEL.
+
+    Same result as ClassData.get_stat_at_level: exact entries win, other
+    levels truncate a linear interpolation between the breakpoints.
+    """
+    levels = np.arange(1, MAX_LEVEL + 1)
+    bps = np.array(STAT_BREAKPOINTS)
+    values = np.array([float(stat.get(str(bp)) or 0) for bp in STAT_BREAKPOINTS])
+    seg = np.clip(np.searchsorted(bps, levels, side='right') - 1, 0, len(bps) - 2)
+    t = (levels - bps[seg]) / (bps[seg + 1] - bps[seg])
+    table = np.trunc(values[seg] + (values[seg + 1] - values[seg]) * t)
+    for key, value in stat.items():
+        if str(key).isdigit() and 1 <= int(key) <= MAX_LEVEL:
+            table[int(key) - 1] = int(value or 0)
+    return table.astype(np.int64)
+
+
+def level_stats_to_gdscript(stats: dict) -> str:
+    """{ stat: PackedInt32Array(value at level 1..MAX_LEVEL) } for ClassData.level_stats."""
+    if not stats:
+        return '{}'
+    rows = ',\n'.join(f'  "{name}": {packed_int_array(level_stat_table(stat))}'
+                      for name, stat in stats.items() if isinstance(stat, dict))
+    return '{\n%s\n}' % rows
+
+
 # ---- Class Data ----
-def import_classes(content_dir: str, data_dir: str):
-    src = os.path.join(content_dir, 'classes')
-    if not os.path.isdir(src):
-        print(f"  Skipping classes: {src} not found")
-        return 0
-    count = 0
-    for fname in sorted(os.listdir(src)):
-        if not fname.endswith('.json'):
-            continue
-        data = read_json(os.path.join(src, fname))
-        slug = slugify(data['name'])
-        tech_limits = data.get('techniqueLimits') or {}
-        trap_limits = data.get('trapLimits') or {}
-        # Convert None values in tech_limits to 0
-        clean_tech = {k: (v if v is not None else 0) for k, v in tech_limits.items()}
+def convert_class(path: str, data: dict, data_dir: str) -> str:
+    slug = slugify(data['name'])
+    tech_limits = data.get('techniqueLimits') or {}
+    trap_limits = data.get('trapLimits') or {}
+    # Convert None values in tech_limits to 0
+    clean_tech = {k: (v if v is not None else 0) for k, v in tech_limits.items()}
 
-        tres = f'''[gd_resource type="Resource" script_class="ClassData" load_steps=2 format=3]
+    strings = table_for(data_dir)
+    tres = f'''[gd_resource type="Resource" script_class="ClassData" load_steps=2 format=3]
 
 [ext_resource type="Script" path="res://scripts/resources/class_data.gd" id="1"]
 
 [resource]
 script = ExtResource("1")
 id = "{slug}"
-name = "{data['name']}"
+name_id = {strings.intern(data['name'])}
 race = "{data['race']}"
 gender = "{data['gender']}"
 type = "{data['type']}"
 bonuses = {packed_string_array(data.get('bonuses', []))}
 material_limit = {data.get('materialLimit', 100)}
 stats = {dict_to_gdscript(data['stats'])}
+level_stats = {level_stats_to_gdscript(data['stats'])}
 technique_limits = {dict_to_gdscript(clean_tech)}
 trap_limits = {dict_to_gdscript(trap_limits)}
 '''
-        write_tres(os.path.join(data_dir, 'classes', f'{slug}.tres'), tres)
-        count += 1
-    return count
+    write_tres(os.path.join(data_dir, 'classes', f'{slug}.tres'), tres)
+    return slug
 
 
 # ---- Consumable Data ----
-def import_consumables(content_dir: str, data_dir: str):
-    src = os.path.join(content_dir, 'consumables')
-    if not os.path.isdir(src):
-        print(f"  Skipping consumables: {src} not found")
-        return 0
-    count = 0
-    for fname in sorted(os.listdir(src)):
-        if not fname.endswith('.json'):
-            continue
-        data = read_json(os.path.join(src, fname))
-        slug = slugify(data['name'])
-        tres = f'''[gd_resource type="Resource" script_class="ConsumableData" load_steps=2 format=3]
+def convert_consumable(path: str, data: dict, data_dir: str) -> str:
+    slug = slugify(data['name'])
+    strings = table_for(data_dir)
+    tres = f'''[gd_resource type="Resource" script_class="ConsumableData" load_steps=2 format=3]
 
 [ext_resource type="Script" path="res://scripts/resources/consumable_data.gd" id="1"]
 
 [resource]
 script = ExtResource("1")
 id = "{slug}"
-name = "{data['name']}"
-japanese_name = "{data.get('japaneseName', '')}"
-details = "{data.get('details', '').replace('"', '\\"')}"
+name_id = {strings.intern(data['name'], data.get('japaneseName', ''))}
+details_id = {strings.intern(data.get('details', ''))}
 rarity = {data.get('rarity', 1)}
 max_stack = {data.get('maxStack', 10)}
 pso_world_id = {data.get('psoWorldId', 0)}
 '''
-        write_tres(os.path.join(data_dir, 'consumables', f'{slug}.tres'), tres)
-        count += 1
-    return count
+    write_tres(os.path.join(data_dir, 'consumables', f'{slug}.tres'), tres)
+    return slug
 
 
 # ---- Unit Data ----
-def import_units(content_dir: str, data_dir: str):
-    src = os.path.join(content_dir, 'units')
-    if not os.path.isdir(src):
-        return 0
-    count = 0
-    for fname in sorted(os.listdir(src)):
-        if not fname.endswith('.json'):
-            continue
-        data = read_json(os.path.join(src, fname))
-        slug = slugify(data['name'])
-        tres = f'''[gd_resource type="Resource" script_class="UnitData" load_steps=2 format=3]
+def convert_unit(path: str, data: dict, data_dir: str) -> str:
+    slug = slugify(data['name'])
+    strings = table_for(data_dir)
+    tres = f'''[gd_resource type="Resource" script_class="UnitData" load_steps=2 format=3]
 
 [ext_resource type="Script" path="res://scripts/resources/unit_data.gd" id="1"]
 
 [resource]
 script = ExtResource("1")
 id = "{slug}"
-name = "{data['name']}"
-japanese_name = "{data.get('japaneseName', '')}"
+name_id = {strings.intern(data['name'], data.get('japaneseName', ''))}
 rarity = {data.get('rarity', 1)}
 category = "{data.get('category', '')}"
 effect = "{data.get('effect', '')}"
 effect_value = {data.get('effectValue', 0)}
 pso_world_id = {data.get('psoWorldId', 0)}
 '''
-        write_tres(os.path.join(data_dir, 'units', f'{slug}.tres'), tres)
-        count += 1
-    return count
+    write_tres(os.path.join(data_dir, 'units', f'{slug}.tres'), tres)
+    return slug
 
 
 # ---- Photon Art Data ----
@@ -195,24 +217,17 @@ def safe_float(val, default=0.0) -> float:
         return default
 
 
-def import_photon_arts(content_dir: str, data_dir: str):
-    src = os.path.join(content_dir, 'photon-arts')
-    if not os.path.isdir(src):
-        return 0
-    count = 0
-    for fname in sorted(os.listdir(src)):
-        if not fname.endswith('.json'):
-            continue
-        data = read_json(os.path.join(src, fname))
-        slug = slugify(data['name'])
-        tres = f'''[gd_resource type="Resource" script_class="PhotonArtData" load_steps=2 format=3]
+def convert_photon_art(path: str, data: dict, data_dir: str) -> str:
+    slug = slugify(data['name'])
+    strings = table_for(data_dir)
+    tres = f'''[gd_resource type="Resource" script_class="PhotonArtData" load_steps=2 format=3]
 
 [ext_resource type="Script" path="res://scripts/resources/photon_art_data.gd" id="1"]
 
 [resource]
 script = ExtResource("1")
 id = "{slug}"
-name = "{data['name']}"
+name_id = {strings.intern(data['name'])}
 weapon_type = "{data.get('weaponType', '')}"
 class_type = "{data.get('classType', '')}"
 attack_mod = {safe_float(data.get('attackMod'))}
@@ -224,84 +239,74 @@ area = {safe_float(data.get('area'))}
 hits = {data.get('hits', 1)}
 notes = "{(data.get('notes', '') or '').replace('"', '\\"')}"
 '''
-        write_tres(os.path.join(data_dir, 'photon_arts', f'{slug}.tres'), tres)
-        count += 1
-    return count
+    write_tres(os.path.join(data_dir, 'photon_arts', f'{slug}.tres'), tres)
+    return slug
 
 
 # ---- Mag Data ----
-def import_mags(content_dir: str, data_dir: str):
-    src = os.path.join(content_dir, 'mags')
-    if not os.path.isdir(src):
-        return 0
-    count = 0
-    for fname in sorted(os.listdir(src)):
-        if not fname.endswith('.json'):
-            continue
-        data = read_json(os.path.join(src, fname))
-        slug = slugify(data['name'])
-        tres = f'''[gd_resource type="Resource" script_class="MagData" load_steps=2 format=3]
+def convert_mag(path: str, data: dict, data_dir: str) -> str:
+    slug = slugify(data['name'])
+    strings = table_for(data_dir)
+    tres = f'''[gd_resource type="Resource" script_class="MagData" load_steps=2 format=3]
 
 [ext_resource type="Script" path="res://scripts/resources/mag_data.gd" id="1"]
 
 [resource]
 script = ExtResource("1")
 id = "{slug}"
-name = "{data['name']}"
-japanese_name = "{data.get('japaneseName', '')}"
+name_id = {strings.intern(data['name'], data.get('japaneseName', ''))}
 stage = "{data.get('stage', '')}"
 evolution_level = {data.get('evolutionLevel', 0)}
 evolution_requirement = {dict_to_gdscript(data.get('evolutionRequirement', {}))}
 photon_blast = "{data.get('photonBlast', '')}"
 pso_world_id = {data.get('psoWorldId', 0)}
 '''
-        write_tres(os.path.join(data_dir, 'mags', f'{slug}.tres'), tres)
-        count += 1
-    return count
+    write_tres(os.path.join(data_dir, 'mags', f'{slug}.tres'), tres)
+    return slug
 
 
 # ---- Mission Data ----
-def import_missions(content_dir: str, data_dir: str):
-    src = os.path.join(content_dir, 'missions')
-    if not os.path.isdir(src):
-        return 0
-    count = 0
-    for fname in sorted(os.listdir(src)):
-        if not fname.endswith('.json'):
-            continue
-        data = read_json(os.path.join(src, fname))
-        slug = slugify(data['name'])
-        tres = f'''[gd_resource type="Resource" script_class="MissionData" load_steps=2 format=3]
+def convert_mission(path: str, data: dict, data_dir: str) -> str:
+    slug = slugify(data['name'])
+    strings = table_for(data_dir)
+    refs = index_for(data_dir)
+    owner = f"missions/{slug}"
+    refs.begin(owner)
+    rewards = {}
+    for difficulty, reward in (data.get('rewards') or {}).items():
+        if isinstance(reward, dict) and reward.get('item'):
+            reward = dict(reward)
+            item_id, quantity = refs.resolve(owner, f"{owner}.rewards.{difficulty}", reward['item'])
+            if item_id:
+                reward['item'] = item_id
+                reward['quantity'] = reward.get('quantity', 1) * quantity
+            else:
+                del reward['item']
+        rewards[difficulty] = reward
+    tres = f'''[gd_resource type="Resource" script_class="MissionData" load_steps=2 format=3]
 
 [ext_resource type="Script" path="res://scripts/resources/mission_data.gd" id="1"]
 
 [resource]
 script = ExtResource("1")
 id = "{slug}"
-name = "{data['name']}"
+name_id = {strings.intern(data['name'])}
 area = "{data.get('area', '')}"
 is_main = {value_to_gdscript(data.get('main', False))}
 is_secret = {value_to_gdscript(data.get('isSecret', False))}
 requires = {packed_string_array(data.get('requires', []))}
-rewards = {dict_to_gdscript(data.get('rewards', {}))}
+rewards = {dict_to_gdscript(rewards)}
 '''
-        write_tres(os.path.join(data_dir, 'missions', f'{slug}.tres'), tres)
-        count += 1
-    return count
+    write_tres(os.path.join(data_dir, 'missions', f'{slug}.tres'), tres)
+    return slug
 
 
 # ---- Quest Area Data ----
-def import_quest_areas(content_dir: str, data_dir: str):
-    src = os.path.join(content_dir, 'quest-areas')
-    if not os.path.isdir(src):
-        return 0
-    count = 0
-    for fname in sorted(os.listdir(src)):
-        if not fname.endswith('.json'):
-            continue
-        data = read_json(os.path.join(src, fname))
-        slug = slugify(data.get('areaId', fname.replace('.json', '')))
-        tres = f'''[gd_resource type="Resource" script_class="QuestAreaData" load_steps=2 format=3]
+def convert_quest_area(path: str, data: dict, data_dir: str) -> str:
+    fname = os.path.basename(path)
+    slug = slugify(data.get('areaId', fname.replace('.json', '')))
+    strings = table_for(data_dir)
+    tres = f'''[gd_resource type="Resource" script_class="QuestAreaData" load_steps=2 format=3]
 
 [ext_resource type="Script" path="res://scripts/resources/quest_area_data.gd" id="1"]
 
@@ -310,29 +315,22 @@ script = ExtResource("1")
 id = "{slug}"
 area_id = "{data.get('areaId', '')}"
 area_name = "{data.get('areaName', '')}"
-description = "{data.get('description', '').replace('"', '\\"')}"
+description_id = {strings.intern(data.get('description', ''))}
 unlock_condition = "{data.get('unlockCondition', '')}"
 recommended_level = {data.get('recommendedLevel', 1)}
 environment = "{data.get('environment', '')}"
 quest_count = {data.get('questCount', 0)}
 '''
-        write_tres(os.path.join(data_dir, 'quest_areas', f'{slug}.tres'), tres)
-        count += 1
-    return count
+    write_tres(os.path.join(data_dir, 'quest_areas', f'{slug}.tres'), tres)
+    return slug
 
 
 # ---- Quest Definition Data ----
-def import_quest_definitions(content_dir: str, data_dir: str):
-    src = os.path.join(content_dir, 'quest-definitions')
-    if not os.path.isdir(src):
-        return 0
-    count = 0
-    for fname in sorted(os.listdir(src)):
-        if not fname.endswith('.json'):
-            continue
-        data = read_json(os.path.join(src, fname))
-        slug = slugify(data.get('questId', fname.replace('.json', '')))
-        tres = f'''[gd_resource type="Resource" script_class="QuestDefinitionData" load_steps=2 format=3]
+def convert_quest_definition(path: str, data: dict, data_dir: str) -> str:
+    fname = os.path.basename(path)
+    slug = slugify(data.get('questId', fname.replace('.json', '')))
+    strings = table_for(data_dir)
+    tres = f'''[gd_resource type="Resource" script_class="QuestDefinitionData" load_steps=2 format=3]
 
 [ext_resource type="Script" path="res://scripts/resources/quest_definition_data.gd" id="1"]
 
@@ -343,86 +341,89 @@ quest_id = "{data.get('questId', '')}"
 quest_name = "{data.get('questName', '')}"
 quest_type = "{data.get('questType', '')}"
 area = "{data.get('area', '')}"
-description = "{data.get('description', '').replace('"', '\\"')}"
+description_id = {strings.intern(data.get('description', ''))}
 difficulties = {array_to_gdscript(data.get('difficulties', []))}
 requirements = {dict_to_gdscript(data.get('requirements', {}))}
 objectives = {array_to_gdscript(data.get('objectives', []))}
 is_repeatable = {value_to_gdscript(data.get('isRepeatable', False))}
 is_secret = {value_to_gdscript(data.get('isSecret', False))}
 '''
-        write_tres(os.path.join(data_dir, 'quest_definitions', f'{slug}.tres'), tres)
-        count += 1
-    return count
+    write_tres(os.path.join(data_dir, 'quest_definitions', f'{slug}.tres'), tres)
+    return slug
 
 
 # ---- Material Data ----
-def import_materials(content_dir: str, data_dir: str):
-    src = os.path.join(content_dir, 'materials')
-    if not os.path.isdir(src):
-        return 0
-    count = 0
-    for fname in sorted(os.listdir(src)):
-        if not fname.endswith('.json'):
-            continue
-        data = read_json(os.path.join(src, fname))
-        slug = slugify(data['name'])
-        tres = f'''[gd_resource type="Resource" script_class="MaterialData" load_steps=2 format=3]
+def convert_material(path: str, data: dict, data_dir: str) -> str:
+    slug = slugify(data['name'])
+    strings = table_for(data_dir)
+    tres = f'''[gd_resource type="Resource" script_class="MaterialData" load_steps=2 format=3]
 
 [ext_resource type="Script" path="res://scripts/resources/material_data.gd" id="1"]
 
 [resource]
 script = ExtResource("1")
 id = "{slug}"
-name = "{data['name']}"
-japanese_name = "{data.get('japaneseName', '')}"
-details = "{data.get('details', '').replace('"', '\\"')}"
+name_id = {strings.intern(data['name'], data.get('japaneseName', ''))}
+details_id = {strings.intern(data.get('details', ''))}
 rarity = {data.get('rarity', 6)}
 pso_world_id = {data.get('psoWorldId', 0)}
 '''
-        write_tres(os.path.join(data_dir, 'materials', f'{slug}.tres'), tres)
-        count += 1
-    return count
+    write_tres(os.path.join(data_dir, 'materials', f'{slug}.tres'), tres)
+    return slug
 
 
 # ---- Set Bonus Data ----
-def import_set_bonuses(content_dir: str, data_dir: str):
-    src = os.path.join(content_dir, 'set-bonuses')
-    if not os.path.isdir(src):
-        return 0
-    count = 0
-    for fname in sorted(os.listdir(src)):
-        if not fname.endswith('.json'):
-            continue
-        data = read_json(os.path.join(src, fname))
-        slug = slugify(data.get('armor', fname.replace('.json', '')))
-        tres = f'''[gd_resource type="Resource" script_class="SetBonusData" load_steps=2 format=3]
+def convert_set_bonus(path: str, data: dict, data_dir: str) -> str:
+    fname = os.path.basename(path)
+    slug = slugify(data.get('armor', fname.replace('.json', '')))
+    # Armor and weapons are display names in the source; store their ids
+    refs = index_for(data_dir)
+    owner = f"set_bonuses/{slug}"
+    refs.begin(owner)
+    armor = refs.resolve(owner, f"{owner}.armor", data['armor'])[0] if data.get('armor') else ''
+    weapons = [item_id for item_id, _ in (refs.resolve(owner, f"{owner}.weapons", name)
+                                          for name in data.get('weapons', [])) if item_id]
+    tres = f'''[gd_resource type="Resource" script_class="SetBonusData" load_steps=2 format=3]
 
 [ext_resource type="Script" path="res://scripts/resources/set_bonus_data.gd" id="1"]
 
 [resource]
 script = ExtResource("1")
 id = "{slug}"
-armor = "{data.get('armor', '')}"
-weapons = {packed_string_array(data.get('weapons', []))}
+armor = "{armor}"
+weapons = {packed_string_array(weapons)}
 bonuses = {dict_to_gdscript(data.get('bonuses', {}))}
 '''
-        write_tres(os.path.join(data_dir, 'set_bonuses', f'{slug}.tres'), tres)
-        count += 1
-    return count
+    write_tres(os.path.join(data_dir, 'set_bonuses', f'{slug}.tres'), tres)
+    return slug
 
 
 # ---- Drop Table Data ----
-def import_drop_tables(content_dir: str, data_dir: str):
-    src = os.path.join(content_dir, 'drops')
-    if not os.path.isdir(src):
-        return 0
-    count = 0
-    for fname in sorted(os.listdir(src)):
-        if not fname.endswith('.json'):
-            continue
-        data = read_json(os.path.join(src, fname))
-        slug = fname.replace('.json', '')
-        tres = f'''[gd_resource type="Resource" script_class="DropTableData" load_steps=2 format=3]
+def convert_drop_table(path: str, data: dict, data_dir: str) -> str:
+    fname = os.path.basename(path)
+    slug = fname.replace('.json', '')
+    # { area: { enemy id: item ids } }; enemy ids are the slugged names
+    refs = index_for(data_dir)
+    owner = f"drop_tables/{slug}"
+    refs.begin(owner)
+    areas = []
+    for area, enemies in data.items():
+        rows = []
+        for enemy, items in enemies.items():
+            enemy_id = slugify(enemy)
+            where = f"{owner}/{area}/{enemy_id}"
+            item_ids = []
+            for name in items:
+                item_id, quantity = refs.resolve(owner, where, name)
+                if quantity > 1:
+                    refs.problems.setdefault(owner, []).append(f"{where}: drops can't carry a quantity ('{name}')")
+                elif item_id:
+                    item_ids.append(item_id)
+            rows.append(f'    "{enemy_id}": {packed_string_array(item_ids)}')
+        rows = ',\n'.join(rows)
+        areas.append(f'  "{area}": {{\n{rows}\n  }}' if rows else f'  "{area}": {{}}')
+    area_drops = '{\n%s\n}' % ',\n'.join(areas) if areas else '{}'
+    tres = f'''[gd_resource type="Resource" script_class="DropTableData" load_steps=2 format=3]
 
 [ext_resource type="Script" path="res://scripts/resources/drop_table_data.gd" id="1"]
 
@@ -430,60 +431,60 @@ def import_drop_tables(content_dir: str, data_dir: str):
 script = ExtResource("1")
 id = "{slug}"
 difficulty = "{slug}"
-area_drops = {dict_to_gdscript(data)}
+area_drops = {area_drops}
 '''
-        write_tres(os.path.join(data_dir, 'drop_tables', f'{slug}.tres'), tres)
-        count += 1
-    return count
+    write_tres(os.path.join(data_dir, 'drop_tables', f'{slug}.tres'), tres)
+    return slug
 
 
 # ---- Shop Data ----
-def import_shops(content_dir: str, data_dir: str):
-    src = os.path.join(content_dir, 'shops')
-    if not os.path.isdir(src):
-        return 0
-    count = 0
-    for fname in sorted(os.listdir(src)):
-        if not fname.endswith('.json'):
-            continue
-        data = read_json(os.path.join(src, fname))
-        slug = slugify(data.get('name', fname.replace('.json', '')))
-        tres = f'''[gd_resource type="Resource" script_class="ShopData" load_steps=2 format=3]
+def convert_shop(path: str, data: dict, data_dir: str) -> str:
+    fname = os.path.basename(path)
+    slug = slugify(data.get('name', fname.replace('.json', '')))
+    strings = table_for(data_dir)
+    refs = index_for(data_dir)
+    owner = f"shops/{slug}"
+    refs.begin(owner)
+    items = []
+    for i, entry in enumerate(data.get('items', [])):
+        entry = dict(entry)
+        for field, count in (('item', 'quantity'), ('tradeIn', 'tradeInQuantity')):
+            if not entry.get(field):
+                continue
+            item_id, quantity = refs.resolve(owner, f"{owner}.items[{i}].{field}", entry[field])
+            entry[field] = item_id
+            if quantity > 1:
+                entry[count] = quantity
+        # An entry whose item or trade-in doesn't resolve can't be sold
+        if all(entry.get(field) != '' for field in ('item', 'tradeIn')):
+            items.append(entry)
+    tres = f'''[gd_resource type="Resource" script_class="ShopData" load_steps=2 format=3]
 
 [ext_resource type="Script" path="res://scripts/resources/shop_data.gd" id="1"]
 
 [resource]
 script = ExtResource("1")
 id = "{slug}"
-name = "{data.get('name', '')}"
-description = "{data.get('description', '').replace('"', '\\"')}"
-items = {array_to_gdscript(data.get('items', []))}
+name_id = {strings.intern(data.get('name', ''))}
+description_id = {strings.intern(data.get('description', ''))}
+items = {array_to_gdscript(items)}
 '''
-        write_tres(os.path.join(data_dir, 'shops', f'{slug}.tres'), tres)
-        count += 1
-    return count
+    write_tres(os.path.join(data_dir, 'shops', f'{slug}.tres'), tres)
+    return slug
 
 
 # ---- Mag Personality Data ----
-def import_mag_personalities(content_dir: str, data_dir: str):
-    src = os.path.join(content_dir, 'mag-personalities')
-    if not os.path.isdir(src):
-        return 0
-    count = 0
-    for fname in sorted(os.listdir(src)):
-        if not fname.endswith('.json'):
-            continue
-        data = read_json(os.path.join(src, fname))
-        slug = slugify(data['name'])
-        tres = f'''[gd_resource type="Resource" script_class="MagPersonalityData" load_steps=2 format=3]
+def convert_mag_personality(path: str, data: dict, data_dir: str) -> str:
+    slug = slugify(data['name'])
+    strings = table_for(data_dir)
+    tres = f'''[gd_resource type="Resource" script_class="MagPersonalityData" load_steps=2 format=3]
 
 [ext_resource type="Script" path="res://scripts/resources/mag_personality_data.gd" id="1"]
 
 [resource]
 script = ExtResource("1")
 id = "{slug}"
-name = "{data['name']}"
-japanese_name = "{data.get('japaneseName', '')}"
+name_id = {strings.intern(data['name'], data.get('japaneseName', ''))}
 category = "{data.get('category', '')}"
 tier = "{data.get('tier', '')}"
 unlock_level = {data.get('unlockLevel', 0)}
@@ -491,105 +492,92 @@ favorite_food = "{data.get('favoriteFood', '')}"
 switch_from = "{data.get('switchFrom', '')}"
 triggers = {dict_to_gdscript(data.get('triggers', {}))}
 '''
-        write_tres(os.path.join(data_dir, 'mag_personalities', f'{slug}.tres'), tres)
-        count += 1
-    return count
+    write_tres(os.path.join(data_dir, 'mag_personalities', f'{slug}.tres'), tres)
+    return slug
 
 
 # ---- Modifier Data ----
-def import_modifiers(content_dir: str, data_dir: str):
-    src = os.path.join(content_dir, 'modifiers')
-    if not os.path.isdir(src):
-        return 0
-    count = 0
-    for fname in sorted(os.listdir(src)):
-        if not fname.endswith('.json'):
-            continue
-        data = read_json(os.path.join(src, fname))
-        slug = slugify(data['name'])
-        tres = f'''[gd_resource type="Resource" script_class="ModifierData" load_steps=2 format=3]
+def convert_modifier(path: str, data: dict, data_dir: str) -> str:
+    slug = slugify(data['name'])
+    strings = table_for(data_dir)
+    tres = f'''[gd_resource type="Resource" script_class="ModifierData" load_steps=2 format=3]
 
 [ext_resource type="Script" path="res://scripts/resources/modifier_data.gd" id="1"]
 
 [resource]
 script = ExtResource("1")
 id = "{slug}"
-name = "{data['name']}"
-japanese_name = "{data.get('japaneseName', '')}"
-details = "{data.get('details', '').replace('"', '\\"')}"
+name_id = {strings.intern(data['name'], data.get('japaneseName', ''))}
+details_id = {strings.intern(data.get('details', ''))}
 rarity = {data.get('rarity', 3)}
 pso_world_id = {data.get('psoWorldId', 0)}
 '''
-        write_tres(os.path.join(data_dir, 'modifiers', f'{slug}.tres'), tres)
-        count += 1
-    return count
+    write_tres(os.path.join(data_dir, 'modifiers', f'{slug}.tres'), tres)
+    return slug
 
 
 # ---- Experience Table ----
-def import_experience(content_dir: str, data_dir: str):
-    src = os.path.join(content_dir, 'experience')
-    if not os.path.isdir(src):
-        return 0
-    for fname in os.listdir(src):
-        if not fname.endswith('.json'):
-            continue
-        data = read_json(os.path.join(src, fname))
-        levels = data.get('levels', data if isinstance(data, list) else [])
-        tres = f'''[gd_resource type="Resource" script_class="ExperienceTable" load_steps=2 format=3]
+def experience_arrays(levels: list) -> tuple[np.ndarray, np.ndarray]:
+    """(total EXP to reach each level, EXP from each level to the next).
+
+    Totals are the source's totalExp, or the prefix sum of expToNext where
+    it's missing; per-level EXP is derived from the totals so the two always
+    agree (the source's expToNext is off in a few places).
+    """
+    levels = sorted(levels, key=lambda e: int(e.get('level', 0)))
+    to_next = np.array([int(e.get('expToNext') or 0) for e in levels], dtype=np.int64)
+    prefix = np.concatenate(([0], np.cumsum(to_next[:-1]))) if len(levels) else to_next
+    totals = np.array([int(e['totalExp']) if e.get('totalExp') is not None else prefix[i]
+                       for i, e in enumerate(levels)], dtype=np.int64)
+    per_level = np.append(np.diff(totals), 0) if len(levels) else totals
+    return totals, per_level
+
+
+def convert_experience(path: str, data, data_dir: str) -> str:
+    levels = data.get('levels', []) if isinstance(data, dict) else data
+    totals, per_level = experience_arrays(levels)
+    tres = f'''[gd_resource type="Resource" script_class="ExperienceTable" load_steps=2 format=3]
 
 [ext_resource type="Script" path="res://scripts/resources/experience_table.gd" id="1"]
 
 [resource]
 script = ExtResource("1")
 levels = {array_to_gdscript(levels)}
+total_exp = {packed_int_array(totals, 'PackedInt64Array')}
+exp_to_next = {packed_int_array(per_level, 'PackedInt64Array')}
 '''
-        write_tres(os.path.join(data_dir, 'experience_table.tres'), tres)
-        return 1
-    return 0
+    write_tres(os.path.join(data_dir, 'experience_table.tres'), tres)
+    return 'experience_table'
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python3 scripts/tools/import_content.py /path/to/psz-sketch")
-        sys.exit(1)
-
-    sketch_dir = sys.argv[1]
-    content_dir = os.path.join(sketch_dir, 'src', 'content')
-    data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'data')
-
-    if not os.path.isdir(content_dir):
-        print(f"Error: content directory not found: {content_dir}")
+    from tool_metrics import VALUE_FLAGS, metrics_from_options
+
+    argv = sys.argv[1:]
+    options = {}
+    args = []
+    i = 0
+    while i < len(argv):
+        if argv[i] in ('--output', '--db') + VALUE_FLAGS and i + 1 < len(argv):
+            options[argv[i]] = argv[i + 1]
+            i += 2
+            continue
+        if not argv[i].startswith('--'):
+            args.append(argv[i])
+        i += 1
+    if not args:
+        print("Usage: python3 scripts/tools/import_content.py /path/to/psz-sketch [--no-db] "
+              "[--output DATA_DIR] [--db DB_PATH] [--profile] [--metrics-json PATH] [--cprofile DIR]")
         sys.exit(1)
 
-    print(f"Importing from: {content_dir}")
-    print(f"Outputting to:  {data_dir}")
-    print()
-
-    importers = [
-        ("Classes", import_classes),
-        ("Consumables", import_consumables),
-        ("Units", import_units),
-        ("Photon Arts", import_photon_arts),
-        ("Mags", import_mags),
-        ("Missions", import_missions),
-        ("Quest Areas", import_quest_areas),
-        ("Quest Definitions", import_quest_definitions),
-        ("Materials", import_materials),
-        ("Set Bonuses", import_set_bonuses),
-        ("Drop Tables", import_drop_tables),
-        ("Shops", import_shops),
-        ("Mag Personalities", import_mag_personalities),
-        ("Modifiers", import_modifiers),
-        ("Experience Table", import_experience),
-    ]
-
-    total = 0
-    for name, func in importers:
-        count = func(content_dir, data_dir)
-        print(f"  {name}: {count} files")
-        total += count
-
-    print(f"\nTotal: {total} .tres files generated")
+    # Delegates to the unified pipeline, limited to this tool's categories
+    from content_pipeline import DATA_DIR, IMPORT_CONTENT_CATEGORIES, run_pipeline
+    from content_db import DEFAULT_DB_PATH
+    content_dir = os.path.join(args[0], 'src', 'content')
+    db_path = None if '--no-db' in argv else options.get('--db', DEFAULT_DB_PATH)
+    run_pipeline(content_dir, options.get('--output', DATA_DIR),
+                 categories=IMPORT_CONTENT_CATEGORIES, db_path=db_path,
+                 metrics=metrics_from_options('import_content', argv, options))
 
 
 if __name__ == '__main__':
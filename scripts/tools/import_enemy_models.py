@@ -8,12 +8,21 @@ modelBaseName, then copies:
   - textures/*.png                     → assets/enemies/{enemy_id}/
 
 Skips multi-part bosses that need special handling.
+
+Usage:
+    python3 scripts/tools/import_enemy_models.py [--optimize-png] [--tiers] [--profile] [--metrics-json PATH] [--cprofile DIR]
 """
 
+import argparse
 import json
 import os
 import shutil
 import sys
+import time
+
+from build_texture_tiers import build_tiers
+from optimize_pngs import optimize_pngs
+from tool_metrics import add_metrics_arguments, dir_bytes, metrics_from_args
 
 # Paths
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -89,6 +98,13 @@ def import_enemy(enemy_id: str) -> bool:
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Import enemy GLB models and textures from psz-sketch")
+    parser.add_argument("--optimize-png", action="store_true", help="Losslessly recompress the copied PNGs")
+    parser.add_argument("--tiers", action="store_true", help="Rebuild the downscaled texture tiers")
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+    metrics = metrics_from_args("import_enemy_models", args)
+
     if not os.path.isdir(ENEMIES_SRC):
         print(f"ERROR: Source directory not found: {ENEMIES_SRC}")
         sys.exit(1)
@@ -108,19 +124,36 @@ def main():
     print(f"Destination: {ENEMIES_DST}")
     print(f"Found {len(enemy_dirs)} enemy directories\n")
 
-    for enemy_id in enemy_dirs:
-        if enemy_id in SKIP_ENEMIES:
-            print(f"  SKIP {enemy_id}: multi-part boss")
-            skipped_boss += 1
-            continue
-
-        if import_enemy(enemy_id):
-            imported += 1
-        else:
-            failed += 1
+    with metrics.stage("enemies"):
+        for enemy_id in enemy_dirs:
+            if enemy_id in SKIP_ENEMIES:
+                print(f"  SKIP {enemy_id}: multi-part boss")
+                skipped_boss += 1
+                metrics.file("enemies", enemy_id, 0.0, status="skipped")
+                continue
+
+            start = time.perf_counter()
+            if import_enemy(enemy_id):
+                imported += 1
+                copied = dir_bytes(os.path.join(ENEMIES_DST, enemy_id))
+                metrics.file("enemies", enemy_id, time.perf_counter() - start, copied, copied, "copied")
+            else:
+                failed += 1
+                metrics.file("enemies", enemy_id, time.perf_counter() - start, status="failed")
 
     print(f"\nDone: {imported} imported, {skipped_boss} bosses skipped, {failed} failed")
 
+    if args.optimize_png:
+        print("\nRecompressing PNGs...")
+        with metrics.stage("png"):
+            optimize_pngs([ENEMIES_DST], metrics=metrics)
+
+    if args.tiers:
+        print("\nBuilding texture tiers...")
+        with metrics.stage("tiers"):
+            build_tiers(metrics=metrics)
+    metrics.finish()
+
 
 if __name__ == "__main__":
     main()
@@ -3,18 +3,27 @@
 
 Copies 56 player variation directories (pc_000–pc_133, skipping pc_a0X specials).
 Each variation gets: 1 GLB model + all PNG textures (~45 per variation).
+The copied textures are then packed into per-variation atlases (see
+build_player_atlases.py) unless --no-atlas is given.
 
 Source: psz-sketch/public/player/pc_XXX/
 Dest:   psz-godot/assets/player/pc_XXX/
 
 Usage:
-    python3 scripts/tools/import_player_models.py
+    python3 scripts/tools/import_player_models.py [--no-atlas] [--optimize-png] [--tiers] [--profile] [--metrics-json PATH] [--cprofile DIR]
 """
 
+import argparse
 import os
 import re
 import shutil
 import sys
+import time
+
+from build_player_atlases import build_atlases
+from build_texture_tiers import build_tiers
+from optimize_pngs import optimize_pngs
+from tool_metrics import add_metrics_arguments, dir_bytes, metrics_from_args
 
 SKETCH_ROOT = os.path.expanduser("~/Github/psz-sketch/public/player")
 GODOT_ROOT = os.path.expanduser("~/Github/psz-godot/assets/player")
@@ -54,6 +63,14 @@ def import_variation(name: str) -> tuple[int, int]:
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Import player model variations from psz-sketch")
+    parser.add_argument("--no-atlas", action="store_true", help="Skip the texture atlas stage")
+    parser.add_argument("--optimize-png", action="store_true", help="Losslessly recompress the copied PNGs")
+    parser.add_argument("--tiers", action="store_true", help="Rebuild the downscaled texture tiers")
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+    metrics = metrics_from_args("import_player_models", args)
+
     if not os.path.isdir(SKETCH_ROOT):
         print(f"ERROR: Source directory not found: {SKETCH_ROOT}")
         sys.exit(1)
@@ -68,18 +85,41 @@ def main():
     total_png = 0
     imported = 0
 
-    for name in variations:
-        glb, png = import_variation(name)
-        if glb > 0:
-            imported += 1
-            total_glb += glb
-            total_png += png
-            print(f"  {name}: {glb} GLB, {png} PNG")
-        else:
-            print(f"  {name}: SKIPPED (no GLB found)")
+    with metrics.stage("variations"):
+        for name in variations:
+            start = time.perf_counter()
+            glb, png = import_variation(name)
+            elapsed = time.perf_counter() - start
+            if glb > 0:
+                imported += 1
+                total_glb += glb
+                total_png += png
+                print(f"  {name}: {glb} GLB, {png} PNG")
+                dst_dir = os.path.join(GODOT_ROOT, name)
+                copied = dir_bytes(dst_dir) + dir_bytes(os.path.join(dst_dir, "textures"))
+                metrics.file("variations", name, elapsed, copied, copied, "copied")
+            else:
+                print(f"  {name}: SKIPPED (no GLB found)")
+                metrics.file("variations", name, elapsed, status="skipped")
 
     print(f"\nDone: {imported} variations, {total_glb} GLB files, {total_png} textures")
 
+    if not args.no_atlas:
+        print("\nBuilding texture atlases...")
+        with metrics.stage("atlas"):
+            build_atlases(GODOT_ROOT, metrics=metrics)
+
+    if args.optimize_png:
+        print("\nRecompressing PNGs...")
+        with metrics.stage("png"):
+            optimize_pngs([GODOT_ROOT], metrics=metrics)
+
+    if args.tiers:
+        print("\nBuilding texture tiers...")
+        with metrics.stage("tiers"):
+            build_tiers(metrics=metrics)
+    metrics.finish()
+
 
 if __name__ == "__main__":
     main()
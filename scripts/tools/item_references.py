@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""Rewrite item references from display names to content ids at import.
+
+Shops, drop tables, set bonuses and mission rewards name other content by
+display name ("St. Kilda", "M&A33") in psz-sketch. Their converters resolve
+those names through one shared index of every item name and write the
+canonical content ids, so the game looks items up directly and never maps a
+name to an id itself. The index is filled in as the item categories
+(consumables, materials, modifiers, units, armors, weapons, mags, plus the
+hand-written data/items) are converted, and saved as
+
+  data/item_references.tres   (ItemReferences)
+    ids    { display name: content id }   every indexed name
+    kinds  { content id: category }       e.g. "weapons", "consumables"
+
+so importing only the referencing categories resolves against the items
+imported earlier.
+
+Besides exact names, a reference resolves when:
+  - NAME_ALIASES maps its source spelling to an item's display name
+    ("Witch Broom");
+  - it is a technique disk, "Disk: Foie Lv.3" → disk_foie_3 (the Inventory
+    id format);
+  - it ends in a quantity, "Lassi Soul x 5" → the id of "Lassi Soul" with
+    quantity 5 (shops and rewards store it next to the id).
+
+Every other reference is an import error naming where it appears
+(shops/enemy_collector.items[3].tradeIn, drop_tables/hard/gurhacia-valley/ghowl,
+...) and is left out of the output.
+
+Standalone, this reports the index and checks that every item id the
+converted shops, drop tables, set bonuses and missions refer to exists
+(exit status 1 otherwise).
+
+Usage:
+    python3 scripts/tools/item_references.py
+    python3 scripts/tools/item_references.py --data /tmp/data
+"""
+
+import argparse
+import os
+import re
+import sys
+
+from string_table import table_for, text_field
+from tres_reader import TresParseError, read_tres
+from tool_metrics import add_metrics_arguments, metrics_from_args
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+GODOT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, '..', '..'))
+DATA_DIR = os.path.join(GODOT_ROOT, 'data')
+OUTPUT_NAME = 'item_references.tres'
+
+# Imported categories whose records are items; data/items is hand-written
+ITEM_CATEGORIES = ('consumables', 'materials', 'modifiers', 'units', 'armors', 'weapons', 'mags')
+HAND_WRITTEN = 'items'
+# Source spellings of existing items that differ from their display name
+NAME_ALIASES = {
+    'Witch Broom': "Witch's Broom",
+}
+# "Disk: Foie Lv.1" → Inventory's disk_<technique id>_<level>
+DISK_NAME = re.compile(r'^Disk: (.+) Lv\.(\d+)$')
+# "Lassi Soul x 5" → ("Lassi Soul", 5)
+QUANTITY_SUFFIX = re.compile(r'^(.*\S)\s+x\s*(\d+)$')
+
+
+def _read_dir(path: str) -> list[dict]:
+    records = []
+    if not os.path.isdir(path):
+        return records
+    for fname in sorted(os.listdir(path)):
+        if not fname.endswith('.tres'):
+            continue
+        try:
+            rec = read_tres(os.path.join(path, fname))
+        except (OSError, TresParseError) as e:
+            print(f"  Skipping {fname}: {e}")
+            continue
+        if rec.get('id'):
+            records.append(rec)
+    return records
+
+
+class ItemIndex:
+    """Item display names → content ids, plus the problems found resolving them.
+
+    Problems are kept per owner ("shops/item_shop", "weapons/saber") so
+    re-converting one file replaces only its own.
+    """
+
+    def __init__(self, ids: dict[str, str] | None = None, kinds: dict[str, str] | None = None):
+        self.ids: dict[str, str] = dict(ids or {})
+        self.kinds: dict[str, str] = dict(kinds or {})
+        self._names: dict[str, str] = {item_id: name for name, item_id in self.ids.items()}
+        self.problems: dict[str, list[str]] = {}
+        self.changed = False
+
+    @classmethod
+    def load(cls, path: str) -> 'ItemIndex':
+        """The index written to `path`, or an empty one if there is none."""
+        if not os.path.exists(path):
+            return cls()
+        props = read_tres(path)
+        return cls(props.get('ids'), props.get('kinds'))
+
+    def add(self, category: str, item_id: str, name: str):
+        """Index (or re-index) one item under its display name."""
+        owner = f"{category}/{item_id}"
+        self.problems.pop(owner, None)
+        if self._names.get(item_id) != name:
+            self.remove(item_id)
+        if self.kinds.get(item_id) != category:
+            self.kinds[item_id] = category
+            self.changed = True
+        if not name:
+            return
+        other = self.ids.get(name)
+        if other is not None and other != item_id:
+            self.problems[owner] = [f"'{name}' names both {self.kinds.get(other, '?')}/{other} and {owner}"]
+            return
+        if other is None:
+            self.ids[name] = item_id
+            self._names[item_id] = name
+            self.changed = True
+
+    def remove(self, item_id: str):
+        name = self._names.pop(item_id, None)
+        if name is not None and self.ids.get(name) == item_id:
+            del self.ids[name]
+            self.changed = True
+        if self.kinds.pop(item_id, None) is not None:
+            self.changed = True
+
+    def name(self, item_id: str) -> str:
+        return self._names.get(item_id, '')
+
+    def lookup(self, name: str) -> tuple[str, int]:
+        """(content id, quantity) for a reference, or ('', 0) if nothing matches."""
+        name = NAME_ALIASES.get(name, name)
+        item_id = self.ids.get(name)
+        if item_id is not None:
+            return item_id, 1
+        disk = DISK_NAME.match(name)
+        if disk:
+            return f"disk_{disk.group(1).lower()}_{int(disk.group(2))}", 1
+        counted = QUANTITY_SUFFIX.match(name)
+        if counted:
+            item_id, _ = self.lookup(counted.group(1))
+            if item_id:
+                return item_id, int(counted.group(2))
+        return '', 0
+
+    def begin(self, owner: str):
+        """Forget an owner's problems before its file is converted again."""
+        self.problems.pop(owner, None)
+
+    def resolve(self, owner: str, where: str, name: str) -> tuple[str, int]:
+        """lookup(), recording a problem against `owner` when nothing matches."""
+        item_id, quantity = self.lookup(name)
+        if not item_id:
+            self.problems.setdefault(owner, []).append(f"{where}: no item named '{name}'")
+        return item_id, quantity
+
+    def all_problems(self) -> list[str]:
+        return [problem for owner in sorted(self.problems) for problem in self.problems[owner]]
+
+
+_INDEXES: dict[str, ItemIndex] = {}
+
+
+def index_for(data_dir: str, fresh: bool = False) -> ItemIndex:
+    """The shared index for data_dir, loaded from its item_references.tres once.
+
+    The pipeline adds items to it as they are converted and the shop, drop
+    table, set bonus and mission converters resolve through it, so both see
+    items converted earlier in the same run before the index is saved.
+    fresh starts over from the hand-written items only, for an import that
+    converts every item category again.
+    """
+    key = os.path.abspath(data_dir)
+    index = _INDEXES.get(key)
+    if index is None or fresh:
+        path = os.path.join(key, OUTPUT_NAME)
+        index = _INDEXES[key] = ItemIndex() if fresh else ItemIndex.load(path)
+        strings = table_for(key)
+        for rec in _read_dir(os.path.join(key, HAND_WRITTEN)):
+            index.add(HAND_WRITTEN, rec['id'], text_field(strings, rec))
+    return index
+
+
+def _escape(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('"', '\\"')
+
+
+def format_index(index: ItemIndex) -> str:
+    id_lines = ',\n'.join(f'  "{_escape(name)}": "{item_id}"' for name, item_id in sorted(index.ids.items()))
+    kind_lines = ',\n'.join(f'  "{item_id}": "{kind}"' for item_id, kind in sorted(index.kinds.items()))
+    return f'''[gd_resource type="Resource" script_class="ItemReferences" load_steps=2 format=3]
+
+[ext_resource type="Script" path="res://scripts/resources/item_references.gd" id="1"]
+
+[resource]
+script = ExtResource("1")
+ids = {{
+{id_lines}
+}}
+kinds = {{
+{kind_lines}
+}}
+'''
+
+
+def save_item_references(data_dir: str = DATA_DIR) -> ItemIndex:
+    """Write data_dir/item_references.tres if the index changed; returns the index."""
+    index = index_for(data_dir)
+    path = os.path.join(data_dir, OUTPUT_NAME)
+    if index.changed or not os.path.exists(path):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(format_index(index))
+        index.changed = False
+    return index
+
+
+def references(data_dir: str):
+    """Yield (where, item id) for every item id the converted content refers to."""
+    for shop in _read_dir(os.path.join(data_dir, 'shops')):
+        for i, entry in enumerate(shop.get('items') or []):
+            for field in ('item', 'tradeIn'):
+                if entry.get(field):
+                    yield f"shops/{shop['id']}.items[{i}].{field}", entry[field]
+    for table in _read_dir(os.path.join(data_dir, 'drop_tables')):
+        for area, enemies in (table.get('area_drops') or {}).items():
+            for enemy, item_ids in enemies.items():
+                for item_id in item_ids:
+                    yield f"drop_tables/{table['id']}/{area}/{enemy}", item_id
+    for bonus in _read_dir(os.path.join(data_dir, 'set_bonuses')):
+        if bonus.get('armor'):
+            yield f"set_bonuses/{bonus['id']}.armor", bonus['armor']
+        for item_id in bonus.get('weapons', []):
+            yield f"set_bonuses/{bonus['id']}.weapons", item_id
+    for mission in _read_dir(os.path.join(data_dir, 'missions')):
+        for difficulty, reward in (mission.get('rewards') or {}).items():
+            if isinstance(reward, dict) and reward.get('item'):
+                yield f"missions/{mission['id']}.rewards.{difficulty}", reward['item']
+
+
+def check_references(data_dir: str, index: ItemIndex) -> tuple[int, list[str]]:
+    """(references checked, problems for ids that aren't indexed items or disks)."""
+    checked, problems = 0, []
+    for where, item_id in references(data_dir):
+        checked += 1
+        if item_id not in index.kinds and not item_id.startswith('disk_'):
+            problems.append(f"{where}: no item with id '{item_id}'")
+    return checked, problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report on the item index and check item id references")
+    parser.add_argument('--data', default=DATA_DIR, help="Generated data/ directory")
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.data):
+        print(f"ERROR: data directory not found: {args.data}")
+        sys.exit(1)
+
+    metrics = metrics_from_args('item_references', args)
+    with metrics.stage('check'):
+        index = index_for(args.data)
+        checked, problems = check_references(args.data, index)
+    print(f"Item references: {len(index.ids)} names indexed, {checked} references checked, "
+          f"{len(problems)} problems")
+    for problem in problems:
+        print(f"  {problem}")
+    metrics.finish()
+    if problems:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
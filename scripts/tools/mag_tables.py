@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""Build the mag evolution decision table and personality switch matrix.
+
+Mags carry an evolution_level and an evolution_requirement dict, and
+personalities describe how to switch to them in a switch_from sentence
+("Feed 5 consecutive Hunter or Force Weapons"). Deciding a form on every
+feed meant walking every MagData and comparing requirement strings. This
+compiles both once, from the converted resources under data/, and writes
+
+  data/mag_tables.tres   (MagTables)
+    base_form             form id below the first threshold
+    evolution_levels      PackedInt32Array   stage thresholds, highest first
+    evolution_forms       [ { "<primary>" | "<primary>/<secondary>": form id } ]
+                          one dict per threshold; stat names lower-case
+    personality_switches  { "<kind>" | "<kind>/<kind>": [ {id, feeds, level} ] }
+                          feed kinds: hunter_weapon, ranger_weapon,
+                          force_weapon, armor; pair keys sorted; a single
+                          kind lists every switch that kind satisfies;
+                          candidates in (level, id) order
+
+Only "stat" requirements are compiled; pure-stat and soul forms aren't
+reached by feeding. switch_from sentences that don't parse are reported and
+left out.
+
+Runs as a content_pipeline.py stage after mags and mag personalities are
+imported, and standalone. The stage keeps a MagTablesBuilder across
+watch-mode updates, so a changed mag or personality only replaces its own
+entry (a personality's switch_from is parsed once per change) and the file
+is rewritten only when the tables changed.
+
+Usage:
+    python3 scripts/tools/mag_tables.py
+    python3 scripts/tools/mag_tables.py --data /tmp/data
+"""
+
+import argparse
+import os
+import re
+import sys
+
+from tres_reader import TresParseError, read_tres
+from tool_metrics import add_metrics_arguments, metrics_from_args
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+GODOT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, '..', '..'))
+DATA_DIR = os.path.join(GODOT_ROOT, 'data')
+OUTPUT_NAME = 'mag_tables.tres'
+BASE_FORM = 'mag'
+
+SWITCH_RE = re.compile(r'^Feed (\d+) consecutive (.+)$')
+WEAPON_CLASSES = {'hunter': 'hunter_weapon', 'ranger': 'ranger_weapon', 'ranged': 'ranger_weapon',
+                  'force': 'force_weapon'}
+
+
+def _read_dir(path: str) -> list[dict]:
+    records = []
+    if not os.path.isdir(path):
+        return records
+    for fname in sorted(os.listdir(path)):
+        if not fname.endswith('.tres'):
+            continue
+        try:
+            records.append(read_tres(os.path.join(path, fname)))
+        except (OSError, TresParseError) as e:
+            print(f"  Skipping {fname}: {e}")
+    return records
+
+
+def evolution_table(mags: list[dict]) -> tuple[list[int], list[dict[str, str]]]:
+    """(thresholds highest first, {stat key: form id} per threshold).
+
+    A stage's threshold is the lowest evolution_level among its stat forms;
+    the first form (by id) wins a key that several forms share.
+    """
+    stages: dict[str, tuple[int, dict[str, str]]] = {}
+    for mag in sorted(mags, key=lambda m: m.get('id', '')):
+        requirement = mag.get('evolution_requirement') or {}
+        if requirement.get('type') != 'stat' or not requirement.get('primary'):
+            continue
+        key = requirement['primary'].lower()
+        if requirement.get('secondary'):
+            key += '/' + requirement['secondary'].lower()
+        level, forms = stages.get(mag.get('stage', ''), (mag.get('evolution_level', 0), {}))
+        forms.setdefault(key, mag['id'])
+        stages[mag.get('stage', '')] = (min(level, mag.get('evolution_level', 0)), forms)
+    ordered = sorted(stages.values(), key=lambda entry: -entry[0])
+    return [level for level, _ in ordered], [forms for _, forms in ordered]
+
+
+def parse_switch(text: str) -> tuple[int, list[str]] | None:
+    """(consecutive feeds, feed kinds) of a switch_from sentence, or None."""
+    match = SWITCH_RE.match(text.strip())
+    if not match:
+        return None
+    kinds = []
+    for part in match.group(2).split(' or '):
+        words = part.lower().split()
+        if words and words[-1] in ('armor', 'armors'):
+            kinds.append('armor')
+        elif words and words[0] in WEAPON_CLASSES:
+            kinds.append(WEAPON_CLASSES[words[0]])
+        else:
+            return None
+    return int(match.group(1)), sorted(set(kinds))
+
+
+def switch_entry(personality: dict) -> tuple[list[str], dict] | None:
+    """(feed keys, candidate) for one personality's switch_from, or None if
+    it doesn't parse. Personalities without one give ([], {})."""
+    text = personality.get('switch_from', '')
+    if not text:
+        return [], {}
+    parsed = parse_switch(text)
+    if parsed is None:
+        return None
+    feeds, kinds = parsed
+    entry = {'id': personality['id'], 'feeds': feeds, 'level': personality.get('unlock_level', 0)}
+    return sorted({'/'.join(kinds), *kinds}), entry
+
+
+def _format_switches(switches: dict[str, list[dict]]) -> str:
+    lines = []
+    for key, candidates in sorted(switches.items()):
+        entries = ', '.join(f'{{"id": "{c["id"]}", "feeds": {c["feeds"]}, "level": {c["level"]}}}'
+                            for c in candidates)
+        lines.append(f'  "{key}": [{entries}]')
+    return ',\n'.join(lines)
+
+
+class MagTablesBuilder:
+    """Mags and parsed personality switches by id, updated one record at a time."""
+
+    def __init__(self):
+        self.mags: dict[str, dict] = {}
+        self.switches: dict[str, tuple[list[str], dict]] = {}
+        self.unparsed: dict[str, str] = {}
+        self._written = None
+
+    def update_mag(self, mag_id: str, mag: dict | None):
+        """Replace one mag (its converted .tres); None removes it."""
+        if mag is None:
+            self.mags.pop(mag_id, None)
+        else:
+            self.mags[mag_id] = mag
+
+    def update_personality(self, personality_id: str, personality: dict | None):
+        """Replace one personality's switch entry; None removes it."""
+        self.switches.pop(personality_id, None)
+        self.unparsed.pop(personality_id, None)
+        if personality is None:
+            return
+        parsed = switch_entry(personality)
+        if parsed is None:
+            self.unparsed[personality_id] = personality.get('switch_from', '')
+        elif parsed[0]:
+            self.switches[personality_id] = parsed
+
+    def personality_switches(self) -> dict[str, list[dict]]:
+        """{feed key: candidates in (level, id) order}."""
+        switches: dict[str, list[dict]] = {}
+        for keys, entry in self.switches.values():
+            for key in keys:
+                switches.setdefault(key, []).append(entry)
+        for candidates in switches.values():
+            candidates.sort(key=lambda entry: (entry['level'], entry['id']))
+        return switches
+
+    def write(self, data_dir: str) -> tuple[int, int, list]:
+        """Write data_dir/mag_tables.tres if it changed; returns (evolution
+        entries, switch keys, unparsed (personality id, switch_from))."""
+        levels, forms = evolution_table(list(self.mags.values()))
+        switches = self.personality_switches()
+        form_lines = ',\n'.join(
+            '{\n' + ',\n'.join(f'  "{key}": "{form_id}"' for key, form_id in sorted(stage.items())) + '\n}'
+            for stage in forms)
+        text = f'''[gd_resource type="Resource" script_class="MagTables" load_steps=2 format=3]
+
+[ext_resource type="Script" path="res://scripts/resources/mag_tables.gd" id="1"]
+
+[resource]
+script = ExtResource("1")
+base_form = "{BASE_FORM}"
+evolution_levels = PackedInt32Array({", ".join(map(str, levels))})
+evolution_forms = [{form_lines}]
+personality_switches = {{
+{_format_switches(switches)}
+}}
+'''
+        path = os.path.join(data_dir, OUTPUT_NAME)
+        if text != self._written or not os.path.exists(path):
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            self._written = text
+        unparsed = sorted(self.unparsed.items())
+        for personality_id, switch_from in unparsed:
+            print(f"  Mag personality {personality_id}: can't parse switch_from '{switch_from}'")
+        return sum(len(stage) for stage in forms), len(switches), unparsed
+
+
+def build_mag_tables(data_dir: str = DATA_DIR) -> tuple[int, int, list]:
+    """Write data_dir/mag_tables.tres from the converted mags and personalities;
+    returns (evolution entries, switch keys, unparsed)."""
+    builder = MagTablesBuilder()
+    for mag in _read_dir(os.path.join(data_dir, 'mags')):
+        builder.update_mag(mag.get('id', ''), mag)
+    for personality in _read_dir(os.path.join(data_dir, 'mag_personalities')):
+        builder.update_personality(personality.get('id', ''), personality)
+    return builder.write(data_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the mag evolution and personality tables")
+    parser.add_argument('--data', default=DATA_DIR, help="Generated data/ directory")
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.data):
+        print(f"ERROR: data directory not found: {args.data}")
+        sys.exit(1)
+
+    metrics = metrics_from_args('mag_tables', args)
+    with metrics.stage('mag_tables'):
+        forms, switches, unparsed = build_mag_tables(args.data)
+    print(f"Mag tables: {forms} evolution entries, {switches} personality switch keys, "
+          f"{len(unparsed)} unparsed switches")
+    metrics.finish()
+
+
+if __name__ == '__main__':
+    main()
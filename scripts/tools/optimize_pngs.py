@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""Losslessly recompress the PNGs under assets/ (or any directory).
+
+Each image is decoded, re-filtered per scanline and deflated at level 9,
+then decoded again and compared with the original pixels (every channel,
+alpha included). The result replaces the file only if it is smaller and
+pixel-identical. Colour-relevant ancillary chunks (sRGB, gAMA, cHRM, iCCP,
+sBIT, tRNS, bKGD, pHYs) are carried over; tIME/tEXt-style metadata is
+dropped. Palette, 16-bit and interlaced files are left untouched.
+
+Work runs on a process pool. Results are cached by the SHA-256 of the input
+in build/png-cache/, so re-importing the same source texture reuses the
+optimized bytes instead of compressing it again, and files that are already
+optimal are skipped on later runs.
+
+Usage:
+    python3 scripts/tools/optimize_pngs.py                    # all of assets/
+    python3 scripts/tools/optimize_pngs.py assets/player --jobs 8
+    python3 scripts/tools/optimize_pngs.py --dry-run --depth 3
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from png_io import PngError, decode_png, encode_png, iter_chunks
+from tool_metrics import add_metrics_arguments, metrics_from_args
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+GODOT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, '..', '..'))
+ASSETS_DIR = os.path.join(GODOT_ROOT, 'assets')
+CACHE_DIR = os.path.join(GODOT_ROOT, 'build', 'png-cache')
+
+# Ancillary chunks that affect how pixels are displayed
+KEEP_CHUNKS = (b'sRGB', b'gAMA', b'cHRM', b'iCCP', b'sBIT', b'tRNS', b'bKGD', b'pHYs')
+DEFAULT_DEPTH = 2
+
+
+def optimize_bytes(data: bytes) -> tuple[bytes | None, str]:
+    """Return (smaller PNG or None, status). status: optimized, kept, unsupported."""
+    try:
+        pixels = decode_png(data)
+        chunks = [(ctype, payload) for ctype, payload in iter_chunks(data) if ctype in KEEP_CHUNKS]
+    except (PngError, ValueError) as e:
+        return None, f'unsupported: {e}'
+    out = encode_png(pixels, level=9, chunks=chunks)
+    if len(out) >= len(data):
+        return None, 'kept'
+    if not np.array_equal(decode_png(out), pixels):
+        return None, 'kept'
+    return out, 'optimized'
+
+
+def _optimize_file(path: str) -> tuple[str, bytes | None, str, float]:
+    start = time.perf_counter()
+    with open(path, 'rb') as f:
+        data = f.read()
+    out, status = optimize_bytes(data)
+    return path, out, status, time.perf_counter() - start
+
+
+class PngCache:
+    """input sha256 → optimized sha256 (or None when the input is already optimal)."""
+
+    def __init__(self, cache_dir: str = CACHE_DIR):
+        self.dir = cache_dir
+        self.index_path = os.path.join(cache_dir, 'index.json')
+        self.index: dict[str, str | None] = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path) as f:
+                self.index = json.load(f)
+
+    def _object(self, digest: str) -> str:
+        return os.path.join(self.dir, 'objects', digest[:2], digest + '.png')
+
+    def lookup(self, digest: str) -> tuple[bool, bytes | None]:
+        """(hit, optimized bytes or None when the input is already optimal)."""
+        if digest not in self.index:
+            return False, None
+        out = self.index[digest]
+        if out is None:
+            return True, None
+        try:
+            with open(self._object(out), 'rb') as f:
+                return True, f.read()
+        except OSError:
+            return False, None
+
+    def store(self, digest: str, out: bytes | None):
+        if out is None:
+            self.index[digest] = None
+            return
+        out_digest = hashlib.sha256(out).hexdigest()
+        path = self._object(out_digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            _write_atomic(path, out)
+        self.index[digest] = out_digest
+        self.index[out_digest] = None  # the optimized file itself needs no work
+
+    def save(self):
+        os.makedirs(self.dir, exist_ok=True)
+        _write_atomic(self.index_path, json.dumps(self.index, sort_keys=True).encode())
+
+
+def _write_atomic(path: str, data: bytes):
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def find_pngs(roots: list[str]) -> list[str]:
+    paths = []
+    for root in roots:
+        if os.path.isfile(root):
+            paths.append(root)
+            continue
+        for dirpath, _, files in os.walk(root):
+            paths.extend(os.path.join(dirpath, f) for f in files if f.lower().endswith('.png'))
+    return sorted(paths)
+
+
+def group_key(path: str, base: str, depth: int) -> str:
+    parts = os.path.relpath(os.path.dirname(path), base).split(os.sep)
+    return '/'.join(parts[:depth]) if parts != ['.'] else '.'
+
+
+def optimize_pngs(roots: list[str], jobs: int | None = None, dry_run: bool = False,
+                  cache_dir: str = CACHE_DIR, depth: int = DEFAULT_DEPTH, metrics=None) -> dict:
+    """Optimize every PNG under `roots`; prints per-directory savings and returns them."""
+    base = os.path.commonpath([os.path.abspath(r) for r in roots]) if roots else ASSETS_DIR
+    if os.path.isfile(base):
+        base = os.path.dirname(base)
+    cache = PngCache(cache_dir)
+    groups: dict[str, dict] = {}
+    counts: dict[str, int] = {}
+
+    def record(path, before, after, status, seconds):
+        key = group_key(path, base, depth)
+        group = groups.setdefault(key, {'files': 0, 'before': 0, 'after': 0})
+        group['files'] += 1
+        group['before'] += before
+        group['after'] += after
+        label = status.split(':')[0]
+        counts[label] = counts.get(label, 0) + 1
+        if metrics:
+            metrics.file('png', os.path.relpath(path, base), seconds, before,
+                         after if after != before else 0, label)
+
+    def apply(path, data, out, status, seconds):
+        if out is not None and not dry_run:
+            _write_atomic(path, out)
+        record(path, len(data), len(out) if out is not None else len(data), status, seconds)
+
+    pending = {}
+    for path in find_pngs(roots):
+        start = time.perf_counter()
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        hit, out = cache.lookup(digest)
+        if hit:
+            apply(path, data, out, 'cached' if out is None else 'optimized', time.perf_counter() - start)
+        else:
+            pending[path] = (data, digest)
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for path, out, status, seconds in pool.map(_optimize_file, pending, chunksize=16):
+                data, digest = pending[path]
+                if not status.startswith('unsupported'):
+                    cache.store(digest, out)
+                else:
+                    print(f"  {os.path.relpath(path, base)}: {status}")
+                apply(path, data, out, status, seconds)
+        cache.save()
+
+    total_before = sum(g['before'] for g in groups.values())
+    total_after = sum(g['after'] for g in groups.values())
+    width = max([len(k) for k in groups] + [9])
+    print(f"{'directory':<{width}} {'files':>6} {'before':>10} {'after':>10} {'saved':>10}")
+    for key, g in sorted(groups.items(), key=lambda kv: kv[1]['after'] - kv[1]['before']):
+        saved = g['before'] - g['after']
+        pct = 100.0 * saved / g['before'] if g['before'] else 0.0
+        print(f"{key:<{width}} {g['files']:>6} {_mb(g['before']):>10} {_mb(g['after']):>10} "
+              f"{_mb(saved):>10} ({pct:4.1f}%)")
+    saved = total_before - total_after
+    pct = 100.0 * saved / total_before if total_before else 0.0
+    summary = ', '.join(f"{k} {v}" for k, v in sorted(counts.items()))
+    print(f"\n{'Would save' if dry_run else 'Saved'} {_mb(saved)} of {_mb(total_before)} ({pct:.1f}%)"
+          f" across {sum(counts.values())} PNGs ({summary})")
+    return groups
+
+
+def _mb(size: int) -> str:
+    return f"{size / (1024 * 1024):.2f} MB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Losslessly recompress PNG assets")
+    parser.add_argument('paths', nargs='*', help="Files or directories (default: assets/)")
+    parser.add_argument('--jobs', '-j', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--dry-run', action='store_true', help="Report savings without rewriting files")
+    parser.add_argument('--cache', default=CACHE_DIR, help="Cache directory (default: build/png-cache)")
+    parser.add_argument('--depth', type=int, default=DEFAULT_DEPTH, help="Directory depth of the savings report")
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+
+    roots = args.paths or [ASSETS_DIR]
+    missing = [p for p in roots if not os.path.exists(p)]
+    if missing:
+        print(f"ERROR: not found: {', '.join(missing)}")
+        sys.exit(1)
+
+    metrics = metrics_from_args('optimize_pngs', args)
+    with metrics.stage('png'):
+        optimize_pngs(roots, args.jobs, args.dry_run, args.cache, args.depth, metrics)
+    metrics.finish()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""Minimal PNG reader/writer on NumPy arrays (no Pillow needed).
+
+Covers what assets/ actually contains: 8-bit, non-interlaced greyscale,
+grey+alpha, RGB and RGBA images. Decoding undoes all five scanline filters
+(None/Sub/Up are vectorised; Average/Paeth fall back to a per-pixel loop).
+Encoding picks a filter per scanline with the usual minimum-sum-of-absolute-
+differences heuristic.
+
+Usage (as a module):
+    from png_io import read_png, write_png, read_png_header
+    pixels = read_png('assets/player/pc_000/textures/pc_000_000.png')  # (h, w, 4) uint8
+    write_png('out.png', pixels)
+    pixels = decode_png(data); data = encode_png(pixels, chunks=[(b'sRGB', b'\x00')])
+"""
+
+import struct
+import zlib
+
+import numpy as np
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# colour type → channels
+CHANNELS = {0: 1, 2: 3, 4: 2, 6: 4}
+COLOR_TYPES = {v: k for k, v in CHANNELS.items()}
+
+
+class PngError(ValueError):
+    pass
+
+
+def iter_chunks(data: bytes):
+    """Yield (type, payload) for every chunk after the signature."""
+    if data[:8] != PNG_SIGNATURE:
+        raise PngError("not a PNG file")
+    pos = 8
+    while pos + 8 <= len(data):
+        length, ctype = struct.unpack_from('>I4s', data, pos)
+        yield ctype, data[pos + 8:pos + 8 + length]
+        pos += 12 + length
+        if ctype == b'IEND':
+            break
+
+
+def read_png_header(path: str) -> dict:
+    """IHDR fields without decompressing anything (reads the first 33 bytes)."""
+    with open(path, 'rb') as f:
+        head = f.read(33)
+    try:
+        return parse_png_header(head)
+    except PngError:
+        raise PngError(f"not a PNG file: {path}") from None
+
+
+def parse_png_header(head: bytes) -> dict:
+    """IHDR fields from the first 33 bytes of a PNG (file or embedded buffer)."""
+    if len(head) < 29 or head[:8] != PNG_SIGNATURE or head[12:16] != b'IHDR':
+        raise PngError("not a PNG file")
+    width, height, bit_depth, color_type, _, _, interlace = struct.unpack('>IIBBBBB', head[16:29])
+    return {'width': width, 'height': height, 'bit_depth': bit_depth,
+            'color_type': color_type, 'interlace': interlace}
+
+
+def _paeth(a, b, c):
+    p = a + b - c
+    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+    if pa <= pb and pa <= pc:
+        return a
+    return b if pb <= pc else c
+
+
+def _unfilter(raw: bytes, width: int, height: int, bpp: int) -> np.ndarray:
+    stride = width * bpp
+    rows = np.frombuffer(raw, dtype=np.uint8).reshape(height, stride + 1)
+    filters = rows[:, 0]
+    data = rows[:, 1:].copy()
+    prev = np.zeros(stride, dtype=np.uint8)
+    for y in range(height):
+        line = data[y]
+        ftype = filters[y]
+        if ftype == 1:  # Sub: running sum per channel
+            pixels = line.reshape(width, bpp)
+            np.cumsum(pixels, axis=0, dtype=np.uint8, out=pixels)
+        elif ftype == 2:  # Up
+            line += prev
+        elif ftype == 3:  # Average
+            out = line.astype(np.int32)
+            up = prev.astype(np.int32)
+            for x in range(stride):
+                left = out[x - bpp] if x >= bpp else 0
+                out[x] = (out[x] + ((left + up[x]) >> 1)) & 0xFF
+            line[:] = out
+        elif ftype == 4:  # Paeth
+            out = line.tolist()
+            up = prev.tolist()
+            for x in range(stride):
+                if x >= bpp:
+                    out[x] = (out[x] + _paeth(out[x - bpp], up[x], up[x - bpp])) & 0xFF
+                else:
+                    out[x] = (out[x] + up[x]) & 0xFF
+            line[:] = out
+        elif ftype != 0:
+            raise PngError(f"bad filter type {ftype} on row {y}")
+        prev = line
+    return data
+
+
+def read_png(path: str) -> np.ndarray:
+    """Decode to a (height, width, channels) uint8 array."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    try:
+        return decode_png(data)
+    except PngError as e:
+        raise PngError(f"{e}: {path}") from None
+
+
+def decode_png(data: bytes) -> np.ndarray:
+    """Decode PNG bytes to a (height, width, channels) uint8 array."""
+    header = None
+    idat = []
+    for ctype, payload in iter_chunks(data):
+        if ctype == b'IHDR':
+            header = struct.unpack('>IIBBBBB', payload[:13])
+        elif ctype == b'IDAT':
+            idat.append(payload)
+    if header is None:
+        raise PngError("missing IHDR")
+    width, height, bit_depth, color_type, _, _, interlace = header
+    if bit_depth != 8 or color_type not in CHANNELS or interlace:
+        raise PngError(f"unsupported PNG (depth {bit_depth}, colour type {color_type}, "
+                       f"interlace {interlace})")
+    bpp = CHANNELS[color_type]
+    raw = zlib.decompress(b''.join(idat))
+    return _unfilter(raw, width, height, bpp).reshape(height, width, bpp)
+
+
+def _filter_rows(pixels: np.ndarray) -> bytes:
+    """Filter every scanline, choosing the type with the smallest abs sum."""
+    height, width, bpp = pixels.shape
+    cur = pixels.reshape(height, width * bpp).astype(np.int16)
+    up = np.zeros_like(cur)
+    up[1:] = cur[:-1]
+    left = np.zeros_like(cur)
+    left[:, bpp:] = cur[:, :-bpp]
+    up_left = np.zeros_like(cur)
+    up_left[1:, bpp:] = cur[:-1, :-bpp]
+
+    p = left + up - up_left
+    pa, pb, pc = np.abs(p - left), np.abs(p - up), np.abs(p - up_left)
+    paeth = np.where((pa <= pb) & (pa <= pc), left, np.where(pb <= pc, up, up_left))
+
+    candidates = np.stack([
+        cur,
+        cur - left,
+        cur - up,
+        cur - ((left + up) >> 1),
+        cur - paeth,
+    ]).astype(np.uint8)
+    # Score as signed bytes, like libpng's heuristic
+    scores = np.abs(candidates.view(np.int8).astype(np.int32)).sum(axis=2)
+    best = scores.argmin(axis=0)
+    chosen = candidates[best, np.arange(height)]
+    out = np.empty((height, width * bpp + 1), dtype=np.uint8)
+    out[:, 0] = best
+    out[:, 1:] = chosen
+    return out.tobytes()
+
+
+def _chunk(ctype: bytes, payload: bytes) -> bytes:
+    crc = zlib.crc32(ctype + payload) & 0xFFFFFFFF
+    return struct.pack('>I', len(payload)) + ctype + payload + struct.pack('>I', crc)
+
+
+def encode_png(pixels: np.ndarray, level: int = 9, chunks=()) -> bytes:
+    """Encode a (h, w, c) or (h, w) uint8 array as PNG bytes.
+
+    `chunks` are extra (type, payload) ancillary chunks written before IDAT
+    (e.g. sRGB/gAMA/tRNS carried over from a source file).
+    """
+    if pixels.ndim == 2:
+        pixels = pixels[:, :, None]
+    height, width, channels = pixels.shape
+    if channels not in COLOR_TYPES:
+        raise PngError(f"unsupported channel count {channels}")
+    pixels = np.ascontiguousarray(pixels, dtype=np.uint8)
+    ihdr = struct.pack('>IIBBBBB', width, height, 8, COLOR_TYPES[channels], 0, 0, 0)
+    idat = zlib.compress(_filter_rows(pixels), level)
+    extra = b''.join(_chunk(ctype, payload) for ctype, payload in chunks)
+    return PNG_SIGNATURE + _chunk(b'IHDR', ihdr) + extra + _chunk(b'IDAT', idat) + _chunk(b'IEND', b'')
+
+
+def write_png(path: str, pixels: np.ndarray, level: int = 9) -> int:
+    """Write a PNG; returns the number of bytes written."""
+    data = encode_png(pixels, level)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return len(data)
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""Index which project files reference which, and report dead weight.
+
+Every scene, resource, script, JSON config and GLB in the project is parsed
+(in parallel) for references:
+
+  .tscn/.tres   ext_resource paths, uid:// ids and any "res://..." string
+  .gd/.gdshader "res://..." literals, plus class_name identifiers used
+  .json/.cfg    "res://..." strings
+  .glb          external image/buffer uris
+  project.godot autoloads, main scene, icon (the graph's roots)
+
+Downscaled texture tiers (build_texture_tiers.py) are looked up at runtime
+by TextureTiers, so nothing names them; assets/tiers/manifest.json supplies
+those edges instead: each tier copy is a variant of its source texture and
+is reachable (and packed) with it, but isn't part of a scene's load set.
+
+A literal is a plain edge when it names a file. Literals built at runtime
+become patterns: "%s" / "%d" match one path segment, a directory literal
+("res://data/weapons/") matches the files directly inside it, and a literal
+followed by `+` in code matches everything below it (a bare "res://" +
+is too broad to mean anything and is ignored). Patterns count for
+reachability (orphans) but not for scene load sets.
+
+Writes build/resource_graph.json and prints orphaned files under assets/,
+data/ and scenes/, references to missing files (other than the generated or
+user-provided files in OPTIONAL_FILES, which the game checks for before
+loading), and each scene's static transitive load set.
+
+Usage:
+    python3 scripts/tools/resource_graph.py
+    python3 scripts/tools/resource_graph.py --orphans-only --orphan-dirs assets,scripts
+    python3 scripts/tools/resource_graph.py --scene res://scenes/2d/city.tscn
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from glb_io import GlbError, read_glb_json
+from tool_metrics import add_metrics_arguments, metrics_from_args
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+GODOT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, '..', '..'))
+DEFAULT_OUTPUT = os.path.join(GODOT_ROOT, 'build', 'resource_graph.json')
+
+# Not part of the Godot project proper
+SKIP_DIRS = {'.git', '.godot', 'build', 'web', 'tools', 'node_modules', '__pycache__'}
+# Sidecar files; folded into the file they describe
+SIDECAR_SUFFIXES = ('.import', '.uid')
+PARSED_SUFFIXES = ('.tscn', '.tres', '.gd', '.gdshader', '.json', '.cfg', '.godot', '.glb')
+DEFAULT_ORPHAN_DIRS = ('assets', 'data', 'scenes')
+TIERS_MANIFEST = 'assets/tiers/manifest.json'
+# Built by tools or written by the player; code checks they exist before loading
+OPTIONAL_FILES = {
+    'res://assets/environments/lod_manifest.json',
+    'res://assets/tiers/manifest.json',
+    'res://data/asset_packs.json',
+    'res://data/graphics.cfg',
+}
+
+RES_STRING_RE = re.compile(r'"\*?(res://[^"]*)"(\s*\+)?')  # "*res://" marks an autoload
+UID_RE = re.compile(r'uid://[0-9a-z]+')
+HEADER_UID_RE = re.compile(r'^\[gd_(?:scene|resource)[^\]]*\buid="(uid://[0-9a-z]+)"', re.M)
+IMPORT_UID_RE = re.compile(r'^uid="(uid://[0-9a-z]+)"', re.M)
+CLASS_NAME_RE = re.compile(r'^class_name\s+(\w+)', re.M)
+IDENT_RE = re.compile(r'\b[A-Z]\w*\b')
+FORMAT_RE = re.compile(r'%[-0-9.]*[sdif]')
+
+
+def res_path(rel: str) -> str:
+    return 'res://' + rel.replace(os.sep, '/')
+
+
+def scan_files(root: str) -> dict[str, int]:
+    """res:// path → size for every project file (sidecars excluded)."""
+    files = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS and not d.startswith('.'))
+        for name in filenames:
+            if name.endswith(SIDECAR_SUFFIXES) or name.endswith('.pyc'):
+                continue
+            path = os.path.join(dirpath, name)
+            files[res_path(os.path.relpath(path, root))] = os.path.getsize(path)
+    return files
+
+
+def parse_file(job: tuple[str, str]) -> dict:
+    """Worker: references found in one file."""
+    root, path = job
+    local = os.path.join(root, path[len('res://'):])
+    found = {'path': path, 'refs': [], 'patterns': [], 'uids': [], 'class_name': None,
+             'idents': [], 'uid': None, 'error': ''}
+    try:
+        if path.endswith('.glb'):
+            doc, _ = read_glb_json(local)
+            base = path.rsplit('/', 1)[0] + '/'
+            for item in doc.get('images', []) + doc.get('buffers', []):
+                uri = item.get('uri', '')
+                if uri and not uri.startswith('data:'):
+                    found['refs'].append(_normalize(base + uri))
+            return found
+        with open(local, encoding='utf-8', errors='replace') as f:
+            text = f.read()
+    except (OSError, GlbError, ValueError) as e:
+        found['error'] = str(e)
+        return found
+
+    for match in RES_STRING_RE.finditer(text):
+        literal, concat = match.group(1), match.group(2)
+        if FORMAT_RE.search(literal) or literal.endswith('/') or concat:
+            found['patterns'].append([literal, 'prefix' if concat else 'pattern'])
+        else:
+            found['refs'].append(_normalize(literal))
+    if path.endswith(('.tscn', '.tres')):
+        header = HEADER_UID_RE.search(text)
+        found['uid'] = header.group(1) if header else None
+        found['uids'] = sorted(set(UID_RE.findall(text)) - {found['uid']})
+    if path.endswith('.gd'):
+        name = CLASS_NAME_RE.search(text)
+        found['class_name'] = name.group(1) if name else None
+        found['idents'] = sorted(set(IDENT_RE.findall(text)))
+    return found
+
+
+def _normalize(path: str) -> str:
+    head, _, rest = path.partition('res://')
+    parts = []
+    for part in rest.split('/'):
+        if part == '..':
+            if parts:
+                parts.pop()
+        elif part not in ('', '.'):
+            parts.append(part)
+    return 'res://' + '/'.join(parts)
+
+
+def read_uid_map(root: str, files: dict[str, int]) -> dict[str, str]:
+    """uid:// → res:// path from .uid sidecars and .import files."""
+    uids = {}
+    for path in files:
+        local = os.path.join(root, path[len('res://'):])
+        for sidecar, regex in ((local + '.uid', UID_RE), (local + '.import', IMPORT_UID_RE)):
+            if os.path.exists(sidecar):
+                with open(sidecar, encoding='utf-8', errors='replace') as f:
+                    match = regex.search(f.read())
+                if match:
+                    uids[match.group(1) if match.groups() else match.group(0)] = path
+    return uids
+
+
+def read_tier_variants(root: str, files: dict[str, int]) -> dict[str, set[str]]:
+    """Source texture → its downscaled tier copies, from the tiers manifest."""
+    path = os.path.join(root, TIERS_MANIFEST)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    roots = {tier: str(entry.get('root', '')) for tier, entry in manifest.get('tiers', {}).items()}
+    variants = {}
+    for rel, entry in manifest.get('textures', {}).items():
+        copies = {roots[tier] + rel for tier in entry.get('tiers', []) if tier in roots}
+        copies &= files.keys()
+        if copies:
+            variants['res://assets/' + rel] = copies
+    return variants
+
+
+def pattern_regex(literal: str, kind: str) -> re.Pattern:
+    parts = FORMAT_RE.split(literal)
+    body = '[^/]*'.join(re.escape(p) for p in parts)
+    if kind == 'prefix':
+        return re.compile(body + '.*')
+    if literal.endswith('/'):
+        return re.compile(body + '[^/]+')
+    return re.compile(body)
+
+
+class ResourceGraph:
+    def __init__(self, files: dict[str, int]):
+        self.files = files
+        self.edges: dict[str, set[str]] = {}       # static references
+        self.dynamic: dict[str, set[str]] = {}     # pattern matches
+        self.variants: dict[str, set[str]] = {}    # texture → tier copies
+        self.patterns: dict[str, list] = {}
+        self.missing: dict[str, set[str]] = {}
+        self.roots: set[str] = set()
+        self.errors: dict[str, str] = {}
+
+    @classmethod
+    def build(cls, root: str, jobs: int | None = None, metrics=None) -> 'ResourceGraph':
+        files = scan_files(root)
+        graph = cls(files)
+        parsed_paths = [p for p in files if p.endswith(PARSED_SUFFIXES)]
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(parse_file, [(root, p) for p in parsed_paths], chunksize=32))
+        if metrics:
+            for r in results:
+                metrics.file('parse', r['path'], 0.0, read=files[r['path']],
+                             status='failed' if r['error'] else 'parsed')
+
+        uid_map = read_uid_map(root, files)
+        uid_map.update({r['uid']: r['path'] for r in results if r['uid']})
+        classes = {r['class_name']: r['path'] for r in results if r['class_name']}
+        compiled = {}
+        for r in results:
+            path = r['path']
+            if r['error']:
+                graph.errors[path] = r['error']
+            targets = set(r['refs'])
+            targets.update(uid_map[u] for u in r['uids'] if u in uid_map)
+            targets.update(classes[i] for i in r['idents'] if i in classes and classes[i] != path)
+            targets.discard(path)
+            for target in [t for t in targets if t not in files]:
+                if os.path.isdir(os.path.join(root, target[len('res://'):])):
+                    targets.discard(target)
+                    r['patterns'].append([target + '/', 'pattern'])
+            graph.edges[path] = {t for t in targets if t in files}
+            missing = {t for t in targets if t not in files and t not in OPTIONAL_FILES}
+            if missing:
+                graph.missing[path] = missing
+            if r['patterns']:
+                graph.patterns[path] = r['patterns']
+                matched = set()
+                for literal, kind in r['patterns']:
+                    if literal == 'res://':
+                        continue
+                    key = (literal, kind)
+                    if key not in compiled:
+                        regex = pattern_regex(literal, kind)
+                        compiled[key] = {f for f in files if regex.fullmatch(f)}
+                    matched |= compiled[key]
+                matched.discard(path)
+                graph.dynamic[path] = matched
+        graph.variants = read_tier_variants(root, files)
+        graph.roots = graph.edges.get('res://project.godot', set()) | {'res://project.godot'}
+        return graph
+
+    def closure(self, start: set[str], dynamic: bool, variants: bool = False) -> set[str]:
+        """Files reachable from start; `dynamic` follows pattern matches and
+        `variants` texture tier copies."""
+        seen = set(start)
+        stack = list(start)
+        while stack:
+            node = stack.pop()
+            nxt = self.edges.get(node, set())
+            if dynamic:
+                nxt = nxt | self.dynamic.get(node, set())
+            if variants:
+                nxt = nxt | self.variants.get(node, set())
+            for target in nxt:
+                if target not in seen:
+                    seen.add(target)
+                    stack.append(target)
+        return seen
+
+    def orphans(self, dirs: tuple[str, ...]) -> list[str]:
+        reachable = self.closure(self.roots, dynamic=True, variants=True)
+        prefixes = tuple(f'res://{d.strip("/")}/' for d in dirs)
+        return sorted(f for f in self.files if f.startswith(prefixes) and f not in reachable)
+
+    def load_set(self, scene: str) -> set[str]:
+        return self.closure({scene}, dynamic=False)
+
+    def to_dict(self) -> dict:
+        return {
+            'generated': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'roots': sorted(self.roots),
+            'files': {
+                path: {
+                    'size': size,
+                    'refs': sorted(self.edges.get(path, ())),
+                    'patterns': self.patterns.get(path, []),
+                    'dynamic_refs': len(self.dynamic.get(path, ())),
+                }
+                for path, size in sorted(self.files.items())
+            },
+            'variants': {path: sorted(t) for path, t in sorted(self.variants.items())},
+            'missing': {path: sorted(t) for path, t in sorted(self.missing.items())},
+            'errors': self.errors,
+        }
+
+
+def _mb(size: int) -> str:
+    return f"{size / (1024 * 1024):.2f} MB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the project resource dependency graph")
+    parser.add_argument('--root', default=GODOT_ROOT, help="Godot project root")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="Graph JSON (default: build/resource_graph.json)")
+    parser.add_argument('--orphan-dirs', default=','.join(DEFAULT_ORPHAN_DIRS),
+                        help="Comma-separated top-level dirs checked for orphans")
+    parser.add_argument('--orphans-only', action='store_true', help="Only list orphaned files")
+    parser.add_argument('--scene', action='append', help="Print the full load set of a scene (repeatable)")
+    parser.add_argument('--jobs', '-j', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--fail-on-missing', action='store_true', help="Exit 1 if any reference is missing")
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+
+    if not os.path.exists(os.path.join(args.root, 'project.godot')):
+        print(f"ERROR: no project.godot in {args.root}")
+        sys.exit(1)
+
+    metrics = metrics_from_args('resource_graph', args)
+    with metrics.stage('parse'):
+        graph = ResourceGraph.build(args.root, args.jobs, metrics)
+    with metrics.stage('analyze'):
+        orphans = graph.orphans(tuple(d for d in args.orphan_dirs.split(',') if d))
+        scenes = {s: graph.load_set(s) for s in graph.files if s.endswith('.tscn')}
+
+    orphan_bytes = sum(graph.files[o] for o in orphans)
+    if args.orphans_only:
+        for path in orphans:
+            print(path)
+    else:
+        by_dir: dict[str, list[int]] = {}
+        for path in orphans:
+            key = '/'.join(path[len('res://'):].split('/')[:2])
+            entry = by_dir.setdefault(key, [0, 0])
+            entry[0] += 1
+            entry[1] += graph.files[path]
+        print("Orphaned files (unreachable from project.godot, patterns included):")
+        for key, (count, size) in sorted(by_dir.items(), key=lambda kv: -kv[1][1]):
+            print(f"  {key:<32} {count:>6} files {_mb(size):>10}")
+
+        print("\nMissing targets:")
+        for path, targets in sorted(graph.missing.items()):
+            for target in sorted(targets):
+                print(f"  {path} → {target}")
+        if not graph.missing:
+            print("  none")
+
+        print("\nScene load sets (static references, transitive):")
+        for scene, deps in sorted(scenes.items(), key=lambda kv: -sum(graph.files[d] for d in kv[1])):
+            size = sum(graph.files[d] for d in deps)
+            print(f"  {scene:<56} {len(deps):>5} files {_mb(size):>10}")
+
+    for scene in args.scene or []:
+        if scene not in graph.files:
+            print(f"\nERROR: unknown scene {scene}")
+            continue
+        print(f"\n{scene}:")
+        for dep in sorted(graph.load_set(scene)):
+            print(f"  {graph.files[dep]:>10}  {dep}")
+
+    total = sum(graph.files.values())
+    print(f"\n{len(graph.files)} files ({_mb(total)}), "
+          f"{sum(len(e) for e in graph.edges.values())} static edges, "
+          f"{sum(len(p) for p in graph.patterns.values())} patterns, "
+          f"{sum(len(v) for v in graph.variants.values())} tier variants; "
+          f"{len(orphans)} orphans ({_mb(orphan_bytes)}), "
+          f"{sum(len(t) for t in graph.missing.values())} missing targets")
+
+    with metrics.stage('write'):
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        report = graph.to_dict()
+        report['orphans'] = orphans
+        report['scenes'] = {s: sorted(d) for s, d in sorted(scenes.items())}
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=1)
+    print(f"Graph → {args.output}")
+    metrics.finish()
+    if args.fail_on_missing and graph.missing:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
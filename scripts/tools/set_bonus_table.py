@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Build the (armor id, weapon id) → set bonus lookup table.
+
+Set bonuses list their armor and weapons by content id (the importer
+resolves the source's display names), but matching one against equipment
+still means scanning every SetBonusData. This flattens them once into
+
+  data/set_bonus_table.tres   (SetBonusTable)
+    pairs    { "<armor_id>/<weapon_id>": set bonus id }
+
+which SetBonusRegistry loads for single-lookup matching.
+
+Runs as a content_pipeline.py stage after set bonuses are imported, and
+standalone. The stage keeps a SetBonusTableBuilder across watch-mode
+updates: a changed set bonus replaces only its own pairs, and the file is
+rewritten only when the table changed.
+
+Usage:
+    python3 scripts/tools/set_bonus_table.py
+    python3 scripts/tools/set_bonus_table.py --data /tmp/data
+"""
+
+import argparse
+import os
+import sys
+
+from tres_reader import TresParseError, read_tres
+from tool_metrics import add_metrics_arguments, metrics_from_args
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+GODOT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, '..', '..'))
+DATA_DIR = os.path.join(GODOT_ROOT, 'data')
+OUTPUT_NAME = 'set_bonus_table.tres'
+
+
+def _read_dir(path: str) -> list[dict]:
+    records = []
+    if not os.path.isdir(path):
+        return records
+    for fname in sorted(os.listdir(path)):
+        if not fname.endswith('.tres'):
+            continue
+        try:
+            records.append(read_tres(os.path.join(path, fname)))
+        except (OSError, TresParseError) as e:
+            print(f"  Skipping {fname}: {e}")
+    return records
+
+
+def bonus_pairs(bonus: dict) -> list[str]:
+    """The "armor_id/weapon_id" keys one set bonus covers."""
+    armor_id = bonus.get('armor', '')
+    if not armor_id:
+        return []
+    return [f'{armor_id}/{weapon_id}' for weapon_id in bonus.get('weapons', [])]
+
+
+class SetBonusTableBuilder:
+    """Pairs per set bonus id, updated one set bonus at a time."""
+
+    def __init__(self):
+        self.by_set: dict[str, list[str]] = {}
+        self._written = None
+
+    def update(self, set_id: str, bonus: dict | None):
+        """Replace one set bonus's pairs (its converted .tres); None removes it."""
+        if bonus is None:
+            self.by_set.pop(set_id, None)
+        else:
+            self.by_set[set_id] = bonus_pairs(bonus)
+
+    def pairs(self) -> dict[str, str]:
+        """{"armor_id/weapon_id": set bonus id}; the first set bonus (by id) wins a pair."""
+        pairs = {}
+        for set_id in sorted(self.by_set):
+            for key in self.by_set[set_id]:
+                pairs.setdefault(key, set_id)
+        return pairs
+
+    def write(self, data_dir: str) -> dict[str, str]:
+        """Write data_dir/set_bonus_table.tres if it changed; returns the pairs."""
+        pairs = self.pairs()
+        lines = ',\n'.join(f'  "{key}": "{set_id}"' for key, set_id in sorted(pairs.items()))
+        text = f'''[gd_resource type="Resource" script_class="SetBonusTable" load_steps=2 format=3]
+
+[ext_resource type="Script" path="res://scripts/resources/set_bonus_table.gd" id="1"]
+
+[resource]
+script = ExtResource("1")
+pairs = {{
+{lines}
+}}
+'''
+        path = os.path.join(data_dir, OUTPUT_NAME)
+        if text != self._written or not os.path.exists(path):
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            self._written = text
+        return pairs
+
+
+def build_set_bonus_table(data_dir: str = DATA_DIR) -> dict[str, str]:
+    """Write data_dir/set_bonus_table.tres from the converted set bonuses; returns the pairs."""
+    builder = SetBonusTableBuilder()
+    for bonus in _read_dir(os.path.join(data_dir, 'set_bonuses')):
+        builder.update(bonus.get('id', ''), bonus)
+    return builder.write(data_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the set bonus lookup table")
+    parser.add_argument('--data', default=DATA_DIR, help="Generated data/ directory")
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.data):
+        print(f"ERROR: data directory not found: {args.data}")
+        sys.exit(1)
+
+    metrics = metrics_from_args('set_bonus_table', args)
+    with metrics.stage('set_bonus_table'):
+        pairs = build_set_bonus_table(args.data)
+    print(f"Set bonus table: {len(pairs)} armor/weapon pairs")
+    metrics.finish()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""Monte Carlo drop simulator for balancing questions.
+
+Answers things like "expected runs to obtain Gun Diva on hard in Gurhacia"
+by simulating full field runs (3 stages x 3 waves, boss on the last wave)
+against data/spawn_pools.tres and data/drop_tables/*.tres.
+
+Runs are simulated in batches with NumPy: every spawn slot is collapsed to
+a per-item drop probability, each run draws its enemy counts and number of
+weapon drops, and the drops are assigned to items in one categorical draw.
+Spawn and drop constants mirror EnemySpawner and CombatManager.generate_drops.
+
+Usage:
+    python3 scripts/tools/simulate_drops.py
+    python3 scripts/tools/simulate_drops.py --difficulty hard --area gurhacia --item "Gun Diva"
+    python3 scripts/tools/simulate_drops.py --runs 5000000 --output drops_report.json
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+from item_references import index_for
+from tres_reader import read_tres
+
+GODOT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+DATA_DIR = os.path.join(GODOT_ROOT, 'data')
+
+DIFFICULTIES = ['normal', 'hard', 'super-hard']
+
+# EnemySpawner area ids → drop table area keys (CombatManager.AREA_DROP_NAMES)
+AREA_DROP_NAMES = {
+    'gurhacia': 'gurhacia-valley',
+    'rioh': 'rioh-snowfield',
+    'ozette': 'ozette-wetland',
+    'paru': 'oblivion-city-paru',
+    'makara': 'makara-ruins',
+    'arca': 'arca-plant',
+    'dark': 'dark-shrine',
+}
+
+# EnemySpawner.ENEMY_COUNTS / SPAWN_WEIGHTS
+ENEMY_COUNTS = {
+    'normal': (3, 6),
+    'hard': (5, 8),
+    'super-hard': (7, 12),
+}
+SPAWN_WEIGHTS = {
+    'normal': {'common': 70, 'uncommon': 25, 'rare': 5},
+    'hard': {'common': 55, 'uncommon': 35, 'rare': 10},
+    'super-hard': {'common': 40, 'uncommon': 40, 'rare': 20},
+}
+BOSS_ESCORTS = (2, 4)
+REGULAR_WAVES = 8  # 3 stages x 3 waves, minus the boss wave
+
+# CombatManager.generate_drops weapon chances
+WEAPON_CHANCE = {'normal': 0.03, 'elite': 0.12, 'boss': 0.25}
+
+RUN_QUANTILES = [0.5, 0.9, 0.99]
+
+
+def load_drop_tables(data_dir: str) -> dict:
+    """{ difficulty: { area: { enemy id: [item name] } } } with item ids named."""
+    index = index_for(data_dir)
+    tables = {}
+    for difficulty in DIFFICULTIES:
+        path = os.path.join(data_dir, 'drop_tables', f'{difficulty}.tres')
+        if os.path.exists(path):
+            tables[difficulty] = {
+                area: {enemy: [index.name(i) or i for i in item_ids] for enemy, item_ids in enemies.items()}
+                for area, enemies in read_tres(path).get('area_drops', {}).items()
+            }
+    return tables
+
+
+def tier_probabilities(difficulty: str, pool: dict) -> dict:
+    """Per-slot probability of each tier, folding missing tiers into common."""
+    weights = SPAWN_WEIGHTS[difficulty]
+    probs = {'common': 0.0, 'uncommon': 0.0, 'rare': 0.0}
+    for tier in ('common', 'uncommon', 'rare'):
+        target = tier if pool.get(tier) else 'common'
+        probs[target] += weights[tier] / 100.0
+    return probs
+
+
+def enemy_item_probs(pool: dict, tier: str, area_table: dict,
+                     chance: float, item_index: dict) -> np.ndarray:
+    """Probability that one enemy drawn from `tier` drops each item.
+
+    Spawn pool ids are source stems ("finjer-r"); drop tables key on
+    EnemyData ids ("finjer_r"), as in CombatManager.generate_drops.
+    """
+    probs = np.zeros(len(item_index))
+    entry = pool.get(tier)
+    if not entry:
+        return probs
+    ids = entry['ids']
+    cumulative = np.asarray(entry['cumulative'], dtype=np.float64)
+    spawn_p = np.diff(cumulative, prepend=0.0) / cumulative[-1]
+    for enemy_id, p in zip(ids, spawn_p):
+        drops = area_table.get(enemy_id.replace('-', '_'), [])
+        for item in drops:
+            probs[item_index[item]] += p * chance / len(drops)
+    return probs
+
+
+def build_scenario(difficulty: str, area_id: str, pool: dict, area_table: dict):
+    """Collapse spawn pools + drop lists into per-slot item probability rows."""
+    items = sorted({item for drops in area_table.values() for item in drops})
+    item_index = {item: i for i, item in enumerate(items)}
+    tiers = tier_probabilities(difficulty, pool)
+
+    # Regular slot: mixture over tiers; rare tier spawns as elite
+    regular = np.zeros(len(items))
+    for tier, p in tiers.items():
+        if p > 0:
+            chance = WEAPON_CHANCE['elite'] if tier == 'rare' else WEAPON_CHANCE['normal']
+            regular += p * enemy_item_probs(pool, tier, area_table, chance, item_index)
+
+    escort = enemy_item_probs(pool, 'common', area_table, WEAPON_CHANCE['normal'], item_index)
+    boss = enemy_item_probs(pool, 'bosses', area_table, WEAPON_CHANCE['boss'], item_index)
+    return items, regular, escort, boss, bool(pool.get('bosses'))
+
+
+def drop_events(rng: np.random.Generator, trials: np.ndarray, probs: np.ndarray):
+    """Sample weapon drops for `trials` enemies per run.
+
+    Each enemy drops at most one weapon, so the number of drops per run is
+    Binomial(trials, sum(probs)) and each drop picks an item categorically.
+    Returns (run_index, item_index) arrays, one entry per drop.
+    """
+    p_any = float(probs.sum())
+    if p_any <= 0.0:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty
+    per_run = rng.binomial(trials, min(p_any, 1.0))
+    run_idx = np.repeat(np.arange(trials.size), per_run)
+    item_idx = rng.choice(probs.size, size=run_idx.size, p=probs / p_any)
+    return run_idx, item_idx
+
+
+def simulate(rng: np.random.Generator, difficulty: str, regular: np.ndarray,
+             escort: np.ndarray, boss: np.ndarray, has_boss: bool,
+             runs: int, batch_size: int):
+    """Simulate `runs` field runs; return (runs_with_item, total_drops, histogram)."""
+    lo, hi = ENEMY_COUNTS[difficulty]
+    n_items = len(regular)
+    acquired = np.zeros(n_items, dtype=np.int64)
+    total = np.zeros(n_items, dtype=np.int64)
+    hist = np.zeros((n_items, 4), dtype=np.int64)  # 0, 1, 2, 3+ drops per run
+
+    done = 0
+    while done < runs:
+        batch = min(batch_size, runs - done)
+        waves = REGULAR_WAVES if has_boss else REGULAR_WAVES + 1
+        slots = rng.integers(lo, hi + 1, size=(batch, waves)).sum(axis=1)
+        events = [drop_events(rng, slots, regular)]
+        if has_boss:
+            escorts = rng.integers(BOSS_ESCORTS[0], BOSS_ESCORTS[1] + 1, size=batch)
+            events.append(drop_events(rng, escorts, escort))
+            events.append(drop_events(rng, np.ones(batch, dtype=np.int64), boss))
+        run_idx = np.concatenate([e[0] for e in events])
+        item_idx = np.concatenate([e[1] for e in events])
+
+        # Per (run, item) drop counts without materialising a runs x items grid
+        pairs, per_pair = np.unique(run_idx * n_items + item_idx, return_counts=True)
+        pair_items = pairs % n_items
+        batch_acquired = np.bincount(pair_items, minlength=n_items)
+        acquired += batch_acquired
+        total += np.bincount(item_idx, minlength=n_items)
+        hist[:, 0] += batch - batch_acquired
+        hist[:, 1] += np.bincount(pair_items[per_pair == 1], minlength=n_items)
+        hist[:, 2] += np.bincount(pair_items[per_pair == 2], minlength=n_items)
+        hist[:, 3] += np.bincount(pair_items[per_pair >= 3], minlength=n_items)
+        done += batch
+
+    return acquired, total, hist
+
+
+def runs_quantile(p_run: float, q: float):
+    """Runs needed to have obtained the item with probability q (geometric)."""
+    if p_run <= 0.0:
+        return None
+    if p_run >= 1.0:
+        return 1
+    return int(math.ceil(math.log(1.0 - q) / math.log(1.0 - p_run)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo drop simulator over drop tables and spawn pools")
+    parser.add_argument('--difficulty', choices=DIFFICULTIES + ['all'], default='all')
+    parser.add_argument('--area', choices=sorted(AREA_DROP_NAMES) + ['all'], default='all')
+    parser.add_argument('--item', action='append', default=[],
+                        help="Only report this item (repeatable); default is every item")
+    parser.add_argument('--runs', type=int, default=1_000_000, help="Runs per area/difficulty")
+    parser.add_argument('--batch-size', type=int, default=100_000)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--data', default=DATA_DIR, help="Path to psz-godot/data")
+    parser.add_argument('--output', help="Write JSON here instead of stdout")
+    args = parser.parse_args()
+
+    spawn_path = os.path.join(args.data, 'spawn_pools.tres')
+    if not os.path.exists(spawn_path):
+        print(f"ERROR: spawn pool table not found: {spawn_path}", file=sys.stderr)
+        sys.exit(1)
+    spawn = read_tres(spawn_path)
+    pools = spawn.get('pools', {})
+    tables = load_drop_tables(args.data)
+
+    difficulties = DIFFICULTIES if args.difficulty == 'all' else [args.difficulty]
+    areas = sorted(AREA_DROP_NAMES) if args.area == 'all' else [args.area]
+    wanted = set(args.item)
+
+    rng = np.random.default_rng(args.seed)
+    start = time.perf_counter()
+    results = []
+    for difficulty in difficulties:
+        for area_id in areas:
+            area_table = tables.get(difficulty, {}).get(AREA_DROP_NAMES[area_id], {})
+            pool = pools.get(area_id, {})
+            if not area_table or not pool:
+                continue
+            items, regular, escort, boss, has_boss = build_scenario(
+                difficulty, area_id, pool, area_table)
+            if wanted:
+                keep = [i for i, item in enumerate(items) if item in wanted]
+                if not keep:
+                    continue
+                items = [items[i] for i in keep]
+                regular, escort, boss = regular[keep], escort[keep], boss[keep]
+
+            acquired, total, hist = simulate(
+                rng, difficulty, regular, escort, boss, has_boss, args.runs, args.batch_size)
+
+            for i, item in enumerate(items):
+                p_run = acquired[i] / args.runs
+                results.append({
+                    'item': item,
+                    'difficulty': difficulty,
+                    'area': area_id,
+                    'p_per_run': p_run,
+                    'mean_drops_per_run': total[i] / args.runs,
+                    'expected_runs': (1.0 / p_run) if p_run > 0 else None,
+                    'runs_quantiles': {
+                        str(q): runs_quantile(p_run, q) for q in RUN_QUANTILES
+                    },
+                    'drops_per_run_histogram': {
+                        '0': int(hist[i, 0]), '1': int(hist[i, 1]),
+                        '2': int(hist[i, 2]), '3+': int(hist[i, 3]),
+                    },
+                })
+
+    report = {
+        'runs_per_scenario': args.runs,
+        'seed': args.seed,
+        'elapsed_seconds': round(time.perf_counter() - start, 3),
+        'results': results,
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Simulated {len(results)} item/area/difficulty combinations "
+              f"in {report['elapsed_seconds']}s → {args.output}")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == '__main__':
+    main()
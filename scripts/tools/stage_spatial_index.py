@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Build a per-map uniform-grid index of portals, spawns and obstacles.
+
+Each assets/environments/<area>/<map>_config.json lists portal gates, the
+default spawn and obstacle volumes in stage-local space. This buckets their
+XZ footprints into square grid cells once and writes
+
+  data/stage_spatial_index.tres   (StageSpatialIndex)
+    cell_size  float, metres per grid cell
+    maps       { map_id: {
+      "kinds":  PackedStringArray     "portal" | "spawn" | "obstacle", per item
+      "ids":    PackedStringArray     portal direction, "default", obstacle id
+      "bounds": PackedFloat32Array    min_x, min_z, max_x, max_z per item
+      "cells":  { Vector2i(cx, cz): PackedInt32Array(item indices) }
+    } }
+
+The field controller loads a map's entry into a SpatialGrid, adds the quest
+cell's objects (boxes, fences, switches) as it spawns them, and answers
+proximity checks from the cells around a point instead of scanning every
+portal and object in the room.
+
+Runs as a content_pipeline.py stage and standalone.
+
+Usage:
+    python3 scripts/tools/stage_spatial_index.py
+    python3 scripts/tools/stage_spatial_index.py --cell-size 4 --profile
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+
+from tool_metrics import add_metrics_arguments, metrics_from_args
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+GODOT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, '..', '..'))
+DATA_DIR = os.path.join(GODOT_ROOT, 'data')
+ENVIRONMENTS_DIR = os.path.join(GODOT_ROOT, 'assets', 'environments')
+OUTPUT_NAME = 'stage_spatial_index.tres'
+# Rooms are ~40-80 m across, so a room is a handful of cells per axis
+CELL_SIZE = 8.0
+
+
+def obstacle_bounds(obstacle: dict) -> tuple[float, float, float, float]:
+    """XZ bounding box of a box (Y-rotated, radians) or cylinder obstacle."""
+    x, _, z = (float(v) for v in obstacle.get('position', [0, 0, 0]))
+    if obstacle.get('type') == 'cylinder':
+        ex = ez = float(obstacle.get('radius', 0))
+    else:
+        ry = float((obstacle.get('rotation') or [0, 0, 0])[1])
+        hw = float(obstacle.get('width', 0)) / 2
+        hd = float(obstacle.get('depth', 0)) / 2
+        c, s = abs(math.cos(ry)), abs(math.sin(ry))
+        ex, ez = c * hw + s * hd, s * hw + c * hd
+    return x - ex, z - ez, x + ex, z + ez
+
+
+def map_items(config: dict) -> list[tuple[str, str, tuple]]:
+    """(kind, id, (min_x, min_z, max_x, max_z)) for everything in a config."""
+    items = []
+    for portal in config.get('portals', []):
+        direction = portal.get('direction', '')
+        if direction:
+            x, _, z = (float(v) for v in portal.get('position', [0, 0, 0]))
+            items.append(('portal', direction, (x, z, x, z)))
+    spawn = config.get('defaultSpawn')
+    if spawn:
+        x, _, z = (float(v) for v in spawn.get('position', [0, 0, 0]))
+        items.append(('spawn', 'default', (x, z, x, z)))
+    for obstacle in config.get('obstacles', []):
+        items.append(('obstacle', obstacle.get('id', ''), obstacle_bounds(obstacle)))
+    return items
+
+
+def grid_cells(items: list, cell_size: float) -> dict[tuple[int, int], list[int]]:
+    """{(cx, cz): item indices} for every cell an item's footprint touches."""
+    cells: dict[tuple[int, int], list[int]] = {}
+    for index, (_, _, (min_x, min_z, max_x, max_z)) in enumerate(items):
+        for cx in range(math.floor(min_x / cell_size), math.floor(max_x / cell_size) + 1):
+            for cz in range(math.floor(min_z / cell_size), math.floor(max_z / cell_size) + 1):
+                cells.setdefault((cx, cz), []).append(index)
+    return cells
+
+
+def read_configs(environments_dir: str) -> dict[str, dict]:
+    """{map_id: config} for every <map>_config.json under environments_dir."""
+    configs = {}
+    if not os.path.isdir(environments_dir):
+        return configs
+    for area in sorted(os.listdir(environments_dir)):
+        area_dir = os.path.join(environments_dir, area)
+        if not os.path.isdir(area_dir):
+            continue
+        for fname in sorted(os.listdir(area_dir)):
+            if not fname.endswith('_config.json'):
+                continue
+            try:
+                with open(os.path.join(area_dir, fname), 'r', encoding='utf-8') as f:
+                    config = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"  Skipping {area}/{fname}: {e}")
+                continue
+            configs[config.get('mapId') or fname[:-len('_config.json')]] = config
+    return configs
+
+
+def _format_map(map_id: str, items: list, cells: dict) -> str:
+    kinds = ', '.join(f'"{kind}"' for kind, _, _ in items)
+    ids = ', '.join(f'"{item_id}"' for _, item_id, _ in items)
+    bounds = ', '.join(f'{v:g}' for _, _, box in items for v in box)
+    cell_lines = ',\n'.join(
+        f'      Vector2i({cx}, {cz}): PackedInt32Array({", ".join(map(str, indices))})'
+        for (cx, cz), indices in sorted(cells.items()))
+    return (f'  "{map_id}": {{\n'
+            f'    "kinds": PackedStringArray({kinds}),\n'
+            f'    "ids": PackedStringArray({ids}),\n'
+            f'    "bounds": PackedFloat32Array({bounds}),\n'
+            f'    "cells": {{\n{cell_lines}\n    }}\n'
+            f'  }}')
+
+
+def build_stage_spatial_index(data_dir: str = DATA_DIR, environments_dir: str = ENVIRONMENTS_DIR,
+                              cell_size: float = CELL_SIZE, metrics=None) -> dict[str, int]:
+    """Write data_dir/stage_spatial_index.tres; returns {map_id: item count}."""
+    blocks, counts = [], {}
+    for map_id, config in sorted(read_configs(environments_dir).items()):
+        start = time.perf_counter()
+        items = map_items(config)
+        counts[map_id] = len(items)
+        if not items:
+            continue
+        cells = grid_cells(items, cell_size)
+        blocks.append(_format_map(map_id, items, cells))
+        if metrics:
+            metrics.file('index', map_id, time.perf_counter() - start, status='indexed')
+    body = ',\n'.join(blocks)
+    with open(os.path.join(data_dir, OUTPUT_NAME), 'w', encoding='utf-8') as f:
+        f.write(f'''[gd_resource type="Resource" script_class="StageSpatialIndex" load_steps=2 format=3]
+
+[ext_resource type="Script" path="res://scripts/resources/stage_spatial_index.gd" id="1"]
+
+[resource]
+script = ExtResource("1")
+cell_size = {float(cell_size)!r}
+maps = {{
+{body}
+}}
+''')
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the per-map spatial index of stage configs")
+    parser.add_argument('--data', default=DATA_DIR, help="Generated data/ directory")
+    parser.add_argument('--environments', default=ENVIRONMENTS_DIR, help="assets/environments directory")
+    parser.add_argument('--cell-size', type=float, default=CELL_SIZE, help="Grid cell size in metres")
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.data):
+        print(f"ERROR: data directory not found: {args.data}")
+        sys.exit(1)
+    if args.cell_size <= 0:
+        print("ERROR: --cell-size must be positive")
+        sys.exit(1)
+
+    metrics = metrics_from_args('stage_spatial_index', args)
+    with metrics.stage('index'):
+        counts = build_stage_spatial_index(args.data, args.environments, args.cell_size, metrics)
+    indexed = sum(1 for n in counts.values() if n)
+    print(f"Stage spatial index: {indexed}/{len(counts)} maps, {sum(counts.values())} items, "
+          f"{args.cell_size:g} m cells")
+    metrics.finish()
+
+
+if __name__ == '__main__':
+    main()
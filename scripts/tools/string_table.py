@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""Interned string table for generated content.
+
+Converters don't write name / japanese_name / description / details text
+into their .tres files; they intern it here and write string ids instead
+(name_id, description_id, details_id), and the spawn pool table stores
+enemy name ids the same way. The text lives once, in
+
+  data/string_table.tres   (StringTableData)
+    en   PackedStringArray, id → English text (id 0 is "")
+    ja   PackedStringArray, id → Japanese text ("" when there is none)
+
+which the StringTable autoload loads once. UI code resolves ids through it,
+so localizing text means replacing this one file rather than re-importing
+every category.
+
+Ids are append-only: the table under data/ is loaded before converting and
+new strings go on the end, so re-importing one file never renumbers the
+others. content_pipeline.py writes it back as its last stage, and only when
+a conversion added something. Strings nothing refers to any more stay until
+a full import into an empty data/ directory.
+
+Standalone, this reports the table's size and checks every string id under
+data/ against it (exit status 1 on ids past the end).
+
+Usage:
+    python3 scripts/tools/string_table.py
+    python3 scripts/tools/string_table.py --data /tmp/data --profile
+"""
+
+import argparse
+import os
+import sys
+
+from tres_reader import TresParseError, read_tres
+from tool_metrics import add_metrics_arguments, metrics_from_args
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+GODOT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, '..', '..'))
+DATA_DIR = os.path.join(GODOT_ROOT, 'data')
+OUTPUT_NAME = 'string_table.tres'
+
+# Interned fields, stored as <field>_id; japanese_name is the "ja" column of the name
+TEXT_FIELDS = ('name', 'description', 'details')
+
+
+def _escape(s: str) -> str:
+    return s.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class StringTable:
+    """Append-only en/ja string table; id 0 is the empty string.
+
+    An English text has one id. A second Japanese text for it fills an empty
+    ja entry, or gets an id of its own if the entry already differs.
+    """
+
+    def __init__(self, en: list[str] | None = None, ja: list[str] | None = None):
+        self.en: list[str] = list(en) if en else ['']
+        self.ja: list[str] = list(ja) if ja else ['']
+        self.ja += [''] * (len(self.en) - len(self.ja))
+        self._ids: dict[str, int] = {}
+        self._variants: dict[tuple[str, str], int] = {}
+        for sid, text in enumerate(self.en):
+            if text in self._ids:
+                self._variants[(text, self.ja[sid])] = sid
+            else:
+                self._ids[text] = sid
+        self.changed = False
+
+    @classmethod
+    def load(cls, path: str) -> 'StringTable':
+        """The table written to `path`, or an empty one if there is none."""
+        if not os.path.exists(path):
+            return cls()
+        props = read_tres(path)
+        return cls(props.get('en'), props.get('ja'))
+
+    def intern(self, text: str, japanese: str = '') -> int:
+        if not text:
+            return 0
+        japanese = japanese or ''
+        sid = self._ids.get(text)
+        if sid is None:
+            sid = self._append(text, japanese)
+            self._ids[text] = sid
+        elif japanese and self.ja[sid] != japanese:
+            if not self.ja[sid]:
+                self.ja[sid] = japanese
+                self.changed = True
+            else:
+                sid = self._variants.get((text, japanese)) or self._append(text, japanese)
+                self._variants[(text, japanese)] = sid
+        return sid
+
+    def _append(self, text: str, japanese: str) -> int:
+        self.en.append(text)
+        self.ja.append(japanese)
+        self.changed = True
+        return len(self.en) - 1
+
+    def text(self, sid) -> str:
+        sid = int(sid or 0)
+        return self.en[sid] if 0 < sid < len(self.en) else ''
+
+    def japanese(self, sid) -> str:
+        sid = int(sid or 0)
+        return self.ja[sid] if 0 < sid < len(self.ja) else ''
+
+    def __len__(self) -> int:
+        return len(self.en)
+
+
+_TABLES: dict[str, StringTable] = {}
+
+
+def table_for(data_dir: str) -> StringTable:
+    """The shared table for data_dir, loaded from its string_table.tres once.
+
+    Converters intern into it and derived stages resolve through it, so both
+    see strings added earlier in the same run before the table is saved.
+    """
+    key = os.path.abspath(data_dir)
+    table = _TABLES.get(key)
+    if table is None:
+        table = _TABLES[key] = StringTable.load(os.path.join(key, OUTPUT_NAME))
+    return table
+
+
+def text_field(strings: StringTable, rec: dict, field: str = 'name') -> str:
+    """A record's text: its <field>_id entry, or an inline <field> string
+    (hand-written .tres such as data/items)."""
+    if f'{field}_id' in rec:
+        return strings.text(rec[f'{field}_id'])
+    value = rec.get(field, '')
+    return value if isinstance(value, str) else ''
+
+
+def _packed_strings(values: list[str]) -> str:
+    return 'PackedStringArray(%s)' % ', '.join(f'"{_escape(v)}"' for v in values)
+
+
+def format_table(table: StringTable) -> str:
+    return f'''[gd_resource type="Resource" script_class="StringTableData" load_steps=2 format=3]
+
+[ext_resource type="Script" path="res://scripts/resources/string_table_data.gd" id="1"]
+
+[resource]
+script = ExtResource("1")
+en = {_packed_strings(table.en)}
+ja = {_packed_strings(table.ja)}
+'''
+
+
+def save_string_table(data_dir: str = DATA_DIR) -> int:
+    """Write data_dir/string_table.tres if strings were added; returns how many it holds."""
+    table = table_for(data_dir)
+    path = os.path.join(data_dir, OUTPUT_NAME)
+    if table.changed or not os.path.exists(path):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(format_table(table))
+        table.changed = False
+    return len(table)
+
+
+def _record_ids(props: dict):
+    """Yield the string ids one parsed .tres refers to."""
+    for field in TEXT_FIELDS:
+        if f'{field}_id' in props:
+            yield props[f'{field}_id']
+
+
+def check_references(data_dir: str, table: StringTable) -> tuple[set[int], list[str]]:
+    """(every string id used under data_dir, problems for ids past the table's end)."""
+    paths = [('.', os.path.join(data_dir, 'spawn_pools.tres'))]
+    for category in sorted(os.listdir(data_dir)):
+        cat_dir = os.path.join(data_dir, category)
+        if os.path.isdir(cat_dir):
+            paths += [(category, os.path.join(cat_dir, f)) for f in sorted(os.listdir(cat_dir))
+                      if f.endswith('.tres')]
+    used, problems = set(), []
+    for category, path in paths:
+        if not os.path.exists(path):
+            continue
+        try:
+            props = read_tres(path)
+        except (OSError, TresParseError) as e:
+            print(f"  Skipping {path}: {e}")
+            continue
+        ids = (props.get('names') or {}).values() if category == '.' else _record_ids(props)
+        for sid in ids:
+            if sid >= len(table):
+                problems.append(f"{os.path.relpath(path, data_dir)}: string id {sid} is past the table's end")
+            used.add(sid)
+    return used, problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report on and check the interned content string table")
+    parser.add_argument('--data', default=DATA_DIR, help="Generated data/ directory")
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.data):
+        print(f"ERROR: data directory not found: {args.data}")
+        sys.exit(1)
+
+    metrics = metrics_from_args('string_table', args)
+    with metrics.stage('check'):
+        table = table_for(args.data)
+        used, problems = check_references(args.data, table)
+    translated = sum(1 for ja in table.ja if ja)
+    unused = len(table) - 1 - len(used - {0})
+    print(f"String table: {len(table)} strings ({translated} with Japanese), "
+          f"{unused} no longer referenced")
+    for problem in problems:
+        print(f"  {problem}")
+    metrics.finish()
+    if problems:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
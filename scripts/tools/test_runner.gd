@@ -16,15 +16,21 @@ func _ready() -> void:
 	test_inventory()
 	test_inventory_capacity()
 	test_character_creation()
+	test_level_tables()
 	test_equipment()
 	test_combat_math()
 	test_combat_drops()
 	test_drop_tables()
+	test_string_table()
+	test_spawn_pools()
 	test_combat_simulation()
 	test_session_manager()
 	test_mission_progression()
+	test_unlock_graph()
+	test_stage_spatial_index()
 	test_mag_feeding()
 	test_mag_evolution()
+	test_mag_tables()
 	test_shops()
 	test_damage_formulas()
 	test_ranger_playthrough()
@@ -32,13 +38,17 @@ func _ready() -> void:
 	test_new_registries()
 	test_material_system()
 	test_set_bonuses()
+	test_item_references()
 	test_technique_casting()
 	test_photon_art_usage()
+	test_weapon_photon_arts()
 	test_tekker_grinding()
 	test_tekker_identification()
 	test_additional_drops()
 	test_telepipe_suspend()
 	test_character_appearance()
+	test_texture_tiers()
+	test_asset_packs()
 	test_valley_grid()
 	test_field_config()
 	test_wetlands_field()
@@ -246,6 +256,43 @@ func test_character_creation() -> void:
 	print("")
 
 
+# ── Level table tests ───────────────────────────────────────
+
+func test_level_tables() -> void:
+	print("── Level Tables ──")
+	# Precomputed class stat tables match breakpoint interpolation
+	var mismatched := 0
+	var checked := 0
+	for class_data in ClassRegistry.get_all_classes():
+		var interpolated: ClassData = class_data.duplicate()
+		interpolated.level_stats = {}
+		for stat_name in class_data.level_stats:
+			for level in range(1, 101):
+				checked += 1
+				if class_data.get_stat_at_level(stat_name, level) != interpolated.get_stat_at_level(stat_name, level):
+					mismatched += 1
+	assert_gt(checked, 0, "Classes have precomputed level stats")
+	assert_eq(mismatched, 0, "Level stat tables match interpolated stats")
+
+	# EXP prefix sums and EXP → level lookup
+	var exp_table: ExperienceTable = load("res://data/experience_table.tres")
+	assert_eq(exp_table.total_exp.size(), 100, "EXP table covers 100 levels")
+	var scan: ExperienceTable = exp_table.duplicate()
+	scan.total_exp = PackedInt64Array()
+	var level_mismatches := 0
+	for level in range(1, 101):
+		var threshold: int = exp_table.get_exp_for_level(level)
+		for total in [threshold - 1, threshold, threshold + 1]:
+			if exp_table.get_level_for_exp(total) != scan.get_level_for_exp(total):
+				level_mismatches += 1
+		if level < 100 and exp_table.get_exp_for_level(level + 1) - threshold != exp_table.get_exp_to_next(level):
+			level_mismatches += 1
+	assert_eq(level_mismatches, 0, "EXP lookup matches the level scan")
+	assert_eq(exp_table.get_level_for_exp(0), 1, "0 EXP is level 1")
+	assert_eq(exp_table.get_level_for_exp(999999999), 100, "EXP past the cap is level 100")
+	print("")
+
+
 # ── Equipment tests ─────────────────────────────────────────
 
 func test_equipment() -> void:
@@ -451,10 +498,10 @@ func test_drop_tables() -> void:
 			missing_areas.append(area_name)
 	assert_true(missing_areas.is_empty(), "All %d areas in normal drop table (missing: %s)" % [expected_areas.size(), str(missing_areas)])
 
-	# 3. Enemy name mapping — spawner names match drop table names
+	# 3. Enemy id mapping — spawner ids match drop table keys (EnemyData ids)
 	#    Note: bosses (reyburn, dark-falz, etc.) and some dark-shrine enemies
 	#    intentionally have no drops in the source data — skip those.
-	print("  ── Enemy Name Mapping ──")
+	print("  ── Enemy Id Mapping ──")
 	var area_id_to_drop_name: Dictionary = CombatManager.AREA_DROP_NAMES
 	var spawner_areas := EnemySpawner._enemy_pools
 	var name_mismatches: Array = []
@@ -465,7 +512,8 @@ func test_drop_tables() -> void:
 		"blade-mother", "dark-falz", "chaos-mobius",  # bosses
 		"hildeghana",  # gorilla_female variant, no drops in source
 		"eulid", "eulidveil", "eulada", "euladaveil", "arkzein",
-		"arkzein-r", "derreo",  # dark-shrine enemies, no drops in source
+		"arkzein-r", "derreo", "phobos", "phobos-dyna", "zaphobos",
+		"zaphobos-dyna", "zerreo",  # dark-shrine enemies, no drops in source
 	]
 
 	for area_id in spawner_areas:
@@ -478,19 +526,19 @@ func test_drop_tables() -> void:
 			for enemy_id in enemies:
 				if enemy_id in no_drops_expected:
 					continue
-				var formatted: String = EnemySpawner._format_enemy_name(enemy_id)
-				if area_table.has(formatted):
+				var drop_key: String = str(enemy_id).replace("-", "_")
+				if area_table.has(drop_key):
 					name_matches += 1
 				else:
-					name_mismatches.append("%s → '%s' not in %s" % [enemy_id, formatted, drop_area])
+					name_mismatches.append("%s → '%s' not in %s" % [enemy_id, drop_key, drop_area])
 
 	if not name_mismatches.is_empty():
-		print("  INFO: %d name mismatches:" % name_mismatches.size())
+		print("  INFO: %d id mismatches:" % name_mismatches.size())
 		for mm in name_mismatches:
 			print("    - %s" % mm)
-	assert_true(name_mismatches.is_empty(), "All spawner enemies match drop table names (%d matched, %d mismatched)" % [name_matches, name_mismatches.size()])
+	assert_true(name_mismatches.is_empty(), "All spawner enemies match drop table ids (%d matched, %d mismatched)" % [name_matches, name_mismatches.size()])
 
-	# 4. Drop item validity — every item in drop tables resolves to a real item
+	# 4. Drop item validity — every item id in drop tables is a real item
 	print("  ── Drop Item Validity ──")
 	var invalid_items: Array = []
 	var valid_items := 0
@@ -498,10 +546,9 @@ func test_drop_tables() -> void:
 
 	for area_name in area_drops:
 		var enemies: Dictionary = area_drops[area_name]
-		for enemy_name in enemies:
-			var items: Array = enemies[enemy_name]
-			for item_name in items:
-				var item_id: String = str(item_name).to_lower().replace(" ", "_").replace("'", "").replace("-", "_").replace("/", "_")
+		for enemy_id in enemies:
+			var items: PackedStringArray = enemies[enemy_id]
+			for item_id in items:
 				if checked_ids.has(item_id):
 					if checked_ids[item_id]:
 						valid_items += 1
@@ -526,15 +573,15 @@ func test_drop_tables() -> void:
 				if found:
 					valid_items += 1
 				else:
-					invalid_items.append("%s (from '%s')" % [item_id, item_name])
+					invalid_items.append(item_id)
 
 	if not invalid_items.is_empty():
 		print("  INFO: %d unresolvable drop items:" % invalid_items.size())
 		for ii in invalid_items:
 			print("    - %s" % ii)
 	print("  INFO: %d valid, %d invalid drop item IDs" % [valid_items, invalid_items.size()])
-	# Allow some items to be missing (units with "/" in name, special items)
-	assert_true(valid_items > 50, "Most drop items resolve to real items (%d valid)" % valid_items)
+	assert_true(valid_items > 50, "Drop tables list items (%d valid)" % valid_items)
+	assert_true(invalid_items.is_empty(), "Every drop item id is a real item")
 
 	# 5. Per-area enemy coverage — each area has at least 3 enemies with drops
 	for area_name in expected_areas:
@@ -668,9 +715,9 @@ func test_drop_tables() -> void:
 		# Check that hard drops differ from normal
 		var hard_gurhacia: Dictionary = hard_areas.get("gurhacia-valley", {})
 		var normal_gurhacia: Dictionary = area_drops.get("gurhacia-valley", {})
-		if hard_gurhacia.has("Ghowl") and normal_gurhacia.has("Ghowl"):
-			var hard_items: Array = hard_gurhacia["Ghowl"]
-			var normal_items: Array = normal_gurhacia["Ghowl"]
+		if hard_gurhacia.has("ghowl") and normal_gurhacia.has("ghowl"):
+			var hard_items: PackedStringArray = hard_gurhacia["ghowl"]
+			var normal_items: PackedStringArray = normal_gurhacia["ghowl"]
 			var same := true
 			for item in hard_items:
 				if item not in normal_items:
@@ -687,6 +734,66 @@ func test_drop_tables() -> void:
 
 # ── Full combat simulation ──────────────────────────────────
 
+func test_string_table() -> void:
+	print("── String Table ──")
+	assert_true(StringTable.is_loaded(), "String table loads")
+	var saved_language: String = StringTable.language
+	assert_eq(StringTable.get_english(0), "", "Id 0 is the empty string")
+	assert_eq(StringTable.get_english(1 << 30), "", "Out-of-range id is the empty string")
+
+	var weapon = WeaponRegistry.get_weapon("saber")
+	assert_true(weapon != null, "Saber loads")
+	if weapon:
+		assert_gt(weapon.name_id, 0, "Weapon stores a name id")
+		assert_eq(weapon.name, "Saber", "English name resolves from its id")
+		StringTable.set_language("en")
+		assert_eq(weapon.get_display_name(), "Saber", "Display name in English")
+		StringTable.set_language("ja")
+		assert_true(not weapon.get_display_name().is_empty(), "Display name in Japanese")
+		assert_eq(weapon.name, "Saber", "English name ignores the display language")
+	StringTable.set_language("xx")
+	assert_eq(StringTable.language, "ja", "Unknown language is ignored")
+
+	StringTable.set_language(saved_language)
+	print("")
+
+
+func test_spawn_pools() -> void:
+	print("── Spawn Pools ──")
+	var areas := ["gurhacia", "rioh", "ozette", "paru", "makara", "arca", "dark"]
+	for area_id in areas:
+		assert_true(EnemySpawner._enemy_pools.has(area_id), "Spawn pool loaded for %s" % area_id)
+
+	# Cumulative weights line up with ids and are strictly increasing
+	var bad_tiers: Array = []
+	for area_id in EnemySpawner._enemy_pools:
+		for tier in EnemySpawner._enemy_pools[area_id]:
+			var ids: Array = EnemySpawner._enemy_pools[area_id][tier]
+			var cumulative: PackedInt32Array = EnemySpawner._pool_weights[area_id][tier]
+			var ok: bool = cumulative.size() == ids.size() and not ids.is_empty()
+			for i in range(1, cumulative.size()):
+				if cumulative[i] <= cumulative[i - 1]:
+					ok = false
+			if not ok:
+				bad_tiers.append("%s/%s" % [area_id, tier])
+	assert_true(bad_tiers.is_empty(), "Cumulative spawn weights valid (bad: %s)" % str(bad_tiers))
+
+	# Every picked enemy resolves to an EnemyData resource
+	var unknown: Array = []
+	for i in range(50):
+		var enemy_id := EnemySpawner._pick_enemy("gurhacia", "common")
+		if not EnemyRegistry.has_enemy(enemy_id.replace("-", "_")):
+			unknown.append(enemy_id)
+	assert_true(unknown.is_empty(), "Picked gurhacia enemies exist in registry (unknown: %s)" % str(unknown))
+	assert_eq(EnemySpawner._pick_enemy("gurhacia", "bosses"), "reyburn", "Gurhacia boss picked from table")
+	# Pinned boss tiers keep the bosses areas had before pools were derived
+	assert_eq(EnemySpawner._enemy_pools["arca"]["bosses"], ["blade-mother"], "Arca boss pinned to Blade Mother")
+	assert_eq(EnemySpawner._enemy_pools["paru"]["bosses"], ["frunaked"], "Paru boss pinned to Frunaked")
+	assert_eq(EnemySpawner._enemy_pools["dark"]["bosses"], ["dark-falz", "chaos-mobius"], "Dark bosses pinned")
+	assert_eq(EnemySpawner._pick_enemy("nowhere", "common"), "", "Unknown area picks nothing")
+	print("")
+
+
 func test_combat_simulation() -> void:
 	print("── Combat Simulation (Gurhacia Normal) ──")
 	var character = CharacterManager.get_active_character()
@@ -824,7 +931,7 @@ func test_session_manager() -> void:
 			str(normal_reward.get("item", "???")),
 			str(normal_reward.get("quantity", 0)),
 			str(normal_reward.get("meseta", 0))])
-		assert_true(not str(normal_reward.get("item", "")).is_empty(), "Has reward item")
+		assert_eq(str(normal_reward.get("item", "")), "grow_shower", "Reward item is a content id")
 		assert_gt(int(normal_reward.get("meseta", 0)), 0, "Has reward meseta")
 	else:
 		print("  INFO: mayor_s_mission not found, checking available missions:")
@@ -901,6 +1008,42 @@ func test_mission_progression() -> void:
 	print("")
 
 
+func test_unlock_graph() -> void:
+	print("── Unlock Graph ──")
+	var graph: UnlockGraph = MissionRegistry.get_unlock_graph()
+	assert_true(graph != null, "Unlock graph loads")
+	if graph == null:
+		print("")
+		return
+
+	# Mask checks agree with walking requires lists at every step of the story
+	var story_chain := ["mayor_s_mission", "waltz_of_rage", "devilish_return", "a_small_friend"]
+	var saved: Array = GameState.completed_missions.duplicate()
+	GameState.completed_missions.clear()
+	var mismatched := 0
+	for step in range(story_chain.size() + 1):
+		var mask := MissionRegistry.get_completed_mask(GameState.completed_missions)
+		for m in MissionRegistry.get_all_missions():
+			if MissionRegistry.is_mission_unlocked(m.id, mask) != _is_mission_available_v2(m.id):
+				mismatched += 1
+		if step < story_chain.size():
+			GameState.complete_mission(story_chain[step])
+	assert_eq(mismatched, 0, "Mask availability matches requires lists")
+	GameState.completed_missions = saved
+
+	# Transitive prerequisites follow the chain back to the root
+	var upstream := graph.get_prerequisites("missions", "the_eternal")
+	assert_true("mayor_s_mission" in upstream, "the_eternal transitively requires mayor_s_mission")
+	assert_true(not ("the_eternal" in upstream), "A mission is not its own prerequisite")
+	var order: PackedStringArray = graph.graphs["missions"]["order"]
+	assert_true(order.find("mayor_s_mission") < order.find("the_eternal"), "Prerequisites come first in unlock order")
+	assert_true("artifacts" in graph.get_prerequisites("quests", "a_far_journey"), "Quest prerequisites are in the graph")
+	var none := graph.completed_mask("quests", [])
+	assert_true(not graph.is_unlocked("quests", "a_far_journey", none, true), "Quest with prerequisites starts locked")
+	assert_true(not graph.is_unlocked("missions", "no_such_mission", MissionRegistry.get_completed_mask([])), "Unknown mission is never unlocked")
+	print("")
+
+
 ## Check if a mission is available by its requires list
 func _is_mission_available_v2(mission_id: String) -> bool:
 	var mission = MissionRegistry.get_mission(mission_id)
@@ -914,6 +1057,33 @@ func _is_mission_available_v2(mission_id: String) -> bool:
 	return true
 
 
+
+func test_stage_spatial_index() -> void:
+	print("── Stage Spatial Index ──")
+	var index := load("res://data/stage_spatial_index.tres") as StageSpatialIndex
+	assert_true(index != null, "Stage spatial index loads")
+	if index == null:
+		print("")
+		return
+	assert_gt(index.maps.size(), 200, "Index covers 200+ maps")
+
+	# s01a_lc1: north gate at (-13.4, -20.4), boulder of radius 4.1 at (1.2, -4.5)
+	var grid := index.create_grid("s01a_lc1")
+	var north := grid.nearest(Vector3(-13.0, 0.0, -20.0), 2.0, "portal")
+	assert_eq(str(north.get("id", "")), "north", "Nearest portal to the north gate is north")
+	assert_true(grid.nearest(Vector3(0.0, 0.0, 0.0), 2.0, "portal").is_empty(), "No portal near the room centre")
+	assert_eq(grid.query(Vector3(4.5, 0.0, -4.5), 0.5, "obstacle").size(), 1, "Point inside the boulder's footprint hits it")
+	assert_eq(grid.query(Vector3(-13.0, 0.0, -20.0), 2.0, "obstacle").size(), 0, "Kind filter excludes portals")
+
+	# Runtime inserts (quest objects) share the grid with indexed items
+	var marker := Node3D.new()
+	grid.insert_point("box", "", Vector3(30.0, 0.0, 30.0), marker)
+	assert_eq(grid.query(Vector3(30.05, 0.0, 30.0), 0.1, "box").size(), 1, "Inserted box found at its position")
+	assert_eq(grid.query(Vector3(31.0, 0.0, 30.0), 0.1, "box").size(), 0, "Inserted box not found 1 m away")
+	marker.free()
+	assert_eq(index.create_grid("no_such_map").size(), 0, "Unknown map gives an empty grid")
+	print("")
+
 # ── Mag feeding tests ──────────────────────────────────────
 
 func test_mag_feeding() -> void:
@@ -1144,6 +1314,50 @@ func test_mag_evolution() -> void:
 	print("")
 
 
+func test_mag_tables() -> void:
+	print("── Mag Tables ──")
+	var tables: MagTables = MagManager._tables
+	assert_true(tables != null, "Mag tables load")
+	if tables == null:
+		print("")
+		return
+	assert_eq(Array(tables.evolution_levels), [60, 30, 10], "Stage thresholds, highest first")
+
+	# Table lookups agree with scanning the mag forms across stat spreads
+	var mismatched := 0
+	var checked := 0
+	var stat_names := ["power", "guard", "hit", "mind"]
+	for total in [20, 49, 50, 149, 150, 299, 300, 400]:
+		for main in stat_names:
+			for second in stat_names + [""]:
+				var mag := MagManager.create_mag()
+				mag.stats[main] = total if second.is_empty() or second == main else total - total / 4
+				if not second.is_empty() and second != main:
+					mag.stats[second] = total / 4
+				var from_table := MagManager.determine_form(mag)
+				MagManager._tables = null
+				var from_scan := MagManager.determine_form(mag)
+				MagManager._tables = tables
+				checked += 1
+				if from_table != from_scan:
+					mismatched += 1
+	assert_eq(mismatched, 0, "Table forms match the scan (%d stat spreads)" % checked)
+
+	# Personality switches: 5 consecutive feeds of the listed kinds at level 60+
+	var hunter_force := ["hunter_weapon", "force_weapon", "hunter_weapon", "force_weapon", "hunter_weapon"]
+	var breezy: Array = tables.get_personality_switches(hunter_force)
+	assert_eq(breezy.size(), 1, "Hunter/Force weapons match one switch")
+	if not breezy.is_empty():
+		assert_eq(str(breezy[0]["id"]), "breezy", "Hunter/Force weapons → Breezy")
+		assert_eq(int(breezy[0]["feeds"]), 5, "Breezy needs 5 feeds")
+		assert_eq(int(breezy[0]["level"]), 60, "Breezy unlocks at level 60")
+	var cautious: Array = tables.get_personality_switches(["armor", "armor", "force_weapon", "armor", "armor"])
+	assert_true(not cautious.is_empty() and str(cautious[0]["id"]) == "cautious", "Force weapons/armors → Cautious")
+	assert_eq(tables.get_personality_switches(["armor", "hunter_weapon", "force_weapon"]).size(), 0,
+		"Three feed kinds match no switch")
+	print("")
+
+
 # ── Shop tests ──────────────────────────────────────────────
 
 func test_shops() -> void:
@@ -1633,8 +1847,9 @@ func test_technique_disks() -> void:
 	# Verify first item is a valid disk
 	if not shop_items.is_empty():
 		var first: Dictionary = shop_items[0]
-		var item_name: String = str(first.get("item", ""))
-		assert_true(item_name.begins_with("Disk: "), "First item is a disk: %s" % item_name)
+		var item_id: String = str(first.get("item", ""))
+		assert_true(item_id.begins_with("disk_"), "First item is a disk: %s" % item_id)
+		assert_eq(Inventory._lookup_item(item_id)["name"], "Disk: Foie Lv.1", "Disk id names its technique and level")
 		assert_gt(int(first.get("cost", 0)), 0, "Disk has a price")
 
 	# ── Disk drops in combat ──
@@ -1737,19 +1952,51 @@ func test_material_system() -> void:
 func test_set_bonuses() -> void:
 	print("── Set Bonuses ──")
 
-	# Test set bonus lookup
-	var bonus: Dictionary = SetBonusRegistry.get_set_bonus_for_equipment("Dragon Wing", "Dragon Horn")
+	# Test set bonus lookup (set bonuses store armor and weapon ids)
+	var bonus: Dictionary = SetBonusRegistry.get_set_bonus_for_equipment("dragon_wing", "dragon_horn")
 	assert_true(not bonus.is_empty(), "Dragon Wing + Dragon Horn has set bonus")
 	assert_eq(int(bonus.get("attack", 0)), 50, "Set bonus attack == 50")
 	assert_eq(int(bonus.get("accuracy", 0)), 25, "Set bonus accuracy == 25")
 
 	# No match
-	var no_bonus: Dictionary = SetBonusRegistry.get_set_bonus_for_equipment("Dragon Wing", "Saber")
+	var no_bonus: Dictionary = SetBonusRegistry.get_set_bonus_for_equipment("dragon_wing", "saber")
 	assert_true(no_bonus.is_empty(), "Dragon Wing + Saber has no set bonus")
 
 	# Scarred Horn also matches
-	var bonus2: Dictionary = SetBonusRegistry.get_set_bonus_for_equipment("Dragon Wing", "Scarred Horn")
+	var bonus2: Dictionary = SetBonusRegistry.get_set_bonus_for_equipment("dragon_wing", "scarred_horn")
 	assert_true(not bonus2.is_empty(), "Dragon Wing + Scarred Horn has set bonus")
+
+	# Id lookup through the precomputed pair table
+	var by_ids: Dictionary = SetBonusRegistry.get_set_bonus_for_ids("dragon_wing", "dragon_horn")
+	assert_eq(by_ids, bonus, "Table lookup matches the scan")
+	assert_true(SetBonusRegistry.get_set_bonus_for_ids("dragon_wing", "saber").is_empty(), "Id lookup: Dragon Wing + Saber has no set bonus")
+	assert_true(SetBonusRegistry.get_set_bonus_for_ids("no_armor", "dragon_horn").is_empty(), "Id lookup: unknown armor has no set bonus")
+	print("")
+
+
+func test_item_references() -> void:
+	print("── Item References ──")
+	# The importer rewrote names to content ids, punctuation included
+	var table = DropRegistry.get_drop_table("hard")
+	if table:
+		var drops: PackedStringArray = DropRegistry.get_enemy_drops("hard", "makara-ruins", "rohjade")
+		assert_true("st_kilda" in drops, "St. Kilda drops as st_kilda")
+		assert_true(WeaponRegistry.get_weapon("st_kilda") != null, "st_kilda is a weapon")
+		assert_eq(DropRegistry.get_enemy_drops("hard", "gurhacia-valley", "ghowl"),
+			table.area_drops["gurhacia-valley"]["ghowl"], "Enemy drops are the table's id array")
+	var star_cloak = SetBonusRegistry.get_set_bonus("star_cloak")
+	if star_cloak:
+		assert_eq(star_cloak.armor, "star_cloak", "Set bonus armor is an id")
+		# Source spellings that differ from the display name go through the alias map
+		assert_true("witchs_broom" in star_cloak.weapons, "Witch Broom → witchs_broom")
+	assert_true(not SetBonusRegistry.get_set_bonus_for_ids("star_cloak", "witchs_broom").is_empty(), "Star Cloak + Witch's Broom has a set bonus")
+
+	# Shop entries are ids the registries know directly
+	var shop_items: Array = ShopManager.get_shop_inventory("item_shop")
+	assert_gt(shop_items.size(), 0, "Item shop has items")
+	for entry in shop_items:
+		var item_id: String = str(entry.get("item", ""))
+		assert_true(ConsumableRegistry.get_consumable(item_id) != null, "Item shop entry %s is a consumable" % item_id)
 	print("")
 
 
@@ -1884,6 +2131,31 @@ func test_photon_art_usage() -> void:
 	print("")
 
 
+func test_weapon_photon_arts() -> void:
+	print("── Weapon Photon Arts ──")
+	var carbine = WeaponRegistry.get_weapon("carbine")
+	assert_true(carbine != null, "Carbine loads")
+	if carbine == null:
+		print("")
+		return
+	assert_eq(carbine.photon_art_ids, PackedStringArray(["wipeout", "mine_sneak"]), "Catalog arts stored as ids")
+	var arts: Array[Dictionary] = carbine.get_photon_arts()
+	assert_eq(arts.size(), 3, "Catalog and inline arts combined")
+	var wipeout = PhotonArtRegistry.get_art("wipeout")
+	if arts.size() == 3 and wipeout:
+		assert_eq(arts[0]["name"], wipeout.name, "Art name comes from the catalog")
+		assert_eq(arts[0]["pp_used"], wipeout.pp_cost, "Art PP comes from the catalog")
+		assert_eq(arts[0]["element"], "Level 4 Heat", "Per-weapon element override applied")
+		assert_eq(arts[1]["name"], "Hollow Snipe", "Art missing from the catalog stays inline, in its slot")
+		assert_true(not arts[1].has("slot"), "Slot index is not part of the art")
+		assert_eq(arts[2]["element"], "-", "Art without override has no element")
+	var acegalda = WeaponRegistry.get_weapon("acegalda")
+	if acegalda:
+		var first: Dictionary = acegalda.get_photon_arts()[0]
+		assert_eq(first["name"], "Linear Shave", "Inline art keeps its source slot ahead of catalog arts")
+	print("")
+
+
 func test_tekker_grinding() -> void:
 	print("── Tekker Grinding ──")
 
@@ -2096,8 +2368,27 @@ func test_character_appearance() -> void:
 		}
 	}
 	var paths: Dictionary = PlayerConfig.get_paths_for_character(char_data)
-	assert_eq(paths["model_path"], "res://assets/player/pc_032/pc_032_000.glb", "Full model path via get_paths_for_character")
-	assert_true(str(paths["texture_path"]).ends_with("pc_032_123.png"), "Full texture path via get_paths_for_character")
+	if PlayerConfig.get_atlas("pc_032").is_empty():
+		assert_eq(paths["model_path"], "res://assets/player/pc_032/pc_032_000.glb", "Full model path via get_paths_for_character")
+		assert_true(str(paths["texture_path"]).ends_with("pc_032_123.png"), "Full texture path via get_paths_for_character")
+		assert_eq(paths["uv_offset"], Vector3.ZERO, "Non-atlased variation has no UV offset")
+	else:
+		assert_eq(paths["model_path"], "res://assets/player/pc_032/pc_032_000_atlas.glb", "Atlased model path via get_paths_for_character")
+		assert_true(str(paths["texture_path"]).ends_with("pc_032_atlas_0.png"), "Atlas texture path via get_paths_for_character")
+
+	# --- Atlas manifest lookup (build_player_atlases.py output) ---
+	var manifest := {
+		"model": "pc_032_000_atlas.glb",
+		"atlases": ["pc_032_atlas_0.png"],
+		"uv_scale": [0.25, 0.5],
+		"cells": {"pc_032_000": [0, 0, 0], "pc_032_123": [0, 3, 1]},
+	}
+	var cell: Dictionary = PlayerConfig.resolve_atlas_cell(manifest, "pc_032_123")
+	assert_eq(cell.get("model", ""), "pc_032_000_atlas.glb", "Atlas cell resolves atlas model")
+	assert_eq(cell.get("atlas", ""), "pc_032_atlas_0.png", "Atlas cell resolves atlas texture")
+	assert_eq(cell.get("uv_offset", Vector3.ZERO), Vector3(0.75, 0.5, 0.0), "Atlas cell UV offset = col/row * uv_scale")
+	assert_true(PlayerConfig.resolve_atlas_cell(manifest, "pc_032_224").is_empty(), "Texture missing from atlas resolves to {}")
+	assert_true(PlayerConfig.resolve_atlas_cell({}, "pc_032_000").is_empty(), "Empty manifest resolves to {}")
 
 	# --- Appearance stored on character creation ---
 	var appearance := {"variation_index": 2, "body_color_index": 1, "hair_color_index": 1, "skin_tone_index": 2}
@@ -2112,8 +2403,12 @@ func test_character_appearance() -> void:
 	# --- Backward compatibility (old save without appearance) ---
 	var old_char := {"class_id": "humar", "name": "OldChar"}
 	var old_paths: Dictionary = PlayerConfig.get_paths_for_character(old_char)
-	assert_eq(old_paths["model_path"], "res://assets/player/pc_000/pc_000_000.glb", "Old char defaults to pc_000 model")
-	assert_true(str(old_paths["texture_path"]).ends_with("pc_000_000.png"), "Old char defaults to 000 texture")
+	if PlayerConfig.get_atlas("pc_000").is_empty():
+		assert_eq(old_paths["model_path"], "res://assets/player/pc_000/pc_000_000.glb", "Old char defaults to pc_000 model")
+		assert_true(str(old_paths["texture_path"]).ends_with("pc_000_000.png"), "Old char defaults to 000 texture")
+	else:
+		assert_eq(old_paths["model_path"], "res://assets/player/pc_000/pc_000_000_atlas.glb", "Old char defaults to pc_000 atlas model")
+		assert_eq(old_paths["uv_offset"], Vector3.ZERO, "Old char defaults to the first atlas cell")
 
 	# Clean up
 	CharacterManager._characters = [null, null, null, null]
@@ -2346,6 +2641,83 @@ func test_valley_grid() -> void:
 	print("")
 
 
+func test_texture_tiers() -> void:
+	print("── Texture Tiers ──")
+	var saved_quality: String = TextureTiers.quality
+
+	# --- Synthetic manifest (build_texture_tiers.py output format) ---
+	var manifest := {
+		"version": 1,
+		"tiers": {
+			"half": {"scale": 2, "root": "res://assets/tiers/half/"},
+			"quarter": {"scale": 4, "root": "res://assets/tiers/quarter/"},
+		},
+		"textures": {
+			"player/pc_000/textures/pc_000_000.png": {"sha256": "", "tiers": ["half", "quarter"]},
+			"enemies/ghowl/b_001.png": {"sha256": "", "tiers": ["half"]},
+		},
+	}
+	var path := "user://test_tiers_manifest.json"
+	var f := FileAccess.open(path, FileAccess.WRITE)
+	f.store_string(JSON.stringify(manifest))
+	f.close()
+	assert_true(TextureTiers.load_manifest(path), "Tier manifest loads")
+
+	var src := "res://assets/player/pc_000/textures/pc_000_000.png"
+	TextureTiers.set_quality("full", false)
+	assert_eq(TextureTiers.resolve(src), src, "Full quality resolves to the source")
+	TextureTiers.set_quality("half", false)
+	assert_eq(TextureTiers.resolve(src), "res://assets/tiers/half/player/pc_000/textures/pc_000_000.png", "Half quality resolves to the half tier")
+	TextureTiers.set_quality("quarter", false)
+	assert_eq(TextureTiers.resolve(src), "res://assets/tiers/quarter/player/pc_000/textures/pc_000_000.png", "Quarter quality resolves to the quarter tier")
+	assert_eq(TextureTiers.resolve("res://assets/enemies/ghowl/b_001.png"), "res://assets/tiers/half/enemies/ghowl/b_001.png", "Missing quarter tier falls back to half")
+	assert_eq(TextureTiers.resolve("res://assets/npcs/x.png"), "res://assets/npcs/x.png", "Texture without tiers resolves to the source")
+	TextureTiers.set_quality("ultra", false)
+	assert_eq(TextureTiers.quality, "quarter", "Unknown quality is ignored")
+
+	assert_true(not TextureTiers.load_manifest("user://missing_tiers_manifest.json"), "Missing manifest reports false")
+	assert_eq(TextureTiers.resolve(src), src, "No manifest resolves to the source")
+
+	# Restore
+	DirAccess.remove_absolute(ProjectSettings.globalize_path(path))
+	TextureTiers.load_manifest(TextureTiers.MANIFEST_PATH)
+	TextureTiers.set_quality(saved_quality, false)
+	print("")
+
+
+func test_asset_packs() -> void:
+	print("── Asset Packs ──")
+
+	# --- Synthetic manifest (build_asset_packs.py output format) ---
+	var manifest := {
+		"version": 1,
+		"packs": {
+			"shared": {"file": "shared.pck", "files": 2, "bytes": 100},
+			"area_valley": {"file": "area_valley.pck", "files": 500, "bytes": 1000},
+		},
+		"areas": {"gurhacia": ["shared", "area_valley"]},
+		"scenes": {"res://scenes/3d/city/city_warp.tscn": ["shared"]},
+		"field_scenes": ["res://scenes/3d/field/valley_field.tscn"],
+	}
+	var path := "user://test_asset_packs.json"
+	var f := FileAccess.open(path, FileAccess.WRITE)
+	f.store_string(JSON.stringify(manifest))
+	f.close()
+	assert_true(AssetPacks.load_manifest(path), "Pack manifest loads")
+
+	assert_eq(AssetPacks.packs_for_area("gurhacia"), ["shared", "area_valley"], "Area resolves to shared + its own pack")
+	assert_eq(AssetPacks.packs_for_area("unknown"), [], "Unknown area needs no packs")
+	assert_eq(AssetPacks.packs_for_scene("res://scenes/3d/field/valley_field.tscn", "gurhacia"), ["shared", "area_valley"], "Field scene uses the session area's packs")
+	assert_eq(AssetPacks.packs_for_scene("res://scenes/3d/city/city_warp.tscn"), ["shared"], "City scene uses its listed packs")
+	assert_eq(AssetPacks.packs_for_scene("res://scenes/2d/title.tscn"), [], "Startup scene needs no packs")
+	assert_true(not AssetPacks.is_loaded("area_valley"), "Packs start unloaded")
+
+	# Restore
+	DirAccess.remove_absolute(ProjectSettings.globalize_path(path))
+	AssetPacks.load_manifest(AssetPacks.MANIFEST_PATH)
+	print("")
+
+
 func test_field_config() -> void:
 	print("── Field Config ──")
 	var GridGen := preload("res://scripts/3d/field/grid_generator.gd")
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""Estimate texture memory per map, per area and per player variation.
+
+Only PNG IHDR headers are read (33 bytes per file; embedded GLB images are
+read at their bufferView offset), so the whole assets/ tree (~6,000
+headers) is scanned in well under a second.
+
+Attribution:
+  map        assets/environments/<area>/<map>.glb: its images (external
+             uri, the <map>_<i>.png Godot extracted, or the embedded PNG)
+  area       the union of its maps' textures, each counted once
+  player     assets/player/pc_XXX: per character (the one skin or atlas in
+             use) and the whole variation
+
+Memory is estimated as uncompressed RGBA8 (what Godot uploads for a
+non-VRAM-compressed texture, whatever the PNG's channel count) and with
+a full mip chain. Entries over the budget are flagged.
+
+Usage:
+    python3 scripts/tools/texture_budget.py
+    python3 scripts/tools/texture_budget.py --map-budget 8 --area-budget 48 --top 20
+    python3 scripts/tools/texture_budget.py --json build/texture_budget.json
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from glb_io import GlbError, read_glb_json
+from png_io import PngError, parse_png_header, read_png_header
+from tool_metrics import add_metrics_arguments, metrics_from_args
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+GODOT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, '..', '..'))
+ASSETS_DIR = os.path.join(GODOT_ROOT, 'assets')
+
+BYTES_PER_PIXEL = 4  # RGBA8 once uploaded
+
+# Budgets in MB (mipmapped)
+DEFAULT_MAP_BUDGET = 16.0
+DEFAULT_AREA_BUDGET = 64.0
+DEFAULT_PLAYER_BUDGET = 0.5
+
+
+def texture_memory(width: int, height: int) -> tuple[int, int]:
+    """(base level bytes, bytes with the full mip chain)."""
+    base = width * height * BYTES_PER_PIXEL
+    total = 0
+    while True:
+        total += width * height * BYTES_PER_PIXEL
+        if width == 1 and height == 1:
+            break
+        width, height = max(1, width // 2), max(1, height // 2)
+    return base, total
+
+
+class TextureIndex:
+    """Caches header lookups so shared textures are read once."""
+
+    def __init__(self):
+        self.sizes: dict[str, tuple[int, int] | None] = {}
+        self.missing: list[tuple[str, str]] = []
+        self.headers_read = 0
+
+    def file(self, path: str) -> tuple[int, int] | None:
+        if path not in self.sizes:
+            try:
+                header = read_png_header(path)
+                self.sizes[path] = (header['width'], header['height'])
+                self.headers_read += 1
+            except (OSError, PngError):
+                self.sizes[path] = None
+        return self.sizes[path]
+
+    def embedded(self, glb_path: str, bin_offset: int, view: dict, key: str) -> tuple[int, int] | None:
+        if key not in self.sizes:
+            self.sizes[key] = None
+            try:
+                with open(glb_path, 'rb') as f:
+                    f.seek(bin_offset + view.get('byteOffset', 0))
+                    header = parse_png_header(f.read(33))
+                self.sizes[key] = (header['width'], header['height'])
+                self.headers_read += 1
+            except (OSError, PngError):
+                pass
+        return self.sizes[key]
+
+
+def map_textures(glb_path: str, index: TextureIndex) -> dict[str, tuple[int, int]]:
+    """Texture key → (width, height) for one map GLB.
+
+    The config's textureFixes[].textureFile values are only keys the field
+    controller matches materials against, not files it loads, so they
+    aren't counted.
+    """
+    folder = os.path.dirname(glb_path)
+    stem = os.path.splitext(glb_path)[0]
+    textures = {}
+
+    def add(key, size, reference):
+        if size is None:
+            index.missing.append((os.path.relpath(glb_path, ASSETS_DIR), reference))
+        else:
+            textures[key] = size
+
+    try:
+        doc, bin_offset = read_glb_json(glb_path)
+    except (OSError, GlbError, ValueError) as e:
+        index.missing.append((os.path.relpath(glb_path, ASSETS_DIR), f"unreadable GLB: {e}"))
+        doc, bin_offset = {}, None
+    for i, image in enumerate(doc.get('images', [])):
+        if 'uri' in image:
+            path = os.path.join(folder, image['uri'])
+            add(path, index.file(path), image['uri'])
+            continue
+        extracted = f'{stem}_{i}.png'
+        if os.path.exists(extracted):
+            add(extracted, index.file(extracted), os.path.basename(extracted))
+        elif bin_offset is not None and 'bufferView' in image:
+            key = f'{glb_path}#image{i}'
+            add(key, index.embedded(glb_path, bin_offset, doc['bufferViews'][image['bufferView']], key),
+                f'embedded image {i}')
+    return textures
+
+
+def summarize(textures: dict[str, tuple[int, int]]) -> dict:
+    base = mip = 0
+    for width, height in textures.values():
+        b, m = texture_memory(width, height)
+        base += b
+        mip += m
+    return {'textures': len(textures), 'bytes': base, 'bytes_mipmapped': mip}
+
+
+def scan_environments(env_dir: str, index: TextureIndex, metrics=None) -> tuple[dict, dict]:
+    maps, areas = {}, {}
+    if not os.path.isdir(env_dir):
+        return maps, areas
+    for area in sorted(os.listdir(env_dir)):
+        area_dir = os.path.join(env_dir, area)
+        if not os.path.isdir(area_dir):
+            continue
+        area_textures = {}
+        for name in sorted(os.listdir(area_dir)):
+            if not name.endswith('.glb'):
+                continue
+            textures = map_textures(os.path.join(area_dir, name), index)
+            area_textures.update(textures)
+            maps[f'{area}/{name[:-4]}'] = summarize(textures)
+            if metrics:
+                metrics.file('environments', f'{area}/{name}', 0.0, status='scanned')
+        areas[area] = summarize(area_textures)
+        areas[area]['maps'] = sum(1 for key in maps if key.startswith(area + '/'))
+    return maps, areas
+
+
+def scan_players(player_dir: str, index: TextureIndex, metrics=None) -> dict:
+    players = {}
+    if not os.path.isdir(player_dir):
+        return players
+    for name in sorted(os.listdir(player_dir)):
+        var_dir = os.path.join(player_dir, name)
+        tex_dir = os.path.join(var_dir, 'textures')
+        if not os.path.isdir(tex_dir):
+            continue
+        textures = {}
+        for f in sorted(os.listdir(tex_dir)):
+            if f.endswith('.png'):
+                size = index.file(os.path.join(tex_dir, f))
+                if size:
+                    textures[os.path.join(tex_dir, f)] = size
+        in_use = textures
+        manifest_path = os.path.join(var_dir, f'{name}_atlas.json')
+        if os.path.exists(manifest_path):
+            with open(manifest_path) as fh:
+                atlases = json.load(fh).get('atlases', [])
+            atlas_sizes = {os.path.join(var_dir, a): index.file(os.path.join(var_dir, a)) for a in atlases}
+            in_use = {k: v for k, v in atlas_sizes.items() if v}
+        # A character shows one skin (or one atlas) at a time
+        largest = max(in_use.items(), key=lambda kv: kv[1][0] * kv[1][1], default=None)
+        row = summarize(textures)
+        per_char = summarize(dict([largest]) if largest else {})
+        row['atlased'] = in_use is not textures
+        row['per_character'] = per_char['bytes']
+        row['per_character_mipmapped'] = per_char['bytes_mipmapped']
+        players[name] = row
+        if metrics:
+            metrics.file('player', name, 0.0, status='scanned')
+    return players
+
+
+def flag(rows: dict, budget_mb: float, key: str = 'bytes_mipmapped') -> list[str]:
+    limit = budget_mb * 1024 * 1024
+    return [name for name, row in rows.items() if row[key] > limit]
+
+
+def _mb(size: int) -> str:
+    return f"{size / (1024 * 1024):.2f}"
+
+
+def print_table(title: str, rows: dict, over: list[str], top: int, key: str = 'bytes_mipmapped',
+                extra: tuple[str, str] | None = None):
+    ordered = sorted(rows.items(), key=lambda kv: kv[1][key], reverse=True)
+    shown = ordered[:top] if top > 0 else ordered
+    width = max([len(name) for name, _ in shown] + [len(title)])
+    heading = f"{title:<{width}} {'tex':>5} {'MB':>8} {'MB+mips':>8}"
+    if extra:
+        heading += f" {extra[1]:>9}"
+    print(heading)
+    for name, row in shown:
+        line = f"{name:<{width}} {row['textures']:>5} {_mb(row['bytes']):>8} {_mb(row['bytes_mipmapped']):>8}"
+        if extra:
+            line += f" {_mb(row[extra[0]]):>9}"
+        if name in over:
+            line += "  OVER BUDGET"
+        print(line)
+    if top > 0 and len(ordered) > top:
+        print(f"  ... {len(ordered) - top} more")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estimate texture memory per map, area and player variation")
+    parser.add_argument('--assets', default=ASSETS_DIR, help="assets/ directory")
+    parser.add_argument('--map-budget', type=float, default=DEFAULT_MAP_BUDGET, help="MB per map (with mips)")
+    parser.add_argument('--area-budget', type=float, default=DEFAULT_AREA_BUDGET, help="MB per area (with mips)")
+    parser.add_argument('--player-budget', type=float, default=DEFAULT_PLAYER_BUDGET,
+                        help="MB per character (with mips)")
+    parser.add_argument('--top', type=int, default=15, help="Rows shown per table (0 = all)")
+    parser.add_argument('--json', metavar='PATH', help="Write the full report as JSON")
+    parser.add_argument('--fail-over-budget', action='store_true', help="Exit 1 if anything is over budget")
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.assets):
+        print(f"ERROR: assets directory not found: {args.assets}")
+        sys.exit(1)
+
+    metrics = metrics_from_args('texture_budget', args)
+    index = TextureIndex()
+    with metrics.stage('environments'):
+        maps, areas = scan_environments(os.path.join(args.assets, 'environments'), index, metrics)
+    with metrics.stage('player'):
+        players = scan_players(os.path.join(args.assets, 'player'), index, metrics)
+
+    over_maps = flag(maps, args.map_budget)
+    over_areas = flag(areas, args.area_budget)
+    over_players = flag(players, args.player_budget, 'per_character_mipmapped')
+
+    print_table('map', maps, over_maps, args.top)
+    print_table('area', areas, over_areas, 0)
+    print_table('player', players, over_players, args.top, extra=('per_character_mipmapped', 'char+mips'))
+
+    missing: dict[str, list[str]] = {}
+    for where, reference in index.missing:
+        missing.setdefault(reference, []).append(where)
+    for reference, where in sorted(missing.items()):
+        more = f" (+{len(where) - 1} more)" if len(where) > 1 else ""
+        print(f"  MISSING {reference}: referenced by {where[0]}{more}")
+    print(f"{index.headers_read} PNG headers read; {len(maps)} maps, {len(areas)} areas, "
+          f"{len(players)} player variations; over budget: {len(over_maps)} maps "
+          f"(> {args.map_budget:g} MB), {len(over_areas)} areas (> {args.area_budget:g} MB), "
+          f"{len(over_players)} players (> {args.player_budget:g} MB)")
+
+    if args.json:
+        os.makedirs(os.path.dirname(os.path.abspath(args.json)), exist_ok=True)
+        report = {
+            'budgets_mb': {'map': args.map_budget, 'area': args.area_budget, 'player': args.player_budget},
+            'maps': maps, 'areas': areas, 'players': players,
+            'over_budget': {'maps': over_maps, 'areas': over_areas, 'players': over_players},
+            'missing': [{'map': m, 'reference': r} for m, r in index.missing],
+        }
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Report → {args.json}")
+    metrics.finish()
+    if args.fail_over_budget and (over_maps or over_areas or over_players):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
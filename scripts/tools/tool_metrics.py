@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""Per-stage timing and I/O metrics shared by the content and asset tools.
+
+A tool creates one Metrics, wraps each stage (a content category, a copy
+pass, ...) in `with metrics.stage(name):` and reports every file it handles
+with `metrics.file(...)`. finish() prints the summary (--profile) and/or
+writes the JSON report (--metrics-json); --cprofile DIR additionally dumps a
+cProfile .prof per stage.
+
+Per-file phase timings (e.g. parse / convert / db) are summed per stage so
+the report shows where the time goes, not just how much there was.
+
+Usage (as a module):
+    from tool_metrics import Metrics, add_metrics_arguments, metrics_from_args
+"""
+
+import cProfile
+import heapq
+import json
+import os
+import resource
+import sys
+import time
+from contextlib import contextmanager
+
+DEFAULT_SLOWEST = 10
+
+# Value-taking flags, for tools that parse sys.argv by hand
+VALUE_FLAGS = ('--metrics-json', '--cprofile', '--slowest')
+
+
+class StageMetrics:
+    __slots__ = ('name', 'wall_s', 'cpu_s', 'statuses', 'bytes_read', 'bytes_written',
+                 'phases', '_slowest', '_seq')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.wall_s = 0.0
+        self.cpu_s = 0.0
+        self.statuses: dict[str, int] = {}
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.phases: dict[str, float] = {}
+        self._slowest: list[tuple[float, int, str, int]] = []
+        self._seq = 0
+
+    def to_dict(self) -> dict:
+        slowest = sorted(self._slowest, reverse=True)
+        return {
+            'wall_s': round(self.wall_s, 6),
+            'cpu_s': round(self.cpu_s, 6),
+            'files': sum(self.statuses.values()),
+            'statuses': dict(sorted(self.statuses.items())),
+            'bytes_read': self.bytes_read,
+            'bytes_written': self.bytes_written,
+            'phases': {k: round(v, 6) for k, v in self.phases.items()},
+            'slowest': [{'path': path, 'seconds': round(sec, 6), 'bytes_read': size}
+                        for sec, _, path, size in slowest],
+        }
+
+
+class Metrics:
+    """Collects stage timings, file counts, bytes and the slowest files."""
+
+    def __init__(self, tool: str, summary: bool = False, json_path: str | None = None,
+                 profile_dir: str | None = None, slowest: int = DEFAULT_SLOWEST):
+        self.tool = tool
+        self.summary = summary
+        self.json_path = json_path
+        self.profile_dir = profile_dir
+        self.slowest = slowest
+        self.stages: dict[str, StageMetrics] = {}
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+
+    @property
+    def enabled(self) -> bool:
+        """True when anything will be reported; callers may skip extra stat() calls otherwise."""
+        return bool(self.summary or self.json_path or self.profile_dir)
+
+    def _stage(self, name: str) -> StageMetrics:
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = self.stages[name] = StageMetrics(name)
+        return stage
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time a block (accumulates if the same stage runs more than once)."""
+        stage = self._stage(name)
+        profiler = None
+        if self.profile_dir:
+            profiler = cProfile.Profile()
+            profiler.enable()
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield stage
+        finally:
+            stage.wall_s += time.perf_counter() - wall
+            stage.cpu_s += time.process_time() - cpu
+            if profiler:
+                profiler.disable()
+                os.makedirs(self.profile_dir, exist_ok=True)
+                profiler.dump_stats(os.path.join(self.profile_dir, f'{self.tool}.{name}.prof'))
+
+    def file(self, stage: str, path: str, seconds: float, read: int = 0, written: int = 0,
+             status: str = 'written', phases: dict[str, float] | None = None):
+        """Record one handled file. status: written, changed, unchanged, skipped, failed..."""
+        st = self._stage(stage)
+        st.statuses[status] = st.statuses.get(status, 0) + 1
+        st.bytes_read += read
+        st.bytes_written += written
+        if phases:
+            for key, value in phases.items():
+                st.phases[key] = st.phases.get(key, 0.0) + value
+        if self.slowest > 0:
+            st._seq += 1
+            entry = (seconds, st._seq, path, read)
+            if len(st._slowest) < self.slowest:
+                heapq.heappush(st._slowest, entry)
+            elif seconds > st._slowest[0][0]:
+                heapq.heapreplace(st._slowest, entry)
+
+    def report(self) -> dict:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        rss = usage.ru_maxrss if sys.platform == 'darwin' else usage.ru_maxrss * 1024
+        stages = {name: st.to_dict() for name, st in self.stages.items()}
+        return {
+            'tool': self.tool,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'wall_s': round(time.perf_counter() - self._wall_start, 6),
+            'cpu_s': round(time.process_time() - self._cpu_start, 6),
+            'peak_rss_mb': round(rss / (1024 * 1024), 1),
+            'files': sum(s['files'] for s in stages.values()),
+            'bytes_read': sum(s['bytes_read'] for s in stages.values()),
+            'bytes_written': sum(s['bytes_written'] for s in stages.values()),
+            'stages': stages,
+        }
+
+    def print_summary(self, report: dict):
+        print(f"\nProfile ({self.tool}): {report['wall_s']:.3f}s wall, {report['cpu_s']:.3f}s CPU, "
+              f"{report['peak_rss_mb']:.1f} MB peak RSS")
+        for name, st in report['stages'].items():
+            counts = ', '.join(f"{k} {v}" for k, v in st['statuses'].items()) or 'no files'
+            print(f"  {name:<22} {st['wall_s'] * 1000:9.1f} ms wall {st['cpu_s'] * 1000:9.1f} ms CPU  "
+                  f"{st['bytes_read'] / 1024:9.1f} KB in {st['bytes_written'] / 1024:9.1f} KB out  ({counts})")
+            if st['phases']:
+                print('      ' + '  '.join(f"{k} {v * 1000:.1f} ms" for k, v in st['phases'].items()))
+            for entry in st['slowest'][:3]:
+                print(f"      {entry['seconds'] * 1000:8.2f} ms  {entry['path']}")
+
+    def finish(self) -> dict | None:
+        """Print and/or write the report as requested; returns it (None if disabled)."""
+        if self.profile_dir:
+            print(f"cProfile dumps → {self.profile_dir}")
+        if not (self.summary or self.json_path):
+            return None
+        report = self.report()
+        if self.summary:
+            self.print_summary(report)
+        if self.json_path:
+            os.makedirs(os.path.dirname(os.path.abspath(self.json_path)), exist_ok=True)
+            with open(self.json_path, 'w') as f:
+                json.dump(report, f, indent=2)
+            print(f"Metrics → {self.json_path}")
+        return report
+
+
+def add_metrics_arguments(parser):
+    """Add --profile / --metrics-json / --cprofile / --slowest to an argparse parser."""
+    group = parser.add_argument_group('metrics')
+    group.add_argument('--profile', action='store_true', help="Print per-stage timings and slowest files")
+    group.add_argument('--metrics-json', metavar='PATH', help="Write the metrics report as JSON")
+    group.add_argument('--cprofile', metavar='DIR', help="Dump a cProfile .prof per stage into DIR")
+    group.add_argument('--slowest', type=int, default=DEFAULT_SLOWEST, help="Slowest files kept per stage")
+
+
+def metrics_from_args(tool: str, args) -> Metrics:
+    return Metrics(tool, summary=args.profile, json_path=args.metrics_json,
+                   profile_dir=args.cprofile, slowest=args.slowest)
+
+
+def metrics_from_options(tool: str, argv: list[str], options: dict) -> Metrics:
+    """For hand-parsed CLIs: `options` holds the VALUE_FLAGS values found in argv."""
+    return Metrics(tool, summary='--profile' in argv, json_path=options.get('--metrics-json'),
+                   profile_dir=options.get('--cprofile'),
+                   slowest=int(options.get('--slowest', DEFAULT_SLOWEST)))
+
+
+def dir_bytes(path: str) -> int:
+    """Total size of the regular files directly under `path`."""
+    total = 0
+    if os.path.isdir(path):
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    total += entry.stat().st_size
+    return total
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Read property values back out of the text .tres files our importers write.
+
+Only covers the Variant literals that show up in data/: dicts, arrays,
+strings, numbers, booleans and constructor calls like PackedStringArray(...)
+or ExtResource("1"). Packed arrays and vectors come back as plain lists.
+
+Usage (as a module):
+    from tres_reader import read_tres
+    props = read_tres('data/drop_tables/normal.tres')
+"""
+
+import re
+
+_KEY_RE = re.compile(r'^([A-Za-z_][A-Za-z0-9_/]*)\s*=\s*', re.MULTILINE)
+_NUMBER_RE = re.compile(r'-?(?:\d+\.?\d*(?:e[-+]?\d+)?|inf|nan)', re.IGNORECASE)
+_IDENT_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', '"': '"', '\\': '\\'}
+
+
+class TresParseError(ValueError):
+    pass
+
+
+class _Parser:
+    def __init__(self, text: str, pos: int = 0):
+        self.text = text
+        self.pos = pos
+
+    def skip_ws(self):
+        text = self.text
+        while self.pos < len(text) and text[self.pos] in ' \t\r\n':
+            self.pos += 1
+
+    def peek(self) -> str:
+        self.skip_ws()
+        return self.text[self.pos] if self.pos < len(self.text) else ''
+
+    def expect(self, ch: str):
+        if self.peek() != ch:
+            raise TresParseError(f"expected '{ch}' at offset {self.pos}")
+        self.pos += 1
+
+    def value(self):
+        ch = self.peek()
+        if ch == '{':
+            return self.dictionary()
+        if ch == '[':
+            return self.array()
+        if ch == '"':
+            return self.string()
+        if ch in ('&', '^') and self.text[self.pos + 1:self.pos + 2] == '"':
+            # StringName / NodePath literals
+            self.pos += 1
+            return self.string()
+        m = _NUMBER_RE.match(self.text, self.pos)
+        if m and (ch.isdigit() or ch == '-'):
+            self.pos = m.end()
+            raw = m.group(0)
+            if re.fullmatch(r'-?\d+', raw):
+                return int(raw)
+            return float(raw)
+        m = _IDENT_RE.match(self.text, self.pos)
+        if not m:
+            raise TresParseError(f"unexpected character {ch!r} at offset {self.pos}")
+        self.pos = m.end()
+        ident = m.group(0)
+        if ident == 'true':
+            return True
+        if ident == 'false':
+            return False
+        if ident == 'null':
+            return None
+        if self.peek() == '(':
+            return self.constructor(ident)
+        return ident
+
+    def string(self) -> str:
+        self.expect('"')
+        text = self.text
+        out = []
+        while True:
+            if self.pos >= len(text):
+                raise TresParseError("unterminated string")
+            ch = text[self.pos]
+            if ch == '\\':
+                nxt = text[self.pos + 1:self.pos + 2]
+                out.append(_ESCAPES.get(nxt, nxt))
+                self.pos += 2
+                continue
+            self.pos += 1
+            if ch == '"':
+                return ''.join(out)
+            out.append(ch)
+
+    def dictionary(self) -> dict:
+        self.expect('{')
+        result = {}
+        while self.peek() != '}':
+            key = self.value()
+            self.expect(':')
+            result[key if not isinstance(key, list) else tuple(key)] = self.value()
+            if self.peek() == ',':
+                self.pos += 1
+        self.pos += 1
+        return result
+
+    def array(self) -> list:
+        self.expect('[')
+        result = []
+        while self.peek() != ']':
+            result.append(self.value())
+            if self.peek() == ',':
+                self.pos += 1
+        self.pos += 1
+        return result
+
+    def constructor(self, name: str):
+        self.expect('(')
+        args = []
+        while self.peek() != ')':
+            args.append(self.value())
+            if self.peek() == ',':
+                self.pos += 1
+        self.pos += 1
+        if name in ('ExtResource', 'SubResource'):
+            return {'type': name, 'id': args[0] if args else ''}
+        return args
+
+
+def parse_value(text: str):
+    """Parse a single Variant literal."""
+    return _Parser(text).value()
+
+
+def parse_properties(text: str) -> dict:
+    """Parse `key = value` lines (values may span lines) into a dict."""
+    props = {}
+    pos = 0
+    while True:
+        m = _KEY_RE.search(text, pos)
+        if not m:
+            break
+        parser = _Parser(text, m.end())
+        props[m.group(1)] = parser.value()
+        pos = parser.pos
+    return props
+
+
+def read_tres(path: str) -> dict:
+    """Return the [resource] section properties of a .tres file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    marker = text.find('[resource]')
+    if marker < 0:
+        return {}
+    return parse_properties(text[marker + len('[resource]'):])
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""Build the mission / quest unlock graph as ordered prerequisite bitsets.
+
+Missions list the missions they require (`requires`) and quest definitions
+list prerequisite quests (`requirements.prerequisiteQuests`). This builds
+one DAG per kind from the converted resources under data/, reports cycles
+and references to ids that don't exist, and writes
+
+  data/unlock_graph.tres   (UnlockGraph)
+    graphs = { "missions" | "quests": {
+      "order":      PackedStringArray   ids in topological order; bit i = order[i]
+      "words":      int                 64-bit words per mask
+      "direct":     PackedInt64Array    words per id: its own prerequisites
+      "transitive": PackedInt64Array    words per id: every prerequisite upstream
+    } }
+
+so a game-side availability check is a mask comparison against the
+player's completed set instead of walking string references. Dangling
+references are left out of the masks; ids on a cycle go last in the order
+and require each other, so they never unlock.
+
+Runs as a content_pipeline.py stage (problems are reported as import
+errors) and standalone, where it exits 1 on any problem. The stage keeps an
+UnlockGraphBuilder across watch-mode updates, so a changed mission or quest
+only replaces its own edges and the file is rewritten only when the graph
+changed.
+
+Usage:
+    python3 scripts/tools/unlock_graph.py
+    python3 scripts/tools/unlock_graph.py --data /tmp/data
+"""
+
+import argparse
+import heapq
+import os
+import sys
+
+from tres_reader import TresParseError, read_tres
+from tool_metrics import add_metrics_arguments, metrics_from_args
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+GODOT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, '..', '..'))
+DATA_DIR = os.path.join(GODOT_ROOT, 'data')
+OUTPUT_NAME = 'unlock_graph.tres'
+WORD_BITS = 64
+
+
+def mission_requires(rec: dict) -> list[str]:
+    return list(rec.get('requires', []))
+
+
+def quest_requires(rec: dict) -> tuple[str, list[str]]:
+    """(quest id, prerequisite quest ids) of a quest definition."""
+    requirements = rec.get('requirements') or {}
+    return rec.get('quest_id') or rec['id'], list(requirements.get('prerequisiteQuests') or [])
+
+
+def _read_dir(path: str) -> list[dict]:
+    records = []
+    if not os.path.isdir(path):
+        return records
+    for fname in sorted(os.listdir(path)):
+        if not fname.endswith('.tres'):
+            continue
+        try:
+            rec = read_tres(os.path.join(path, fname))
+        except (OSError, TresParseError) as e:
+            print(f"  Skipping {fname}: {e}")
+            continue
+        if rec.get('id'):
+            records.append(rec)
+    return records
+
+
+class UnlockGraph:
+    """Prerequisite DAG for one kind of content; `problems` lists what's wrong."""
+
+    def __init__(self, kind: str, requires: dict[str, list[str]]):
+        self.kind = kind
+        self.problems: list[str] = []
+        self.requires: dict[str, list[str]] = {}
+        for node_id, reqs in sorted(requires.items()):
+            kept = []
+            for req in reqs:
+                if req not in requires:
+                    self.problems.append(f"{kind} '{node_id}' requires unknown '{req}'")
+                elif req not in kept:
+                    kept.append(req)
+            self.requires[node_id] = kept
+        self.order = self._topological_order()
+        self.index = {node_id: i for i, node_id in enumerate(self.order)}
+        self.words = max(1, -(-len(self.order) // WORD_BITS))
+
+    def _topological_order(self) -> list[str]:
+        """Kahn's algorithm, alphabetical among ready ids; cycle members go last."""
+        dependents: dict[str, list[str]] = {n: [] for n in self.requires}
+        pending = {}
+        for node_id, reqs in self.requires.items():
+            pending[node_id] = len(reqs)
+            for req in reqs:
+                dependents[req].append(node_id)
+        ready = [n for n, count in pending.items() if count == 0]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            node_id = heapq.heappop(ready)
+            order.append(node_id)
+            for dep in dependents[node_id]:
+                pending[dep] -= 1
+                if pending[dep] == 0:
+                    heapq.heappush(ready, dep)
+        stuck = sorted(n for n in self.requires if n not in set(order))
+        if stuck:
+            self.problems.append(f"{self.kind} cycle among: {', '.join(stuck)}")
+        return order + stuck
+
+    def _mask(self, ids) -> int:
+        mask = 0
+        for node_id in ids:
+            mask |= 1 << self.index[node_id]
+        return mask
+
+    def direct_masks(self) -> list[int]:
+        return [self._mask(self.requires[n]) for n in self.order]
+
+    def transitive_masks(self) -> list[int]:
+        """Union of prerequisites' own masks, in topological order (iterated
+        to a fixed point so ids on a cycle end up requiring each other)."""
+        masks = {n: self._mask(self.requires[n]) for n in self.order}
+        changed = True
+        while changed:
+            changed = False
+            for node_id in self.order:
+                mask = masks[node_id]
+                for req in self.requires[node_id]:
+                    mask |= masks[req]
+                if mask != masks[node_id]:
+                    masks[node_id] = mask
+                    changed = True
+        return [masks[n] for n in self.order]
+
+    def split_words(self, masks: list[int]) -> list[int]:
+        """Each mask as `words` signed 64-bit ints, low word first."""
+        out = []
+        for mask in masks:
+            for w in range(self.words):
+                word = (mask >> (w * WORD_BITS)) & ((1 << WORD_BITS) - 1)
+                out.append(word - (1 << WORD_BITS) if word >= 1 << (WORD_BITS - 1) else word)
+        return out
+
+
+def _format_graph(graph: UnlockGraph) -> str:
+    def packed_ints(values):
+        return 'PackedInt64Array(%s)' % ', '.join(map(str, values))
+
+    order = ', '.join(f'"{n}"' for n in graph.order)
+    return (f'  "{graph.kind}": {{\n'
+            f'    "order": PackedStringArray({order}),\n'
+            f'    "words": {graph.words},\n'
+            f'    "direct": {packed_ints(graph.split_words(graph.direct_masks()))},\n'
+            f'    "transitive": {packed_ints(graph.split_words(graph.transitive_masks()))}\n'
+            f'  }}')
+
+
+class UnlockGraphBuilder:
+    """Mission and quest prerequisites by content id, updated one record at a time."""
+
+    def __init__(self):
+        self.missions: dict[str, list[str]] = {}
+        self.quests: dict[str, tuple[str, list[str]]] = {}
+        self._written = None
+
+    def update_mission(self, mission_id: str, mission: dict | None):
+        """Replace one mission's requirements (its converted .tres); None removes it."""
+        if mission is None:
+            self.missions.pop(mission_id, None)
+        else:
+            self.missions[mission_id] = mission_requires(mission)
+
+    def update_quest(self, content_id: str, quest: dict | None):
+        """Replace one quest definition's prerequisites; None removes it."""
+        if quest is None:
+            self.quests.pop(content_id, None)
+        else:
+            self.quests[content_id] = quest_requires(quest)
+
+    def write(self, data_dir: str) -> list[UnlockGraph]:
+        """Write data_dir/unlock_graph.tres if it changed and return the graphs
+        (with problems)."""
+        quests = dict(self.quests[content_id] for content_id in sorted(self.quests))
+        graphs = [UnlockGraph('missions', self.missions), UnlockGraph('quests', quests)]
+        body = ',\n'.join(_format_graph(g) for g in graphs)
+        text = f'''[gd_resource type="Resource" script_class="UnlockGraph" load_steps=2 format=3]
+
+[ext_resource type="Script" path="res://scripts/resources/unlock_graph.gd" id="1"]
+
+[resource]
+script = ExtResource("1")
+graphs = {{
+{body}
+}}
+'''
+        path = os.path.join(data_dir, OUTPUT_NAME)
+        if text != self._written or not os.path.exists(path):
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            self._written = text
+        for graph in graphs:
+            for problem in graph.problems:
+                print(f"  Unlock graph: {problem}")
+        return graphs
+
+
+def build_unlock_graph(data_dir: str = DATA_DIR) -> list[UnlockGraph]:
+    """Write data_dir/unlock_graph.tres and return the graphs (with problems)."""
+    builder = UnlockGraphBuilder()
+    for rec in _read_dir(os.path.join(data_dir, 'missions')):
+        builder.update_mission(rec['id'], rec)
+    for rec in _read_dir(os.path.join(data_dir, 'quest_definitions')):
+        builder.update_quest(rec['id'], rec)
+    return builder.write(data_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the mission/quest unlock graph")
+    parser.add_argument('--data', default=DATA_DIR, help="Generated data/ directory")
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.data):
+        print(f"ERROR: data directory not found: {args.data}")
+        sys.exit(1)
+
+    metrics = metrics_from_args('unlock_graph', args)
+    with metrics.stage('unlock_graph'):
+        graphs = build_unlock_graph(args.data)
+    for graph in graphs:
+        edges = sum(len(r) for r in graph.requires.values())
+        print(f"Unlock graph: {graph.kind}: {len(graph.order)} ids, {edges} edges, "
+              f"{len(graph.problems)} problems")
+    metrics.finish()
+    if any(graph.problems for graph in graphs):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,15 +2,29 @@
 """
 Convert psz-sketch JSON data to Godot .tres resource files.
 
+Holds the weapon, armor and enemy converters. Scanning and dispatch live in
+scripts/tools/content_pipeline.py, which this CLI runs for these categories.
+Records are also mirrored into the SQLite content store (see
+scripts/tools/content_db.py); pass --no-db to skip it.
+
 Usage:
     python convert_psz_data.py --source /path/to/psz-sketch/src/content --output /path/to/psz-godot/data
+    python convert_psz_data.py ... --profile --metrics-json metrics.json
 """
 
 import json
 import os
+import re
+import sys
 import argparse
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts" / "tools"))
+
+from string_table import table_for, text_field  # noqa: E402
+from tool_metrics import add_metrics_arguments, metrics_from_args  # noqa: E402
+from tres_reader import TresParseError, read_tres  # noqa: E402
+
 
 # Weapon type mapping from string to enum index
 WEAPON_TYPE_MAP = {
@@ -48,6 +62,60 @@ ELEMENT_MAP = {
     "Dark": 3,
 }
 
+# Enemy location display names → EnemySpawner area ids
+SPAWN_AREA_MAP = {
+    "Gurhacia Valley": "gurhacia",
+    "Rioh Snowfield": "rioh",
+    "Ozette Wetland": "ozette",
+    "Ozette Wetlands": "ozette",
+    "Oblivion City Paru": "paru",
+    "Makara Ruins": "makara",
+    "Arca Plant": "arca",
+    "Dark Shrine": "dark",
+}
+
+SPAWN_TIERS = ["common", "uncommon", "rare", "bosses", "elites"]
+
+# Spawn tiers the source data can't express. isRare/isBoss only give us
+# rare/bosses, so uncommon and elite picks are kept here (keyed by file stem).
+SPAWN_TIER_OVERRIDES = {
+    "garahadan": ["uncommon"],
+    "grimble": ["uncommon"],
+    "tormatible": ["uncommon"],
+    "helion": ["elites"],
+    "usanimere": ["common"],
+    "stagg": ["uncommon"],
+    "hildeghana": ["uncommon"],
+    "hildegigas": ["rare", "elites"],
+    "hildegao": ["bosses"],
+    "vespao": ["uncommon"],
+    "pelcatraz": ["uncommon"],
+    "pelcatobur": ["rare", "elites"],
+    "goldix": ["uncommon"],
+    "azherowa-b2": ["uncommon"],
+    "froutang": ["uncommon", "elites"],
+    "frunaked": ["rare", "bosses"],
+    "kapantha": ["uncommon"],
+    "rohjade": ["uncommon", "elites"],
+    "rohcrysta": ["rare", "bosses"],
+    "akorse": ["common", "elites"],
+    "finjer-g": ["uncommon"],
+    "finjer-b": ["uncommon"],
+    "euladaveil": ["uncommon"],
+    "arkzein": ["uncommon"],
+    "arkzein-r": ["uncommon", "elites"],
+    "derreo": ["rare", "elites"],
+}
+
+# Area tiers kept as they were before pools were derived. The content puts
+# Blade Mother in Eternal Tower and Chaos & Mobius in Paru, and marks
+# Humilias and Mother Trinity as bosses, which per-enemy overrides can't undo.
+SPAWN_POOL_PINS = {
+    ("arca", "bosses"): ["blade-mother"],
+    ("paru", "bosses"): ["frunaked"],
+    ("dark", "bosses"): ["dark-falz", "chaos-mobius"],
+}
+
 
 def sanitize_id(name: str) -> str:
     """Convert name to valid ID (lowercase, underscores)."""
@@ -61,33 +129,147 @@ def escape_string(s: str) -> str:
     return s.replace("\\", "\\\\").replace('"', '\\"')
 
 
-def convert_weapon(json_path: Path, output_dir: Path):
-    """Convert a weapon JSON to .tres format."""
+def read_json(json_path: Path) -> dict:
     with open(json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    weapon_id = sanitize_id(json_path.stem)
-    weapon_type = WEAPON_TYPE_MAP.get(data.get("weaponType", "Saber"), 0)
-
-    # Build photon arts array
-    photon_arts = data.get("photonArts", [])
-    pa_str = "[]"
-    if photon_arts:
+        return json.load(f)
+
+
+def art_slug(name: str) -> str:
+    """Photon art id as written by import_content.convert_photon_art."""
+    return re.sub(r'[^a-z0-9]+', '_', name.lower()).strip('_')
+
+
+_ART_CATALOG: dict[str, tuple[tuple, dict]] = {}
+
+
+def load_art_catalog(output_dir: Path) -> dict:
+    """Photon arts already converted to output_dir/photon_arts, keyed by id.
+
+    Cached per directory and re-read when any file in it changes (watch mode).
+    Names are resolved from the string table into each art's "name".
+    """
+    arts_dir = output_dir / "photon_arts"
+    if not arts_dir.is_dir():
+        return {}
+    files = sorted(p for p in arts_dir.iterdir() if p.suffix == ".tres")
+    signature = tuple((p.name, p.stat().st_mtime_ns) for p in files)
+    cached = _ART_CATALOG.get(str(arts_dir))
+    if cached and cached[0] == signature:
+        return cached[1]
+    catalog = {}
+    strings = table_for(str(output_dir))
+    for p in files:
+        try:
+            art = read_tres(str(p))
+        except (OSError, TresParseError):
+            continue
+        if art.get("id"):
+            art["name"] = text_field(strings, art)
+            catalog[art["id"]] = art
+    _ART_CATALOG[str(arts_dir)] = (signature, catalog)
+    return catalog
+
+
+def resolve_photon_arts(arts: list, catalog: dict) -> tuple[list, dict, list]:
+    """Split a weapon's inline photonArts into catalog references.
+
+    Returns (art ids, {art id: {field: value}} for values that differ from the
+    catalog, inline dicts for arts the catalog doesn't have). Inline dicts
+    carry their "slot" in the source list so the original order survives.
+    """
+    ids, overrides, inline = [], {}, []
+    for slot, pa in enumerate(arts):
+        art = catalog.get(art_slug(pa.get("name", "")))
+        if art is None:
+            inline.append({**pa, "slot": slot})
+            continue
+        ids.append(art["id"])
+        changed = {}
+        for field, key in (("attack_mod", "attackMod"), ("accuracy_mod", "accuracyMod"), ("pp_cost", "ppUsed")):
+            if key in pa and float(pa[key] or 0) != float(art.get(field, 0)):
+                changed[field] = pa[key]
+        if pa.get("element", "-") != "-":
+            changed["element"] = pa["element"]
+        if changed:
+            overrides[art["id"]] = changed
+    return ids, overrides, inline
+
+
+def inline_photon_arts(ids: list, overrides: dict, catalog: dict, inline: list = ()) -> list:
+    """Inverse of resolve_photon_arts: source-style photonArts dicts for
+    catalog references (ids the catalog doesn't have are skipped), with the
+    .tres-style inline arts put back at their slots."""
+    arts = []
+    for art_id in ids:
+        art = catalog.get(art_id)
+        if art is None:
+            continue
+        changed = overrides.get(art_id, {})
+        arts.append({
+            "name": art.get("name", ""),
+            "attackMod": changed.get("attack_mod", art.get("attack_mod", 0)),
+            "accuracyMod": changed.get("accuracy_mod", art.get("accuracy_mod", 0)),
+            "ppUsed": changed.get("pp_cost", art.get("pp_cost", 0)),
+            "element": changed.get("element", "-"),
+        })
+    for pa in sorted(inline, key=lambda pa: pa.get("slot", len(arts))):
+        arts.insert(min(pa.get("slot", len(arts)), len(arts)), {
+            "name": pa.get("name", ""),
+            "attackMod": pa.get("attack_mod", 0),
+            "accuracyMod": pa.get("accuracy_mod", 0),
+            "ppUsed": pa.get("pp_used", 0),
+            "element": pa.get("element", ""),
+        })
+    return arts
+
+
+def format_photon_arts(ids: list, overrides: dict, inline: list) -> str:
+    """The photon_art_ids / photon_art_overrides (and, for arts the catalog
+    lacks, photon_arts) .tres lines."""
+    id_str = "PackedStringArray(" + ", ".join(f'"{i}"' for i in ids) + ")"
+    override_str = "{}"
+    if overrides:
+        override_str = "{" + ", ".join(
+            f'"{art_id}": {{' + ", ".join(
+                f'"{k}": "{escape_string(v)}"' if isinstance(v, str) else f'"{k}": {v}'
+                for k, v in changed.items()) + "}"
+            for art_id, changed in overrides.items()) + "}"
+    lines = (f"photon_art_ids = {id_str}\n"
+             f"photon_art_overrides = {override_str}")
+    # photon_arts only holds arts the catalog lacks; WeaponData defaults it to []
+    if inline:
         pa_items = []
-        for pa in photon_arts:
+        for pa in inline:
             pa_items.append(
                 f'{{"name": "{escape_string(pa.get("name", ""))}", '
                 f'"attack_mod": {pa.get("attackMod", 0)}, '
                 f'"accuracy_mod": {pa.get("accuracyMod", 0)}, '
                 f'"pp_used": {pa.get("ppUsed", 0)}, '
-                f'"element": "{escape_string(pa.get("element", "-"))}"}}'
+                f'"element": "{escape_string(pa.get("element", "-"))}", '
+                f'"slot": {pa["slot"]}}}'
             )
-        pa_str = "[" + ", ".join(pa_items) + "]"
+        lines += "\nphoton_arts = [" + ", ".join(pa_items) + "]"
+    return lines
+
+
+def convert_weapon(json_path: Path, output_dir: Path, data: dict | None = None):
+    """Convert a weapon JSON to .tres format."""
+    if data is None:
+        data = read_json(json_path)
+
+    weapon_id = sanitize_id(json_path.stem)
+    weapon_type = WEAPON_TYPE_MAP.get(data.get("weaponType", "Saber"), 0)
+
+    # Photon arts: references into data/photon_arts plus per-weapon overrides;
+    # only arts missing from that catalog stay inline
+    pa_str = format_photon_arts(*resolve_photon_arts(data.get("photonArts", []),
+                                                     load_art_catalog(output_dir)))
 
     # Build usable_by array
     usable_by = data.get("usableBy", [])
     usable_str = "PackedStringArray(" + ", ".join(f'"{u}"' for u in usable_by) + ")"
 
+    strings = table_for(str(output_dir))
     tres_content = f'''[gd_resource type="Resource" script_class="WeaponData" load_steps=2 format=3]
 
 [ext_resource type="Script" path="res://scripts/resources/weapon_data.gd" id="1"]
@@ -95,8 +277,7 @@ def convert_weapon(json_path: Path, output_dir: Path):
 [resource]
 script = ExtResource("1")
 id = "{weapon_id}"
-name = "{escape_string(data.get("name", ""))}"
-japanese_name = "{escape_string(data.get("japaneseName", ""))}"
+name_id = {strings.intern(data.get("name", ""), data.get("japaneseName", ""))}
 rarity = {data.get("rarity", 1)}
 weapon_type = {weapon_type}
 max_grind = {data.get("maxGrind", 0)}
@@ -108,7 +289,7 @@ accuracy_base = {data.get("accuracyBase", 0)}
 accuracy_max = {data.get("accuracyMax", 0)}
 element = "{escape_string(data.get("element", ""))}"
 element_level = {data.get("elementLevel", 0) or 0}
-photon_arts = {pa_str}
+{pa_str}
 usable_by = {usable_str}
 pso_world_id = {data.get("psoWorldId", 0)}
 model_id = "{escape_string(data.get("modelId", ""))}"
@@ -124,10 +305,10 @@ variant_id = "{escape_string(data.get("variantId", "") or "")}"
     return weapon_id
 
 
-def convert_armor(json_path: Path, output_dir: Path):
+def convert_armor(json_path: Path, output_dir: Path, data: dict | None = None):
     """Convert an armor JSON to .tres format."""
-    with open(json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    if data is None:
+        data = read_json(json_path)
 
     armor_id = sanitize_id(json_path.stem)
     armor_type = ARMOR_TYPE_MAP.get(data.get("type", "Armor"), 0)
@@ -139,6 +320,7 @@ def convert_armor(json_path: Path, output_dir: Path):
     usable_by = data.get("usableBy", [])
     usable_str = "PackedStringArray(" + ", ".join(f'"{u}"' for u in usable_by) + ")"
 
+    strings = table_for(str(output_dir))
     tres_content = f'''[gd_resource type="Resource" script_class="ArmorData" load_steps=2 format=3]
 
 [ext_resource type="Script" path="res://scripts/resources/armor_data.gd" id="1"]
@@ -146,8 +328,7 @@ def convert_armor(json_path: Path, output_dir: Path):
 [resource]
 script = ExtResource("1")
 id = "{armor_id}"
-name = "{escape_string(data.get("name", ""))}"
-japanese_name = "{escape_string(data.get("japaneseName", ""))}"
+name_id = {strings.intern(data.get("name", ""), data.get("japaneseName", ""))}
 type = {armor_type}
 rarity = {data.get("rarity", 1)}
 max_grind = {data.get("maxGrind", 0)}
@@ -177,10 +358,10 @@ pso_world_id = {data.get("psoWorldId", 0)}
     return armor_id
 
 
-def convert_enemy(json_path: Path, output_dir: Path):
+def convert_enemy(json_path: Path, output_dir: Path, data: dict | None = None):
     """Convert an enemy JSON to .tres format."""
-    with open(json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    if data is None:
+        data = read_json(json_path)
 
     enemy_id = sanitize_id(json_path.stem)
     element = ELEMENT_MAP.get(data.get("element", "Native"), 0)
@@ -219,6 +400,7 @@ def convert_enemy(json_path: Path, output_dir: Path):
 
     behavior = 5 if is_boss else 0  # BOSS or MELEE
 
+    strings = table_for(str(output_dir))
     tres_content = f'''[gd_resource type="Resource" script_class="EnemyData" load_steps=2 format=3]
 
 [ext_resource type="Script" path="res://scripts/resources/enemy_data.gd" id="1"]
@@ -226,8 +408,7 @@ def convert_enemy(json_path: Path, output_dir: Path):
 [resource]
 script = ExtResource("1")
 id = "{enemy_id}"
-name = "{escape_string(data.get("name", ""))}"
-japanese_name = "{escape_string(data.get("japaneseName", ""))}"
+name_id = {strings.intern(data.get("name", ""), data.get("japaneseName", ""))}
 element = {element}
 locations = {locations_str}
 is_rare = {str(is_rare).lower()}
@@ -257,51 +438,114 @@ collision_height = 1.5
     return enemy_id
 
 
+def build_spawn_pools(enemies: dict, output_dir: Path):
+    """Derive per-area spawn pools from enemy locations.
+
+    `enemies` maps each enemy's source file stem to its parsed JSON. Tiers in
+    SPAWN_POOL_PINS replace the derived ones. Each tier stores enemy ids
+    alongside a cumulative weight array so the spawner can pick with a binary
+    search instead of rebuilding lists. Enemy names are string table ids.
+    """
+    strings = table_for(str(output_dir))
+    pools = {}
+    names = {}
+    for enemy_id in sorted(enemies):
+        data = enemies[enemy_id]
+        if enemy_id in SPAWN_TIER_OVERRIDES:
+            tiers = SPAWN_TIER_OVERRIDES[enemy_id]
+        elif data.get("isBoss", False):
+            tiers = ["bosses"]
+        elif data.get("isRare", False):
+            tiers = ["rare"]
+        else:
+            tiers = ["common"]
+
+        weight = max(int(data.get("spawnWeight", 1) or 1), 1)
+        names[enemy_id] = strings.intern(data.get("name", ""), data.get("japaneseName", ""))
+        for loc in data.get("locations", []):
+            area_id = SPAWN_AREA_MAP.get(loc)
+            if not area_id:
+                continue
+            area = pools.setdefault(area_id, {})
+            for tier in tiers:
+                area.setdefault(tier, []).append((enemy_id, weight))
+
+    for (area_id, tier), pinned in SPAWN_POOL_PINS.items():
+        pools.setdefault(area_id, {})[tier] = [
+            (enemy_id, max(int(enemies.get(enemy_id, {}).get("spawnWeight", 1) or 1), 1))
+            for enemy_id in pinned
+        ]
+
+    area_items = []
+    for area_id in sorted(pools):
+        tier_items = []
+        for tier in SPAWN_TIERS:
+            entries = pools[area_id].get(tier, [])
+            if not entries:
+                continue
+            cumulative = []
+            total = 0
+            for _, weight in entries:
+                total += weight
+                cumulative.append(str(total))
+            ids = ", ".join(f'"{enemy_id}"' for enemy_id, _ in entries)
+            tier_items.append(
+                f'    "{tier}": {{\n'
+                f'      "ids": PackedStringArray({ids}),\n'
+                f'      "cumulative": PackedInt32Array({", ".join(cumulative)})\n'
+                f'    }}'
+            )
+        area_items.append(f'  "{area_id}": {{\n' + ",\n".join(tier_items) + "\n  }")
+
+    pools_str = ",\n".join(area_items)
+    names_str = ",\n".join(
+        f'  "{enemy_id}": {name_id}'
+        for enemy_id, name_id in sorted(names.items())
+    )
+
+    tres_content = f'''[gd_resource type="Resource" script_class="SpawnPoolTable" load_steps=2 format=3]
+
+[ext_resource type="Script" path="res://scripts/resources/spawn_pool_table.gd" id="1"]
+
+[resource]
+script = ExtResource("1")
+pools = {{
+{pools_str}
+}}
+names = {{
+{names_str}
+}}
+'''
+
+    output_path = output_dir / "spawn_pools.tres"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(tres_content)
+
+    return len(pools)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Convert psz-sketch JSON to Godot .tres")
     parser.add_argument("--source", required=True, help="Path to psz-sketch/src/content")
     parser.add_argument("--output", required=True, help="Path to psz-godot/data")
     parser.add_argument("--type", choices=["all", "weapons", "armors", "enemies"], default="all")
+    parser.add_argument("--db", help="Content DB path (default: <output>/../build/content.db)")
+    parser.add_argument("--no-db", action="store_true", help="Don't update the SQLite content store")
+    add_metrics_arguments(parser)
     args = parser.parse_args()
 
-    source = Path(args.source)
-    output = Path(args.output)
+    # Scanning and dispatch live in the unified pipeline
+    from content_pipeline import CONVERT_PSZ_CATEGORIES, run_pipeline
 
-    if args.type in ["all", "weapons"]:
-        weapons_dir = source / "weapons"
-        if weapons_dir.exists():
-            count = 0
-            for json_file in weapons_dir.glob("*.json"):
-                try:
-                    convert_weapon(json_file, output)
-                    count += 1
-                except Exception as e:
-                    print(f"Error converting {json_file}: {e}")
-            print(f"Converted {count} weapons")
-
-    if args.type in ["all", "armors"]:
-        armors_dir = source / "armors"
-        if armors_dir.exists():
-            count = 0
-            for json_file in armors_dir.glob("*.json"):
-                try:
-                    convert_armor(json_file, output)
-                    count += 1
-                except Exception as e:
-                    print(f"Error converting {json_file}: {e}")
-            print(f"Converted {count} armors")
-
-    if args.type in ["all", "enemies"]:
-        enemies_dir = source / "enemies"
-        if enemies_dir.exists():
-            count = 0
-            for json_file in enemies_dir.glob("*.json"):
-                try:
-                    convert_enemy(json_file, output)
-                    count += 1
-                except Exception as e:
-                    print(f"Error converting {json_file}: {e}")
-            print(f"Converted {count} enemies")
+    output = Path(args.output)
+    categories = CONVERT_PSZ_CATEGORIES if args.type == "all" else [args.type]
+    db_path = None
+    if not args.no_db:
+        db_path = args.db or str(output.resolve().parent / "build" / "content.db")
+    run_pipeline(args.source, str(output), categories=categories, db_path=db_path,
+                 metrics=metrics_from_args("convert_psz_data", args))
 
 
 if __name__ == "__main__":
@@ -10,7 +10,7 @@ import { useNavigate } from 'react-router-dom';
 import type { QuestProject, QuestProjectSource } from './types';
 import { createDefaultProject } from './types';
 import { godotQuestToProject } from './utils/quest-io';
-import { assetUrl } from '../utils/assets';
+import { fetchData } from '../utils/assets';
 
 interface GameQuestInfo {
   filename: string;
@@ -61,8 +61,7 @@ export default function QuestHome() {
 
     (async () => {
       try {
-        const manifestUrl = assetUrl('/data/quests/manifest.json');
-        const res = await fetch(manifestUrl);
+        const res = await fetchData('quests/manifest.json');
         if (!res.ok) {
           setError('Could not load quest manifest');
           setLoading(false);
@@ -73,8 +72,7 @@ export default function QuestHome() {
         const quests: GameQuestInfo[] = [];
         for (const fn of filenames) {
           try {
-            const questUrl = assetUrl(`/data/quests/${fn}.json`);
-            const qRes = await fetch(questUrl);
+            const qRes = await fetchData(`quests/${fn}.json`);
             if (!qRes.ok) continue;
             const quest = await qRes.json();
             quests.push({
@@ -104,8 +102,7 @@ export default function QuestHome() {
 
   const handleOpenGameQuest = useCallback(async (filename: string) => {
     try {
-      const questUrl = assetUrl(`/data/quests/${filename}.json`);
-      const res = await fetch(questUrl);
+      const res = await fetchData(`quests/${filename}.json`);
       if (!res.ok) throw new Error('Fetch failed');
       const quest = await res.json();
       const project = godotQuestToProject(quest);
@@ -8,6 +8,7 @@
 import { useState, useEffect, useMemo } from 'react';
 import type { StageConfig, Direction } from '../types';
 import { EDITOR_AREAS } from '../types';
+import { fetchData } from '../../utils/assets';
 
 // Module-level config cache (shared across all hook instances)
 let _configCache: Record<string, StageConfig> | null = null;
@@ -26,11 +27,10 @@ export async function loadAllConfigs(): Promise<Record<string, StageConfig>> {
 
   _configPromise = (async () => {
     const merged: Record<string, StageConfig> = {};
-    const base = import.meta.env.BASE_URL || '/';
     await Promise.all(
       CONFIG_FILES.map(async (name) => {
         try {
-          const resp = await fetch(`${base}data/stage_configs/${name}.json`);
+          const resp = await fetchData(`stage_configs/${name}.json`);
           if (resp.ok) {
             const data = await resp.json();
             Object.assign(merged, data);
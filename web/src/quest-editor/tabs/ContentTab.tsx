@@ -14,7 +14,7 @@ import type { QuestProject, Direction, CellObject, CellObjectType } from '../typ
 import { CELL_OBJECT_COLORS, CELL_OBJECT_LABELS } from '../types';
 import { getRotatedGates, getStageConfig, getStageSuffix } from '../hooks/useStageConfigs';
 import { getGlbPath, getAreaFromMapId } from '../constants';
-import { assetUrl } from '../../utils/assets';
+import { assetUrl, fetchData } from '../../utils/assets';
 import type { GateConfig } from '../types';
 
 /** NPC ID → GLB asset path mapping (mirrors field_npc.gd NPC_MODELS) */
@@ -56,8 +56,7 @@ function useEnemyList(): EnemyInfo[] {
 
   useEffect(() => {
     if (_enemyListCache) return;
-    const base = import.meta.env.BASE_URL || '/';
-    fetch(`${base}data/enemies.json`)
+    fetchData('enemies.json')
       .then(r => r.json())
       .then((data: EnemyInfo[]) => {
         _enemyListCache = data;
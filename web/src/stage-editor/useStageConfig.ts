@@ -1,5 +1,5 @@
 import { useState, useEffect, useCallback } from 'react';
-import { assetUrl } from '../utils/assets';
+import { fetchData } from '../utils/assets';
 import type { UnifiedStageConfig } from './types';
 import { createDefaultConfig } from './types';
 
@@ -29,7 +29,7 @@ export function ensureSeeded(): Promise<void> {
       // Seed stage configs if localStorage is empty
       const existingConfigs = localStorage.getItem(STORAGE_KEY);
       if (!existingConfigs) {
-        const resp = await fetch(assetUrl('data/stage_configs/unified-stage-configs.json'));
+        const resp = await fetchData('stage_configs/unified-stage-configs.json');
         if (resp.ok) {
           const committed = await resp.json();
           localStorage.setItem(STORAGE_KEY, JSON.stringify(committed));
@@ -39,7 +39,7 @@ export function ensureSeeded(): Promise<void> {
       // Seed texture fixes if localStorage is empty
       const existingFixes = localStorage.getItem(TEXTURE_FIXES_KEY);
       if (!existingFixes) {
-        const resp = await fetch(assetUrl('data/stage_configs/global-texture-fixes.json'));
+        const resp = await fetchData('stage_configs/global-texture-fixes.json');
         if (resp.ok) {
           const committed = await resp.json();
           localStorage.setItem(TEXTURE_FIXES_KEY, JSON.stringify(committed));
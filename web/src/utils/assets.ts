@@ -8,3 +8,33 @@ export function assetUrl(path: string): string {
   const clean = path.startsWith('/') ? path.slice(1) : path;
   return `${base}${clean}`;
 }
+
+// =============== Fingerprinted data files ===============
+// scripts/tools/export_web_data.py writes data/data-manifest.json mapping
+// each data path to a content-hashed copy that can be cached indefinitely.
+// Without the manifest (vite dev server) the plain path is used.
+
+type DataManifest = { files: Record<string, string> };
+
+let _manifestPromise: Promise<DataManifest | null> | null = null;
+
+function loadDataManifest(): Promise<DataManifest | null> {
+  if (!_manifestPromise) {
+    _manifestPromise = fetch(assetUrl('data/data-manifest.json'), { cache: 'no-cache' })
+      .then((resp) => (resp.ok ? resp.json() : null))
+      .catch(() => null);
+  }
+  return _manifestPromise;
+}
+
+/** URL of a data file (path relative to data/, e.g. "enemies.json"), fingerprinted when exported */
+export async function dataUrl(path: string): Promise<string> {
+  const clean = path.replace(/^\/?(data\/)?/, '');
+  const manifest = await loadDataManifest();
+  return assetUrl(`data/${manifest?.files[clean] ?? clean}`);
+}
+
+/** fetch() a data file through the manifest */
+export async function fetchData(path: string, init?: RequestInit): Promise<Response> {
+  return fetch(await dataUrl(path), init);
+}